@@ -0,0 +1,341 @@
+"""Micro-benchmarks for the AI Employee database layer.
+
+Usage:
+    python scripts/benchmark_database.py pool [--ops 5000]
+    python scripts/benchmark_database.py bulk [--rows 5000]
+    python scripts/benchmark_database.py financial [--rows 100000]
+    python scripts/benchmark_database.py startup [--ops 200]
+    python scripts/benchmark_database.py rows [--rows 20000]
+    python scripts/benchmark_database.py async [--ops 2000]
+    python scripts/benchmark_database.py dashboard [--rows 100000]
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.async_manager import AsyncDatabaseManager
+from src.database.db_manager import DatabaseManager
+
+
+class UnpooledDatabaseManager(DatabaseManager):
+    """Baseline that opens and closes a connection for every operation."""
+
+    @contextmanager
+    def _get_connection(self):
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _timed(label: str, ops: int, func):
+    """Run func ops times and print throughput."""
+    start = time.perf_counter()
+    for i in range(ops):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {ops / elapsed:>12,.0f} ops/sec  ({elapsed:.3f}s)")
+    return ops / elapsed
+
+
+def bench_pool(ops: int):
+    """Compare get_item/update_item throughput without and with pooling."""
+    results = {}
+    for label, cls in [('before (connect per call)', UnpooledDatabaseManager),
+                       ('after (pooled + WAL)', DatabaseManager)]:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = cls(str(Path(tmp) / 'bench.db'))
+            ids = [str(uuid4()) for _ in range(100)]
+            for item_id in ids:
+                db.create_item({'id': item_id, 'source': 'gmail', 'type': 'email'})
+
+            print(f"\n{label}")
+            get_rate = _timed('get_item', ops, lambda i: db.get_item(ids[i % 100]))
+            update_rate = _timed('update_item', ops,
+                                 lambda i: db.update_item(ids[i % 100], {'status': f's{i}'}))
+            results[label] = (get_rate, update_rate)
+            if hasattr(db, 'close'):
+                db.close()
+
+    (before_get, before_upd), (after_get, after_upd) = results.values()
+    print(f"\nSpeedup: get_item x{after_get / before_get:.1f}, "
+          f"update_item x{after_upd / before_upd:.1f}")
+
+
+def bench_bulk(rows: int):
+    """Compare row-at-a-time inserts with the bulk executemany APIs."""
+    def make_items():
+        return [{'id': str(uuid4()), 'source': 'gmail', 'type': 'email',
+                 'file_path': f'Inbox/emails/{i}.md'} for i in range(rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'bench.db'))
+
+        items = make_items()
+        start = time.perf_counter()
+        for item in items:
+            db.create_item(item)
+        single = time.perf_counter() - start
+
+        items = make_items()
+        start = time.perf_counter()
+        db.create_items_many(items)
+        bulk = time.perf_counter() - start
+
+        entries = [{'level': 'INFO', 'component': 'bench', 'action': f'event {i}'}
+                   for i in range(rows)]
+        start = time.perf_counter()
+        db.log_activity_many(entries)
+        activity = time.perf_counter() - start
+        db.close()
+
+    print(f"\n{rows:,} rows")
+    print(f"  create_item loop          {single * 1000:>10.1f} ms")
+    print(f"  create_items_many         {bulk * 1000:>10.1f} ms  (x{single / bulk:.1f})")
+    print(f"  log_activity_many         {activity * 1000:>10.1f} ms")
+
+
+def _scan_financial_summary(db: DatabaseManager):
+    """Baseline: the full-scan aggregates the rollups replaced."""
+    with db._get_connection() as conn:
+        conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM financial_records
+            WHERE record_type = 'invoice' AND payment_status = 'pending'
+        """).fetchone()
+        conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM financial_records
+            WHERE record_type = 'invoice' AND payment_status = 'paid'
+            AND strftime('%Y-%m', paid_at) = strftime('%Y-%m', 'now')
+        """).fetchone()
+        conn.execute("""
+            SELECT COALESCE(SUM(amount), 0) FROM financial_records
+            WHERE record_type = 'expense'
+            AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
+        """).fetchone()
+
+
+def bench_financial(rows: int, ops: int = 200):
+    """Compare the full-scan financial summary with the rollup lookups."""
+    types = ['invoice', 'expense', 'receipt', 'payment']
+    statuses = ['pending', 'paid', 'overdue']
+    categories = ['software', 'travel', 'consulting', 'office', None]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'bench.db'))
+
+        records = [{
+            'id': str(uuid4()),
+            'record_type': types[i % 4],
+            'amount': float(i % 997),
+            'payment_status': statuses[i % 3],
+            'category': categories[i % 5],
+            'created_at': f'202{4 + i % 3}-{1 + i % 12:02d}-15 10:00:00',
+            'paid_at': f'202{4 + i % 3}-{1 + i % 12:02d}-20 10:00:00' if i % 3 == 1 else None,
+        } for i in range(rows)]
+
+        start = time.perf_counter()
+        db.create_financial_records_many(records)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.rebuild_financial_rollups()
+        rebuild = time.perf_counter() - start
+
+        print(f"\n{rows:,} financial records (load incl. triggers {load:.2f}s, "
+              f"rebuild {rebuild * 1000:.1f} ms)")
+        before = _timed('before (full scans)', ops, lambda i: _scan_financial_summary(db))
+        after = _timed('after (rollups)', ops, lambda i: db.get_financial_summary())
+        db.close()
+
+    print(f"\nSpeedup: get_financial_summary x{after / before:.0f}")
+
+
+def bench_startup(ops: int):
+    """Compare DatabaseManager construction with and without a current schema."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / 'bench.db')
+        DatabaseManager(db_path).close()
+
+        def open_unversioned(i):
+            # Forget the version so every open re-runs the full DDL
+            conn = sqlite3.connect(db_path)
+            conn.execute("PRAGMA user_version = 0")
+            conn.close()
+            DatabaseManager(db_path).close()
+
+        print(f"\nDatabaseManager() on an existing database")
+        before = _timed('before (full DDL)', ops, open_unversioned)
+        after = _timed('after (version current)', ops, lambda i: DatabaseManager(db_path).close())
+
+    print(f"\nSpeedup: startup x{after / before:.1f}")
+
+
+def _dict_rows(db: DatabaseManager, source: str):
+    """Baseline: SELECT * decoded through sqlite3.Row into dicts."""
+    with db._get_connection() as conn:
+        cursor = conn.execute(
+            "SELECT * FROM items WHERE source = ? ORDER BY created_at DESC", (source,))
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def bench_rows(rows: int, ops: int = 20):
+    """Compare dict rows with slot models for a list query."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'bench.db'))
+        db.create_items_many([{'id': str(uuid4()), 'source': 'gmail', 'type': 'email',
+                               'category': 'invoice', 'amount': float(i),
+                               'file_path': f'Inbox/emails/{i}.md'} for i in range(rows)])
+
+        print(f"\nget_items_by_source over {rows:,} rows")
+        before = _timed('before (dict(sqlite3.Row))', ops, lambda i: _dict_rows(db, 'gmail'))
+        after = _timed('after (slot models)', ops, lambda i: db.get_items_by_source('gmail'))
+
+        dict_row = _dict_rows(db, 'gmail')[0]
+        model_row = db.get_items_by_source('gmail')[0]
+        print(f"  per-row size: dict {sys.getsizeof(dict_row)} B, "
+              f"model {sys.getsizeof(model_row)} B")
+        db.close()
+
+    print(f"\nSpeedup: list query x{after / before:.1f}")
+
+
+def bench_async(ops: int, concurrency: int = 50):
+    """Compare awaited writes through the thread pool with group commits."""
+    def item(i):
+        return {'id': str(uuid4()), 'source': 'whatsapp', 'type': 'message',
+                'file_path': f'Inbox/messages/{i}.md'}
+
+    async def run(create):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ingest(i):
+            async with semaphore:
+                await create(item(i))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(ingest(i) for i in range(ops)))
+        return time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'before.db'))
+
+        async def to_thread(data):
+            return await asyncio.to_thread(db.create_item, data)
+
+        before = asyncio.run(run(to_thread))
+        db.close()
+
+        async def grouped():
+            async with AsyncDatabaseManager(str(Path(tmp) / 'after.db')) as adb:
+                elapsed = await run(adb.create_item)
+                return elapsed, adb.stats['batches']
+
+        after, batches = asyncio.run(grouped())
+
+    print(f"\n{ops:,} create_item awaits, {concurrency} concurrent coroutines")
+    print(f"  before (commit per call)     {ops / before:>12,.0f} ops/sec  ({before:.3f}s)")
+    print(f"  after (group commit)         {ops / after:>12,.0f} ops/sec  ({after:.3f}s, "
+          f"{batches} commits)")
+    print(f"\nSpeedup: awaited writes x{before / after:.1f}")
+
+
+def _scan_platform_counts(db: DatabaseManager):
+    """Baseline: the GROUP BY item count the item rollups replaced."""
+    with db._get_connection() as conn:
+        conn.execute("SELECT source, COUNT(*) FROM items GROUP BY source").fetchall()
+
+
+def bench_dashboard(rows: int, ops: int = 200):
+    """Compare counting items with GROUP BY against a whole dashboard snapshot."""
+    sources = ['gmail', 'filesystem', 'whatsapp', 'linkedin']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'bench.db'))
+        db.create_items_many([{
+            'id': f'item-{i}',
+            'source': sources[i % 4],
+            'type': 'email',
+            'status': 'pending' if i % 3 else 'done',
+            'created_at': f'2026-02-{1 + i % 28:02d} 10:00:00',
+        } for i in range(rows)])
+        with db.transaction() as tx:
+            for i in range(rows // 10):
+                tx.create_approval({'id': f'approval-{i}', 'item_id': f'item-{i}',
+                                    'deadline': f'2026-03-{1 + i % 28:02d} 00:00:00',
+                                    'decision': 'approved' if i % 2 else None})
+        db.log_activity_many([
+            {'timestamp': f'2026-02-{1 + i % 28:02d} {i % 24:02d}:00:00',
+             'component': 'Bench', 'action': f'event {i}'}
+            for i in range(rows // 5)
+        ])
+
+        print(f"\n{rows:,} items, {rows // 10:,} approvals, {rows // 5:,} activity rows")
+        before = _timed('before (GROUP BY items)', ops, lambda i: _scan_platform_counts(db))
+        after = _timed('after (whole snapshot)', ops, lambda i: db.get_dashboard_snapshot())
+        db.close()
+
+    print(f"\n  snapshot latency {1000 / after:.2f} ms")
+    print(f"\nSpeedup: platform counts x{after / before:.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Database micro-benchmarks')
+    subparsers = parser.add_subparsers(dest='bench')
+
+    pool_parser = subparsers.add_parser('pool', help='Connection pooling: get/update ops/sec')
+    pool_parser.add_argument('--ops', type=int, default=5000)
+
+    bulk_parser = subparsers.add_parser('bulk', help='Bulk insert vs row-at-a-time')
+    bulk_parser.add_argument('--rows', type=int, default=5000)
+
+    financial_parser = subparsers.add_parser('financial',
+                                             help='Financial summary: full scans vs rollups')
+    financial_parser.add_argument('--rows', type=int, default=100000)
+
+    startup_parser = subparsers.add_parser('startup', help='Manager construction cost')
+    startup_parser.add_argument('--ops', type=int, default=200)
+
+    rows_parser = subparsers.add_parser('rows', help='Row decoding: dicts vs slot models')
+    rows_parser.add_argument('--rows', type=int, default=20000)
+
+    async_parser = subparsers.add_parser('async', help='Awaited writes: per-call vs group commit')
+    async_parser.add_argument('--ops', type=int, default=2000)
+
+    dashboard_parser = subparsers.add_parser('dashboard',
+                                             help='Dashboard snapshot vs GROUP BY item counts')
+    dashboard_parser.add_argument('--rows', type=int, default=100000)
+
+    args = parser.parse_args()
+    if args.bench == 'pool':
+        bench_pool(args.ops)
+    elif args.bench == 'bulk':
+        bench_bulk(args.rows)
+    elif args.bench == 'financial':
+        bench_financial(args.rows)
+    elif args.bench == 'startup':
+        bench_startup(args.ops)
+    elif args.bench == 'rows':
+        bench_rows(args.rows)
+    elif args.bench == 'async':
+        bench_async(args.ops)
+    elif args.bench == 'dashboard':
+        bench_dashboard(args.rows)
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,6 +28,12 @@ check_watcher "Filesystem Watcher" "filesystem_watcher.py"
 check_watcher "WhatsApp Watcher" "whatsapp_watcher.js"
 check_watcher "LinkedIn Watcher" "linkedin_watcher.py"
 
+echo ""
+echo "=========================================="
+echo "💓 Heartbeats"
+echo "=========================================="
+python -m src.utils.watcher_registry 2>/dev/null || echo "   Heartbeat registry unavailable"
+
 echo ""
 echo "=========================================="
 echo "📊 Detailed Process List"
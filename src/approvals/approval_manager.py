@@ -204,6 +204,10 @@ python -m ai_employee reject {approval_id} --reason "Your reason here"
     def process_approval(self, approval_id: str, decision: str, reason: Optional[str] = None) -> Dict[str, Any]:
         """Process approval decision.
 
+        The approval update, item update and activity entry commit together;
+        the card is moved last, so a failed move rolls the records back and a
+        failed commit moves the card back.
+
         Args:
             approval_id: Unique approval ID
             decision: 'approved' or 'rejected'
@@ -212,66 +216,74 @@ python -m ai_employee reject {approval_id} --reason "Your reason here"
         Returns:
             Dictionary with success status and details
         """
-        try:
-            # Get approval record
-            approval = self.db.get_approval(approval_id)
+        moved = None
 
-            if not approval:
-                return {
-                    'success': False,
-                    'error': f'Approval ID not found: {approval_id}'
+        try:
+            with self.db.transaction() as tx:
+                # Get approval record
+                approval = tx.get_approval(approval_id)
+
+                if not approval:
+                    return {
+                        'success': False,
+                        'error': f'Approval ID not found: {approval_id}'
+                    }
+
+                # Check if already decided
+                if approval['decision'] is not None:
+                    return {
+                        'success': False,
+                        'error': f'Already decided: {approval["decision"]} at {approval["decided_at"]}'
+                    }
+
+                # Update approval record
+                update_data = {
+                    'decision': decision,
+                    'decided_at': datetime.now().isoformat(),
+                    'auto_decided': 0
                 }
 
-            # Check if already decided
-            if approval['decision'] is not None:
-                return {
-                    'success': False,
-                    'error': f'Already decided: {approval["decision"]} at {approval["decided_at"]}'
-                }
+                if reason:
+                    update_data['reason'] = reason
 
-            # Update approval record
-            update_data = {
-                'decision': decision,
-                'decided_at': datetime.now().isoformat(),
-                'auto_decided': 0
-            }
-
-            if reason:
-                update_data['reason'] = reason
+                if not tx.update_approval(approval_id, update_data):
+                    raise RuntimeError(f'Could not update approval {approval_id}')
 
-            self.db.update_approval(approval_id, update_data)
+                # Log activity
+                if not tx.log_activity({
+                    'level': 'INFO',
+                    'component': 'approval-manager',
+                    'action': f'Approval {decision}: {approval_id}',
+                    'item_id': approval['item_id'],
+                    'details': reason or 'No reason provided'
+                }):
+                    raise RuntimeError(f'Could not log decision for approval {approval_id}')
 
-            # Get item details
-            item = self.db.get_item(approval['item_id'])
+                # Get item details
+                item = tx.get_item(approval['item_id'])
 
-            if item and item['file_path']:
-                # Move file
-                source_path = self.vault_path / item['file_path']
+                if item and item['file_path']:
+                    source_path = self.vault_path / item['file_path']
 
-                if decision == 'approved':
-                    dest_folder = self.vault_path / 'Approved'
-                else:
-                    dest_folder = self.vault_path / 'Rejected'
+                    if decision == 'approved':
+                        dest_folder = self.vault_path / 'Approved'
+                    else:
+                        dest_folder = self.vault_path / 'Rejected'
 
-                if source_path.exists():
-                    dest_path = dest_folder / source_path.name
-                    shutil.move(str(source_path), str(dest_path))
+                    if source_path.exists():
+                        dest_path = dest_folder / source_path.name
 
-                    # Update item file path
-                    new_path = str(dest_path.relative_to(self.vault_path))
-                    self.db.update_item(approval['item_id'], {
-                        'file_path': new_path,
-                        'status': decision
-                    })
+                        # Update item file path
+                        new_path = str(dest_path.relative_to(self.vault_path))
+                        if not tx.update_item(approval['item_id'], {
+                            'file_path': new_path,
+                            'status': decision
+                        }):
+                            raise RuntimeError(f'Could not update item {approval["item_id"]}')
 
-            # Log activity
-            self.db.log_activity({
-                'level': 'INFO',
-                'component': 'approval-manager',
-                'action': f'Approval {decision}: {approval_id}',
-                'item_id': approval['item_id'],
-                'details': reason or 'No reason provided'
-            })
+                        # Move file
+                        shutil.move(str(source_path), str(dest_path))
+                        moved = (dest_path, source_path)
 
             logger.info(f"Approval {approval_id} {decision}")
 
@@ -282,6 +294,9 @@ python -m ai_employee reject {approval_id} --reason "Your reason here"
             }
 
         except Exception as e:
+            if moved:
+                # The records were rolled back, so put the card back as well
+                shutil.move(str(moved[0]), str(moved[1]))
             logger.error(f"Error processing approval {approval_id}: {e}")
             return {
                 'success': False,
@@ -291,6 +306,9 @@ python -m ai_employee reject {approval_id} --reason "Your reason here"
     def check_approval_timeouts(self) -> List[str]:
         """Check for and process timed-out approvals.
 
+        Each approval is auto-approved in its own transaction, so one failure
+        neither leaves a half-applied decision nor blocks the others.
+
         Returns:
             List of approval IDs that were auto-approved
         """
@@ -305,25 +323,34 @@ python -m ai_employee reject {approval_id} --reason "Your reason here"
                     # Auto-approve
                     approval_id = approval['id']
 
-                    self.db.update_approval(approval_id, {
-                        'decision': 'approved',
-                        'decided_at': datetime.now().isoformat(),
-                        'auto_decided': 1,
-                        'reason': f'Auto-approved after {self.config["approval_timeout_hours"]} hour timeout'
-                    })
-
-                    # Update item status
-                    self.db.update_item(approval['item_id'], {
-                        'status': 'approved'
-                    })
-
-                    # Log activity
-                    self.db.log_activity({
-                        'level': 'WARN',
-                        'component': 'approval-manager',
-                        'action': f'Auto-approved after timeout: {approval_id}',
-                        'item_id': approval['item_id']
-                    })
+                    try:
+                        with self.db.transaction() as tx:
+                            if not tx.update_approval(approval_id, {
+                                'decision': 'approved',
+                                'decided_at': datetime.now().isoformat(),
+                                'auto_decided': 1,
+                                'reason': f'Auto-approved after {self.config["approval_timeout_hours"]} hour timeout'
+                            }):
+                                raise RuntimeError('approval update failed')
+
+                            # Update item status
+                            if not tx.update_item(approval['item_id'], {
+                                'status': 'approved'
+                            }):
+                                raise RuntimeError('item update failed')
+
+                            # Log activity
+                            if not tx.log_activity({
+                                'level': 'WARN',
+                                'component': 'approval-manager',
+                                'action': f'Auto-approved after timeout: {approval_id}',
+                                'item_id': approval['item_id']
+                            }):
+                                raise RuntimeError('activity log failed')
+
+                    except Exception as e:
+                        logger.error(f"Error auto-approving {approval_id}: {e}")
+                        continue
 
                     auto_approved.append(approval_id)
                     logger.warning(f"Auto-approved {approval_id} after timeout")
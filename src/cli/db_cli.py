@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Database CLI - Maintenance commands for the AI Employee database.
+
+Usage:
+    python -m src.cli.db_cli migrate
+    python -m src.cli.db_cli rebuild-rollups
+    python -m src.cli.db_cli rebuild-rollups --db AI_Employee_Vault/Database/ai_employee.db
+    python -m src.cli.db_cli index
+    python -m src.cli.db_cli search "acme invoice" --limit 10
+    python -m src.cli.db_cli search "invoic*" --no-sync
+    python -m src.cli.db_cli maintain --retention-days 90
+    python -m src.cli.db_cli maintain --every 24        # run daily until stopped
+    python -m src.cli.db_cli backup --keep 7
+    python -m src.cli.db_cli backup --every 6           # snapshot every 6 hours until stopped
+    python -m src.cli.db_cli activity --component gmail --since 2025-01-01 --limit 50
+"""
+
+import sys
+import os
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database.db_manager import DatabaseManager
+from src.database.migrations import MIGRATIONS, SCHEMA_VERSION
+
+
+def setup_db(args) -> DatabaseManager:
+    """Open the database selected by --db (default location otherwise)."""
+    return DatabaseManager(args.db)
+
+
+def cmd_migrate(args):
+    """Apply pending schema migrations and report the schema version."""
+    try:
+        # Opening the database applies any pending migrations
+        db = setup_db(args)
+        version = db.get_schema_version()
+        db.close()
+
+        print(f"✓ Schema version {version} (latest {SCHEMA_VERSION})")
+        for number, description, _ in MIGRATIONS:
+            marker = '✓' if number <= version else ' '
+            print(f"  {marker} {number:>3}  {description}")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error migrating database: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_rebuild_rollups(args):
+    """Recompute financial_rollups from financial_records."""
+    db = setup_db(args)
+
+    try:
+        start = time.perf_counter()
+        if not db.rebuild_financial_rollups():
+            print("✗ Failed to rebuild financial rollups", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+
+        summary = db.get_financial_summary()
+        print(f"✓ Financial rollups rebuilt in {elapsed * 1000:.1f} ms")
+        print(f"  Pending invoices: {summary['pending_invoices_count']} "
+              f"(${summary['pending_invoices_amount']:,.2f})")
+        print(f"  Paid this month: {summary['paid_this_month_count']} "
+              f"(${summary['paid_this_month_amount']:,.2f})")
+        print(f"  Expenses this month: ${summary['expenses_this_month']:,.2f}")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error rebuilding rollups: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def cmd_index(args):
+    """Update the full-text index for new, changed and deleted vault cards."""
+    db = setup_db(args)
+
+    try:
+        start = time.perf_counter()
+        stats = db.index_vault(args.vault)
+        if not stats:
+            print("✗ Failed to index vault", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+
+        print(f"✓ Vault indexed in {elapsed * 1000:.1f} ms")
+        print(f"  Indexed: {stats['indexed']}  Removed: {stats['removed']}  "
+              f"Unchanged: {stats['unchanged']}")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error indexing vault: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def cmd_search(args):
+    """Search items and vault cards, best matches first."""
+    db = setup_db(args)
+
+    try:
+        if not args.no_sync:
+            db.index_vault(args.vault)
+
+        hits = db.search(args.query, limit=args.limit)
+        if not hits:
+            print(f"No matches for: {args.query}")
+            return 0
+
+        print(f"\n{len(hits)} match(es) for: {args.query}")
+        print("=" * 60)
+        for n, hit in enumerate(hits, 1):
+            snippet = ' '.join(hit['snippet'].split())
+            print(f"{n:>3}. [{hit['kind']}] {hit['title']}")
+            print(f"     {hit['ref']}")
+            print(f"     {snippet}")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error searching: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def _format_bytes(size: int) -> str:
+    """Human-readable byte count."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+
+
+def cmd_maintain(args):
+    """Archive old activity, reclaim free pages and report metrics."""
+    db = setup_db(args)
+
+    try:
+        while True:
+            metrics = db.run_maintenance(args.retention_days, args.vacuum_pages)
+            if not metrics:
+                print("✗ Maintenance failed", file=sys.stderr)
+                return 1
+
+            print(f"✓ Maintenance completed in {metrics['duration_ms']:.1f} ms "
+                  f"({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+            if metrics['vacuum_converted']:
+                print("  Converted database to auto_vacuum=INCREMENTAL")
+            months = ', '.join(metrics['archive_months']) or 'none'
+            print(f"  Archived: {metrics['rows_archived']} activity entries (months: {months})")
+            print(f"  Pages freed: {metrics['pages_freed']}")
+            print(f"  Size: {_format_bytes(metrics['size_before'])} → "
+                  f"{_format_bytes(metrics['size_after'])}")
+
+            if not args.every:
+                return 0
+            time.sleep(args.every * 3600)
+
+    except KeyboardInterrupt:
+        print("\nMaintenance scheduler stopped")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error running maintenance: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def cmd_backup(args):
+    """Write a compressed online snapshot of the database and rotate old ones."""
+    db = setup_db(args)
+
+    try:
+        while True:
+            result = db.backup(args.keep, args.pages)
+            if not result:
+                print("✗ Backup failed", file=sys.stderr)
+                return 1
+
+            print(f"✓ Backup completed in {result['duration_ms']:.1f} ms "
+                  f"({result['finished_at']} UTC)")
+            print(f"  Snapshot: {result['path']} ({_format_bytes(result['size_bytes'])}, "
+                  f"{result['pages']} pages)")
+            if result['removed']:
+                print(f"  Rotated out: {len(result['removed'])} old snapshot(s)")
+
+            if not args.every:
+                return 0
+            time.sleep(args.every * 3600)
+
+    except KeyboardInterrupt:
+        print("\nBackup scheduler stopped")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error backing up database: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def cmd_activity(args):
+    """Show activity entries from the live table and archives."""
+    db = setup_db(args)
+
+    try:
+        entries = db.query_activity(start=args.since, end=args.until,
+                                    component=args.component, level=args.level,
+                                    limit=args.limit)
+        for entry in entries:
+            print(f"{entry['timestamp']}  {entry['level'] or '':<5}  "
+                  f"{entry['component']:<20}  {entry['action']}")
+        print(f"\n{len(entries)} entries")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error querying activity: {e}", file=sys.stderr)
+        return 1
+
+    finally:
+        db.close()
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description='AI Employee database maintenance',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--db', help='Database path (default: vault database)')
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    # Migrate command
+    migrate_parser = subparsers.add_parser('migrate', help='Apply pending schema migrations')
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    # Rebuild rollups command
+    rebuild_parser = subparsers.add_parser('rebuild-rollups',
+                                           help='Recompute financial summary rollups')
+    rebuild_parser.set_defaults(func=cmd_rebuild_rollups)
+
+    # Index command
+    index_parser = subparsers.add_parser('index', help='Update the vault full-text index')
+    index_parser.add_argument('--vault', help='Vault path (default: project vault)')
+    index_parser.set_defaults(func=cmd_index)
+
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Full-text search items and vault cards')
+    search_parser.add_argument('query', help='Search terms (all must match, word* for prefix)')
+    search_parser.add_argument('--limit', type=int, default=20, help='Maximum hits')
+    search_parser.add_argument('--vault', help='Vault path (default: project vault)')
+    search_parser.add_argument('--no-sync', action='store_true',
+                               help='Skip the incremental index update before searching')
+    search_parser.set_defaults(func=cmd_search)
+
+    # Maintain command
+    maintain_parser = subparsers.add_parser('maintain',
+                                            help='Archive old activity and reclaim space')
+    maintain_parser.add_argument('--retention-days', type=int,
+                                 default=DatabaseManager.ACTIVITY_RETENTION_DAYS,
+                                 help='Days of activity kept live (default: %(default)s)')
+    maintain_parser.add_argument('--vacuum-pages', type=int,
+                                 help='Maximum pages to release (default: all)')
+    maintain_parser.add_argument('--every', type=float,
+                                 help='Repeat every N hours until interrupted')
+    maintain_parser.set_defaults(func=cmd_maintain)
+
+    # Backup command
+    backup_parser = subparsers.add_parser('backup',
+                                          help='Write a compressed online snapshot')
+    backup_parser.add_argument('--keep', type=int, default=DatabaseManager.BACKUP_KEEP,
+                               help='Snapshots to keep (default: %(default)s)')
+    backup_parser.add_argument('--pages', type=int,
+                               default=DatabaseManager.BACKUP_PAGES_PER_STEP,
+                               help='Pages copied per step (default: %(default)s)')
+    backup_parser.add_argument('--every', type=float,
+                               help='Repeat every N hours until interrupted')
+    backup_parser.set_defaults(func=cmd_backup)
+
+    # Activity command
+    activity_parser = subparsers.add_parser('activity',
+                                            help='Query activity across live and archived months')
+    activity_parser.add_argument('--since', help='Earliest timestamp, e.g. 2025-01-01')
+    activity_parser.add_argument('--until', help='Latest timestamp (exclusive)')
+    activity_parser.add_argument('--component', help='Only this component')
+    activity_parser.add_argument('--level', help='Only this level')
+    activity_parser.add_argument('--limit', type=int, default=50, help='Maximum entries')
+    activity_parser.set_defaults(func=cmd_activity)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    # Execute command
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ Usage:
     python -m src.cli.linkedin_cli create "Post content" --importance normal
     python -m src.cli.linkedin_cli schedule "Post content" --time "2026-02-21 10:00"
     python -m src.cli.linkedin_cli list pending
+    python -m src.cli.linkedin_cli list posted --limit 20 --after <post_id>
     python -m src.cli.linkedin_cli approve <post_id>
     python -m src.cli.linkedin_cli reject <post_id> --reason "Not appropriate"
     python -m src.cli.linkedin_cli status <post_id>
@@ -18,6 +19,7 @@ import os
 import argparse
 import json
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -41,7 +43,9 @@ def setup_poster(headless: bool = False) -> LinkedInPoster:
         headless: Run browser in headless mode (default: False, visible browser)
     """
     vault_path = Path(__file__).parent.parent.parent / 'AI_Employee_Vault'
-    db_manager = DatabaseManager()
+    # Audit entries are written behind the command and flushed at exit;
+    # repeated post/approval lookups within a command are served from cache
+    db_manager = DatabaseManager(async_activity_log=True, entity_cache=True)
     config = {'headless': headless}
     return LinkedInPoster(db_manager, str(vault_path), config=config)
 
@@ -93,34 +97,58 @@ def cmd_schedule(args):
 
 
 def cmd_list(args):
-    """List posts by status."""
+    """List posts by status, streaming pages with --limit/--after."""
     poster = setup_poster()
+    db = poster.db
+    limit = getattr(args, 'limit', None)
+    chunk_size = min(limit, 500) if limit else 500
 
     try:
         if args.filter == 'pending':
-            posts = poster.db.get_linkedin_posts_needing_approval()
+            sort_key = 'created_at'
+            stream = lambda after: db.iter_linkedin_posts_by_status(
+                'pending', chunk_size=chunk_size, after=after, oldest_first=True)
             title = "Posts Pending Approval"
         elif args.filter == 'approved':
-            posts = poster.db.get_linkedin_posts_by_status('approved')
+            sort_key = 'created_at'
+            stream = lambda after: db.iter_linkedin_posts_by_status(
+                'approved', chunk_size=chunk_size, after=after)
             title = "Approved Posts (Ready to Post)"
         elif args.filter == 'posted':
-            posts = poster.db.get_linkedin_posts_by_status('posted')
+            sort_key = 'created_at'
+            stream = lambda after: db.iter_linkedin_posts_by_status(
+                'posted', chunk_size=chunk_size, after=after)
             title = "Posted"
         elif args.filter == 'failed':
-            posts = poster.db.get_failed_linkedin_posts()
+            sort_key = 'updated_at'
+            stream = lambda after: db.iter_failed_linkedin_posts(
+                chunk_size=chunk_size, after=after)
             title = "Failed Posts (Can Retry)"
         else:
             print(f"✗ Invalid filter: {args.filter}", file=sys.stderr)
             return 1
 
+        # Resume after a previously listed post (keyset cursor)
+        after = None
+        if getattr(args, 'after', None):
+            anchor = db.get_linkedin_post(args.after)
+            if not anchor:
+                print(f"✗ Post not found: {args.after}", file=sys.stderr)
+                return 1
+            after = (anchor[sort_key], anchor['id'])
+
+        posts = stream(after)
+        if limit:
+            posts = islice(posts, limit)
+
         print(f"\n{title}")
         print("=" * 60)
 
-        if not posts:
-            print("  (No posts found)")
-            return 0
-
+        total = 0
+        last_id = None
         for post in posts:
+            total += 1
+            last_id = post['id']
             print(f"\n  ID: {post['id'][:8]}...")
             print(f"  Content: {post['content'][:50]}...")
             print(f"  Importance: {post['importance_level']}")
@@ -140,7 +168,13 @@ def cmd_list(args):
             if post['retry_count'] > 0:
                 print(f"  Retries: {post['retry_count']}/{post['max_retries']}")
 
-        print(f"\n  Total: {len(posts)} posts")
+        if total == 0:
+            print("  (No posts found)")
+            return 0
+
+        print(f"\n  Total: {total} posts")
+        if limit and total == limit:
+            print(f"  → Next page: list {args.filter} --limit {limit} --after {last_id}")
         return 0
 
     except Exception as e:
@@ -331,6 +365,8 @@ def main():
     list_parser = subparsers.add_parser('list', help='List posts')
     list_parser.add_argument('filter', choices=['pending', 'approved', 'posted', 'failed'],
                             help='Filter by status')
+    list_parser.add_argument('--limit', type=int, help='Maximum posts to show (one page)')
+    list_parser.add_argument('--after', help='Continue after this post ID')
     list_parser.set_defaults(func=cmd_list)
 
     # Approve command
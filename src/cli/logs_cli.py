@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Logs CLI - Query the vault logs through their offset indexes.
+
+Usage:
+    python -m src.cli.logs_cli query --component GmailWatcher --level ERROR
+    python -m src.cli.logs_cli query --since 2025-01-01 --until "2025-01-02 12:00" --grep invoice
+    python -m src.cli.logs_cli query --level WARN --level ERROR --limit 200 --json
+    python -m src.cli.logs_cli index
+    python -m src.cli.logs_cli index --rebuild
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.log_index import DEFAULT_LOG_DIR, index_logs, query_logs
+
+
+def _timestamp(value: str) -> datetime:
+    """argparse type for --since/--until."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO date/time: {value}")
+
+
+def cmd_query(args):
+    """Print matching log entries, oldest first."""
+    try:
+        start = time.perf_counter()
+        count = 0
+        for entry in query_logs(args.logs, since=args.since, until=args.until,
+                                components=args.component, levels=args.level,
+                                contains=args.grep, limit=args.limit):
+            count += 1
+            if args.json:
+                print(json.dumps({**entry, 'timestamp': entry['timestamp'].isoformat()},
+                                 ensure_ascii=False))
+            else:
+                print(f"{entry['timestamp'].isoformat(sep=' ', timespec='seconds')}  "
+                      f"{entry['level']:<5}  {entry['component']:<20}  {entry['message']}")
+        elapsed = time.perf_counter() - start
+
+        if not args.json:
+            print(f"\n{count} entries ({elapsed * 1000:.1f} ms)")
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error querying logs: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_index(args):
+    """Bring every log file's sidecar index up to date."""
+    try:
+        start = time.perf_counter()
+        stats = index_logs(args.logs, rebuild=args.rebuild)
+        elapsed = time.perf_counter() - start
+
+        print(f"✓ Indexed {stats['files']} log file(s), {stats['bytes']:,} bytes "
+              f"in {elapsed * 1000:.1f} ms")
+        if stats['errors']:
+            print(f"  {stats['errors']} file(s) could not be read", file=sys.stderr)
+            return 1
+        return 0
+
+    except Exception as e:
+        print(f"✗ Error indexing logs: {e}", file=sys.stderr)
+        return 1
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description='AI Employee log queries',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--logs', default=str(DEFAULT_LOG_DIR),
+                        help='Log folder (default: %(default)s)')
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    # Query command
+    query_parser = subparsers.add_parser('query', help='Find log entries across all log files')
+    query_parser.add_argument('--since', type=_timestamp, help='Earliest time, e.g. 2025-01-01')
+    query_parser.add_argument('--until', type=_timestamp, help='Latest time (exclusive)')
+    query_parser.add_argument('--component', action='append',
+                              help='Only this component (repeatable)')
+    query_parser.add_argument('--level', action='append', help='Only this level (repeatable)')
+    query_parser.add_argument('--grep', help='Only messages containing this text')
+    query_parser.add_argument('--limit', type=int, help='Maximum entries')
+    query_parser.add_argument('--json', action='store_true', help='One JSON object per line')
+    query_parser.set_defaults(func=cmd_query)
+
+    # Index command
+    index_parser = subparsers.add_parser('index', help='Update the log offset indexes')
+    index_parser.add_argument('--rebuild', action='store_true',
+                              help='Reindex every file from the start')
+    index_parser.set_defaults(func=cmd_index)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    # Execute command
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
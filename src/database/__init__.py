@@ -1,5 +1,10 @@
 """Database module for AI Employee Silver Tier."""
 
 from .db_manager import DatabaseManager
+from .async_manager import AsyncDatabaseManager
+from .activity_writer import ActivityLogWriter
+from .entity_cache import EntityCache
+from .models import Item, Approval, Plan, Workflow, FinancialRecord, LinkedInPost
 
-__all__ = ['DatabaseManager']
+__all__ = ['DatabaseManager', 'AsyncDatabaseManager', 'ActivityLogWriter', 'EntityCache',
+           'Item', 'Approval', 'Plan', 'Workflow', 'FinancialRecord', 'LinkedInPost']
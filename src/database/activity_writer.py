@@ -0,0 +1,183 @@
+"""Write-behind queue for activity_log inserts.
+
+Callers enqueue audit entries and return immediately; a background thread
+group-commits them in batches through DatabaseManager.log_activity_many.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Markers that make the writer commit its current batch immediately
+_FLUSH = object()
+_STOP = object()
+
+
+class ActivityLogWriter:
+    """Batches activity_log inserts on a background thread.
+
+    A batch is committed once ``batch_size`` entries are queued or
+    ``flush_interval`` seconds have passed since the first queued entry,
+    whichever comes first.
+    """
+
+    OVERFLOW_POLICIES = ('block', 'drop')
+
+    def __init__(self, db_manager, batch_size: int = 100, flush_interval: float = 0.2,
+                 max_queue_size: int = 10000, overflow: str = 'block',
+                 block_timeout: Optional[float] = 5.0):
+        """Initialize and start the writer thread.
+
+        Args:
+            db_manager: DatabaseManager used for the batched inserts
+            batch_size: Maximum rows per group commit
+            flush_interval: Maximum seconds an entry waits before commit
+            max_queue_size: Bound on queued entries
+            overflow: 'block' waits for space (up to block_timeout), 'drop' discards
+            block_timeout: Seconds to wait for space under 'block'; None waits forever
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+
+        self.db = db_manager
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._stop = threading.Event()
+
+        # Producers and the writer thread both count, so updates take _stats_lock
+        self._stats_lock = threading.Lock()
+        self.stats = {'queued': 0, 'written': 0, 'failed': 0, 'dropped': 0, 'batches': 0}
+
+        self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, log_data: Dict[str, Any]) -> bool:
+        """Queue an activity entry.
+
+        Returns:
+            True if queued, False if dropped because the queue is full or closed
+        """
+        if self._stop.is_set():
+            self._count(dropped=1)
+            return False
+
+        entry = dict(log_data)
+        # Stamp now (CURRENT_TIMESTAMP format) so queueing delay doesn't skew the audit trail
+        entry.setdefault('timestamp', datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
+
+        with self._pending_cond:
+            self._pending += 1
+        try:
+            if self.overflow == 'drop':
+                self._queue.put_nowait(entry)
+            else:
+                self._queue.put(entry, timeout=self.block_timeout)
+        except queue.Full:
+            self._done(1)
+            self._count(dropped=1)
+            logger.warning("Activity log queue full - entry dropped")
+            return False
+
+        self._count(queued=1)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued entry has been written.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self._pending_cond:
+            if self._pending == 0:
+                return True
+        self._wake(_FLUSH)
+        with self._pending_cond:
+            return self._pending_cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Flush outstanding entries and stop the writer thread."""
+        if self._stop.is_set():
+            return
+        self.flush(timeout)
+        self._stop.set()
+        self._wake(_STOP)
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    @property
+    def queue_size(self) -> int:
+        """Number of entries waiting to be written."""
+        return self._queue.qsize()
+
+    def _wake(self, marker):
+        """Queue a marker so the writer stops waiting for a full batch."""
+        try:
+            self._queue.put_nowait(marker)
+        except queue.Full:
+            pass  # a full queue already yields full batches
+
+    def _count(self, **amounts: int):
+        """Add to stats counters atomically."""
+        with self._stats_lock:
+            for name, amount in amounts.items():
+                self.stats[name] += amount
+
+    def _done(self, count: int):
+        """Mark entries as handled and wake flush() waiters."""
+        with self._pending_cond:
+            self._pending -= count
+            if self._pending == 0:
+                self._pending_cond.notify_all()
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Wait for the first entry, then gather more until size or time limit."""
+        try:
+            entry = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        if entry is _FLUSH or entry is _STOP:
+            return []
+
+        batch = [entry]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is _FLUSH or entry is _STOP:
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        """Writer loop: group-commit batches until stopped and drained."""
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._collect_batch()
+            if not batch:
+                continue
+            try:
+                results = self.db.log_activity_many(batch)
+                written = sum(1 for ok in results if ok)
+                self._count(written=written, failed=len(batch) - written, batches=1)
+            except Exception as e:
+                self._count(failed=len(batch))
+                logger.error(f"Error writing activity batch: {e}")
+            finally:
+                self._done(len(batch))
@@ -0,0 +1,269 @@
+"""asyncio facade over DatabaseManager.
+
+Every public DatabaseManager method is mirrored as a coroutine, so event-loop
+code can ``await db.create_item(...)`` without stalling the loop. Reads run
+on a small thread pool; WAL lets them proceed while a write is in progress.
+Writes go to a single writer thread, which drains everything queued since its
+last commit and runs it in one transaction, so concurrent coroutines share a
+group commit instead of paying for a commit each.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+
+from .db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AsyncDatabaseManager:
+    """Coroutine API over a DatabaseManager with a writer thread and reader pool.
+
+    A write coroutine resolves once its transaction has committed, so a read
+    awaited afterwards always sees it. If a batch raises, it is rolled back
+    and its writes are replayed one transaction each, so one bad write
+    cannot fail the others.
+    """
+
+    # Methods that modify the database and go through the writer thread
+    WRITE_METHODS = frozenset({
+        'create_item', 'create_items_many', 'upsert_items', 'update_item', 'delete_item',
+        'create_approval', 'update_approval',
+        'create_plan', 'update_plan',
+        'create_workflow', 'update_workflow',
+        'create_financial_record', 'create_financial_records_many',
+        'upsert_financial_records', 'update_financial_record', 'rebuild_financial_rollups',
+        'log_activity', 'log_activity_many',
+        'create_linkedin_post', 'update_linkedin_post',
+        'index_vault',
+    })
+
+    # Writes that manage their own transactions (ATTACH, executescript) and
+    # therefore run alone on the writer thread, outside any batch
+    STANDALONE_METHODS = frozenset({'archive_activity_log', 'incremental_vacuum',
+                                    'run_maintenance', 'backup'})
+
+    # Sync-only methods with no coroutine counterpart
+    EXCLUDED_METHODS = frozenset({'transaction', 'close'})
+
+    def __init__(self, db_path: Optional[str] = None, reader_threads: int = 4,
+                 batch_size: int = 100, batch_window: float = 0.0, **db_options):
+        """Open the database and start the writer and reader threads.
+
+        Args:
+            db_path: Path to SQLite database file. Defaults to vault Database folder.
+            reader_threads: Threads serving read coroutines
+            batch_size: Maximum writes per group commit
+            batch_window: Seconds the writer waits for more writes after the
+                first one before committing (0 commits whatever is queued)
+            **db_options: Further DatabaseManager keyword arguments
+        """
+        db_options.setdefault('pool_size', reader_threads + 1)
+        self.db = DatabaseManager(db_path, **db_options)
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+
+        self._readers = ThreadPoolExecutor(max_workers=max(1, reader_threads),
+                                           thread_name_prefix='db-reader')
+        self._writes: queue.Queue = queue.Queue()
+        self._held: Optional[tuple] = None
+        self._closed = False
+
+        self.stats = {'reads': 0, 'writes': 0, 'batches': 0, 'replayed': 0}
+
+        self._writer = threading.Thread(target=self._run_writer, name='db-writer', daemon=True)
+        self._writer.start()
+
+    async def __aenter__(self) -> 'AsyncDatabaseManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # === Dispatch ===
+
+    async def _read(self, name: str, *args, **kwargs) -> Any:
+        """Run a read method on the reader pool."""
+        if self._closed:
+            raise RuntimeError("AsyncDatabaseManager is closed")
+        self.stats['reads'] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers, functools.partial(getattr(self.db, name), *args, **kwargs))
+
+    async def _write(self, func: Callable, args: tuple, kwargs: dict,
+                     standalone: bool = False) -> Any:
+        """Queue a write for the writer thread and wait for its commit."""
+        if self._closed:
+            raise RuntimeError("AsyncDatabaseManager is closed")
+        future: Future = Future()
+        self._writes.put((func, args, kwargs, future, standalone))
+        return await asyncio.wrap_future(future)
+
+    async def run_transaction(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(db, *args, **kwargs)`` on the writer thread in its own transaction.
+
+        Use this for multi-step writes that must commit together, the
+        coroutine counterpart of ``with db.transaction() as tx:``.
+        """
+        def unit_of_work(*a, **kw):
+            with self.db.transaction() as tx:
+                return func(tx, *a, **kw)
+        return await self._write(unit_of_work, args, kwargs, standalone=True)
+
+    async def _iterate(self, name: str, args: tuple, kwargs: dict) -> AsyncIterator[Any]:
+        """Stream an iter_* method, fetching one chunk per reader hop."""
+        chunk_size = kwargs.get('chunk_size', 500)
+        loop = asyncio.get_running_loop()
+        # Lazy: no query runs until the first chunk is pulled
+        rows = getattr(self.db, name)(*args, **kwargs)
+        while True:
+            chunk = await loop.run_in_executor(
+                self._readers, lambda: list(itertools.islice(rows, chunk_size)))
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+
+    # === Writer thread ===
+
+    def _next_job(self, timeout: Optional[float] = None, block: bool = True):
+        """Next queued write, honouring one held back by the previous batch."""
+        if self._held is not None:
+            job, self._held = self._held, None
+            return job
+        return self._writes.get(block, timeout)
+
+    def _collect_batch(self) -> Tuple[List[tuple], bool]:
+        """Wait for the first write, then take whatever else is ready.
+
+        Returns:
+            (jobs, stop requested)
+        """
+        job = self._next_job()
+        if job is _STOP:
+            return [], True
+        batch = [job]
+        if job[4]:
+            return batch, False
+
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    job = self._next_job(timeout=remaining)
+                else:
+                    job = self._next_job(block=False)
+            except queue.Empty:
+                break
+            if job is _STOP:
+                return batch, True
+            if job[4]:
+                # Standalone writes run on their own, after this batch
+                self._held = job
+                break
+            batch.append(job)
+        return batch, False
+
+    @staticmethod
+    def _call(job: tuple) -> Any:
+        func, args, kwargs, _, _ = job
+        return func(*args, **kwargs)
+
+    def _run_standalone(self, job: tuple):
+        future = job[3]
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self._call(job))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _run_batch(self, batch: List[tuple]):
+        """Run queued writes in one transaction, replaying singly on failure."""
+        # Writes whose coroutine was cancelled while queued are skipped
+        batch = [job for job in batch if job[3].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            with self.db.transaction():
+                results = [self._call(job) for job in batch]
+        except Exception as e:
+            logger.warning(f"Write batch of {len(batch)} rolled back, replaying singly: {e}")
+            self.stats['replayed'] += len(batch)
+            for job in batch:
+                try:
+                    with self.db.transaction():
+                        result = self._call(job)
+                except Exception as job_error:
+                    job[3].set_exception(job_error)
+                else:
+                    job[3].set_result(result)
+            return
+
+        self.stats['batches'] += 1
+        for job, result in zip(batch, results):
+            job[3].set_result(result)
+
+    def _run_writer(self):
+        """Writer loop: group-commit queued writes until stopped."""
+        while True:
+            batch, stop = self._collect_batch()
+            if batch:
+                self.stats['writes'] += len(batch)
+                if batch[0][4]:
+                    self._run_standalone(batch[0])
+                else:
+                    self._run_batch(batch)
+            if stop:
+                return
+
+    async def close(self):
+        """Finish queued writes, stop the threads and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._writes.put(_STOP)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._writer.join)
+        self._readers.shutdown(wait=True)
+        self.db.close()
+
+
+def _mirror(name: str):
+    """Build the coroutine counterpart of DatabaseManager.<name>."""
+    sync_method = getattr(DatabaseManager, name)
+
+    if name in AsyncDatabaseManager.WRITE_METHODS or name in AsyncDatabaseManager.STANDALONE_METHODS:
+        standalone = name in AsyncDatabaseManager.STANDALONE_METHODS
+
+        async def method(self, *args, **kwargs):
+            return await self._write(getattr(self.db, name), args, kwargs, standalone)
+    elif name.startswith('iter_'):
+        def method(self, *args, **kwargs):
+            return self._iterate(name, args, kwargs)
+    else:
+        async def method(self, *args, **kwargs):
+            return await self._read(name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncDatabaseManager.{name}"
+    method.__doc__ = sync_method.__doc__
+    return method
+
+
+for _name in dir(DatabaseManager):
+    if (not _name.startswith('_') and callable(getattr(DatabaseManager, _name))
+            and _name not in AsyncDatabaseManager.EXCLUDED_METHODS
+            and not hasattr(AsyncDatabaseManager, _name)):
+        setattr(AsyncDatabaseManager, _name, _mirror(_name))
@@ -0,0 +1,148 @@
+"""Online snapshots of the vault database.
+
+Snapshots are taken with the sqlite3 online backup API a few hundred pages
+at a time, so the copy never holds a lock for long and writers keep going.
+Each copy is integrity-checked, gzip-compressed next to the database under a
+UTC timestamped name, and older snapshots beyond the retention count are
+removed. DatabaseManager.backup records each run in the ``backups`` table.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Snapshot file suffix
+SNAPSHOT_SUFFIX = '.db.gz'
+
+
+class BackupRestarted(Exception):
+    """The source changed under a stepped copy too often to finish."""
+
+
+def snapshot_path(backup_dir: Path, stem: str, when: datetime) -> Path:
+    """Timestamped snapshot path that does not exist yet."""
+    base = f"{stem}_{when.strftime('%Y%m%d_%H%M%S')}"
+    taken = [_sequence(p.name[:-len(SNAPSHOT_SUFFIX)], base)
+             for p in backup_dir.glob(f"{base}*{SNAPSHOT_SUFFIX}")]
+    taken = [n for n in taken if n is not None]
+    if not taken:
+        return backup_dir / f"{base}{SNAPSHOT_SUFFIX}"
+    # Number past the highest existing one, even if older ones were rotated out
+    return backup_dir / f"{base}_{max(taken) + 1}{SNAPSHOT_SUFFIX}"
+
+
+def _sequence(name: str, base: str) -> Optional[int]:
+    """Collision number of a snapshot name for ``base`` (0 for the plain name)."""
+    if name == base:
+        return 0
+    suffix = name[len(base) + 1:]
+    return int(suffix) if name.startswith(base + '_') and suffix.isdigit() else None
+
+
+def _snapshot_key(path: Path) -> tuple:
+    """Sort key putting snapshots in time order (base, base_1, ..., base_10)."""
+    name = path.name[:-len(SNAPSHOT_SUFFIX)]
+    head, _, tail = name.rpartition('_')
+    # Plain names end in the HHMMSS time, numbered ones in a short counter
+    if tail.isdigit() and len(tail) != 6:
+        return head, int(tail)
+    return name, 0
+
+
+def list_snapshots(backup_dir: Path, stem: str) -> List[Path]:
+    """Snapshots for a database, oldest first."""
+    if not backup_dir.exists():
+        return []
+    # Names embed the timestamp, so name order is time order
+    return sorted(backup_dir.glob(f"{stem}_*{SNAPSHOT_SUFFIX}"), key=_snapshot_key)
+
+
+def copy_online(source: sqlite3.Connection, dest_path: Path, pages_per_step: int = 256,
+                sleep: float = 0.005, max_restarts: int = 3) -> int:
+    """Copy a live database to ``dest_path`` in page-sized steps.
+
+    A write from another connection restarts a stepped copy. After
+    ``max_restarts`` restarts the copy is redone in a single step, which under
+    WAL still does not block writers.
+
+    Returns:
+        Number of pages copied
+    """
+    progress = {'total': 0, 'last_remaining': None, 'restarts': 0}
+
+    def on_step(status, remaining, total):
+        last = progress['last_remaining']
+        if last is not None and remaining > last:
+            progress['restarts'] += 1
+            if progress['restarts'] > max_restarts:
+                raise BackupRestarted(f"source changed {progress['restarts']} times")
+        progress['last_remaining'] = remaining
+        progress['total'] = total
+
+    dest = sqlite3.connect(str(dest_path))
+    try:
+        try:
+            source.backup(dest, pages=pages_per_step, progress=on_step, sleep=sleep)
+        except BackupRestarted as e:
+            logger.info(f"Stepped backup restarting too often ({e}); copying in one step")
+            source.backup(dest, pages=-1)
+            progress['total'] = dest.execute("PRAGMA page_count").fetchone()[0]
+
+        result = dest.execute("PRAGMA quick_check").fetchone()[0]
+        if result != 'ok':
+            raise sqlite3.DatabaseError(f"snapshot failed quick_check: {result}")
+        return progress['total']
+    finally:
+        dest.close()
+
+
+def compress(source_path: Path, dest_path: Path):
+    """Gzip ``source_path`` to ``dest_path`` atomically (temp file + rename)."""
+    partial = dest_path.with_name(dest_path.name + '.partial')
+    with open(source_path, 'rb') as src, open(partial, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as gz:
+            shutil.copyfileobj(src, gz, 1024 * 1024)
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(partial, dest_path)
+
+
+def rotate(backup_dir: Path, stem: str, keep: int) -> List[Path]:
+    """Delete all but the newest ``keep`` snapshots.
+
+    Returns:
+        Removed snapshot paths
+    """
+    snapshots = list_snapshots(backup_dir, stem)
+    removed = snapshots[:-keep] if keep > 0 else snapshots
+    for path in removed:
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not remove old snapshot {path}: {e}")
+    return removed
+
+
+def restore(snapshot: Path, target: Path, overwrite: bool = False):
+    """Decompress a snapshot to ``target`` (which must not be open).
+
+    Raises:
+        FileExistsError: If target exists and overwrite is False
+    """
+    target = Path(target)
+    if target.exists() and not overwrite:
+        raise FileExistsError(target)
+    partial = target.with_name(target.name + '.partial')
+    with gzip.open(snapshot, 'rb') as src, open(partial, 'wb') as dest:
+        shutil.copyfileobj(src, dest, 1024 * 1024)
+    for suffix in ('-wal', '-shm'):
+        Path(f"{target}{suffix}").unlink(missing_ok=True)
+    os.replace(partial, target)
+
@@ -8,13 +8,107 @@ Silver Tier entities.
 import sqlite3
 import json
 import logging
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Tuple, Callable
+from datetime import datetime, timedelta, timezone
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+from .activity_writer import ActivityLogWriter
+from .backup import compress, copy_online, rotate, snapshot_path
+from .entity_cache import EntityCache
+from .migrations import SCHEMA_VERSION, get_schema_version, migrate, rebuild_financial_rollups
+from .models import (MODELS, Model, Item, Approval, Plan, Workflow, FinancialRecord,
+                     LinkedInPost)
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_VAULT_PATH = Path(__file__).parent.parent.parent / 'AI_Employee_Vault'
+
+
+@lru_cache(maxsize=128)
+def _build_insert_sql(table: str, columns: tuple, upsert_key: Optional[str] = None) -> str:
+    """Build (and cache) an INSERT statement for a table and column set."""
+    fields = ', '.join(columns)
+    placeholders = ', '.join('?' for _ in columns)
+    query = f"INSERT INTO {table} ({fields}) VALUES ({placeholders})"
+    if upsert_key:
+        updates = ', '.join(f"{c} = excluded.{c}" for c in columns if c != upsert_key)
+        if updates:
+            query += f" ON CONFLICT({upsert_key}) DO UPDATE SET {updates}"
+        else:
+            query += f" ON CONFLICT({upsert_key}) DO NOTHING"
+    return query
+
+
+@lru_cache(maxsize=128)
+def _build_update_sql(table: str, columns: tuple) -> str:
+    """Build (and cache) an UPDATE-by-id statement for a table and column set."""
+    set_clause = ', '.join(f"{c} = ?" for c in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query of quoted terms (trailing * = prefix)."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def _markdown_title(text: str, default: str) -> str:
+    """First level-one heading of a markdown card, skipping front matter."""
+    lines = text.splitlines()
+    if lines and lines[0].strip() == '---':
+        try:
+            lines = lines[lines.index('---', 1) + 1:]
+        except ValueError:
+            pass
+    for line in lines:
+        if line.startswith('# '):
+            return line[2:].strip()
+    return default
+
+
+# Columns shared by the live activity_log and its monthly archives
+_ACTIVITY_COLUMNS = 'id, timestamp, level, component, action, item_id, details'
+
+_ACTIVITY_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archive.activity_log (
+    id INTEGER PRIMARY KEY,
+    timestamp TIMESTAMP,
+    level TEXT,
+    component TEXT NOT NULL,
+    action TEXT NOT NULL,
+    item_id TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS archive.idx_activity_timestamp ON activity_log(timestamp);
+"""
+
+
+def _next_month(month: str) -> str:
+    """'2026-01' -> '2026-02'."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Pooled connection whose commit() is deferred inside a unit of work."""
+
+    unit_of_work = False
+
+    def commit(self):
+        if not self.unit_of_work:
+            super().commit()
+
 
 class DatabaseManager:
     """Manages SQLite database operations for AI Employee.
@@ -23,29 +117,125 @@ class DatabaseManager:
     transaction support, and error handling.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    # Default number of pooled connections per manager
+    POOL_SIZE = 5
+
+    # Pragmas applied once to every pooled connection
+    PRAGMAS = {
+        'auto_vacuum': 'INCREMENTAL', # new databases only; see run_maintenance
+        'journal_mode': 'WAL',        # readers never block on writers
+        'synchronous': 'NORMAL',      # safe with WAL, avoids fsync per commit
+        'mmap_size': 268435456,       # 256 MB memory-mapped I/O
+        'cache_size': -16000,         # ~16 MB page cache (negative = KiB)
+        'temp_store': 'MEMORY',
+    }
+
+    # Days of activity_log kept in the live database
+    ACTIVITY_RETENTION_DAYS = 90
+
+    # Snapshots kept by backup(), and pages copied per online backup step
+    BACKUP_KEEP = 7
+    BACKUP_PAGES_PER_STEP = 256
+
+    def __init__(self, db_path: Optional[str] = None, pool_size: int = POOL_SIZE,
+                 foreign_keys: bool = False, async_activity_log: bool = False,
+                 activity_log_options: Optional[Dict[str, Any]] = None,
+                 entity_cache: bool = False,
+                 entity_cache_options: Optional[Dict[str, Any]] = None):
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file. Defaults to vault Database folder.
+            pool_size: Maximum number of pooled connections kept open.
+            foreign_keys: Enforce foreign key constraints. Off by default because
+                LinkedIn approvals reference post IDs that are not in ``items``.
+            async_activity_log: Queue log_activity calls and group-commit them
+                on a background thread instead of writing synchronously.
+            activity_log_options: Keyword overrides for ActivityLogWriter
+                (batch_size, flush_interval, max_queue_size, overflow, block_timeout).
+            entity_cache: Serve repeated get_item/get_approval/get_linkedin_post
+                lookups from an in-process LRU cache.
+            entity_cache_options: Keyword overrides for EntityCache (max_size, ttl).
         """
         if db_path is None:
-            vault_path = Path(__file__).parent.parent.parent / 'AI_Employee_Vault'
-            db_path = vault_path / 'Database' / 'ai_employee.db'
+            db_path = DEFAULT_VAULT_PATH / 'Database' / 'ai_employee.db'
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-month activity_log archives live next to the database
+        self.archive_dir = self.db_path.parent / f"{self.db_path.stem}_archive"
+        # Compressed snapshots written by backup()
+        self.backup_dir = self.db_path.parent / f"{self.db_path.stem}_backups"
+
+        # Connection pool state
+        self.pool_size = max(1, pool_size)
+        self.foreign_keys = foreign_keys
+        self._pool = queue.LifoQueue(maxsize=self.pool_size)
+        self._pool_lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._local = threading.local()
 
         # Initialize tables
         self._init_database()
 
+        # Optional write-behind audit log
+        self.activity_writer: Optional[ActivityLogWriter] = None
+        if async_activity_log:
+            self.activity_writer = ActivityLogWriter(self, **(activity_log_options or {}))
+
+        # Optional read-through cache for lookups by ID
+        self.entity_cache: Optional[EntityCache] = None
+        if entity_cache:
+            self.entity_cache = EntityCache(**(entity_cache_options or {}))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply performance pragmas."""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30,
+                               factory=_PooledConnection)
+        conn.row_factory = sqlite3.Row
+        for name, value in self.PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take a connection from the pool, opening one if below the limit."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if len(self._connections) < self.pool_size:
+                conn = self._connect()
+                self._connections.append(conn)
+                return conn
+
+        # Pool exhausted - wait for another thread to release a connection
+        return self._pool.get()
+
+    def _release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, discarding uncommitted work."""
+        if conn.in_transaction:
+            conn.rollback()
+        self._pool.put(conn)
+
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper cleanup."""
+        """Borrow a pooled connection for the duration of the block.
+
+        Nested calls on the same thread reuse the connection already held,
+        so helpers can call each other without exhausting the pool.
+        """
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            conn.row_factory = sqlite3.Row
+            conn = self._acquire()
+            self._local.conn = conn
             yield conn
         except sqlite3.Error as e:
             if conn:
@@ -54,184 +244,319 @@ class DatabaseManager:
             raise
         finally:
             if conn:
-                conn.close()
+                self._local.conn = None
+                self._release(conn)
 
-    def _init_database(self):
-        """Create all required tables if they don't exist."""
-        schema = """
-        -- Items table: All processed items from all sources
-        CREATE TABLE IF NOT EXISTS items (
-            id TEXT PRIMARY KEY,
-            source TEXT NOT NULL,  -- gmail, filesystem, whatsapp, linkedin
-            type TEXT NOT NULL,    -- email, file, message, post
-            category TEXT,         -- invoice, receipt, contract, etc.
-            priority TEXT DEFAULT 'normal',  -- urgent, normal, low
-            amount REAL,
-            status TEXT DEFAULT 'pending',  -- pending, approved, rejected, done
-            file_path TEXT,
-            metadata TEXT,         -- JSON string
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            processed_at TIMESTAMP
-        );
-
-        -- Approvals table: Approval workflow tracking
-        CREATE TABLE IF NOT EXISTS approvals (
-            id TEXT PRIMARY KEY,
-            item_id TEXT NOT NULL,
-            requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            decided_at TIMESTAMP,
-            decision TEXT,  -- approved, rejected, expired
-            reason TEXT,
-            auto_decided BOOLEAN DEFAULT 0,
-            deadline TIMESTAMP,
-            reminder_sent BOOLEAN DEFAULT 0,
-            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
-        );
-
-        -- Plans table: AI-generated execution plans
-        CREATE TABLE IF NOT EXISTS plans (
-            id TEXT PRIMARY KEY,
-            title TEXT NOT NULL,
-            description TEXT,
-            complexity TEXT,  -- simple, detailed
-            status TEXT DEFAULT 'pending_approval',  -- pending_approval, active, completed
-            steps_total INTEGER DEFAULT 0,
-            steps_completed INTEGER DEFAULT 0,
-            estimated_hours REAL,
-            actual_hours REAL,
-            budget REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            started_at TIMESTAMP,
-            completed_at TIMESTAMP
-        );
-
-        -- Workflows table: Workflow execution state
-        CREATE TABLE IF NOT EXISTS workflows (
-            id TEXT PRIMARY KEY,
-            workflow_type TEXT NOT NULL,  -- invoice, receipt, research, etc.
-            item_id TEXT,
-            current_step INTEGER DEFAULT 1,
-            total_steps INTEGER DEFAULT 1,
-            status TEXT DEFAULT 'running',  -- running, paused, completed, failed
-            state_data TEXT,  -- JSON string for workflow-specific data
-            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            completed_at TIMESTAMP,
-            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
-        );
-
-        -- Financial records table: Money tracking
-        CREATE TABLE IF NOT EXISTS financial_records (
-            id TEXT PRIMARY KEY,
-            item_id TEXT,
-            record_type TEXT NOT NULL,  -- invoice, payment, receipt, expense
-            amount REAL NOT NULL,
-            currency TEXT DEFAULT 'USD',
-            vendor TEXT,
-            payee TEXT,
-            due_date TIMESTAMP,
-            payment_status TEXT DEFAULT 'pending',  -- pending, paid, overdue
-            paid_at TIMESTAMP,
-            category TEXT,
-            receipt_path TEXT,
-            tax_deductible BOOLEAN DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
-        );
-
-        -- Activity log table: Audit trail
-        CREATE TABLE IF NOT EXISTS activity_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            level TEXT DEFAULT 'INFO',  -- DEBUG, INFO, WARN, ERROR
-            component TEXT NOT NULL,    -- which skill/watcher
-            action TEXT NOT NULL,
-            item_id TEXT,
-            details TEXT,
-            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
-        );
-
-        -- LinkedIn posts table: Autonomous posting queue
-        CREATE TABLE IF NOT EXISTS linkedin_posts (
-            id TEXT PRIMARY KEY,
-            content TEXT NOT NULL,
-            media_paths TEXT,  -- JSON array of file paths
-            link_url TEXT,
-            document_path TEXT,
-            scheduled_time TIMESTAMP,
-            posted_time TIMESTAMP,
-            status TEXT DEFAULT 'pending',  -- pending, approved, posted, failed
-            importance_level TEXT DEFAULT 'normal',  -- low, normal, high, critical
-            retry_count INTEGER DEFAULT 0,
-            max_retries INTEGER DEFAULT 2,
-            error_message TEXT,
-            approval_id TEXT,  -- Link to approvals table if needed
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (approval_id) REFERENCES approvals(id) ON DELETE SET NULL
-        );
-
-        -- Create indexes for common queries
-        CREATE INDEX IF NOT EXISTS idx_items_status ON items(status);
-        CREATE INDEX IF NOT EXISTS idx_items_source ON items(source);
-        CREATE INDEX IF NOT EXISTS idx_items_category ON items(category);
-        CREATE INDEX IF NOT EXISTS idx_approvals_decision ON approvals(decision);
-        CREATE INDEX IF NOT EXISTS idx_approvals_deadline ON approvals(deadline);
-        CREATE INDEX IF NOT EXISTS idx_workflows_status ON workflows(status);
-        CREATE INDEX IF NOT EXISTS idx_financial_status ON financial_records(payment_status);
-        CREATE INDEX IF NOT EXISTS idx_financial_due_date ON financial_records(due_date);
-        CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON activity_log(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_linkedin_posts_status ON linkedin_posts(status);
-        CREATE INDEX IF NOT EXISTS idx_linkedin_posts_scheduled ON linkedin_posts(scheduled_time);
+    @contextmanager
+    def transaction(self):
+        """Run several operations as one BEGIN IMMEDIATE transaction.
+
+        The calling thread holds one pooled connection for the block, so every
+        DatabaseManager call it makes inside joins the transaction and their
+        individual commits collapse into a single commit on exit. An exception
+        rolls the whole block back and propagates. Nested blocks join the
+        outer transaction. Maintenance methods that ATTACH or run scripts
+        (archive_activity_log, incremental_vacuum, run_maintenance) must not
+        be called inside.
+
+        Example:
+            with db.transaction() as tx:
+                tx.update_approval(approval_id, {'decision': 'approved'})
+                tx.update_item(item_id, {'status': 'approved'})
+
+        Yields:
+            This manager
         """
+        with self._get_connection() as conn:
+            if conn.unit_of_work:
+                yield self
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            conn.unit_of_work = True
+            self._local.tx_invalidations = []
+            try:
+                yield self
+                conn.unit_of_work = False
+                conn.commit()
+            except BaseException:
+                conn.unit_of_work = False
+                conn.rollback()
+                raise
+            finally:
+                conn.unit_of_work = False
+                invalidations, self._local.tx_invalidations = self._local.tx_invalidations, None
+                # Rows read or written inside the block may have been cached
+                # before the outcome was known
+                for table, entity_id in invalidations:
+                    self._invalidate(table, entity_id)
+
+    def _in_transaction(self) -> bool:
+        """True while the calling thread is inside a transaction() block."""
+        return getattr(self._local, 'tx_invalidations', None) is not None
+
+    def close(self):
+        """Flush queued activity and close every pooled connection."""
+        if self.activity_writer is not None:
+            self.activity_writer.close()
+            self.activity_writer = None
+
+        with self._pool_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.error(f"Error closing connection: {e}")
+            self._connections.clear()
+            self._pool = queue.LifoQueue(maxsize=self.pool_size)
 
+    def _init_database(self):
+        """Bring the schema up to date; a no-op when it is already current."""
         with self._get_connection() as conn:
-            conn.executescript(schema)
-            conn.commit()
-            logger.info("Database initialized successfully")
+            applied = migrate(conn)
+            if applied:
+                logger.info(f"Database schema migrated to version {SCHEMA_VERSION} "
+                            f"({applied} migration(s) applied)")
 
-    # === Items Operations ===
+    def get_schema_version(self) -> int:
+        """Get the schema version recorded in PRAGMA user_version."""
+        try:
+            with self._get_connection() as conn:
+                return get_schema_version(conn)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting schema version: {e}")
+            return 0
+
+    def _insert_many(self, table: str, rows: List[Dict[str, Any]],
+                     upsert_key: Optional[str] = None) -> List[bool]:
+        """Insert many rows in one transaction using executemany.
+
+        Rows are grouped by column set so each group is a single executemany.
+        If a group hits a constraint error it is rolled back to its savepoint
+        and retried row by row, so the result reports the outcome of each row.
+
+        Args:
+            table: Target table name
+            rows: Row dictionaries (or models) to insert
+            upsert_key: Conflict column for ON CONFLICT DO UPDATE, if any
+
+        Returns:
+            List of per-row success flags in input order
+        """
+        if not rows:
+            return []
+
+        rows = [row.to_dict(skip_none=True) if isinstance(row, Model) else row for row in rows]
+        model = MODELS.get(table)
+        results = [False] * len(rows)
+        groups: Dict[tuple, List[int]] = {}
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(row.keys()), []).append(index)
+
+        if model is not None:
+            for columns in list(groups):
+                try:
+                    model.check_columns(columns)
+                except ValueError as e:
+                    logger.error(f"Bulk insert into {table} rejected "
+                                 f"{len(groups.pop(columns))} row(s): {e}")
 
-    def create_item(self, item_data: Dict[str, Any]) -> bool:
-        """Create a new item record."""
         try:
             with self._get_connection() as conn:
-                fields = ', '.join(item_data.keys())
-                placeholders = ', '.join(['?' for _ in item_data])
-                query = f"INSERT INTO items ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(item_data.values()))
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                for columns, indexes in groups.items():
+                    query = _build_insert_sql(table, columns, upsert_key)
+                    conn.execute("SAVEPOINT bulk_group")
+                    try:
+                        conn.executemany(query, [tuple(rows[i].values()) for i in indexes])
+                        for i in indexes:
+                            results[i] = True
+                    except sqlite3.Error:
+                        conn.execute("ROLLBACK TO bulk_group")
+                        for i in indexes:
+                            try:
+                                conn.execute(query, tuple(rows[i].values()))
+                                results[i] = True
+                            except sqlite3.Error as e:
+                                logger.warning(f"Bulk insert into {table} skipped row {i}: {e}")
+                    conn.execute("RELEASE bulk_group")
                 conn.commit()
-                return True
+                return results
         except sqlite3.Error as e:
-            logger.error(f"Error creating item: {e}")
-            return False
+            logger.error(f"Error bulk inserting into {table}: {e}")
+            return [False] * len(rows)
 
-    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
-        """Get item by ID."""
+    def _keyset_page(self, select: str, where: str, params: tuple,
+                     sort: Tuple[str, str], limit: int,
+                     after: Optional[Tuple[Any, str]] = None,
+                     descending: bool = True,
+                     model: Optional[type] = None) -> List[Dict[str, Any]]:
+        """Fetch one page ordered by (sort column, id) using keyset pagination.
+
+        Args:
+            select: SELECT ... FROM clause
+            where: Filter expression (without WHERE)
+            params: Parameters for the filter
+            sort: (sort column, tie-break id column) as written in the query
+            limit: Maximum rows to return
+            after: (sort value, id) of the last row of the previous page
+            descending: Newest first when True
+            model: Row model to decode into; plain dicts when None
+
+        Returns:
+            List of models (or row dictionaries)
+        """
+        clauses = [where] if where else []
+        if after is not None:
+            column, id_column = sort
+            value, last_id = after
+            op = '<' if descending else '>'
+            # SQLite sorts NULLs first ascending and last descending, and a row-value
+            # comparison against NULL is never true, so NULL sort values get their own branch
+            if value is None:
+                clause = f"({column} IS NULL AND {id_column} {op} ?)"
+                if not descending:
+                    clause = f"({clause} OR {column} IS NOT NULL)"
+                params = tuple(params) + (last_id,)
+            else:
+                clause = f"({column}, {id_column}) {op} (?, ?)"
+                if descending:
+                    clause = f"({clause} OR {column} IS NULL)"
+                params = tuple(params) + (value, last_id)
+            clauses.append(clause)
+
+        direction = 'DESC' if descending else 'ASC'
+        query = select
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {sort[0]} {direction}, {sort[1]} {direction} LIMIT ?"
+
+        with self._get_connection() as conn:
+            if model is not None:
+                return self._model_cursor(conn, model).execute(query, params + (limit,)).fetchall()
+            cursor = conn.execute(query, params + (limit,))
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _iter_keyset(fetch_page: Callable[..., List[Dict[str, Any]]], sort_key: str,
+                     chunk_size: int, after: Optional[Tuple[Any, str]] = None
+                     ) -> Iterator[Dict[str, Any]]:
+        """Stream rows page by page, holding at most one chunk in memory."""
+        while True:
+            page = fetch_page(limit=chunk_size, after=after)
+            yield from page
+            if len(page) < chunk_size:
+                return
+            last = page[-1]
+            after = (last[sort_key], last['id'])
+
+    @staticmethod
+    def _model_cursor(conn: sqlite3.Connection, model: type) -> sqlite3.Cursor:
+        """Cursor that decodes rows straight into ``model`` instances."""
+        cursor = conn.cursor()
+        cursor.row_factory = model.from_row
+        return cursor
+
+    def _fetch_by_id(self, model: type, entity_id: str, label: str) -> Optional[Model]:
+        """Fetch one row by ID as a model."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM items WHERE id = ?",
-                    (item_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
+                return self._model_cursor(conn, model).execute(
+                    f"{model.SELECT} WHERE id = ?", (entity_id,)
+                ).fetchone()
         except sqlite3.Error as e:
-            logger.error(f"Error getting item: {e}")
+            logger.error(f"Error getting {label}: {e}")
             return None
 
-    def update_item(self, item_id: str, updates: Dict[str, Any]) -> bool:
-        """Update item fields."""
+    def _read_through(self, model: type, entity_id: str, label: str) -> Optional[Model]:
+        """Fetch a row by ID, via the entity cache when enabled."""
+        cache = self.entity_cache
+        if cache is None or self._in_transaction():
+            # Uncommitted rows must not become visible to other threads
+            return self._fetch_by_id(model, entity_id, label)
+
+        cached = cache.get(model.TABLE, entity_id)
+        if cached is not None:
+            return cached
+        token = cache.token()
+        result = self._fetch_by_id(model, entity_id, label)
+        if result is not None:
+            cache.put(model.TABLE, entity_id, result, token)
+        return result
+
+    def _create(self, model: type, data: Dict[str, Any], label: str) -> bool:
+        """Insert one row after checking its columns against the model.
+
+        Args:
+            model: Row model of the target table
+            data: Column values, as a dict or a model (None fields left to defaults)
+            label: Entity name for error messages
+        """
+        if isinstance(data, Model):
+            data = data.to_dict(skip_none=True)
         try:
+            columns = model.check_columns(data)
             with self._get_connection() as conn:
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE items SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [item_id])
+                conn.execute(_build_insert_sql(model.TABLE, columns), list(data.values()))
                 conn.commit()
                 return True
-        except sqlite3.Error as e:
-            logger.error(f"Error updating item: {e}")
+        except (ValueError, sqlite3.Error) as e:
+            logger.error(f"Error creating {label}: {e}")
+            return False
+
+    def _update(self, model: type, entity_id: str, updates: Dict[str, Any], label: str) -> bool:
+        """Update columns of one row by ID after checking them against the model."""
+        try:
+            columns = model.check_columns(updates)
+            if not columns:
+                raise ValueError("no columns to update")
+            with self._get_connection() as conn:
+                conn.execute(_build_update_sql(model.TABLE, columns),
+                             list(updates.values()) + [entity_id])
+                conn.commit()
+                return True
+        except (ValueError, sqlite3.Error) as e:
+            logger.error(f"Error updating {label}: {e}")
             return False
 
+    def _invalidate(self, table: str, *entity_ids: str):
+        """Drop rows from the entity cache after a write."""
+        if self.entity_cache is not None:
+            pending = getattr(self._local, 'tx_invalidations', None)
+            for entity_id in entity_ids:
+                self.entity_cache.invalidate(table, entity_id)
+                if pending is not None:
+                    pending.append((table, entity_id))
+
+    # === Items Operations ===
+
+    def create_item(self, item_data: Dict[str, Any]) -> bool:
+        """Create a new item record."""
+        return self._create(Item, item_data, 'item')
+
+    def create_items_many(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """Create many item records in a single transaction."""
+        return self._insert_many('items', items)
+
+    def upsert_items(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """Insert items, updating the supplied fields of any existing IDs."""
+        try:
+            return self._insert_many('items', items, upsert_key='id')
+        finally:
+            self._invalidate('items', *(item.get('id') for item in items))
+
+    def get_item(self, item_id: str) -> Optional[Item]:
+        """Get item by ID."""
+        return self._read_through(Item, item_id, 'item')
+
+    def update_item(self, item_id: str, updates: Dict[str, Any]) -> bool:
+        """Update item fields."""
+        try:
+            return self._update(Item, item_id, updates, 'item')
+        finally:
+            self._invalidate('items', item_id)
+
     def delete_item(self, item_id: str) -> bool:
         """Delete item by ID."""
         try:
@@ -242,75 +567,129 @@ class DatabaseManager:
         except sqlite3.Error as e:
             logger.error(f"Error deleting item: {e}")
             return False
+        finally:
+            self._invalidate('items', item_id)
 
-    def get_items_by_source(self, source: str) -> List[Dict[str, Any]]:
+    def get_items_by_source(self, source: str) -> List[Item]:
         """Get all items from a specific source."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM items WHERE source = ? ORDER BY created_at DESC",
+                cursor = self._model_cursor(conn, Item).execute(
+                    f"{Item.SELECT} WHERE source = ? ORDER BY created_at DESC",
                     (source,)
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting items by source: {e}")
             return []
 
-    def get_items_by_status(self, status: str) -> List[Dict[str, Any]]:
+    def get_items_by_status(self, status: str) -> List[Item]:
         """Get all items with a specific status."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM items WHERE status = ? ORDER BY created_at DESC",
+                cursor = self._model_cursor(conn, Item).execute(
+                    f"{Item.SELECT} WHERE status = ? ORDER BY created_at DESC",
                     (status,)
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting items by status: {e}")
             return []
 
-    # === Approvals Operations ===
+    def get_items_by_source_page(self, source: str, limit: int = 100,
+                                 after: Optional[Tuple[str, str]] = None) -> List[Item]:
+        """Get one page of items from a source, newest first.
 
-    def create_approval(self, approval_data: Dict[str, Any]) -> bool:
-        """Create a new approval record."""
+        Args:
+            source: Item source
+            limit: Page size
+            after: (created_at, id) of the last item on the previous page
+        """
         try:
-            with self._get_connection() as conn:
-                fields = ', '.join(approval_data.keys())
-                placeholders = ', '.join(['?' for _ in approval_data])
-                query = f"INSERT INTO approvals ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(approval_data.values()))
-                conn.commit()
-                return True
+            return self._keyset_page(Item.SELECT, "source = ?", (source,),
+                                     ('created_at', 'id'), limit, after,
+                                     model=Item)
         except sqlite3.Error as e:
-            logger.error(f"Error creating approval: {e}")
-            return False
+            logger.error(f"Error getting items page by source: {e}")
+            return []
 
-    def get_approval(self, approval_id: str) -> Optional[Dict[str, Any]]:
-        """Get approval by ID."""
+    def get_items_by_status_page(self, status: str, limit: int = 100,
+                                 after: Optional[Tuple[str, str]] = None) -> List[Item]:
+        """Get one page of items with a status, newest first."""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM approvals WHERE id = ?",
-                    (approval_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
+            return self._keyset_page(Item.SELECT, "status = ?", (status,),
+                                     ('created_at', 'id'), limit, after,
+                                     model=Item)
         except sqlite3.Error as e:
-            logger.error(f"Error getting approval: {e}")
-            return None
+            logger.error(f"Error getting items page by status: {e}")
+            return []
+
+    def iter_items_by_source(self, source: str, chunk_size: int = 500,
+                             after: Optional[Tuple[str, str]] = None) -> Iterator[Item]:
+        """Stream items from a source, newest first, in chunks."""
+        return self._iter_keyset(
+            lambda limit, after: self.get_items_by_source_page(source, limit, after),
+            'created_at', chunk_size, after)
+
+    def iter_items_by_status(self, status: str, chunk_size: int = 500,
+                             after: Optional[Tuple[str, str]] = None) -> Iterator[Item]:
+        """Stream items with a status, newest first, in chunks."""
+        return self._iter_keyset(
+            lambda limit, after: self.get_items_by_status_page(status, limit, after),
+            'created_at', chunk_size, after)
+
+    def get_items_by_sender(self, sender: str, limit: int = 100,
+                            after: Optional[Tuple[str, str]] = None) -> List[Item]:
+        """Get one page of items whose metadata names this sender, newest first.
+
+        Args:
+            sender: Value of ``metadata.sender``
+            limit: Page size
+            after: (created_at, id) of the last item on the previous page
+        """
+        try:
+            return self._keyset_page(Item.SELECT, "sender = ?", (sender,),
+                                     ('created_at', 'id'), limit, after, model=Item)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting items by sender: {e}")
+            return []
+
+    def get_items_by_vendor(self, vendor: str, limit: int = 100,
+                            after: Optional[Tuple[str, str]] = None) -> List[Item]:
+        """Get one page of items whose metadata names this vendor, newest first."""
+        try:
+            return self._keyset_page(Item.SELECT, "vendor = ?", (vendor,),
+                                     ('created_at', 'id'), limit, after, model=Item)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting items by vendor: {e}")
+            return []
+
+    def get_items_by_chat_type(self, chat_type: str, limit: int = 100,
+                               after: Optional[Tuple[str, str]] = None) -> List[Item]:
+        """Get one page of items with this ``metadata.chat_type``, newest first."""
+        try:
+            return self._keyset_page(Item.SELECT, "chat_type = ?", (chat_type,),
+                                     ('created_at', 'id'), limit, after, model=Item)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting items by chat type: {e}")
+            return []
+
+    # === Approvals Operations ===
+
+    def create_approval(self, approval_data: Dict[str, Any]) -> bool:
+        """Create a new approval record."""
+        return self._create(Approval, approval_data, 'approval')
+
+    def get_approval(self, approval_id: str) -> Optional[Approval]:
+        """Get approval by ID."""
+        return self._read_through(Approval, approval_id, 'approval')
 
     def update_approval(self, approval_id: str, updates: Dict[str, Any]) -> bool:
         """Update approval fields."""
         try:
-            with self._get_connection() as conn:
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE approvals SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [approval_id])
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error updating approval: {e}")
-            return False
+            return self._update(Approval, approval_id, updates, 'approval')
+        finally:
+            self._invalidate('approvals', approval_id)
 
     def get_pending_approvals(self) -> List[Dict[str, Any]]:
         """Get all pending approvals with item details."""
@@ -328,6 +707,30 @@ class DatabaseManager:
             logger.error(f"Error getting pending approvals: {e}")
             return []
 
+    def get_pending_approvals_page(self, limit: int = 100,
+                                   after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        """Get one page of pending approvals, earliest deadline first.
+
+        Args:
+            limit: Page size
+            after: (deadline, id) of the last approval on the previous page
+        """
+        try:
+            return self._keyset_page(
+                """SELECT a.*, i.source, i.type, i.category, i.amount, i.file_path
+                   FROM approvals a
+                   JOIN items i ON a.item_id = i.id""",
+                "a.decision IS NULL", (), ('a.deadline', 'a.id'), limit, after,
+                descending=False)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting pending approvals page: {e}")
+            return []
+
+    def iter_pending_approvals(self, chunk_size: int = 500,
+                               after: Optional[Tuple[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream pending approvals, earliest deadline first, in chunks."""
+        return self._iter_keyset(self.get_pending_approvals_page, 'deadline', chunk_size, after)
+
     def get_overdue_approvals(self) -> List[Dict[str, Any]]:
         """Get approvals past their deadline."""
         try:
@@ -349,53 +752,24 @@ class DatabaseManager:
 
     def create_plan(self, plan_data: Dict[str, Any]) -> bool:
         """Create a new plan record."""
-        try:
-            with self._get_connection() as conn:
-                fields = ', '.join(plan_data.keys())
-                placeholders = ', '.join(['?' for _ in plan_data])
-                query = f"INSERT INTO plans ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(plan_data.values()))
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error creating plan: {e}")
-            return False
+        return self._create(Plan, plan_data, 'plan')
 
-    def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
+    def get_plan(self, plan_id: str) -> Optional[Plan]:
         """Get plan by ID."""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM plans WHERE id = ?",
-                    (plan_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
-        except sqlite3.Error as e:
-            logger.error(f"Error getting plan: {e}")
-            return None
+        return self._fetch_by_id(Plan, plan_id, 'plan')
 
     def update_plan(self, plan_id: str, updates: Dict[str, Any]) -> bool:
         """Update plan fields."""
-        try:
-            with self._get_connection() as conn:
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE plans SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [plan_id])
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error updating plan: {e}")
-            return False
+        return self._update(Plan, plan_id, updates, 'plan')
 
-    def get_active_plans(self) -> List[Dict[str, Any]]:
+    def get_active_plans(self) -> List[Plan]:
         """Get all active plans."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM plans WHERE status = 'active' ORDER BY started_at DESC"
+                cursor = self._model_cursor(conn, Plan).execute(
+                    f"{Plan.SELECT} WHERE status = 'active' ORDER BY started_at DESC"
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting active plans: {e}")
             return []
@@ -404,175 +778,168 @@ class DatabaseManager:
 
     def create_workflow(self, workflow_data: Dict[str, Any]) -> bool:
         """Create a new workflow record."""
-        try:
-            with self._get_connection() as conn:
-                fields = ', '.join(workflow_data.keys())
-                placeholders = ', '.join(['?' for _ in workflow_data])
-                query = f"INSERT INTO workflows ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(workflow_data.values()))
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error creating workflow: {e}")
-            return False
+        return self._create(Workflow, workflow_data, 'workflow')
 
-    def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+    def get_workflow(self, workflow_id: str) -> Optional[Workflow]:
         """Get workflow by ID."""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM workflows WHERE id = ?",
-                    (workflow_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
-        except sqlite3.Error as e:
-            logger.error(f"Error getting workflow: {e}")
-            return None
+        return self._fetch_by_id(Workflow, workflow_id, 'workflow')
 
     def update_workflow(self, workflow_id: str, updates: Dict[str, Any]) -> bool:
         """Update workflow fields."""
+        return self._update(Workflow, workflow_id, updates, 'workflow')
+
+    def get_active_workflows(self) -> List[Workflow]:
+        """Get all active workflows."""
         try:
             with self._get_connection() as conn:
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE workflows SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [workflow_id])
-                conn.commit()
-                return True
+                cursor = self._model_cursor(conn, Workflow).execute(
+                    f"{Workflow.SELECT} WHERE status IN ('running', 'paused') ORDER BY started_at DESC"
+                )
+                return cursor.fetchall()
         except sqlite3.Error as e:
-            logger.error(f"Error updating workflow: {e}")
-            return False
+            logger.error(f"Error getting active workflows: {e}")
+            return []
 
-    def get_active_workflows(self) -> List[Dict[str, Any]]:
-        """Get all active workflows."""
+    def get_workflows_by_pause_reason(self, reason: str) -> List[Workflow]:
+        """Get workflows whose ``state_data.pause_reason`` matches, newest first."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM workflows WHERE status IN ('running', 'paused') ORDER BY started_at DESC"
+                cursor = self._model_cursor(conn, Workflow).execute(
+                    f"{Workflow.SELECT} WHERE pause_reason = ? ORDER BY started_at DESC",
+                    (reason,)
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
-            logger.error(f"Error getting active workflows: {e}")
+            logger.error(f"Error getting workflows by pause reason: {e}")
             return []
 
     # === Financial Records Operations ===
 
     def create_financial_record(self, record_data: Dict[str, Any]) -> bool:
         """Create a new financial record."""
-        try:
-            with self._get_connection() as conn:
-                fields = ', '.join(record_data.keys())
-                placeholders = ', '.join(['?' for _ in record_data])
-                query = f"INSERT INTO financial_records ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(record_data.values()))
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error creating financial record: {e}")
-            return False
+        return self._create(FinancialRecord, record_data, 'financial record')
+
+    def create_financial_records_many(self, records: List[Dict[str, Any]]) -> List[bool]:
+        """Create many financial records in a single transaction."""
+        return self._insert_many('financial_records', records)
 
-    def get_financial_record(self, record_id: str) -> Optional[Dict[str, Any]]:
+    def upsert_financial_records(self, records: List[Dict[str, Any]]) -> List[bool]:
+        """Insert financial records, updating any existing IDs."""
+        return self._insert_many('financial_records', records, upsert_key='id')
+
+    def get_financial_record(self, record_id: str) -> Optional[FinancialRecord]:
         """Get financial record by ID."""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM financial_records WHERE id = ?",
-                    (record_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
-        except sqlite3.Error as e:
-            logger.error(f"Error getting financial record: {e}")
-            return None
+        return self._fetch_by_id(FinancialRecord, record_id, 'financial record')
 
     def update_financial_record(self, record_id: str, updates: Dict[str, Any]) -> bool:
         """Update financial record fields."""
-        try:
-            with self._get_connection() as conn:
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE financial_records SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [record_id])
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error updating financial record: {e}")
-            return False
+        return self._update(FinancialRecord, record_id, updates, 'financial record')
 
-    def get_pending_invoices(self) -> List[Dict[str, Any]]:
+    def get_pending_invoices(self) -> List[FinancialRecord]:
         """Get all pending invoices."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM financial_records
+                cursor = self._model_cursor(conn, FinancialRecord).execute(f"""
+                    {FinancialRecord.SELECT}
                     WHERE record_type = 'invoice' AND payment_status = 'pending'
                     ORDER BY due_date ASC
                 """)
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting pending invoices: {e}")
             return []
 
-    def get_overdue_invoices(self) -> List[Dict[str, Any]]:
+    def get_overdue_invoices(self) -> List[FinancialRecord]:
         """Get overdue invoices."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM financial_records
+                cursor = self._model_cursor(conn, FinancialRecord).execute(f"""
+                    {FinancialRecord.SELECT}
                     WHERE record_type = 'invoice'
                     AND payment_status = 'pending'
                     AND due_date < date('now')
                     ORDER BY due_date ASC
                 """)
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting overdue invoices: {e}")
             return []
 
     def get_financial_summary(self) -> Dict[str, Any]:
-        """Get financial summary for dashboard."""
+        """Get financial summary for dashboard.
+
+        Reads the trigger-maintained financial_rollups table, so the cost is
+        a few index lookups regardless of how many records exist.
+        """
         try:
             with self._get_connection() as conn:
-                # Pending invoices
-                cursor = conn.execute("""
-                    SELECT COUNT(*), COALESCE(SUM(amount), 0)
-                    FROM financial_records
-                    WHERE record_type = 'invoice' AND payment_status = 'pending'
-                """)
-                pending_count, pending_amount = cursor.fetchone()
-
-                # Paid this month
-                cursor = conn.execute("""
-                    SELECT COUNT(*), COALESCE(SUM(amount), 0)
-                    FROM financial_records
-                    WHERE record_type = 'invoice' AND payment_status = 'paid'
-                    AND strftime('%Y-%m', paid_at) = strftime('%Y-%m', 'now')
-                """)
-                paid_count, paid_amount = cursor.fetchone()
-
-                # Expenses this month
-                cursor = conn.execute("""
-                    SELECT COALESCE(SUM(amount), 0)
-                    FROM financial_records
-                    WHERE record_type = 'expense'
-                    AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
-                """)
-                expenses = cursor.fetchone()[0]
-
-                return {
-                    'pending_invoices_count': pending_count,
-                    'pending_invoices_amount': pending_amount,
-                    'paid_this_month_count': paid_count,
-                    'paid_this_month_amount': paid_amount,
-                    'expenses_this_month': expenses
-                }
+                return self._financial_summary(conn)
         except sqlite3.Error as e:
             logger.error(f"Error getting financial summary: {e}")
             return {}
 
+    @staticmethod
+    def _financial_summary(conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Invoice and expense totals from one grouped read of financial_rollups."""
+        cursor = conn.execute("""
+            SELECT record_type, payment_status, month = strftime('%Y-%m', 'now'),
+                   SUM(record_count), SUM(total_amount)
+            FROM financial_rollups
+            WHERE record_type IN ('invoice', 'expense')
+            GROUP BY record_type, payment_status, month
+        """)
+        summary = {
+            'pending_invoices_count': 0,
+            'pending_invoices_amount': 0,
+            'paid_this_month_count': 0,
+            'paid_this_month_amount': 0,
+            'expenses_this_month': 0
+        }
+        for record_type, status, this_month, count, amount in cursor:
+            if record_type == 'invoice' and status == 'pending':
+                # Pending invoices (every month)
+                summary['pending_invoices_count'] += count
+                summary['pending_invoices_amount'] += amount
+            elif not this_month:
+                continue
+            elif record_type == 'invoice' and status == 'paid':
+                # Paid this month (rolled up by paid_at month)
+                summary['paid_this_month_count'] += count
+                summary['paid_this_month_amount'] += amount
+            elif record_type == 'expense':
+                # Expenses this month (rolled up by created_at month)
+                summary['expenses_this_month'] += amount
+        return summary
+
+    def rebuild_financial_rollups(self) -> bool:
+        """Recompute financial_rollups from financial_records.
+
+        The triggers keep the rollups current; this is for backfills, bulk
+        loads with triggers dropped, or repairing drift.
+        """
+        try:
+            with self._get_connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                rebuild_financial_rollups(conn)
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.error(f"Error rebuilding financial rollups: {e}")
+            return False
+
     # === Activity Log Operations ===
 
     def log_activity(self, log_data: Dict[str, Any]) -> bool:
-        """Log an activity."""
+        """Log an activity.
+
+        With ``async_activity_log`` enabled the entry is queued for the
+        background writer and True means it was accepted, not yet committed.
+        Inside transaction() the entry is always written with the transaction.
+        """
+        if self.activity_writer is not None and not self._in_transaction():
+            return self.activity_writer.submit(log_data)
+
         try:
             with self._get_connection() as conn:
                 fields = ', '.join(log_data.keys())
@@ -585,8 +952,26 @@ class DatabaseManager:
             logger.error(f"Error logging activity: {e}")
             return False
 
+    def log_activity_many(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """Log many activities in a single transaction."""
+        return self._insert_many('activity_log', entries)
+
+    def flush_activity_log(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued activity entries are committed.
+
+        Returns False straight away inside transaction(): the writer would
+        wait on the write lock the calling thread holds.
+        """
+        if self.activity_writer is None:
+            return True
+        if self._in_transaction():
+            return False
+        return self.activity_writer.flush(timeout)
+
     def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent activity log entries."""
+        # Read-your-writes for queued audit entries
+        self.flush_activity_log()
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
@@ -598,8 +983,469 @@ class DatabaseManager:
             logger.error(f"Error getting recent activity: {e}")
             return []
 
+    def query_activity(self, start: Optional[str] = None, end: Optional[str] = None,
+                       component: Optional[str] = None, level: Optional[str] = None,
+                       limit: int = 100) -> List[Dict[str, Any]]:
+        """Query activity entries across the live table and monthly archives.
+
+        Args:
+            start: Earliest timestamp (inclusive), e.g. '2026-01-01'
+            end: Latest timestamp (exclusive)
+            component: Only entries from this component
+            level: Only entries at this level
+            limit: Maximum entries returned
+
+        Returns:
+            Entries newest first; archived months are read only when the live
+            table can't fill the limit
+        """
+        self.flush_activity_log()
+        clauses, params = [], []
+        for clause, value in (("timestamp >= ?", start), ("timestamp < ?", end),
+                              ("component = ?", component), ("level = ?", level)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        query = (f"SELECT {_ACTIVITY_COLUMNS} FROM activity_log {where} "
+                 f"ORDER BY timestamp DESC LIMIT ?")
+
+        try:
+            with self._get_connection() as conn:
+                entries = [dict(row) for row in conn.execute(query, params + [limit])]
+        except sqlite3.Error as e:
+            logger.error(f"Error querying activity: {e}")
+            return []
+
+        for month, path in sorted(self._activity_archives().items(), reverse=True):
+            if start is not None and _next_month(month) <= start[:7]:
+                break
+            if end is not None and month > end[:7]:
+                continue
+            # Archived months are disjoint, so stop once they can't add newer rows
+            if len(entries) >= limit and entries[limit - 1]['timestamp'] >= _next_month(month):
+                break
+            try:
+                archive = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                archive.row_factory = sqlite3.Row
+                try:
+                    entries.extend(dict(row) for row in archive.execute(query, params + [limit]))
+                finally:
+                    archive.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading activity archive {path.name}: {e}")
+            entries.sort(key=lambda entry: entry['timestamp'] or '', reverse=True)
+            del entries[limit:]
+
+        return entries
+
+    def archive_activity_log(self, retention_days: Optional[int] = None) -> Dict[str, Any]:
+        """Move activity entries older than the retention window to monthly archives.
+
+        Each month goes to ``<db>_archive/activity_log_YYYY-MM.db``. A month is
+        copied and deleted in one transaction; the copy ignores IDs already
+        archived, so a crash between the two databases' commits is repaired
+        by the next run.
+
+        Args:
+            retention_days: Days kept live (default ACTIVITY_RETENTION_DAYS)
+
+        Returns:
+            rows_archived and the months written ({} on error)
+        """
+        if retention_days is None:
+            retention_days = self.ACTIVITY_RETENTION_DAYS
+        self.flush_activity_log()
+        result = {'rows_archived': 0, 'months': []}
+        try:
+            with self._get_connection() as conn:
+                # CURRENT_TIMESTAMP format (UTC) so string comparison orders correctly
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)
+                          ).strftime('%Y-%m-%d %H:%M:%S')
+                lower = ''
+                while True:
+                    # Jump straight to the next month that has expired rows
+                    oldest = conn.execute(
+                        "SELECT MIN(timestamp) FROM activity_log WHERE timestamp >= ? AND timestamp < ?",
+                        (lower, cutoff)
+                    ).fetchone()[0]
+                    if oldest is None:
+                        return result
+
+                    month = oldest[:7]
+                    lower = min(f"{_next_month(month)}-01", cutoff)
+                    self.archive_dir.mkdir(parents=True, exist_ok=True)
+                    result['rows_archived'] += self._archive_month(conn, month, f"{month}-01", lower)
+                    result['months'].append(month)
+        except sqlite3.Error as e:
+            logger.error(f"Error archiving activity log: {e}")
+            return {}
+
+    def _archive_month(self, conn: sqlite3.Connection, month: str, lower: str, upper: str) -> int:
+        """Copy one month's range into its archive file and delete it from the live table."""
+        path = self.archive_dir / f"activity_log_{month}.db"
+        conn.execute("ATTACH DATABASE ? AS archive", (str(path),))
+        try:
+            conn.executescript(_ACTIVITY_ARCHIVE_SCHEMA)
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                f"INSERT OR IGNORE INTO archive.activity_log ({_ACTIVITY_COLUMNS}) "
+                f"SELECT {_ACTIVITY_COLUMNS} FROM main.activity_log "
+                f"WHERE timestamp >= ? AND timestamp < ?",
+                (lower, upper)
+            )
+            moved = conn.execute(
+                "DELETE FROM main.activity_log WHERE timestamp >= ? AND timestamp < ?",
+                (lower, upper)
+            ).rowcount
+            conn.commit()
+            return moved
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("DETACH DATABASE archive")
+
+    def _activity_archives(self) -> Dict[str, Path]:
+        """Archive files by month ('YYYY-MM')."""
+        if not self.archive_dir.is_dir():
+            return {}
+        return {path.stem[len('activity_log_'):]: path
+                for path in self.archive_dir.glob('activity_log_*.db')}
+
+    # === Full-Text Search ===
+
+    # Vault content that is generated or not a card
+    SEARCH_EXCLUDED_FOLDERS = ('Logs', 'Database')
+    SEARCH_EXCLUDED_FILES = ('Dashboard.md',)
+
+    def index_vault(self, vault_path: Optional[str] = None,
+                    paths: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Bring the vault full-text index up to date.
+
+        Only markdown files whose mtime or size changed since they were last
+        indexed are read; files that disappeared are dropped from the index.
+
+        Args:
+            vault_path: Vault root. Defaults to the project vault.
+            paths: Only check these files (e.g. cards just written). By
+                default the whole vault is checked.
+
+        Returns:
+            Counts of indexed, removed and unchanged files ({} on error)
+        """
+        root = Path(vault_path) if vault_path else DEFAULT_VAULT_PATH
+        stats = {'indexed': 0, 'removed': 0, 'unchanged': 0}
+        try:
+            with self._get_connection() as conn:
+                if paths is None:
+                    candidates = self._walk_vault_markdown(root)
+                    known = {row['path']: row for row in conn.execute(
+                        "SELECT id, path, mtime, size FROM vault_documents")}
+                else:
+                    candidates, known = [], {}
+                    for path in paths:
+                        rel = self._vault_relative(root, Path(path))
+                        if rel is None:
+                            continue
+                        row = conn.execute(
+                            "SELECT id, path, mtime, size FROM vault_documents WHERE path = ?",
+                            (rel,)
+                        ).fetchone()
+                        if row:
+                            known[rel] = row
+                        file_path = root / rel
+                        if file_path.is_file():
+                            candidates.append((rel, file_path, file_path.stat()))
+
+                for rel, file_path, st in candidates:
+                    row = known.pop(rel, None)
+                    if row and row['mtime'] == st.st_mtime and row['size'] == st.st_size:
+                        stats['unchanged'] += 1
+                        continue
+                    try:
+                        text = file_path.read_text(encoding='utf-8', errors='replace')
+                    except OSError as e:
+                        logger.warning(f"Skipping unreadable vault file {rel}: {e}")
+                        continue
+
+                    title = _markdown_title(text, file_path.stem)
+                    if row:
+                        doc_id = row['id']
+                        conn.execute(
+                            "UPDATE vault_documents SET title = ?, mtime = ?, size = ?, "
+                            "indexed_at = CURRENT_TIMESTAMP WHERE id = ?",
+                            (title, st.st_mtime, st.st_size, doc_id)
+                        )
+                        conn.execute("DELETE FROM vault_fts WHERE rowid = ?", (doc_id,))
+                    else:
+                        doc_id = conn.execute(
+                            "INSERT INTO vault_documents (path, folder, title, mtime, size) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            (rel, rel.split('/')[0] if '/' in rel else '', title,
+                             st.st_mtime, st.st_size)
+                        ).lastrowid
+                    conn.execute(
+                        "INSERT INTO vault_fts (rowid, title, body) VALUES (?, ?, ?)",
+                        (doc_id, title, text)
+                    )
+                    stats['indexed'] += 1
+
+                # Whatever is still known was not found on disk
+                for row in known.values():
+                    conn.execute("DELETE FROM vault_fts WHERE rowid = ?", (row['id'],))
+                    conn.execute("DELETE FROM vault_documents WHERE id = ?", (row['id'],))
+                    stats['removed'] += 1
+
+                conn.commit()
+                return stats
+        except sqlite3.Error as e:
+            logger.error(f"Error indexing vault: {e}")
+            return {}
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Full-text search over items and indexed vault markdown.
+
+        Every term must match; a trailing ``*`` matches a prefix. Call
+        index_vault() first to pick up cards written since the last index.
+
+        Returns:
+            Hits ordered by relevance, each with kind ('item' or 'vault'),
+            ref (item ID or vault path), title, snippet and rank
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT 'item' AS kind, id AS ref,
+                           COALESCE(file_path, category, id) AS title,
+                           snippet(items_fts, -1, '[', ']', '...', 12) AS snippet,
+                           rank
+                    FROM items_fts
+                    WHERE items_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, (match, limit))
+                hits = [dict(row) for row in cursor.fetchall()]
+
+                cursor = conn.execute("""
+                    SELECT 'vault' AS kind, d.path AS ref, d.title AS title,
+                           snippet(vault_fts, 1, '[', ']', '...', 12) AS snippet,
+                           vault_fts.rank AS rank
+                    FROM vault_fts
+                    JOIN vault_documents d ON d.id = vault_fts.rowid
+                    WHERE vault_fts MATCH ?
+                    ORDER BY vault_fts.rank
+                    LIMIT ?
+                """, (match, limit))
+                hits.extend(dict(row) for row in cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Error searching: {e}")
+            return []
+
+        hits.sort(key=lambda hit: hit['rank'])
+        return hits[:limit]
+
+    def _walk_vault_markdown(self, root: Path) -> Iterator[Tuple[str, Path, os.stat_result]]:
+        """Yield (relative path, path, stat) for every indexable markdown card."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            at_root = Path(dirpath) == root
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith('.') and not (at_root and d in self.SEARCH_EXCLUDED_FOLDERS)
+            ]
+            for name in filenames:
+                if not name.endswith('.md') or (at_root and name in self.SEARCH_EXCLUDED_FILES):
+                    continue
+                file_path = Path(dirpath) / name
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                yield file_path.relative_to(root).as_posix(), file_path, st
+
+    def _vault_relative(self, root: Path, path: Path) -> Optional[str]:
+        """Vault-relative POSIX path of an indexable card, or None."""
+        try:
+            rel = path.resolve().relative_to(root.resolve())
+        except ValueError:
+            return None
+        parts = rel.parts
+        if (not parts or rel.suffix != '.md' or any(p.startswith('.') for p in parts)
+                or (len(parts) > 1 and parts[0] in self.SEARCH_EXCLUDED_FOLDERS)
+                or (len(parts) == 1 and parts[0] in self.SEARCH_EXCLUDED_FILES)):
+            return None
+        return rel.as_posix()
+
     # === Utility Methods ===
 
+    def incremental_vacuum(self, max_pages: Optional[int] = None) -> int:
+        """Return free pages to the filesystem.
+
+        Only effective once the database uses auto_vacuum=INCREMENTAL (new
+        databases do; run_maintenance converts older ones).
+
+        Args:
+            max_pages: Upper bound on pages released; None releases all
+
+        Returns:
+            Number of pages released
+        """
+        try:
+            with self._get_connection() as conn:
+                before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                # executescript steps the pragma to completion
+                pages = f"({int(max_pages)})" if max_pages is not None else ''
+                conn.executescript(f"PRAGMA incremental_vacuum{pages};")
+                after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                return before - after
+        except sqlite3.Error as e:
+            logger.error(f"Error running incremental vacuum: {e}")
+            return 0
+
+    def run_maintenance(self, retention_days: Optional[int] = None,
+                        vacuum_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Scheduled maintenance: archive old activity, reclaim pages, optimize.
+
+        The first run on a database created before auto_vacuum=INCREMENTAL
+        performs a one-off VACUUM to switch it over.
+
+        Returns:
+            Metrics: rows_archived, archive_months, pages_freed, vacuum_converted,
+            size_before, size_after (bytes incl. WAL) and duration_ms ({} on error)
+        """
+        start = time.perf_counter()
+        size_before = self._database_size()
+        metrics: Dict[str, Any] = {'vacuum_converted': False}
+        try:
+            with self._get_connection() as conn:
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                    metrics['vacuum_converted'] = True
+
+            archived = self.archive_activity_log(retention_days)
+            if not archived:
+                return {}
+            metrics['rows_archived'] = archived['rows_archived']
+            metrics['archive_months'] = archived['months']
+            metrics['pages_freed'] = self.incremental_vacuum(vacuum_pages)
+
+            with self._get_connection() as conn:
+                conn.execute("PRAGMA optimize")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.error(f"Error running maintenance: {e}")
+            return {}
+
+        metrics['size_before'] = size_before
+        metrics['size_after'] = self._database_size()
+        metrics['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Database maintenance: {metrics}")
+        self.log_activity({
+            'level': 'INFO',
+            'component': 'db-maintenance',
+            'action': 'Maintenance completed',
+            'details': json.dumps(metrics)
+        })
+        return metrics
+
+    def backup(self, keep: Optional[int] = None, pages_per_step: Optional[int] = None,
+               backup_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Write a compressed snapshot of the live database and rotate old ones.
+
+        The copy uses the online backup API in ``pages_per_step`` steps, so
+        writers are only paused between steps (not at all under WAL). Every
+        run, successful or not, is recorded in the ``backups`` table. Must not
+        be called inside transaction().
+
+        Args:
+            keep: Snapshots to keep (default BACKUP_KEEP)
+            pages_per_step: Pages copied per step (default BACKUP_PAGES_PER_STEP)
+            backup_dir: Snapshot folder (default ``<db stem>_backups`` next to the database)
+
+        Returns:
+            path, started_at, finished_at (UTC), duration_ms, size_bytes, pages and
+            removed (rotated-out snapshot paths); {} on error
+        """
+        keep = self.BACKUP_KEEP if keep is None else keep
+        backup_dir = Path(backup_dir) if backup_dir else self.backup_dir
+        started = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        snapshot = snapshot_path(backup_dir, self.db_path.stem, started)
+        scratch = snapshot.with_name(snapshot.name + '.tmp')
+
+        result: Dict[str, Any] = {'started_at': started.strftime('%Y-%m-%d %H:%M:%S')}
+        try:
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            with self._get_connection() as conn:
+                result['pages'] = copy_online(
+                    conn, scratch, pages_per_step or self.BACKUP_PAGES_PER_STEP)
+            compress(scratch, snapshot)
+            result['removed'] = [str(p) for p in rotate(backup_dir, self.db_path.stem, keep)]
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error backing up database: {e}")
+            result.update(status='failed', error=str(e))
+        else:
+            result.update(status='ok', path=str(snapshot),
+                          size_bytes=snapshot.stat().st_size)
+        finally:
+            try:
+                scratch.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        result['finished_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        result['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        if not self._record_backup(result) or result['status'] != 'ok':
+            return {}
+
+        logger.info(f"Database backup: {result['path']} ({result['duration_ms']} ms)")
+        self.log_activity({
+            'level': 'INFO',
+            'component': 'db-backup',
+            'action': 'Backup completed',
+            'details': json.dumps({k: result[k] for k in ('path', 'duration_ms', 'size_bytes')})
+        })
+        return result
+
+    def _record_backup(self, result: Dict[str, Any]) -> bool:
+        """Append a backup run to the backups table."""
+        columns = ('started_at', 'finished_at', 'duration_ms', 'path', 'size_bytes',
+                   'pages', 'status', 'error')
+        try:
+            with self._get_connection() as conn:
+                conn.execute(_build_insert_sql('backups', columns),
+                             [result.get(c) for c in columns])
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.error(f"Error recording backup: {e}")
+            return False
+
+    def get_last_backup(self) -> Optional[Dict[str, Any]]:
+        """Most recent successful backup run, or None if there has been none."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT * FROM backups WHERE status = 'ok' ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+                return dict(row) if row else None
+        except sqlite3.Error as e:
+            logger.error(f"Error getting last backup: {e}")
+            return None
+
+    def _database_size(self) -> int:
+        """Bytes used by the database file and its WAL."""
+        total = 0
+        for suffix in ('', '-wal'):
+            path = Path(f"{self.db_path}{suffix}")
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
     def get_tables(self) -> List[str]:
         """Get list of all tables in database."""
         try:
@@ -614,6 +1460,7 @@ class DatabaseManager:
 
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics."""
+        self.flush_activity_log()
         try:
             with self._get_connection() as conn:
                 stats = {}
@@ -625,104 +1472,225 @@ class DatabaseManager:
             logger.error(f"Error getting stats: {e}")
             return {}
 
-    # === LinkedIn Posts Operations ===
+    # === Dashboard ===
 
-    def create_linkedin_post(self, post_data: Dict[str, Any]) -> bool:
-        """Create a new LinkedIn post record."""
+    def get_dashboard_snapshot(self, list_limit: int = 5,
+                               activity_limit: int = 10) -> Dict[str, Any]:
+        """Read every dashboard section from one consistent snapshot.
+
+        All sections are read on one pooled connection inside a single read
+        transaction, so counts, lists and totals describe the same moment
+        while watchers keep writing. Each section is one grouped or
+        index-ordered query; item counts and financial totals come from the
+        item_rollups and financial_rollups tables.
+
+        Args:
+            list_limit: Rows returned for approvals, plans and workflows
+            activity_limit: Rows returned for recent activity
+
+        Returns:
+            Dictionary with 'items_by_source' ({source: count}),
+            'pending_approvals', 'active_plans', 'active_workflows',
+            'recent_activity' (lists of row dicts), 'financial' (as
+            get_financial_summary) and 'last_backup' (row dict or None);
+            empty on error
+        """
+        # Read-your-writes for queued audit entries
+        self.flush_activity_log()
         try:
             with self._get_connection() as conn:
-                fields = ', '.join(post_data.keys())
-                placeholders = ', '.join(['?' for _ in post_data])
-                query = f"INSERT INTO linkedin_posts ({fields}) VALUES ({placeholders})"
-                conn.execute(query, list(post_data.values()))
-                conn.commit()
-                return True
+                # Inside transaction() the caller's transaction already pins the snapshot
+                own_transaction = not conn.in_transaction
+                if own_transaction:
+                    conn.execute("BEGIN")
+                try:
+                    return self._dashboard_snapshot(conn, list_limit, activity_limit)
+                finally:
+                    if own_transaction:
+                        conn.rollback()
         except sqlite3.Error as e:
-            logger.error(f"Error creating LinkedIn post: {e}")
-            return False
+            logger.error(f"Error getting dashboard snapshot: {e}")
+            return {}
+
+    def _dashboard_snapshot(self, conn: sqlite3.Connection, list_limit: int,
+                            activity_limit: int) -> Dict[str, Any]:
+        """Run the dashboard queries on a connection holding a read transaction."""
+        # Trigger-maintained counts: a handful of rows however many items exist
+        items_by_source = dict(conn.execute(
+            "SELECT source, SUM(item_count) FROM item_rollups GROUP BY source"
+        ).fetchall())
+
+        approvals = conn.execute("""
+            SELECT a.id, a.item_id, a.requested_at, a.deadline,
+                   i.source, i.type, i.category, i.priority, i.amount
+            FROM approvals a
+            JOIN items i ON a.item_id = i.id
+            WHERE a.decision IS NULL
+            ORDER BY a.deadline ASC
+            LIMIT ?
+        """, (list_limit,)).fetchall()
+
+        plans = conn.execute("""
+            SELECT id, title, status, steps_total, steps_completed, started_at
+            FROM plans
+            WHERE status = 'active'
+            ORDER BY started_at DESC
+            LIMIT ?
+        """, (list_limit,)).fetchall()
+
+        workflows = conn.execute("""
+            SELECT id, workflow_type, item_id, status, current_step, total_steps, started_at
+            FROM workflows
+            WHERE status IN ('running', 'paused')
+            ORDER BY started_at DESC
+            LIMIT ?
+        """, (list_limit,)).fetchall()
+
+        activity = conn.execute("""
+            SELECT timestamp, level, component, action, item_id
+            FROM activity_log
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (activity_limit,)).fetchall()
+
+        backup = conn.execute(
+            "SELECT * FROM backups WHERE status = 'ok' ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+
+        return {
+            'items_by_source': items_by_source,
+            'pending_approvals': [dict(row) for row in approvals],
+            'active_plans': [dict(row) for row in plans],
+            'active_workflows': [dict(row) for row in workflows],
+            'financial': self._financial_summary(conn),
+            'recent_activity': [dict(row) for row in activity],
+            'last_backup': dict(backup) if backup else None
+        }
 
-    def get_linkedin_post(self, post_id: str) -> Optional[Dict[str, Any]]:
+    # === LinkedIn Posts Operations ===
+
+    def create_linkedin_post(self, post_data: Dict[str, Any]) -> bool:
+        """Create a new LinkedIn post record."""
+        return self._create(LinkedInPost, post_data, 'LinkedIn post')
+
+    def get_linkedin_post(self, post_id: str) -> Optional[LinkedInPost]:
         """Get LinkedIn post by ID."""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM linkedin_posts WHERE id = ?",
-                    (post_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
-        except sqlite3.Error as e:
-            logger.error(f"Error getting LinkedIn post: {e}")
-            return None
+        return self._read_through(LinkedInPost, post_id, 'LinkedIn post')
 
     def update_linkedin_post(self, post_id: str, updates: Dict[str, Any]) -> bool:
         """Update LinkedIn post fields."""
+        # Always update updated_at timestamp
+        updates = {**updates, 'updated_at': datetime.now().isoformat()}
         try:
-            with self._get_connection() as conn:
-                # Always update updated_at timestamp
-                updates['updated_at'] = datetime.now().isoformat()
-                set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-                query = f"UPDATE linkedin_posts SET {set_clause} WHERE id = ?"
-                conn.execute(query, list(updates.values()) + [post_id])
-                conn.commit()
-                return True
-        except sqlite3.Error as e:
-            logger.error(f"Error updating LinkedIn post: {e}")
-            return False
+            return self._update(LinkedInPost, post_id, updates, 'LinkedIn post')
+        finally:
+            self._invalidate('linkedin_posts', post_id)
 
-    def get_pending_linkedin_posts(self) -> List[Dict[str, Any]]:
+    def get_pending_linkedin_posts(self) -> List[LinkedInPost]:
         """Get all pending LinkedIn posts (approved and ready to post)."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM linkedin_posts
+                cursor = self._model_cursor(conn, LinkedInPost).execute(f"""
+                    {LinkedInPost.SELECT}
                     WHERE status = 'approved'
                     AND scheduled_time <= CURRENT_TIMESTAMP
                     ORDER BY scheduled_time ASC
                 """)
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting pending LinkedIn posts: {e}")
             return []
 
-    def get_linkedin_posts_needing_approval(self) -> List[Dict[str, Any]]:
+    def get_linkedin_posts_needing_approval(self) -> List[LinkedInPost]:
         """Get LinkedIn posts that need approval."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM linkedin_posts
+                cursor = self._model_cursor(conn, LinkedInPost).execute(f"""
+                    {LinkedInPost.SELECT}
                     WHERE status = 'pending'
                     ORDER BY created_at ASC
                 """)
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting LinkedIn posts needing approval: {e}")
             return []
 
-    def get_failed_linkedin_posts(self) -> List[Dict[str, Any]]:
+    def get_failed_linkedin_posts(self) -> List[LinkedInPost]:
         """Get failed LinkedIn posts that can be retried."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM linkedin_posts
+                cursor = self._model_cursor(conn, LinkedInPost).execute(f"""
+                    {LinkedInPost.SELECT}
                     WHERE status = 'failed'
                     AND retry_count < max_retries
                     ORDER BY updated_at DESC
                 """)
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting failed LinkedIn posts: {e}")
             return []
 
-    def get_linkedin_posts_by_status(self, status: str) -> List[Dict[str, Any]]:
+    def get_linkedin_posts_by_status(self, status: str) -> List[LinkedInPost]:
         """Get LinkedIn posts by status."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM linkedin_posts WHERE status = ? ORDER BY created_at DESC",
+                cursor = self._model_cursor(conn, LinkedInPost).execute(
+                    f"{LinkedInPost.SELECT} WHERE status = ? ORDER BY created_at DESC",
                     (status,)
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error getting LinkedIn posts by status: {e}")
             return []
+
+    def get_linkedin_posts_by_status_page(self, status: str, limit: int = 100,
+                                          after: Optional[Tuple[str, str]] = None,
+                                          oldest_first: bool = False) -> List[LinkedInPost]:
+        """Get one page of LinkedIn posts by status.
+
+        Args:
+            status: Post status
+            limit: Page size
+            after: (created_at, id) of the last post on the previous page
+            oldest_first: Order ascending instead of newest first
+        """
+        try:
+            return self._keyset_page(LinkedInPost.SELECT, "status = ?", (status,),
+                                     ('created_at', 'id'), limit, after,
+                                     descending=not oldest_first,
+                                     model=LinkedInPost)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting LinkedIn posts page by status: {e}")
+            return []
+
+    def iter_linkedin_posts_by_status(self, status: str, chunk_size: int = 500,
+                                      after: Optional[Tuple[str, str]] = None,
+                                      oldest_first: bool = False) -> Iterator[LinkedInPost]:
+        """Stream LinkedIn posts by status in chunks."""
+        return self._iter_keyset(
+            lambda limit, after: self.get_linkedin_posts_by_status_page(
+                status, limit, after, oldest_first),
+            'created_at', chunk_size, after)
+
+    def get_failed_linkedin_posts_page(self, limit: int = 100,
+                                       after: Optional[Tuple[str, str]] = None) -> List[LinkedInPost]:
+        """Get one page of retryable failed posts, most recently updated first.
+
+        Args:
+            limit: Page size
+            after: (updated_at, id) of the last post on the previous page
+        """
+        try:
+            return self._keyset_page(LinkedInPost.SELECT,
+                                     "status = 'failed' AND retry_count < max_retries", (),
+                                     ('updated_at', 'id'), limit, after,
+                                     model=LinkedInPost)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting failed LinkedIn posts page: {e}")
+            return []
+
+    def iter_failed_linkedin_posts(self, chunk_size: int = 500,
+                                   after: Optional[Tuple[str, str]] = None) -> Iterator[LinkedInPost]:
+        """Stream retryable failed posts in chunks."""
+        return self._iter_keyset(self.get_failed_linkedin_posts_page, 'updated_at',
+                                 chunk_size, after)
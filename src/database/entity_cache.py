@@ -0,0 +1,97 @@
+"""Read-through LRU cache for single-row lookups by ID.
+
+DatabaseManager consults the cache in get_item, get_approval and
+get_linkedin_post, and invalidates entries from the matching update and
+delete methods. Entries also expire after a TTL, which bounds staleness from
+writes made by other processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class EntityCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss counters.
+
+    Values (row dicts or models) are copied on the way in and out so callers
+    can mutate what they receive without corrupting the cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 5.0):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached rows before LRU eviction
+            ttl: Seconds an entry stays valid; None keeps entries until evicted
+        """
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so in-flight loads can't store stale rows
+        self._generation = 0
+
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0, 'invalidations': 0}
+
+    def get(self, table: str, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached row, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[(table, key)]
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end((table, key))
+            self.stats['hits'] += 1
+            return value.copy()
+
+    def token(self) -> int:
+        """Snapshot the invalidation generation before loading a row."""
+        with self._lock:
+            return self._generation
+
+    def put(self, table: str, key: Hashable, value: Dict[str, Any], token: int):
+        """Cache a loaded row unless an invalidation happened since ``token``."""
+        with self._lock:
+            if token != self._generation:
+                return
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else float('inf')
+            self._entries[(table, key)] = (expires_at, value.copy())
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def invalidate(self, table: str, key: Hashable):
+        """Drop one row from the cache."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop((table, key), None)
+            self.stats['invalidations'] += 1
+
+    def clear(self):
+        """Drop every cached row."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    @property
+    def size(self) -> int:
+        """Number of cached rows."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
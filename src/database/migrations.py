@@ -0,0 +1,485 @@
+"""Schema migrations for the AI Employee database.
+
+The schema version lives in ``PRAGMA user_version``. Opening a database whose
+version matches SCHEMA_VERSION runs no DDL at all; an older database has
+every newer migration applied, in order, inside one write transaction.
+
+To change the schema, append a migration to MIGRATIONS - never edit one that
+has shipped, since existing vault databases have already applied it.
+"""
+
+import logging
+import sqlite3
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _rollup_key(ref: str) -> str:
+    """SQL for the financial_rollups key of a financial_records row.
+
+    The month is the reporting month: paid invoices count in the month they
+    were paid, everything else in the month it was created.
+    """
+    return f"""COALESCE(strftime('%Y-%m', CASE WHEN {ref}.record_type = 'invoice'
+                                              AND {ref}.payment_status = 'paid'
+                                         THEN {ref}.paid_at ELSE {ref}.created_at END), ''),
+        {ref}.record_type, COALESCE({ref}.payment_status, ''), COALESCE({ref}.category, '')"""
+
+
+def _rollup_apply(ref: str, sign: str) -> str:
+    """Trigger statements adding (+) or removing (-) one row from the rollups."""
+    return f"""
+        INSERT INTO financial_rollups
+            (month, record_type, payment_status, category, record_count, total_amount)
+        VALUES ({_rollup_key(ref)}, {sign}1, {sign}{ref}.amount)
+        ON CONFLICT (month, record_type, payment_status, category) DO UPDATE SET
+            record_count = record_count + excluded.record_count,
+            total_amount = total_amount + excluded.total_amount;
+        DELETE FROM financial_rollups
+        WHERE (month, record_type, payment_status, category) = ({_rollup_key(ref)})
+        AND record_count = 0;"""
+
+
+_FINANCIAL_ROLLUP_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS trg_financial_rollups_insert
+AFTER INSERT ON financial_records
+BEGIN{_rollup_apply('NEW', '+')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_financial_rollups_delete
+AFTER DELETE ON financial_records
+BEGIN{_rollup_apply('OLD', '-')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_financial_rollups_update
+AFTER UPDATE OF record_type, amount, payment_status, paid_at, category, created_at
+ON financial_records
+BEGIN{_rollup_apply('OLD', '-')}{_rollup_apply('NEW', '+')}
+END;
+"""
+
+
+def rebuild_financial_rollups(conn: sqlite3.Connection):
+    """Replace the rollup rows with a fresh aggregate (caller commits)."""
+    conn.execute("DELETE FROM financial_rollups")
+    conn.execute(f"""
+        INSERT INTO financial_rollups
+            (month, record_type, payment_status, category, record_count, total_amount)
+        SELECT {_rollup_key('financial_records')}, COUNT(*), SUM(amount)
+        FROM financial_records
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def _run_script(conn: sqlite3.Connection, script: str):
+    """Execute a multi-statement script inside the current transaction.
+
+    ``executescript`` would commit first, so statements are split on
+    complete-statement boundaries (trigger bodies stay intact) instead.
+    """
+    statement = ''
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ''
+    if statement.strip():
+        conn.execute(statement)
+
+
+# Version 1: everything created before versioning existed. All statements are
+# idempotent so unversioned databases from earlier releases upgrade in place.
+_BASELINE_SCHEMA = """
+    -- Items table: All processed items from all sources
+    CREATE TABLE IF NOT EXISTS items (
+        id TEXT PRIMARY KEY,
+        source TEXT NOT NULL,  -- gmail, filesystem, whatsapp, linkedin
+        type TEXT NOT NULL,    -- email, file, message, post
+        category TEXT,         -- invoice, receipt, contract, etc.
+        priority TEXT DEFAULT 'normal',  -- urgent, normal, low
+        amount REAL,
+        status TEXT DEFAULT 'pending',  -- pending, approved, rejected, done
+        file_path TEXT,
+        metadata TEXT,         -- JSON string
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        processed_at TIMESTAMP
+    );
+
+    -- Approvals table: Approval workflow tracking
+    CREATE TABLE IF NOT EXISTS approvals (
+        id TEXT PRIMARY KEY,
+        item_id TEXT NOT NULL,
+        requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        decided_at TIMESTAMP,
+        decision TEXT,  -- approved, rejected, expired
+        reason TEXT,
+        auto_decided BOOLEAN DEFAULT 0,
+        deadline TIMESTAMP,
+        reminder_sent BOOLEAN DEFAULT 0,
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+    );
+
+    -- Plans table: AI-generated execution plans
+    CREATE TABLE IF NOT EXISTS plans (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        description TEXT,
+        complexity TEXT,  -- simple, detailed
+        status TEXT DEFAULT 'pending_approval',  -- pending_approval, active, completed
+        steps_total INTEGER DEFAULT 0,
+        steps_completed INTEGER DEFAULT 0,
+        estimated_hours REAL,
+        actual_hours REAL,
+        budget REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP
+    );
+
+    -- Workflows table: Workflow execution state
+    CREATE TABLE IF NOT EXISTS workflows (
+        id TEXT PRIMARY KEY,
+        workflow_type TEXT NOT NULL,  -- invoice, receipt, research, etc.
+        item_id TEXT,
+        current_step INTEGER DEFAULT 1,
+        total_steps INTEGER DEFAULT 1,
+        status TEXT DEFAULT 'running',  -- running, paused, completed, failed
+        state_data TEXT,  -- JSON string for workflow-specific data
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP,
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
+    );
+
+    -- Financial records table: Money tracking
+    CREATE TABLE IF NOT EXISTS financial_records (
+        id TEXT PRIMARY KEY,
+        item_id TEXT,
+        record_type TEXT NOT NULL,  -- invoice, payment, receipt, expense
+        amount REAL NOT NULL,
+        currency TEXT DEFAULT 'USD',
+        vendor TEXT,
+        payee TEXT,
+        due_date TIMESTAMP,
+        payment_status TEXT DEFAULT 'pending',  -- pending, paid, overdue
+        paid_at TIMESTAMP,
+        category TEXT,
+        receipt_path TEXT,
+        tax_deductible BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
+    );
+
+    -- Activity log table: Audit trail
+    CREATE TABLE IF NOT EXISTS activity_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        level TEXT DEFAULT 'INFO',  -- DEBUG, INFO, WARN, ERROR
+        component TEXT NOT NULL,    -- which skill/watcher
+        action TEXT NOT NULL,
+        item_id TEXT,
+        details TEXT,
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL
+    );
+
+    -- LinkedIn posts table: Autonomous posting queue
+    CREATE TABLE IF NOT EXISTS linkedin_posts (
+        id TEXT PRIMARY KEY,
+        content TEXT NOT NULL,
+        media_paths TEXT,  -- JSON array of file paths
+        link_url TEXT,
+        document_path TEXT,
+        scheduled_time TIMESTAMP,
+        posted_time TIMESTAMP,
+        status TEXT DEFAULT 'pending',  -- pending, approved, posted, failed
+        importance_level TEXT DEFAULT 'normal',  -- low, normal, high, critical
+        retry_count INTEGER DEFAULT 0,
+        max_retries INTEGER DEFAULT 2,
+        error_message TEXT,
+        approval_id TEXT,  -- Link to approvals table if needed
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (approval_id) REFERENCES approvals(id) ON DELETE SET NULL
+    );
+
+    -- Create indexes for common queries
+    CREATE INDEX IF NOT EXISTS idx_items_category ON items(category);
+    CREATE INDEX IF NOT EXISTS idx_financial_status ON financial_records(payment_status);
+    CREATE INDEX IF NOT EXISTS idx_financial_due_date ON financial_records(due_date);
+    CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON activity_log(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_posts_scheduled ON linkedin_posts(scheduled_time);
+
+    -- Composite indexes matching filter + sort (+ keyset id) of hot queries
+    CREATE INDEX IF NOT EXISTS idx_items_source_created ON items(source, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_items_status_created ON items(status, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_approvals_decision_deadline ON approvals(decision, deadline, id);
+    CREATE INDEX IF NOT EXISTS idx_approvals_item_id ON approvals(item_id);
+    CREATE INDEX IF NOT EXISTS idx_plans_status_started ON plans(status, started_at);
+    CREATE INDEX IF NOT EXISTS idx_workflows_active_started
+        ON workflows(started_at) WHERE status IN ('running', 'paused');
+    CREATE INDEX IF NOT EXISTS idx_workflows_item_id ON workflows(item_id);
+    CREATE INDEX IF NOT EXISTS idx_financial_type_status_due
+        ON financial_records(record_type, payment_status, due_date, amount);
+    CREATE INDEX IF NOT EXISTS idx_financial_item_id ON financial_records(item_id);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_posts_status_created
+        ON linkedin_posts(status, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_posts_status_scheduled
+        ON linkedin_posts(status, scheduled_time);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_posts_status_updated
+        ON linkedin_posts(status, updated_at, id);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_posts_status_posted
+        ON linkedin_posts(status, posted_time);
+
+    -- Financial rollups: per-month aggregates of financial_records kept
+    -- current by triggers, so the dashboard summary never scans records
+    CREATE TABLE IF NOT EXISTS financial_rollups (
+        month TEXT NOT NULL,           -- reporting month YYYY-MM, '' if undated
+        record_type TEXT NOT NULL,
+        payment_status TEXT NOT NULL,
+        category TEXT NOT NULL,        -- '' if uncategorised
+        record_count INTEGER NOT NULL DEFAULT 0,
+        total_amount REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (month, record_type, payment_status, category)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_financial_rollups_type_status
+        ON financial_rollups(record_type, payment_status, month);
+
+    -- Single-column indexes superseded by the composites above
+    DROP INDEX IF EXISTS idx_items_status;
+    DROP INDEX IF EXISTS idx_items_source;
+    DROP INDEX IF EXISTS idx_approvals_decision;
+    DROP INDEX IF EXISTS idx_approvals_deadline;
+    DROP INDEX IF EXISTS idx_workflows_status;
+    DROP INDEX IF EXISTS idx_linkedin_posts_status;
+"""
+
+
+def _migration_1_baseline(conn: sqlite3.Connection):
+    """Create the original tables and indexes plus the financial rollups."""
+    _run_script(conn, _BASELINE_SCHEMA)
+    _run_script(conn, _FINANCIAL_ROLLUP_TRIGGERS)
+    # Backfill rollups for records written before the triggers existed
+    rebuild_financial_rollups(conn)
+
+
+# Version 2: full-text search. items_fts is an external-content index over
+# items kept in sync by triggers; vault_fts holds markdown cards, tracked by
+# path and mtime in vault_documents so re-indexing is incremental.
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    id UNINDEXED, source UNINDEXED, category, file_path, metadata,
+    content='items', content_rowid='rowid', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_items_fts_insert AFTER INSERT ON items
+BEGIN
+    INSERT INTO items_fts (rowid, id, source, category, file_path, metadata)
+    VALUES (NEW.rowid, NEW.id, NEW.source, NEW.category, NEW.file_path, NEW.metadata);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_items_fts_delete AFTER DELETE ON items
+BEGIN
+    INSERT INTO items_fts (items_fts, rowid, id, source, category, file_path, metadata)
+    VALUES ('delete', OLD.rowid, OLD.id, OLD.source, OLD.category, OLD.file_path, OLD.metadata);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_items_fts_update AFTER UPDATE OF id, source, category, file_path, metadata ON items
+BEGIN
+    INSERT INTO items_fts (items_fts, rowid, id, source, category, file_path, metadata)
+    VALUES ('delete', OLD.rowid, OLD.id, OLD.source, OLD.category, OLD.file_path, OLD.metadata);
+    INSERT INTO items_fts (rowid, id, source, category, file_path, metadata)
+    VALUES (NEW.rowid, NEW.id, NEW.source, NEW.category, NEW.file_path, NEW.metadata);
+END;
+
+-- Markdown cards in the vault (path relative to the vault, POSIX separators)
+CREATE TABLE IF NOT EXISTS vault_documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    folder TEXT NOT NULL,      -- top-level vault folder, '' for the vault root
+    title TEXT,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS vault_fts USING fts5(
+    title, body, tokenize='porter unicode61'
+);
+
+-- Title matches outrank body matches
+INSERT INTO vault_fts (vault_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+"""
+
+
+def _migration_2_search(conn: sqlite3.Connection):
+    """Add FTS5 indexes over items and vault markdown."""
+    _run_script(conn, _SEARCH_SCHEMA)
+    conn.execute("INSERT INTO items_fts (items_fts) VALUES ('rebuild')")
+
+
+# Version 3: columns derived from JSON text, indexed for filtering. Listed as
+# (table, column, source column, JSON path). Virtual, so they cost no storage;
+# malformed JSON yields NULL instead of failing the write.
+_JSON_COLUMNS = [
+    ('items', 'sender', 'metadata', '$.sender'),
+    ('items', 'vendor', 'metadata', '$.vendor'),
+    ('items', 'chat_type', 'metadata', '$.chat_type'),
+    ('workflows', 'pause_reason', 'state_data', '$.pause_reason'),
+]
+
+_JSON_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_items_sender ON items(sender, created_at, id) WHERE sender IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_items_vendor ON items(vendor, created_at, id) WHERE vendor IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_items_chat_type ON items(chat_type, created_at, id) WHERE chat_type IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_workflows_pause_reason ON workflows(pause_reason, started_at)
+    WHERE pause_reason IS NOT NULL;
+"""
+
+
+def _migration_3_json_columns(conn: sqlite3.Connection):
+    """Expose JSON fields of items.metadata and workflows.state_data as indexed columns."""
+    for table, column, source, path in _JSON_COLUMNS:
+        # table_xinfo lists generated columns too; ADD COLUMN has no IF NOT EXISTS
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+        if column in existing:
+            continue
+        conn.execute(
+            f"ALTER TABLE {table} ADD COLUMN {column} TEXT GENERATED ALWAYS AS "
+            f"(CASE WHEN json_valid({source}) THEN json_extract({source}, '{path}') END) VIRTUAL"
+        )
+    _run_script(conn, _JSON_INDEXES)
+
+
+# Version 4: backup history, one row per backup run with its timing, size and
+# outcome, so the last good backup is a single indexed lookup.
+_BACKUPS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP,
+    duration_ms REAL,
+    path TEXT,
+    size_bytes INTEGER,
+    pages INTEGER,
+    status TEXT NOT NULL,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_backups_status ON backups(status);
+"""
+
+
+def _migration_4_backups(conn: sqlite3.Connection):
+    """Add the backup history table."""
+    _run_script(conn, _BACKUPS_SCHEMA)
+
+
+# Version 5: per-source item counts kept current by triggers, so the
+# dashboard's platform summary never scans items.
+_ITEM_ROLLUPS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS item_rollups (
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,          -- '' if unset
+    item_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, status)
+) WITHOUT ROWID;
+"""
+
+
+def _item_rollup_apply(ref: str, sign: str) -> str:
+    """Trigger statements adding (+) or removing (-) one item from the rollups."""
+    return f"""
+        INSERT INTO item_rollups (source, status, item_count)
+        VALUES ({ref}.source, COALESCE({ref}.status, ''), {sign}1)
+        ON CONFLICT (source, status) DO UPDATE SET
+            item_count = item_count + excluded.item_count;
+        DELETE FROM item_rollups
+        WHERE source = {ref}.source AND status = COALESCE({ref}.status, '')
+        AND item_count = 0;"""
+
+
+_ITEM_ROLLUP_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS trg_item_rollups_insert
+AFTER INSERT ON items
+BEGIN{_item_rollup_apply('NEW', '+')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_item_rollups_delete
+AFTER DELETE ON items
+BEGIN{_item_rollup_apply('OLD', '-')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_item_rollups_update
+AFTER UPDATE OF source, status ON items
+BEGIN{_item_rollup_apply('OLD', '-')}{_item_rollup_apply('NEW', '+')}
+END;
+"""
+
+
+def rebuild_item_rollups(conn: sqlite3.Connection):
+    """Replace the item rollup rows with a fresh count (caller commits)."""
+    conn.execute("DELETE FROM item_rollups")
+    conn.execute("""
+        INSERT INTO item_rollups (source, status, item_count)
+        SELECT source, COALESCE(status, ''), COUNT(*)
+        FROM items
+        GROUP BY 1, 2
+    """)
+
+
+def _migration_5_item_rollups(conn: sqlite3.Connection):
+    """Add trigger-maintained item counts per source and status."""
+    _run_script(conn, _ITEM_ROLLUPS_SCHEMA)
+    _run_script(conn, _ITEM_ROLLUP_TRIGGERS)
+    rebuild_item_rollups(conn)
+
+
+# (version, description, apply) - append only
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, 'baseline schema, composite indexes, financial rollups', _migration_1_baseline),
+    (2, 'full-text search over items and vault markdown', _migration_2_search),
+    (3, 'generated JSON columns for sender, vendor, chat type and pause reason',
+     _migration_3_json_columns),
+    (4, 'backup history', _migration_4_backups),
+    (5, 'item counts per source and status', _migration_5_item_rollups),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Read the schema version stored in the database header."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations.
+
+    Returns:
+        Number of migrations applied (0 when the schema was already current)
+    """
+    current = get_schema_version(conn)
+    if current == SCHEMA_VERSION:
+        return 0
+    if current > SCHEMA_VERSION:
+        logger.warning(f"Database schema version {current} is newer than this "
+                       f"release ({SCHEMA_VERSION}); leaving it untouched")
+        return 0
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another process may have migrated while we waited for the lock
+        current = get_schema_version(conn)
+        applied = 0
+        for version, description, apply in MIGRATIONS:
+            if version <= current:
+                continue
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            logger.info(f"Applied schema migration {version}: {description}")
+            applied += 1
+        conn.commit()
+        return applied
+    except sqlite3.Error:
+        conn.rollback()
+        raise
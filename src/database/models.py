@@ -0,0 +1,192 @@
+"""Typed row models for the AI Employee database tables.
+
+Each model is a slotted dataclass whose fields mirror its table's columns in
+schema order, so rows decode positionally (``Model.from_row`` doubles as a
+cursor ``row_factory``) without building an intermediate ``sqlite3.Row`` or
+dict. Models are also read-only mappings over their columns, which keeps
+``row['status']``, ``row.get('amount')`` and ``dict(row)`` working for code
+written against the old dict results.
+
+``COLUMN_SET`` is the whitelist DatabaseManager checks write payloads
+against before any SQL is built. Generated columns (items.sender, vendor and
+chat_type, workflows.pause_reason) are derived from the JSON columns, so they
+are neither model fields nor writable.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Model class for each table, filled in by the @_model decorator
+MODELS: Dict[str, type] = {}
+
+
+class Model(Mapping):
+    """Base class for table row models."""
+
+    __slots__ = ()
+
+    TABLE: str = ''
+    COLUMNS: Tuple[str, ...] = ()
+    COLUMN_SET: frozenset = frozenset()
+    SELECT: str = ''
+
+    @classmethod
+    def from_row(cls, cursor, row: tuple) -> 'Model':
+        """Decode a row selected with ``cls.SELECT`` (usable as a row_factory)."""
+        return cls(*row)
+
+    @classmethod
+    def check_columns(cls, columns: Iterable[str]) -> Tuple[str, ...]:
+        """Return the columns as a tuple, rejecting names not in the table.
+
+        Raises:
+            ValueError: If a column is unknown
+        """
+        columns = tuple(columns)
+        unknown = [str(c) for c in columns if c not in cls.COLUMN_SET]
+        if unknown:
+            raise ValueError(f"Unknown {cls.TABLE} column(s): {', '.join(unknown)}")
+        return columns
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.COLUMN_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.COLUMN_SET:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self.COLUMNS)
+
+    def to_dict(self, skip_none: bool = False) -> Dict[str, Any]:
+        """Column values as a dict; ``skip_none`` leaves unset columns out."""
+        values = {name: getattr(self, name) for name in self.COLUMNS}
+        if skip_none:
+            return {k: v for k, v in values.items() if v is not None}
+        return values
+
+    def copy(self) -> 'Model':
+        """Shallow copy of the row."""
+        return type(self)(*(getattr(self, name) for name in self.COLUMNS))
+
+
+def _model(table: str):
+    """Turn a field list into a slotted row model registered for ``table``."""
+    def wrap(cls):
+        # eq=False keeps Mapping equality, so a model compares equal to a dict
+        cls = dataclass(slots=True, eq=False)(cls)
+        cls.TABLE = table
+        cls.COLUMNS = tuple(f.name for f in fields(cls))
+        cls.COLUMN_SET = frozenset(cls.COLUMNS)
+        cls.SELECT = f"SELECT {', '.join(cls.COLUMNS)} FROM {table}"
+        MODELS[table] = cls
+        return cls
+    return wrap
+
+
+@_model('items')
+class Item(Model):
+    """Row of the items table."""
+    id: Optional[str] = None
+    source: Optional[str] = None
+    type: Optional[str] = None
+    category: Optional[str] = None
+    priority: Optional[str] = None
+    amount: Optional[float] = None
+    status: Optional[str] = None
+    file_path: Optional[str] = None
+    metadata: Optional[str] = None
+    created_at: Optional[str] = None
+    processed_at: Optional[str] = None
+
+
+@_model('approvals')
+class Approval(Model):
+    """Row of the approvals table."""
+    id: Optional[str] = None
+    item_id: Optional[str] = None
+    requested_at: Optional[str] = None
+    decided_at: Optional[str] = None
+    decision: Optional[str] = None
+    reason: Optional[str] = None
+    auto_decided: Optional[int] = None
+    deadline: Optional[str] = None
+    reminder_sent: Optional[int] = None
+
+
+@_model('plans')
+class Plan(Model):
+    """Row of the plans table."""
+    id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    complexity: Optional[str] = None
+    status: Optional[str] = None
+    steps_total: Optional[int] = None
+    steps_completed: Optional[int] = None
+    estimated_hours: Optional[float] = None
+    actual_hours: Optional[float] = None
+    budget: Optional[float] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+@_model('workflows')
+class Workflow(Model):
+    """Row of the workflows table."""
+    id: Optional[str] = None
+    workflow_type: Optional[str] = None
+    item_id: Optional[str] = None
+    current_step: Optional[int] = None
+    total_steps: Optional[int] = None
+    status: Optional[str] = None
+    state_data: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+@_model('financial_records')
+class FinancialRecord(Model):
+    """Row of the financial_records table."""
+    id: Optional[str] = None
+    item_id: Optional[str] = None
+    record_type: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = None
+    vendor: Optional[str] = None
+    payee: Optional[str] = None
+    due_date: Optional[str] = None
+    payment_status: Optional[str] = None
+    paid_at: Optional[str] = None
+    category: Optional[str] = None
+    receipt_path: Optional[str] = None
+    tax_deductible: Optional[int] = None
+    created_at: Optional[str] = None
+
+
+@_model('linkedin_posts')
+class LinkedInPost(Model):
+    """Row of the linkedin_posts table."""
+    id: Optional[str] = None
+    content: Optional[str] = None
+    media_paths: Optional[str] = None
+    link_url: Optional[str] = None
+    document_path: Optional[str] = None
+    scheduled_time: Optional[str] = None
+    posted_time: Optional[str] = None
+    status: Optional[str] = None
+    importance_level: Optional[str] = None
+    retry_count: Optional[int] = None
+    max_retries: Optional[int] = None
+    error_message: Optional[str] = None
+    approval_id: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
@@ -4,35 +4,170 @@ Generates real-time dashboard with multi-platform summary, approvals, plans,
 workflows, financial tracking, and system status.
 """
 
-import os
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
+from src.utils.watcher_registry import WATCHERS, format_status, get_registry
+
 logger = logging.getLogger(__name__)
 
+# Multi-Platform Summary rows and the item source counted under each
+PLATFORM_SOURCES = {
+    'email': 'gmail',
+    'whatsapp': 'whatsapp',
+    'linkedin': 'linkedin',
+    'files': 'filesystem',
+}
+
+# Monthly budget used when none is given (FinancialTracker's default)
+DEFAULT_MONTHLY_BUDGET = 5000
+
+# Rows shown in the approval, plan and workflow tables, and in recent activity
+LIST_LIMIT = 5
+ACTIVITY_LIMIT = 10
+
 
 class EnhancedDashboard:
     """Generates enhanced real-time dashboard for AI Employee.
 
     Displays multi-platform summary, pending approvals, active plans,
     workflow status, financial tracking, recent activity, and system status.
+    Every section of one render comes from a single database snapshot.
     """
 
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, db_manager=None,
+                 monthly_budget: float = DEFAULT_MONTHLY_BUDGET):
         """Initialize enhanced dashboard.
 
         Args:
             vault_path: Path to AI_Employee_Vault
+            db_manager: Optional DatabaseManager (default: the vault's
+                Database/ai_employee.db, opened on first use)
+            monthly_budget: Budget the month's expenses are compared against
         """
         self.vault_path = Path(vault_path)
+        self.db = db_manager
+        self.monthly_budget = monthly_budget
+        self._owns_db = False
+
+    def _database(self, create: bool = False):
+        """The dashboard's database, opened on first use.
+
+        Args:
+            create: Create the vault database if it does not exist yet
+
+        Returns:
+            DatabaseManager, or None if there is no database and create is False
 
-        # Mock data storage (would use database in production)
-        self.mock_approvals = []
-        self.mock_plans = []
-        self.mock_workflows = []
-        self.mock_activities = []
+        Raises:
+            FileNotFoundError: If create is True and the vault does not exist
+        """
+        if self.db is None:
+            db_path = self.vault_path / 'Database' / 'ai_employee.db'
+            if not db_path.exists():
+                if not create:
+                    return None
+                if not self.vault_path.is_dir():
+                    raise FileNotFoundError(f"Vault not found: {self.vault_path}")
+            from src.database.db_manager import DatabaseManager
+            self.db = DatabaseManager(str(db_path))
+            self._owns_db = True
+        return self.db
+
+    def close(self):
+        """Close the database if the dashboard opened it."""
+        if self._owns_db and self.db is not None:
+            self.db.close()
+            self.db = None
+            self._owns_db = False
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Read every dashboard section in one database read transaction.
+
+        Returns:
+            Dictionary with 'platforms', 'approvals', 'plans', 'workflows',
+            'financial', 'activity', 'last_backup' and 'database' (connection
+            state: 'connected', 'not created' or 'error')
+        """
+        db = self._database()
+        raw = db.get_dashboard_snapshot(LIST_LIMIT, ACTIVITY_LIMIT) if db is not None else {}
+        if db is None:
+            database = 'not created'
+        else:
+            database = 'connected' if raw else 'error'
+
+        items_by_source = raw.get('items_by_source', {})
+        return {
+            'platforms': {platform: int(items_by_source.get(source, 0))
+                          for platform, source in PLATFORM_SOURCES.items()},
+            'approvals': [self._approval_row(row) for row in raw.get('pending_approvals', [])],
+            'plans': [self._plan_row(row) for row in raw.get('active_plans', [])],
+            'workflows': [self._workflow_row(row) for row in raw.get('active_workflows', [])],
+            'financial': self._financial_section(raw.get('financial', {})),
+            'activity': [{'timestamp': row['timestamp'],
+                          'action': f"[{row['component']}] {row['action']}"}
+                         for row in raw.get('recent_activity', [])],
+            'last_backup': raw.get('last_backup'),
+            'database': database
+        }
+
+    @staticmethod
+    def _approval_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Pending approval as shown in the approvals table."""
+        approval = {
+            'approval_id': row['id'],
+            'item_id': row['item_id'],
+            'type': row['category'] or row['type'],
+            'priority': row['priority'] or 'normal',
+            'deadline': row['deadline'] or 'N/A'
+        }
+        if row['amount'] is not None:
+            approval['amount'] = row['amount']
+        return approval
+
+    @staticmethod
+    def _plan_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Active plan as shown in the plans table."""
+        total = row['steps_total'] or 0
+        completed = row['steps_completed'] or 0
+        return {
+            'plan_id': row['id'],
+            'title': row['title'],
+            'total_steps': total,
+            'completed_steps': completed,
+            'progress': int(completed * 100 / total) if total else 0,
+            'status': row['status']
+        }
+
+    @staticmethod
+    def _workflow_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Running or paused workflow as shown in the workflow table."""
+        return {
+            'workflow_id': row['id'],
+            'type': row['workflow_type'],
+            'state': row['status'],
+            'current_step': row['current_step'],
+            'total_steps': row['total_steps']
+        }
+
+    def _financial_section(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Financial tracking figures from the database summary."""
+        spent = summary.get('expenses_this_month', 0)
+        budget = self.monthly_budget
+        return {
+            'pending_invoices': summary.get('pending_invoices_count', 0),
+            'pending_invoices_amount': summary.get('pending_invoices_amount', 0),
+            'paid_invoices': summary.get('paid_this_month_count', 0),
+            'total_expenses': spent,
+            'budget_status': {
+                'total_budget': budget,
+                'spent': spent,
+                'remaining': budget - spent,
+                'percentage': int((spent / budget) * 100) if budget > 0 else 0
+            }
+        }
 
     def generate_dashboard(self) -> Dict[str, Any]:
         """Generate complete dashboard.
@@ -41,23 +176,18 @@ class EnhancedDashboard:
             Result dictionary with filepath
         """
         try:
-            # Gather all data
-            platform_summary = self.get_platform_summary()
-            pending_approvals = self.get_pending_approvals()
-            active_plans = self.get_active_plans()
-            workflow_status = self.get_workflow_status()
-            financial_summary = self.get_financial_summary()
-            recent_activity = self.get_recent_activity()
-            system_status = self.get_system_status()
+            # Gather all data from one snapshot
+            snapshot = self.get_snapshot()
+            system_status = self.get_system_status(snapshot)
 
             # Generate markdown
             markdown = self._generate_dashboard_markdown(
-                platform_summary,
-                pending_approvals,
-                active_plans,
-                workflow_status,
-                financial_summary,
-                recent_activity,
+                snapshot['platforms'],
+                snapshot['approvals'],
+                snapshot['plans'],
+                snapshot['workflows'],
+                snapshot['financial'],
+                snapshot['activity'],
                 system_status
             )
 
@@ -170,8 +300,8 @@ class EnhancedDashboard:
         # Financial Tracking
         markdown += "## Financial Tracking\n\n"
         markdown += f"- **Pending Invoices:** {financial_summary.get('pending_invoices', 0)}\n"
-        markdown += f"- **Paid Invoices:** {financial_summary.get('paid_invoices', 0)}\n"
-        markdown += f"- **Total Expenses:** ${financial_summary.get('total_expenses', 0):,.2f}\n"
+        markdown += f"- **Paid Invoices (this month):** {financial_summary.get('paid_invoices', 0)}\n"
+        markdown += f"- **Expenses (this month):** ${financial_summary.get('total_expenses', 0):,.2f}\n"
 
         if 'budget_status' in financial_summary:
             budget = financial_summary['budget_status']
@@ -204,7 +334,10 @@ class EnhancedDashboard:
             markdown += f"- File Watcher: {system_status.get('file_watcher', 'unknown')}\n"
 
         markdown += f"\n**Database:** {system_status.get('database', 'unknown')}\n"
-        markdown += f"**Last Backup:** {system_status.get('last_backup', 'N/A')}\n"
+        markdown += f"**Last Backup:** {system_status.get('last_backup', 'N/A')}"
+        if system_status.get('last_backup_duration_ms') is not None:
+            markdown += f" ({system_status['last_backup_duration_ms']:.0f} ms)"
+        markdown += "\n"
         markdown += "\n"
 
         markdown += "---\n\n"
@@ -218,40 +351,31 @@ class EnhancedDashboard:
         Returns:
             Dictionary mapping platform to count
         """
-        # Placeholder - would query database in production
-        return {
-            'email': 0,
-            'whatsapp': 0,
-            'linkedin': 0,
-            'files': 0
-        }
+        return self.get_snapshot()['platforms']
 
     def get_pending_approvals(self) -> List[Dict[str, Any]]:
-        """Get pending approvals.
+        """Get pending approvals, earliest deadline first.
 
         Returns:
             List of pending approval dictionaries
         """
-        # Return mock data for testing
-        return self.mock_approvals
+        return self.get_snapshot()['approvals']
 
     def get_active_plans(self) -> List[Dict[str, Any]]:
-        """Get active plans.
+        """Get active plans, most recently started first.
 
         Returns:
             List of active plan dictionaries
         """
-        # Return mock data for testing
-        return self.mock_plans
+        return self.get_snapshot()['plans']
 
     def get_workflow_status(self) -> List[Dict[str, Any]]:
-        """Get workflow status.
+        """Get running and paused workflows, most recently started first.
 
         Returns:
             List of workflow status dictionaries
         """
-        # Return mock data for testing
-        return self.mock_workflows
+        return self.get_snapshot()['workflows']
 
     def get_financial_summary(self) -> Dict[str, Any]:
         """Get financial summary.
@@ -259,46 +383,48 @@ class EnhancedDashboard:
         Returns:
             Financial summary dictionary
         """
-        # Placeholder - would query database in production
-        return {
-            'pending_invoices': 0,
-            'paid_invoices': 0,
-            'total_expenses': 0,
-            'budget_status': {
-                'total_budget': 5000,
-                'spent': 0,
-                'remaining': 5000,
-                'percentage': 0
-            }
-        }
+        return self.get_snapshot()['financial']
 
     def get_recent_activity(self) -> List[Dict[str, Any]]:
-        """Get recent activity (last 10 items).
+        """Get recent activity (last 10 items), newest first.
 
         Returns:
             List of activity dictionaries
         """
-        # Return last 10 activities
-        return self.mock_activities[-10:]
+        return self.get_snapshot()['activity']
 
-    def get_system_status(self) -> Dict[str, Any]:
+    def get_system_status(self, snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get system status.
 
+        Args:
+            snapshot: Snapshot from get_snapshot() to reuse (default: read one)
+
         Returns:
             System status dictionary
         """
-        # Placeholder - would check actual system status in production
-        return {
-            'watchers': {
-                'email': 'running',
-                'whatsapp': 'running',
-                'linkedin': 'running',
-                'files': 'running'
-            },
-            'database': 'connected',
-            'last_backup': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+
+        # Liveness from the watchers' own heartbeats
+        watchers = get_registry(str(self.vault_path)).statuses()
+        status = {
+            'watchers': {WATCHERS.get(name, name): format_status(watchers[name])
+                         for name in sorted(watchers)},
+            'database': snapshot['database'],
+            'last_backup': 'N/A',
+            'last_backup_duration_ms': None
         }
 
+        if snapshot['database'] == 'connected':
+            backup = snapshot['last_backup']
+            if backup:
+                status['last_backup'] = f"{backup['finished_at']} UTC"
+                status['last_backup_duration_ms'] = backup['duration_ms']
+            else:
+                status['last_backup'] = 'never'
+
+        return status
+
     def update_on_event(self, event_type: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update dashboard on event.
 
@@ -311,10 +437,12 @@ class EnhancedDashboard:
         """
         try:
             # Log activity
-            self._add_mock_activity({
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            logged = self._database(create=True).log_activity({
+                'component': 'Dashboard',
                 'action': f"{event_type}: {event_data.get('source', 'unknown')}"
             })
+            if not logged:
+                raise RuntimeError(f"Could not log {event_type} event")
 
             # Regenerate dashboard
             return self.generate_dashboard()
@@ -333,20 +461,3 @@ class EnhancedDashboard:
             Result dictionary
         """
         return self.generate_dashboard()
-
-    # Mock data methods for testing
-    def _add_mock_approval(self, approval: Dict[str, Any]):
-        """Add mock approval for testing."""
-        self.mock_approvals.append(approval)
-
-    def _add_mock_plan(self, plan: Dict[str, Any]):
-        """Add mock plan for testing."""
-        self.mock_plans.append(plan)
-
-    def _add_mock_workflow(self, workflow: Dict[str, Any]):
-        """Add mock workflow for testing."""
-        self.mock_workflows.append(workflow)
-
-    def _add_mock_activity(self, activity: Dict[str, Any]):
-        """Add mock activity for testing."""
-        self.mock_activities.append(activity)
@@ -0,0 +1,217 @@
+"""Activity Ring - Recent activity shared by every watcher process
+
+A fixed-size ring of activity entries in an mmap'd file
+(Database/activity_ring.bin). Every process appends to the same ring, so the
+dashboard's "Recent Activity" shows one merged feed no matter which watcher
+renders it.
+
+Appends take a short file lock to claim the next sequence number and write one
+slot: O(1), no file growth. Reads take no lock and cost O(k) for the latest k
+entries. A slot carries its sequence number before and after its body is
+written (the number is cleared first), so a reader skips a slot that is being
+rewritten or has already been reused instead of returning a torn entry.
+
+Layout (little-endian):
+    header  magic[8] capacity:u32 slot_size:u32 next_seq:u64, padded to 64 bytes
+    slot    seq:u64 time:f64 pid:u32 length:u16 reserved:u16 text[slot_size - 24]
+Sequence numbers start at 1; slot seq 0 means empty or being written.
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# Default ring file inside the vault
+RING_NAME = "activity_ring.bin"
+
+# Entries kept before the oldest is overwritten
+DEFAULT_CAPACITY = 256
+
+# Bytes per slot; text beyond SLOT_SIZE - 24 bytes is truncated
+SLOT_SIZE = 256
+
+_MAGIC = b'AERING01'
+_HEADER = struct.Struct('<8sIIQ')
+_HEADER_SIZE = 64
+_SEQ_OFFSET = 16
+_SEQ = struct.Struct('<Q')
+_SLOT = struct.Struct('<QdIHH')
+
+
+@contextmanager
+def _file_lock(fd: int):
+    """Exclusive lock on an open file, held for the with block."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class ActivityRing:
+    """Fixed-size activity ring shared between processes.
+
+    Safe to share between threads. The first process to open the file sets its
+    geometry; later openers adopt it whatever capacity they ask for.
+    """
+
+    def __init__(self, vault_path: str = "AI_Employee_Vault", path: str = None,
+                 capacity: int = DEFAULT_CAPACITY, slot_size: int = SLOT_SIZE):
+        """
+        Open (or create) the ring for a vault.
+
+        Args:
+            vault_path: Vault root
+            path: Ring file (default: Database/activity_ring.bin in the vault)
+            capacity: Number of slots for a new ring
+            slot_size: Bytes per slot for a new ring (at least 32)
+        """
+        self.path = Path(path) if path else Path(vault_path) / "Database" / RING_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0),
+                           0o644)
+        try:
+            with self._lock, _file_lock(self._fd):
+                self.capacity, self.slot_size = self._init_file(capacity, max(slot_size, 32))
+            self._map = mmap.mmap(self._fd, _HEADER_SIZE + self.capacity * self.slot_size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _init_file(self, capacity: int, slot_size: int) -> tuple:
+        """Read the ring geometry, writing a fresh header if the file is new or not a ring."""
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        header = os.read(self._fd, _HEADER.size)
+        if len(header) == _HEADER.size:
+            magic, file_capacity, file_slot_size, _ = _HEADER.unpack(header)
+            size = os.fstat(self._fd).st_size
+            if (magic == _MAGIC and file_capacity and file_slot_size
+                    and size >= _HEADER_SIZE + file_capacity * file_slot_size):
+                return file_capacity, file_slot_size
+
+        os.ftruncate(self._fd, 0)
+        os.ftruncate(self._fd, _HEADER_SIZE + capacity * slot_size)
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, _HEADER.pack(_MAGIC, capacity, slot_size, 1))
+        return capacity, slot_size
+
+    def _slot_offset(self, seq: int) -> int:
+        return _HEADER_SIZE + (seq % self.capacity) * self.slot_size
+
+    # === Public API ===
+
+    def append(self, text: str, timestamp: float = None) -> int:
+        """
+        Add an entry, overwriting the oldest once the ring is full.
+
+        Args:
+            text: Activity description (truncated to fit a slot)
+            timestamp: Epoch time of the activity (default: now)
+
+        Returns:
+            Sequence number of the entry (0 if the ring is closed or the write failed)
+        """
+        body = text.encode('utf-8')[:self.slot_size - _SLOT.size]
+        body = body.decode('utf-8', 'ignore').encode('utf-8')
+        try:
+            with self._lock:
+                if self._map is None:
+                    return 0
+                with _file_lock(self._fd):
+                    seq = _SEQ.unpack_from(self._map, _SEQ_OFFSET)[0]
+                    # Stamped under the lock so sequence order is time order
+                    if timestamp is None:
+                        timestamp = time.time()
+                    offset = self._slot_offset(seq)
+                    # Invalidate, write the body, then publish the sequence number
+                    _SEQ.pack_into(self._map, offset, 0)
+                    _SLOT.pack_into(self._map, offset, 0, timestamp, os.getpid(), len(body), 0)
+                    start = offset + _SLOT.size
+                    self._map[start:start + len(body)] = body
+                    _SEQ.pack_into(self._map, offset, seq)
+                    _SEQ.pack_into(self._map, _SEQ_OFFSET, seq + 1)
+            return seq
+        except (OSError, ValueError) as e:
+            logger.error(f"Activity ring append failed: {e}")
+            return 0
+
+    def latest(self, k: int = 10) -> list:
+        """
+        Most recent entries from every process.
+
+        Args:
+            k: Maximum number of entries
+
+        Returns:
+            Entries newest first, as {'seq', 'time', 'pid', 'text'}
+        """
+        mapped = self._map
+        if mapped is None:
+            return []
+        entries = []
+        newest = _SEQ.unpack_from(mapped, _SEQ_OFFSET)[0] - 1
+        oldest = max(1, newest - min(k, self.capacity) + 1)
+        for seq in range(newest, oldest - 1, -1):
+            offset = self._slot_offset(seq)
+            slot_seq, timestamp, pid, length, _ = _SLOT.unpack_from(mapped, offset)
+            start = offset + _SLOT.size
+            body = mapped[start:start + min(length, self.slot_size - _SLOT.size)]
+            # Skip slots being written or already reused by a newer entry
+            if slot_seq != seq or _SEQ.unpack_from(mapped, offset)[0] != seq:
+                continue
+            entries.append({'seq': seq, 'time': timestamp, 'pid': pid,
+                            'text': body.decode('utf-8', 'replace')})
+        return entries
+
+    def close(self):
+        """Unmap and close the ring file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+                os.close(self._fd)
+
+
+# One ring per vault
+_rings = {}
+_rings_lock = threading.Lock()
+
+
+def get_activity_ring(vault_path: str = "AI_Employee_Vault") -> ActivityRing:
+    """
+    Shared activity ring for a vault.
+
+    Args:
+        vault_path: Vault root
+
+    Returns:
+        ActivityRing for the vault
+    """
+    key = str(Path(vault_path).resolve())
+    with _rings_lock:
+        ring = _rings.get(key)
+        if ring is None:
+            ring = _rings[key] = ActivityRing(vault_path)
+        return ring
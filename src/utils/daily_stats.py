@@ -0,0 +1,313 @@
+"""Daily Stats - Cross-process daily counters with history
+
+Increments are collected in memory and applied in one transaction every
+flush_interval seconds as SQLite UPSERTs (value = value + n), so watchers
+running as separate processes never lose each other's counts and an event
+costs a dictionary update instead of a JSON read-modify-write. Counters are
+keyed by local date: a new day starts at zero on its own, and earlier days
+stay in the table for trend reports.
+
+After each flush today's totals are written to Logs/daily_stats.json, the
+snapshot the dashboard and Obsidian have always read.
+"""
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from src.utils.vault_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Default stats database inside the vault
+STATS_NAME = "daily_stats.db"
+
+# Counters kept for every day, in snapshot order
+STAT_FIELDS = ('emails_processed', 'files_organized', 'actions_completed', 'errors')
+
+# Seconds increments are held in memory before they are applied
+FLUSH_INTERVAL = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT NOT NULL,          -- local date, YYYY-MM-DD
+    stat TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, stat)
+) WITHOUT ROWID;
+"""
+
+_UPSERT = """
+INSERT INTO daily_stats (day, stat, value) VALUES (?, ?, ?)
+ON CONFLICT (day, stat) DO UPDATE SET value = value + excluded.value
+"""
+
+
+def _today() -> str:
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _empty_day(day: str) -> dict:
+    return {'date': day, **{field: 0 for field in STAT_FIELDS}}
+
+
+class DailyStats:
+    """Daily counters shared by every process using the vault.
+
+    Thread-safe. Pending increments are applied by a background thread, by
+    flush(), before every read in this process, and at exit.
+    """
+
+    def __init__(self, vault_path: str = "AI_Employee_Vault", db_path: str = None,
+                 snapshot_path: str = None, flush_interval: float = FLUSH_INTERVAL):
+        """
+        Open (or create) the stats database for a vault.
+
+        Args:
+            vault_path: Vault root
+            db_path: Stats database (default: Database/daily_stats.db in the vault)
+            snapshot_path: JSON snapshot of today (default: Logs/daily_stats.json in the vault)
+            flush_interval: Seconds increments are held before being applied
+        """
+        root = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else root / "Database" / STATS_NAME
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else \
+            root / "Logs" / "daily_stats.json"
+        self.flush_interval = flush_interval
+
+        self._cond = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._pending = Counter()   # (day, stat) -> increment not yet applied
+        self._thread = None
+        self._closed = False
+
+        self._conn = None
+        with self._db_lock:
+            self._import_snapshot(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, reopening it after close() (call with _db_lock held)."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _import_snapshot(self, conn: sqlite3.Connection):
+        """Seed an empty database with the day recorded in an existing JSON snapshot."""
+        if conn.execute("SELECT 1 FROM daily_stats LIMIT 1").fetchone():
+            return
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text(encoding='utf-8'))
+            day = str(snapshot['date'])
+            rows = [(day, field, int(snapshot.get(field, 0))) for field in STAT_FIELDS]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO daily_stats (day, stat, value) VALUES (?, ?, ?)", rows)
+
+    # === Public API ===
+
+    def increment(self, stat: str, amount: int = 1, day: str = None):
+        """
+        Add to one of today's counters.
+
+        Args:
+            stat: Counter name (one of STAT_FIELDS)
+            amount: Amount to add
+            day: Date to count against (default: today)
+
+        Raises:
+            ValueError: If stat is not a known counter
+        """
+        if stat not in STAT_FIELDS:
+            raise ValueError(f"Unknown daily stat: {stat}")
+        key = (day or _today(), stat)
+        with self._cond:
+            self._pending[key] += amount
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self._ensure_thread()
+                self._cond.notify()
+        if closed:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Apply pending increments and refresh the JSON snapshot.
+
+        Returns:
+            Number of counters updated (0 if nothing was pending or the write failed)
+        """
+        with self._cond:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return 0
+
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        _UPSERT, [(day, stat, n) for (day, stat), n in pending.items()])
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"Error saving daily stats: {e}")
+            # Keep the counts for the next attempt
+            with self._cond:
+                self._pending.update(pending)
+            return 0
+
+        self._write_snapshot()
+        return len(pending)
+
+    def get(self, day: str = None) -> dict:
+        """
+        Totals for one day across every process.
+
+        Args:
+            day: Date (default: today)
+
+        Returns:
+            {'date': day, 'emails_processed': n, 'files_organized': n,
+             'actions_completed': n, 'errors': n}
+        """
+        self.flush()
+        day = day or _today()
+        stats = _empty_day(day)
+        try:
+            with self._db_lock:
+                rows = self._connect().execute(
+                    "SELECT stat, value FROM daily_stats WHERE day = ?", (day,)).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading daily stats: {e}")
+            return stats
+        for stat, value in rows:
+            if stat in stats:
+                stats[stat] = value
+        return stats
+
+    def history(self, days: int = 30, end: str = None) -> list:
+        """
+        Daily totals for a trend report.
+
+        Args:
+            days: Number of days, ending with end
+            end: Last date (default: today)
+
+        Returns:
+            One dict per day (as get()), oldest first; days without events are zero
+        """
+        self.flush()
+        last = date.fromisoformat(end or _today())
+        first = last - timedelta(days=days - 1)
+        by_day = {(first + timedelta(days=n)).isoformat():
+                  _empty_day((first + timedelta(days=n)).isoformat()) for n in range(days)}
+        try:
+            with self._db_lock:
+                rows = self._connect().execute(
+                    "SELECT day, stat, value FROM daily_stats WHERE day BETWEEN ? AND ?",
+                    (first.isoformat(), last.isoformat())).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading daily stats history: {e}")
+            rows = []
+        for day, stat, value in rows:
+            if stat in STAT_FIELDS:
+                by_day[day][stat] = value
+        return list(by_day.values())
+
+    def close(self):
+        """
+        Apply pending increments, stop the background thread and close the database.
+
+        Later calls still work: increments are applied as they are made and
+        the database is reopened on demand, so a service closed at exit keeps
+        serving other exit hooks.
+        """
+        with self._cond:
+            if self._closed and self._conn is None:
+                return
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # === Internals ===
+
+    def _write_snapshot(self):
+        """Write today's totals to the JSON snapshot."""
+        day = _today()
+        stats = _empty_day(day)
+        try:
+            with self._db_lock:
+                for stat, value in self._connect().execute(
+                        "SELECT stat, value FROM daily_stats WHERE day = ?", (day,)):
+                    if stat in stats:
+                        stats[stat] = value
+            atomic_write(self.snapshot_path, json.dumps(stats, indent=2).encode('utf-8'))
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error writing daily stats snapshot: {e}")
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='daily-stats', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Apply pending increments every flush_interval."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Let increments pile up for one interval
+                self._cond.wait_for(lambda: self._closed, timeout=self.flush_interval)
+                if self._closed:
+                    return
+            self.flush()
+
+
+# One stats service per vault, flushed at exit
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_daily_stats(vault_path: str = "AI_Employee_Vault", **options) -> DailyStats:
+    """
+    Shared stats service for a vault, opened on first use and flushed at exit.
+
+    Args:
+        vault_path: Vault root
+        **options: DailyStats options, used only when the service is created
+
+    Returns:
+        DailyStats for the vault
+    """
+    key = str(Path(vault_path).resolve())
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = DailyStats(vault_path, **options)
+            atexit.register(service.close)
+        return service
@@ -0,0 +1,288 @@
+"""Dashboard Refresher - Debounced Dashboard.md regeneration
+
+Events (processed items, vault changes) only mark the dashboard dirty. A
+background thread renders once the events stop for a debounce window, and at
+the latest max_latency after the first event of a burst, so ingesting 500
+files costs a handful of renders instead of 500 full regenerations.
+
+Run as a daemon that refreshes the dashboard on vault changes:
+    python -m src.utils.dashboard_refresher
+    python -m src.utils.dashboard_refresher --benchmark 5000
+"""
+import argparse
+import atexit
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds without new events before the dashboard is rendered
+DEFAULT_DEBOUNCE = 1.0
+
+# Longest a continuous stream of events can hold a render back
+DEFAULT_MAX_LATENCY = 5.0
+
+# Folders whose changes show up on the dashboard
+DASHBOARD_FOLDERS = ('Inbox', 'Needs_Action', 'Done')
+
+
+def _default_render():
+    from src.utils.dashboard_updater import update_dashboard_complete
+    return update_dashboard_complete()
+
+
+def _commit_vault_writes():
+    from src.utils.vault_management import flush_vault_writes
+    flush_vault_writes()
+
+
+class DashboardRefresher:
+    """Coalesces dashboard refresh requests into one render per window.
+
+    Thread-safe. notify() renders on the caller's thread only after close();
+    flush() and close() render pending events synchronously.
+    """
+
+    def __init__(self, render=None, debounce: float = DEFAULT_DEBOUNCE,
+                 max_latency: float = DEFAULT_MAX_LATENCY):
+        """
+        Create a refresher.
+
+        Args:
+            render: Callable that regenerates the dashboard (default:
+                dashboard_updater.update_dashboard_complete)
+            debounce: Seconds of quiet before rendering
+            max_latency: Maximum seconds between the first event of a burst
+                and its render
+        """
+        self.render = render or _default_render
+        self.debounce = debounce
+        self.max_latency = max(max_latency, debounce)
+
+        self._cond = threading.Condition()
+        self._render_lock = threading.Lock()
+        self._pending = 0           # events since the last render started
+        self._first = self._due = 0.0
+        self._thread = None
+        self._closed = False
+        self.last_result = None
+
+        self.stats = {
+            'events': 0,            # notify() calls
+            'renders': 0,           # renders run
+            'failures': 0,          # renders that raised
+            'max_delay_ms': 0.0,    # longest first-event-to-render delay
+        }
+
+    # === Public API ===
+
+    def notify(self, event=None):
+        """
+        Record that the dashboard is out of date.
+
+        Args:
+            event: What happened (ignored; accepted so notify can be used
+                directly as a VaultChangeFeed subscriber)
+        """
+        now = time.monotonic()
+        with self._cond:
+            self.stats['events'] += 1
+            if not self._pending:
+                self._first = now
+                self._due = now + self.debounce
+            else:
+                # The render thread rechecks the deadline when it wakes, so
+                # moving it later needs no wakeup
+                self._due = min(now + self.debounce, self._first + self.max_latency)
+            self._pending += 1
+            if not self._closed:
+                if self._pending == 1:
+                    self._ensure_thread()
+                    self._cond.notify()
+                return
+        # Closed: nothing left to coalesce with, render on the caller's thread
+        self._render()
+
+    def flush(self):
+        """
+        Render now if events are pending.
+
+        Returns:
+            The render's result, or None if nothing was pending
+        """
+        with self._cond:
+            if not self._pending:
+                return None
+        return self._render()
+
+    def watch(self, feed, folders=DASHBOARD_FOLDERS) -> int:
+        """
+        Refresh on vault changes reported by a VaultChangeFeed.
+
+        Args:
+            feed: VaultChangeFeed to subscribe to
+            folders: Folders whose changes affect the dashboard
+
+        Returns:
+            Subscription token for feed.unsubscribe()
+        """
+        return feed.subscribe(self.notify, folders=list(folders))
+
+    def close(self):
+        """Render pending events and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    # === Internals ===
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='dashboard-refresher',
+                                            daemon=True)
+            self._thread.start()
+
+    def _render(self):
+        """Render once for every event pending so far."""
+        with self._render_lock:
+            with self._cond:
+                if not self._pending:
+                    return self.last_result
+                first, self._pending = self._first, 0
+            try:
+                self.last_result = self.render()
+            except Exception as e:
+                self.stats['failures'] += 1
+                logger.error(f"Dashboard refresh failed: {e}")
+                return None
+            finally:
+                self.stats['renders'] += 1
+                delay_ms = (time.monotonic() - first) * 1000
+                self.stats['max_delay_ms'] = max(self.stats['max_delay_ms'], delay_ms)
+            return self.last_result
+
+    def _run(self):
+        """Render each burst once its window closes."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    remaining = self._due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+            self._render()
+
+
+# Shared refresher, flushed at exit
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_refresher(**options) -> DashboardRefresher:
+    """
+    Shared dashboard refresher, created on first use and flushed at exit.
+
+    Args:
+        **options: DashboardRefresher options, used only when it is created
+
+    Returns:
+        DashboardRefresher
+    """
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = DashboardRefresher(**options)
+            atexit.register(_close_shared, _refresher)
+        return _refresher
+
+
+def _close_shared(refresher: DashboardRefresher):
+    """Exit hook: render pending events and commit the deferred Dashboard.md write.
+
+    A vault writer first created by that render registers its own exit hook
+    while hooks are already running, so it would never be flushed.
+    """
+    refresher.close()
+    try:
+        _commit_vault_writes()
+    except Exception as e:
+        logger.error(f"Dashboard write at exit failed: {e}")
+
+
+def benchmark(events: int = 5000, render=None, debounce: float = 0.05,
+              max_latency: float = 0.5, activity=None) -> dict:
+    """
+    Measure how many events per second the debounced pipeline absorbs.
+
+    Args:
+        events: Events to send
+        render: Render callable (default: the real dashboard render)
+        debounce: Debounce window for the run
+        max_latency: Max-latency cap for the run
+        activity: Optional callable(n) run per event before notify, e.g.
+            dashboard_updater.add_activity
+
+    Returns:
+        {'events', 'seconds', 'events_per_sec', 'renders', 'max_delay_ms'}
+    """
+    refresher = DashboardRefresher(render, debounce=debounce, max_latency=max_latency)
+    start = time.perf_counter()
+    for n in range(events):
+        if activity is not None:
+            activity(n)
+        refresher.notify()
+    refresher.close()
+    seconds = time.perf_counter() - start
+    return {
+        'events': events,
+        'seconds': seconds,
+        'events_per_sec': events / seconds if seconds else float('inf'),
+        'renders': refresher.stats['renders'],
+        'max_delay_ms': refresher.stats['max_delay_ms'],
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Keep Dashboard.md current')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help='Seconds of quiet before rendering (default: %(default)s)')
+    parser.add_argument('--max-latency', type=float, default=DEFAULT_MAX_LATENCY,
+                        help='Maximum seconds a render is held back (default: %(default)s)')
+    parser.add_argument('--benchmark', type=int, metavar='EVENTS',
+                        help='Measure events/sec against the vault dashboard and exit')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.benchmark:
+        from src.utils.dashboard_updater import add_activity
+        result = benchmark(args.benchmark, debounce=args.debounce, max_latency=args.max_latency,
+                           activity=lambda n: add_activity(f"Benchmark event {n}"))
+        print(f"📊 {result['events']} events in {result['seconds'] * 1000:.1f} ms "
+              f"({result['events_per_sec']:,.0f} events/sec), "
+              f"{result['renders']} render(s), max delay {result['max_delay_ms']:.0f} ms")
+    else:
+        from src.utils.vault_events import VaultChangeFeed
+
+        refresher = get_refresher(debounce=args.debounce, max_latency=args.max_latency)
+        feed = VaultChangeFeed()
+        refresher.watch(feed)
+        refresher.notify()
+        print(f"📊 Refreshing dashboard on vault changes "
+              f"(debounce {args.debounce}s, max latency {args.max_latency}s)")
+        print("Press Ctrl+C to stop...")
+        try:
+            with feed:
+                while True:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            print("\n⏸️  Dashboard refresher stopped")
@@ -1,20 +1,28 @@
 """Dashboard Updater - Maintain real-time Dashboard.md with system status"""
-import json
 from pathlib import Path
 from datetime import datetime
-from collections import deque
 
 # Import vault management
 try:
-    from src.utils.vault_management import read_vault_file, write_vault_file, write_log, count_vault_items
+    from src.utils.vault_management import (read_vault_file, write_vault_file, write_log,
+                                            count_vault_items, flush_vault_writes)
+    from src.utils.activity_ring import get_activity_ring
+    from src.utils.dashboard_refresher import get_refresher
+    from src.utils.daily_stats import get_daily_stats
+    from src.utils.watcher_registry import WATCHERS, format_status, get_registry
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-    from src.utils.vault_management import read_vault_file, write_vault_file, write_log, count_vault_items
+    from src.utils.vault_management import (read_vault_file, write_vault_file, write_log,
+                                            count_vault_items, flush_vault_writes)
+    from src.utils.activity_ring import get_activity_ring
+    from src.utils.dashboard_refresher import get_refresher
+    from src.utils.daily_stats import get_daily_stats
+    from src.utils.watcher_registry import WATCHERS, format_status, get_registry
 
 
-# Global activity buffer (max 10 activities)
-activity_buffer = deque(maxlen=10)
+# Number of activities shown on the dashboard
+RECENT_ACTIVITY_COUNT = 10
 
 
 def calculate_vault_counts() -> dict:
@@ -45,15 +53,30 @@ def calculate_vault_counts() -> dict:
     }
 
 
+def get_watcher_statuses() -> dict:
+    """
+    Get liveness of each watcher from its heartbeats.
+
+    Returns:
+        Dictionary of watcher name -> status (state, lag, items processed, last error)
+    """
+    return get_registry().statuses()
+
+
+def summarize_watchers(statuses: dict) -> str:
+    """Overall watcher state: Active if any watcher is, Stalled if any hangs or died"""
+    states = {status['state'] for status in statuses.values()}
+    if 'Active' in states:
+        return 'Active'
+    if states & {'Stalled', 'Dead'}:
+        return 'Stalled'
+    return 'Stopped'
+
+
 def check_watcher_process() -> str:
-    """Check if watcher process is running"""
+    """Check if any watcher is running (from the heartbeat registry, no process scan)"""
     try:
-        import psutil
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            cmdline = ' '.join(proc.info.get('cmdline', []))
-            if 'watcher' in cmdline.lower():
-                return 'Active'
-        return 'Stopped'
+        return summarize_watchers(get_watcher_statuses())
     except Exception:
         return 'Unknown'
 
@@ -65,8 +88,13 @@ def get_system_status() -> dict:
     Returns:
         Dictionary with status indicators
     """
-    # Check if watcher process is running
-    watcher_status = check_watcher_process()
+    # Check watcher heartbeats
+    try:
+        watchers = get_watcher_statuses()
+        watcher_status = summarize_watchers(watchers)
+    except Exception:
+        watchers = {}
+        watcher_status = 'Unknown'
 
     # Claude Code is assumed connected if dashboard is being updated
     claude_status = 'Connected'
@@ -77,7 +105,7 @@ def get_system_status() -> dict:
     # Overall system status
     if watcher_status == 'Active':
         overall_status = 'Active'
-    elif watcher_status == 'Unknown':
+    elif watcher_status in ('Stalled', 'Unknown'):
         overall_status = 'Warning'
     else:
         overall_status = 'Stopped'
@@ -85,6 +113,7 @@ def get_system_status() -> dict:
     return {
         'overall': overall_status,
         'watcher': watcher_status,
+        'watchers': watchers,
         'claude': claude_status,
         'last_check': last_check,
         'timestamp': datetime.now().isoformat()
@@ -95,12 +124,13 @@ def add_activity(description: str):
     """
     Add new activity to recent activities.
 
+    Activities go to the vault's shared activity ring, so every watcher
+    process sees the others' entries.
+
     Args:
         description: Activity description
     """
-    timestamp = datetime.now().strftime('%H:%M')
-    activity = f"[{timestamp}] {description}"
-    activity_buffer.appendleft(activity)
+    get_activity_ring().append(description)
 
 
 def get_recent_activities() -> str:
@@ -108,16 +138,19 @@ def get_recent_activities() -> str:
     Get formatted recent activities for dashboard.
 
     Returns:
-        Formatted activity list as markdown
+        Formatted activity list as markdown, newest first, from all processes
     """
-    if not activity_buffer:
+    activities = get_activity_ring().latest(RECENT_ACTIVITY_COUNT)
+    if not activities:
         return "- No recent activity"
 
-    return '\n'.join(f"- {activity}" for activity in list(activity_buffer)[:10])
+    return '\n'.join(
+        f"- [{datetime.fromtimestamp(entry['time']).strftime('%H:%M')}] {entry['text']}"
+        for entry in activities)
 
 
 def get_stats_file() -> Path:
-    """Get path to daily stats file"""
+    """Get path to the daily stats snapshot (refreshed from the stats database)"""
     return Path("AI_Employee_Vault/Logs/daily_stats.json")
 
 
@@ -134,51 +167,36 @@ def create_new_stats(date: str) -> dict:
 
 def load_daily_stats() -> dict:
     """
-    Load or initialize daily statistics.
+    Load today's statistics, summed over every watcher process.
 
     Returns:
-        Dictionary with daily stats
-    """
-    stats_file = get_stats_file()
-    today = datetime.now().strftime('%Y-%m-%d')
-
-    if stats_file.exists():
-        try:
-            stats = json.loads(stats_file.read_text())
-            # Reset if new day
-            if stats.get('date') != today:
-                stats = create_new_stats(today)
-        except Exception:
-            stats = create_new_stats(today)
-    else:
-        stats = create_new_stats(today)
-        stats_file.parent.mkdir(parents=True, exist_ok=True)
+        Dictionary with daily stats (fresh counters after midnight)
+    """
+    return get_daily_stats().get()
+
 
-    return stats
+# Counter incremented for each stat type
+STAT_TYPES = {
+    'email': 'emails_processed',
+    'file': 'files_organized',
+    'completed': 'actions_completed',
+    'error': 'errors',
+}
 
 
 def update_daily_stats(stat_type: str):
     """
     Update specific daily statistic.
 
+    The increment is applied to the shared stats database within a second
+    (and at exit), so concurrent watchers never overwrite each other's counts.
+
     Args:
         stat_type: Type of stat to increment ('email', 'file', 'completed', 'error')
     """
-    stats = load_daily_stats()
-
-    # Increment appropriate counter
-    if stat_type == 'email':
-        stats['emails_processed'] += 1
-    elif stat_type == 'file':
-        stats['files_organized'] += 1
-    elif stat_type == 'completed':
-        stats['actions_completed'] += 1
-    elif stat_type == 'error':
-        stats['errors'] += 1
-
-    # Save updated stats
-    stats_file = get_stats_file()
-    stats_file.write_text(json.dumps(stats, indent=2))
+    field = STAT_TYPES.get(stat_type)
+    if field:
+        get_daily_stats().increment(field)
 
 
 def get_daily_stats_formatted() -> str:
@@ -196,6 +214,20 @@ def get_daily_stats_formatted() -> str:
 - Errors: {stats['errors']}"""
 
 
+def get_watcher_lines(watchers: dict) -> str:
+    """
+    Get one dashboard line per watcher.
+
+    Args:
+        watchers: Watcher statuses from get_watcher_statuses()
+
+    Returns:
+        Formatted watcher list as markdown (indented under the Watcher line)
+    """
+    return ''.join(f"\n  - {WATCHERS.get(name, name)}: {format_status(watchers[name])}"
+                   for name in sorted(watchers))
+
+
 def generate_dashboard_content(counts: dict, status: dict) -> str:
     """
     Generate complete Dashboard.md content.
@@ -223,7 +255,7 @@ def generate_dashboard_content(counts: dict, status: dict) -> str:
 {get_recent_activities()}
 
 ## System Status
-- Watcher: {status['watcher']}
+- Watcher: {status['watcher']}{get_watcher_lines(status.get('watchers', {}))}
 - Claude Code: {status['claude']}
 - Last Check: {status['last_check']}
 
@@ -254,7 +286,7 @@ def update_dashboard_complete() -> dict:
         content = generate_dashboard_content(counts, status)
 
         # Step 4: Write to file
-        result = write_vault_file("Dashboard.md", content)
+        result = write_vault_file("Dashboard.md", content, defer=True)
 
         if result:
             write_log('INFO', 'DashboardUpdater', 'Dashboard updated successfully')
@@ -278,9 +310,13 @@ def update_dashboard_complete() -> dict:
 
 def log_and_update(activity: str, stat_type: str = None):
     """
-    Add activity and update dashboard in one call.
+    Add activity and schedule a dashboard refresh in one call.
     This is the MAIN function to call after processing any item.
 
+    The dashboard is not regenerated here: the shared DashboardRefresher
+    renders once per burst of events (see dashboard_refresher). Call
+    flush_dashboard() when the file must be current right away.
+
     Args:
         activity: Activity description to log (e.g., "Processed file: document.pdf → Inbox/")
         stat_type: Optional stat type to increment ('email', 'file', 'completed', 'error')
@@ -296,14 +332,30 @@ def log_and_update(activity: str, stat_type: str = None):
     if stat_type:
         update_daily_stats(stat_type)
 
-    # Full dashboard update
-    result = update_dashboard_complete()
+    # Debounced dashboard update
+    get_refresher().notify(activity)
 
     # Print confirmation for CLI visibility
-    if result['status'] == 'success':
-        print(f"📊 Dashboard updated: {activity}")
+    print(f"📊 Dashboard update queued: {activity}")
 
-    return result
+    return {
+        'status': 'queued',
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def flush_dashboard() -> dict:
+    """
+    Render queued dashboard updates now and write Dashboard.md to disk.
+
+    Returns:
+        Result of the render (as update_dashboard_complete), or
+        {'status': 'unchanged'} if nothing was queued
+    """
+    result = get_refresher().flush()
+    # The render defers its write to the vault writer; commit it before returning
+    flush_vault_writes()
+    return result or {'status': 'unchanged'}
 
 
 def quick_update_counts():
@@ -337,7 +389,7 @@ def quick_update_counts():
             else:
                 new_lines.append(line)
 
-        write_vault_file("Dashboard.md", '\n'.join(new_lines))
+        write_vault_file("Dashboard.md", '\n'.join(new_lines), defer=True)
         return {'status': 'success', 'counts': counts}
     except Exception as e:
         return {'status': 'error', 'error': str(e)}
@@ -0,0 +1,380 @@
+"""Log Index - Sidecar offset indexes and time-ordered queries over vault logs
+
+Each log file under AI_Employee_Vault/Logs gets a small JSON sidecar in
+Logs/.index/ that maps (minute, component, level) runs to byte ranges of the
+file. Queries pick the matching ranges from the sidecars, read only those
+bytes through mmap and merge the entries of every file in time order, so a
+query over months of logs touches a few kilobytes per matching file instead of
+whole files.
+
+Sidecars are brought up to date incrementally: only bytes appended since the
+last indexing are parsed, and a file that was truncated or replaced is
+reindexed from scratch. DailyFileHandler indexes each day's file as it rotates.
+
+Understood line formats:
+    [2026-03-01T09:15:02.123] [INFO] [GmailWatcher] message     (<date>.log)
+    {"ts": "...", "level": "...", "component": "...", "message": "..."}  (<date>.jsonl)
+    [2026-03-01T09:15:02.123Z] ERROR: message                    (whatsapp_errors.log)
+Lines that match none of these (tracebacks, wrapped messages) belong to the
+entry above them.
+"""
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+
+from src.utils.vault_writer import atomic_write
+
+# Default log folder
+DEFAULT_LOG_DIR = Path("AI_Employee_Vault/Logs")
+
+# Sidecar folder inside the log folder
+INDEX_DIR_NAME = ".index"
+
+# Bump when the sidecar layout changes; older sidecars are rebuilt
+INDEX_VERSION = 1
+
+# Extensions that are indexed
+LOG_SUFFIXES = ('.log', '.jsonl')
+
+# Component for files whose lines do not name one
+FILE_COMPONENTS = {
+    'whatsapp_errors.log': 'WhatsAppWatcher',
+}
+
+_TEXT_LINE = re.compile(r'\[([^\]]+)\] \[([A-Za-z]+)\] \[([^\]]*)\] ?(.*)')
+_BARE_LINE = re.compile(r'\[([^\]]+)\] ([A-Z]+): ?(.*)')
+_DATED_NAME = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Bytes hashed to notice a file that was replaced rather than appended to
+_HEAD_BYTES = 256
+
+
+def _normalize_level(level: str) -> str:
+    level = level.upper()
+    return 'WARN' if level == 'WARNING' else level
+
+
+def _parse_timestamp(text: str):
+    """Naive local datetime for an ISO timestamp, or None."""
+    try:
+        ts = datetime.fromisoformat(text.strip())
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.astimezone().replace(tzinfo=None)
+    return ts
+
+
+def parse_log_line(line: str, default_component: str = ''):
+    """
+    Parse the first line of a log entry.
+
+    Args:
+        line: Line without its newline
+        default_component: Component for formats that do not name one
+
+    Returns:
+        (timestamp, level, component, message), or None for a continuation line
+    """
+    if line.startswith('{'):
+        try:
+            record = json.loads(line)
+            ts = _parse_timestamp(record['ts'])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        if ts is None:
+            return None
+        return (ts, _normalize_level(str(record.get('level', ''))),
+                str(record.get('component') or default_component),
+                str(record.get('message', '')))
+
+    if not line.startswith('['):
+        return None
+    match = _TEXT_LINE.match(line)
+    if match:
+        ts = _parse_timestamp(match.group(1))
+        if ts is not None:
+            return ts, _normalize_level(match.group(2)), match.group(3), match.group(4)
+    match = _BARE_LINE.match(line)
+    if match:
+        ts = _parse_timestamp(match.group(1))
+        if ts is not None:
+            return ts, _normalize_level(match.group(2)), default_component, match.group(3)
+    return None
+
+
+def _minute(ts: datetime) -> str:
+    return ts.strftime('%Y-%m-%dT%H:%M')
+
+
+def _default_component(path: Path) -> str:
+    return FILE_COMPONENTS.get(path.name, path.stem)
+
+
+def index_path(log_file: Path, log_dir: Path) -> Path:
+    """Sidecar location for a log file."""
+    rel = Path(log_file).resolve().relative_to(Path(log_dir).resolve())
+    return Path(log_dir) / INDEX_DIR_NAME / rel.parent / f"{rel.name}.idx.json"
+
+
+def _head_digest(f, size: int) -> str:
+    f.seek(0)
+    return hashlib.blake2b(f.read(min(size, _HEAD_BYTES)), digest_size=8).hexdigest()
+
+
+def _load_index(sidecar: Path):
+    try:
+        index = json.loads(sidecar.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        return None
+    return index
+
+
+def _empty_index() -> dict:
+    return {'version': INDEX_VERSION, 'size': 0, 'head': '', 'head_size': 0,
+            'components': [], 'levels': [], 'ranges': []}
+
+
+def _extend_index(index: dict, f, start: int, default_component: str):
+    """Index complete lines from byte offset start onwards."""
+    components = {name: i for i, name in enumerate(index['components'])}
+    levels = {name: i for i, name in enumerate(index['levels'])}
+    ranges = index['ranges']
+    offset = start
+    f.seek(start)
+
+    for raw in f:
+        if not raw.endswith(b'\n'):
+            break   # partial line still being written
+        end = offset + len(raw)
+        parsed = parse_log_line(raw.decode('utf-8', 'replace').rstrip('\r\n'),
+                                default_component)
+        if parsed is None:
+            # Continuation of the entry above (or junk before the first entry)
+            if ranges and ranges[-1][4] == offset:
+                ranges[-1][4] = end
+            offset = end
+            continue
+
+        ts, level, component, _ = parsed
+        key = (_minute(ts),
+               components.setdefault(component, len(components)),
+               levels.setdefault(level, len(levels)))
+        last = ranges[-1] if ranges else None
+        if last is not None and tuple(last[:3]) == key and last[4] == offset:
+            last[4] = end
+        else:
+            ranges.append([*key, offset, end])
+        offset = end
+
+    index['components'] = list(components)
+    index['levels'] = list(levels)
+    index['size'] = offset
+
+
+def index_log_file(log_file, log_dir=None, rebuild: bool = False) -> dict:
+    """
+    Bring a log file's sidecar index up to date.
+
+    Args:
+        log_file: Log file to index
+        log_dir: Log folder holding the sidecar folder (default: the file's folder)
+        rebuild: Reindex from the start even if the sidecar looks current
+
+    Returns:
+        The index: {'size', 'components', 'levels',
+        'ranges': [[minute, component id, level id, start, end], ...]}
+
+    Raises:
+        OSError: If the log file cannot be read
+    """
+    log_file = Path(log_file)
+    log_dir = Path(log_dir) if log_dir is not None else log_file.parent
+    sidecar = index_path(log_file, log_dir)
+    index = None if rebuild else _load_index(sidecar)
+
+    with open(log_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if index is not None:
+            head = _head_digest(f, min(size, index['head_size']))
+            if size < index['size'] or head != index['head']:
+                index = None    # truncated or replaced
+            elif size == index['size']:
+                return index
+        if index is None:
+            index = _empty_index()
+
+        indexed = index['size']
+        _extend_index(index, f, indexed, _default_component(log_file))
+        if index['size'] == indexed and sidecar.exists():
+            return index    # only a partial line was added
+        index['head_size'] = min(index['size'], _HEAD_BYTES)
+        index['head'] = _head_digest(f, index['head_size'])
+
+    atomic_write(sidecar, json.dumps(index, separators=(',', ':')).encode('utf-8'))
+    return index
+
+
+def _log_files(log_dir: Path):
+    """Every indexable log file under log_dir, sidecars excluded."""
+    for root, dirs, files in os.walk(log_dir):
+        dirs[:] = sorted(d for d in dirs if d != INDEX_DIR_NAME)
+        for name in sorted(files):
+            if name.endswith(LOG_SUFFIXES):
+                yield Path(root) / name
+
+
+def index_logs(log_dir=None, rebuild: bool = False) -> dict:
+    """
+    Bring every sidecar in a log folder up to date.
+
+    Args:
+        log_dir: Log folder (default: AI_Employee_Vault/Logs)
+        rebuild: Reindex every file from the start
+
+    Returns:
+        {'files': files indexed, 'bytes': bytes covered, 'errors': files that failed}
+    """
+    log_dir = Path(log_dir or DEFAULT_LOG_DIR)
+    stats = {'files': 0, 'bytes': 0, 'errors': 0}
+    for log_file in _log_files(log_dir):
+        try:
+            stats['bytes'] += index_log_file(log_file, log_dir, rebuild)['size']
+            stats['files'] += 1
+        except OSError:
+            stats['errors'] += 1
+    return stats
+
+
+def _as_datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+def _file_may_match(log_file: Path, since, until) -> bool:
+    """Skip dated files outside the time range without opening them."""
+    match = _DATED_NAME.search(log_file.name)
+    if not match:
+        return True
+    try:
+        day = date.fromisoformat(match.group(1))
+    except ValueError:
+        return True
+    if since is not None and day < since.date():
+        return False
+    if until is not None and datetime(day.year, day.month, day.day) >= until:
+        return False
+    return True
+
+
+def _file_entries(log_file: Path, index: dict, since, until, components, levels, contains):
+    """Matching entries of one file, in file order."""
+    wanted_components = {i for i, name in enumerate(index['components'])
+                         if components is None or name.lower() in components}
+    wanted_levels = {i for i, name in enumerate(index['levels'])
+                     if levels is None or name in levels}
+    low = _minute(since) if since is not None else None
+    high = _minute(until) if until is not None else None
+
+    spans = []
+    for minute, component, level, start, end in index['ranges']:
+        if component not in wanted_components or level not in wanted_levels:
+            continue
+        if (low is not None and minute < low) or (high is not None and minute > high):
+            continue
+        if spans and spans[-1][1] == start:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+    if not spans:
+        return
+
+    default_component = _default_component(log_file)
+    with open(log_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start, end in spans:
+                entry = None
+                offset = start
+                for raw in mapped[start:end].splitlines(keepends=True):
+                    line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                    parsed = parse_log_line(line, default_component)
+                    if parsed is None:
+                        if entry is not None:
+                            entry['message'] += '\n' + line
+                    else:
+                        if entry is not None and _matches(entry, since, until, components,
+                                                          levels, contains):
+                            yield entry
+                        ts, level, component, message = parsed
+                        entry = {'timestamp': ts, 'level': level, 'component': component,
+                                 'message': message, 'file': str(log_file), 'offset': offset}
+                    offset += len(raw)
+                if entry is not None and _matches(entry, since, until, components,
+                                                  levels, contains):
+                    yield entry
+
+
+def _matches(entry: dict, since, until, components, levels, contains) -> bool:
+    if since is not None and entry['timestamp'] < since:
+        return False
+    if until is not None and entry['timestamp'] >= until:
+        return False
+    if components is not None and entry['component'].lower() not in components:
+        return False
+    if levels is not None and entry['level'] not in levels:
+        return False
+    return contains is None or contains in entry['message'].lower()
+
+
+def query_logs(log_dir=None, since=None, until=None, components=None, levels=None,
+               contains: str = None, limit: int = None):
+    """
+    Find log entries across every log file, oldest first.
+
+    Args:
+        log_dir: Log folder (default: AI_Employee_Vault/Logs)
+        since: Earliest timestamp (datetime, date or ISO string)
+        until: Latest timestamp, exclusive
+        components: Component names to keep (case-insensitive)
+        levels: Levels to keep (WARN and WARNING are the same)
+        contains: Case-insensitive text the message must contain
+        limit: Maximum entries
+
+    Yields:
+        {'timestamp', 'level', 'component', 'message', 'file', 'offset'} dicts
+    """
+    log_dir = Path(log_dir or DEFAULT_LOG_DIR)
+    since, until = _as_datetime(since), _as_datetime(until)
+    if components is not None:
+        components = {name.lower() for name in components}
+    if levels is not None:
+        levels = {_normalize_level(level) for level in levels}
+    if contains is not None:
+        contains = contains.lower()
+
+    streams = []
+    for log_file in _log_files(log_dir):
+        if not _file_may_match(log_file, since, until):
+            continue
+        try:
+            index = index_log_file(log_file, log_dir)
+        except OSError:
+            continue
+        streams.append(_file_entries(log_file, index, since, until, components, levels,
+                                     contains))
+
+    merged = heapq.merge(*streams, key=lambda entry: entry['timestamp'])
+    for count, entry in enumerate(merged):
+        if limit is not None and count >= limit:
+            return
+        yield entry
@@ -0,0 +1,385 @@
+"""Vault Events - Real-time change feed for the AI Employee Vault
+
+Files reach Inbox, Needs_Action, Done, Approved and Rejected through our own
+writers and through Obsidian drag-and-drop alike. VaultChangeFeed watches the
+vault with Linux inotify, collects the folders touched during a short window
+(so a storm of events costs one rescan per folder), reconciles just those
+folders into the VaultManifest and hands the resulting changes to
+subscribers. If the kernel's inotify queue overflows, events were lost, so
+the manifest is rebuilt from scratch and subscribers are told to resync.
+
+Where inotify is unavailable the feed polls the manifest's folder stamps
+instead, which detects the same changes with a little more latency.
+"""
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    from src.utils.vault_manifest import VaultManifest, get_manifest
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.utils.vault_manifest import VaultManifest, get_manifest
+
+logger = logging.getLogger(__name__)
+
+# inotify event flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Events that change what a folder contains (IN_MODIFY is left out: a write
+# shows up once as IN_CLOSE_WRITE instead of once per write() call)
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+              | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Change dict delivered to every subscriber after an overflow
+RESYNC = {'change': 'resync', 'path': None, 'folder': '', 'kind': None}
+
+
+class _Inotify:
+    """Minimal ctypes binding for the Linux inotify API."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm = libc.inotify_rm_watch
+        self._rm.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._add(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def rm_watch(self, wd: int):
+        # EINVAL just means the kernel already dropped the watch
+        self._rm(self.fd, wd)
+
+    def read(self) -> list:
+        """Pending events as (wd, mask, name) tuples."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+def inotify_available() -> bool:
+    """Whether the inotify change feed can run on this system."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        _Inotify().close()
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
+class VaultChangeFeed:
+    """Keeps the vault manifest current and notifies subscribers of changes.
+
+    Subscribers are called on the feed's thread with a list of change dicts
+    (change: added/modified/removed, path, folder, kind); after an inotify
+    overflow they get a single RESYNC change instead and should recompute
+    whatever they derived from earlier changes.
+    """
+
+    def __init__(self, manifest: VaultManifest = None, vault_path: str = "AI_Employee_Vault",
+                 coalesce: float = 0.2, poll_interval: float = 2.0, use_inotify: bool = None):
+        """
+        Set up the feed (call start() to begin watching).
+
+        Args:
+            manifest: Manifest to keep current (default: the shared one for vault_path)
+            vault_path: Vault root, used when no manifest is given
+            coalesce: Seconds to gather events after the first before applying them
+            poll_interval: Seconds between stamp checks when polling
+            use_inotify: Force inotify on or off (default: use it when available)
+        """
+        self.manifest = manifest or get_manifest(vault_path)
+        self.root = self.manifest.root
+        self.coalesce = coalesce
+        self.poll_interval = poll_interval
+        self.use_inotify = inotify_available() if use_inotify is None else use_inotify
+
+        self._subscribers = {}
+        self._next_token = 0
+        self._sub_lock = threading.Lock()
+
+        self._inotify = None
+        self._watches = {}   # wd -> folder
+        self._folders = {}   # folder -> wd
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = None, None
+
+        self.stats = {'events': 0, 'batches': 0, 'folders_synced': 0, 'resyncs': 0}
+
+    # === Subscriptions ===
+
+    def subscribe(self, callback, folders=None) -> int:
+        """
+        Register a callback for vault changes.
+
+        Args:
+            callback: Called with a list of change dicts
+            folders: Only deliver changes in these folders (and below); default all
+
+        Returns:
+            Token for unsubscribe()
+        """
+        prefixes = None
+        if folders is not None:
+            prefixes = tuple(self.manifest._folder(f) for f in folders)
+        with self._sub_lock:
+            self._next_token += 1
+            self._subscribers[self._next_token] = (callback, prefixes)
+            return self._next_token
+
+    def unsubscribe(self, token: int):
+        """Remove a subscription."""
+        with self._sub_lock:
+            self._subscribers.pop(token, None)
+
+    def _publish(self, changes: list):
+        with self._sub_lock:
+            subscribers = list(self._subscribers.values())
+        for callback, prefixes in subscribers:
+            if prefixes is None:
+                selected = changes
+            else:
+                selected = [c for c in changes if c is RESYNC or any(
+                    not p or c['folder'] == p or c['folder'].startswith(p + '/')
+                    for p in prefixes)]
+            if not selected:
+                continue
+            try:
+                callback(selected)
+            except Exception as e:
+                logger.error(f"Vault change subscriber {callback!r} failed: {e}")
+
+    # === Lifecycle ===
+
+    def start(self):
+        """Start watching in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if self.use_inotify:
+            self._inotify = _Inotify()
+            self._wake_r, self._wake_w = os.pipe()
+            self._watch_tree('')
+            target = self._run_inotify
+        else:
+            target = self._run_polling
+        # Catch up on anything that changed while nobody was watching
+        self._apply(self.manifest.sync([''], recursive=True))
+        self._thread = threading.Thread(target=target, name='vault-change-feed', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and release the inotify descriptor."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b'x')
+        self._thread.join()
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._inotify, self._wake_r, self._wake_w = None, None, None
+            self._watches.clear()
+            self._folders.clear()
+
+    def __enter__(self) -> 'VaultChangeFeed':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # === Watch bookkeeping ===
+
+    def _watch_tree(self, folder: str):
+        """Add watches for a folder and every folder below it."""
+        top = self.root / folder
+        for dirpath, dirnames, _ in os.walk(top):
+            rel = Path(dirpath).relative_to(self.root).as_posix()
+            rel = '' if rel == '.' else rel
+            try:
+                wd = self._inotify.add_watch(Path(dirpath), WATCH_MASK)
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    logger.warning("inotify watch limit reached; raise fs.inotify.max_user_watches")
+                    return
+                # Removed before we got to it
+                dirnames[:] = []
+                continue
+            self._watches[wd] = rel
+            self._folders[rel] = wd
+
+    def _unwatch_tree(self, folder: str):
+        """Drop watches for a folder that moved away or was deleted."""
+        prefix = folder + '/'
+        for rel in [f for f in self._folders if f == folder or f.startswith(prefix)]:
+            wd = self._folders.pop(rel)
+            self._watches.pop(wd, None)
+            self._inotify.rm_watch(wd)
+
+    def _rewatch_all(self):
+        for wd in list(self._watches):
+            self._inotify.rm_watch(wd)
+        self._watches.clear()
+        self._folders.clear()
+        self._watch_tree('')
+
+    # === Event loops ===
+
+    def _collect(self, events: list, dirty: set) -> bool:
+        """Fold raw events into the set of dirty folders.
+
+        Returns:
+            True if the kernel queue overflowed
+        """
+        overflow = False
+        for wd, mask, name in events:
+            self.stats['events'] += 1
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                folder = self._watches.pop(wd, None)
+                if folder is not None and self._folders.get(folder) == wd:
+                    del self._folders[folder]
+                continue
+            folder = self._watches.get(wd)
+            if folder is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                # The parent's own event marks the parent dirty
+                continue
+            rel = f"{folder}/{name}" if folder else name
+            if rel in self.manifest.ignored:
+                continue
+            dirty.add(folder)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(rel)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._unwatch_tree(rel)
+        return overflow
+
+    def _run_inotify(self):
+        poller = select.poll()
+        poller.register(self._inotify.fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+
+        while not self._stop.is_set():
+            if not poller.poll(None) or self._stop.is_set():
+                continue
+
+            dirty = set()
+            overflow = self._collect(self._inotify.read(), dirty)
+            # Gather the rest of the storm before touching the manifest
+            deadline = time.monotonic() + self.coalesce
+            while not overflow and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not poller.poll(remaining * 1000):
+                    break
+                overflow = self._collect(self._inotify.read(), dirty)
+
+            try:
+                if overflow:
+                    self._resync()
+                elif dirty:
+                    self.stats['folders_synced'] += len(dirty)
+                    self._apply(self.manifest.sync(dirty))
+            except Exception as e:
+                logger.error(f"Vault change feed failed to apply changes: {e}")
+
+    def _run_polling(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                # Stamp-checked: only folders whose mtime moved are rescanned
+                self._apply(self.manifest.sync([''], recursive=True))
+            except Exception as e:
+                logger.error(f"Vault change poll failed: {e}")
+
+    def _resync(self):
+        """Rebuild after lost events and tell every subscriber."""
+        logger.warning("inotify queue overflowed; rebuilding the vault manifest")
+        self.stats['resyncs'] += 1
+        # Drain whatever is still queued; the rebuild covers it
+        while self._inotify.read():
+            pass
+        self._rewatch_all()
+        self.manifest.rebuild()
+        self._publish([RESYNC])
+
+    def _apply(self, changes: list):
+        if changes:
+            self.stats['batches'] += 1
+            self._publish(changes)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    vault = sys.argv[1] if len(sys.argv) > 1 else 'AI_Employee_Vault'
+
+    def show(changes):
+        for change in changes:
+            print(f"{change['change']:>8}  {change['path'] or '(whole vault)'}")
+
+    feed = VaultChangeFeed(VaultManifest(vault))
+    feed.subscribe(show)
+    print(f"👀 Watching vault: {vault} ({'inotify' if feed.use_inotify else 'polling'})")
+    print("Press Ctrl+C to stop...")
+    try:
+        with feed:
+            while True:
+                time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n⏸️  Vault change feed stopped")
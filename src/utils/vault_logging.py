@@ -0,0 +1,317 @@
+"""Vault Logging - Queue-backed structured logging for the AI Employee Vault
+
+Callers only build a log record and put it on a queue. A listener thread
+writes the records to AI_Employee_Vault/Logs/<YYYY-MM-DD>.log through a
+buffered file that stays open for the whole day, and flushes it whenever the
+queue runs dry or a batch fills up, so a burst of lines costs one write()
+rather than an open/append/close per line. When a day's file is done its
+query index is brought up to date (see log_index).
+
+Configuration (configure_logging() arguments, or the environment at first use):
+    AI_EMPLOYEE_LOG_FORMAT=jsonl                      one JSON object per line (<date>.jsonl)
+    AI_EMPLOYEE_LOG_LEVELS=VaultManager=WARN,Gmail=DEBUG   per-component levels
+    AI_EMPLOYEE_LOG_LEVEL=INFO                        default level for every component
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.utils.log_index import index_log_file
+
+# Parent of every component logger
+LOGGER_NAME = 'ai_employee'
+
+# Default daily log folder
+DEFAULT_LOG_DIR = Path("AI_Employee_Vault/Logs")
+
+# Level names used in the vault logs (write_log has always said WARN)
+LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+_LEVEL_NAMES = {logging.DEBUG: 'DEBUG', logging.INFO: 'INFO', logging.WARNING: 'WARN',
+                logging.ERROR: 'ERROR', logging.CRITICAL: 'CRITICAL'}
+
+_state_lock = threading.RLock()
+_listener = None
+_handler = None
+_queue = None
+_component_loggers = {}
+
+
+def _level(level) -> int:
+    if isinstance(level, int):
+        return level
+    return LEVELS.get(str(level).upper(), logging.INFO)
+
+
+def _parse_levels(spec: str) -> dict:
+    """Parse 'Component=LEVEL,Other=LEVEL' into a dict."""
+    levels = {}
+    for part in spec.split(','):
+        component, _, level = part.partition('=')
+        if component.strip() and level.strip():
+            levels[component.strip()] = level.strip()
+    return levels
+
+
+class _VaultRecord(logging.LogRecord):
+    """LogRecord holding only what the vault log writes.
+
+    Skips the caller-frame lookup and process/thread bookkeeping a regular
+    LogRecord does, which is most of the per-call cost of stdlib logging.
+    """
+
+    def __init__(self, name: str, levelno: int, component: str, vault_level: str, message: str):
+        self.name = name
+        self.msg = message
+        self.args = None
+        self.levelno = levelno
+        self.levelname = _LEVEL_NAMES.get(levelno, vault_level)
+        self.created = time.time()
+        self.msecs = 0
+        self.relativeCreated = 0
+        self.component = component
+        self.vault_level = vault_level
+        self.exc_info = self.exc_text = self.stack_info = None
+        self.pathname = self.filename = self.module = self.funcName = ''
+        self.lineno = 0
+        self.thread = self.threadName = self.process = self.processName = None
+
+
+class _FlushRequest:
+    """Queue marker: the listener flushes its handlers and sets ``done``."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that passes plain records through without copying them."""
+
+    def prepare(self, record):
+        if record.args or record.exc_info or record.stack_info:
+            return super().prepare(record)
+        return record
+
+
+class DailyFileHandler(logging.Handler):
+    """Writes records to one file per day, flushing in batches.
+
+    Runs on the listener thread only; flush() may be called from anywhere.
+    """
+
+    def __init__(self, log_dir: Path, json_lines: bool = False, max_batch: int = 256):
+        super().__init__()
+        self.log_dir = Path(log_dir)
+        self.json_lines = json_lines
+        self.max_batch = max_batch
+        self._stream = None
+        self._day_start = self._day_end = 0.0
+        self._unflushed = 0
+
+    def _open_for(self, created: float):
+        """Switch to the file for the day a record was created on."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._index(self.path)
+        day = datetime.fromtimestamp(created)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        suffix = 'jsonl' if self.json_lines else 'log'
+        self.path = self.log_dir / f"{day.strftime('%Y-%m-%d')}.{suffix}"
+        self._stream = open(self.path, 'a', encoding='utf-8', buffering=64 * 1024)
+        start = datetime(day.year, day.month, day.day)
+        self._day_start = start.timestamp()
+        self._day_end = (start + timedelta(days=1)).timestamp()
+
+    def _index(self, path: Path):
+        """Bring the query index of a finished day's file up to date."""
+        try:
+            index_log_file(path, self.log_dir)
+        except OSError as e:
+            logging.getLogger(__name__).warning("Could not index %s: %s", path, e)
+
+    def format_line(self, record: logging.LogRecord) -> str:
+        level = getattr(record, 'vault_level', None) or _LEVEL_NAMES.get(record.levelno,
+                                                                         record.levelname)
+        component = getattr(record, 'component', None) or record.name.rpartition('.')[2]
+        timestamp = datetime.fromtimestamp(record.created).isoformat()
+        message = record.getMessage()
+        if self.json_lines:
+            return json.dumps({'ts': timestamp, 'level': level, 'component': component,
+                               'message': message}, ensure_ascii=False) + '\n'
+        return f"[{timestamp}] [{level}] [{component}] {message}\n"
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self._stream is None or not (self._day_start <= record.created < self._day_end):
+                self._open_for(record.created)
+            self._stream.write(self.format_line(record))
+            self._unflushed += 1
+            if self._unflushed >= self.max_batch:
+                self._stream.flush()
+                self._unflushed = 0
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if self._stream is not None and self._unflushed:
+                self._stream.flush()
+                self._unflushed = 0
+
+    def close(self):
+        with self.lock:
+            if self._stream is not None:
+                self._stream.flush()
+                self._stream.close()
+                self._stream = None
+        super().close()
+
+
+class _BatchingListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._flush_handlers()
+            return self.queue.get(block)
+
+    def handle(self, record):
+        if isinstance(record, _FlushRequest):
+            self._flush_handlers()
+            record.done.set()
+            return
+        super().handle(record)
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            handler.flush()
+
+
+def configure_logging(log_dir=None, json_lines: bool = None, levels: dict = None,
+                      default_level=None, max_batch: int = 256):
+    """
+    Set up (or reconfigure) the vault log pipeline.
+
+    Args:
+        log_dir: Folder for daily log files (default: AI_Employee_Vault/Logs)
+        json_lines: Write JSON lines to <date>.jsonl instead of text
+        levels: Per-component minimum levels, e.g. {'VaultManager': 'WARN'}
+        default_level: Minimum level for components without their own
+        max_batch: Lines written between forced flushes under sustained load
+    """
+    global _listener, _handler, _queue
+    if json_lines is None:
+        json_lines = os.environ.get('AI_EMPLOYEE_LOG_FORMAT', '').lower() in ('json', 'jsonl')
+    if levels is None:
+        levels = _parse_levels(os.environ.get('AI_EMPLOYEE_LOG_LEVELS', ''))
+    if default_level is None:
+        default_level = os.environ.get('AI_EMPLOYEE_LOG_LEVEL', 'DEBUG')
+
+    with _state_lock:
+        _stop_locked()
+
+        _queue = queue.SimpleQueue()
+        _handler = DailyFileHandler(Path(log_dir or DEFAULT_LOG_DIR).resolve(),
+                                    json_lines=json_lines, max_batch=max_batch)
+        _listener = _BatchingListener(_queue, _handler)
+
+        root = logging.getLogger(LOGGER_NAME)
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(_QueueHandler(_queue))
+        root.setLevel(_level(default_level))
+        root.propagate = False
+
+        for component, component_logger in _component_loggers.items():
+            component_logger.setLevel(logging.NOTSET)
+        for component, level in levels.items():
+            get_component_logger(component).setLevel(_level(level))
+
+        _listener.start()
+
+
+def _stop_locked():
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        _handler.close()
+        _listener, _handler = None, None
+
+
+def shutdown_logging():
+    """Write out queued records and stop the listener thread."""
+    with _state_lock:
+        _stop_locked()
+
+
+def _ensure_configured():
+    with _state_lock:
+        if _listener is None:
+            configure_logging()
+
+
+def get_component_logger(component: str) -> logging.Logger:
+    """Logger for one component (ai_employee.<component>)."""
+    component_logger = _component_loggers.get(component)
+    if component_logger is None:
+        component_logger = logging.getLogger(f"{LOGGER_NAME}.{component}")
+        _component_loggers[component] = component_logger
+    return component_logger
+
+
+def set_component_level(component: str, level):
+    """Change a component's minimum level at runtime."""
+    get_component_logger(component).setLevel(_level(level))
+
+
+def log_event(level: str, component: str, message: str) -> bool:
+    """
+    Queue one log line.
+
+    Args:
+        level: Level name (DEBUG, INFO, WARN, ERROR, CRITICAL)
+        component: Component name
+        message: Log message
+
+    Returns:
+        True if the line passed the component's level filter
+    """
+    if _listener is None:
+        _ensure_configured()
+    component_logger = _component_loggers.get(component) or get_component_logger(component)
+    levelno = LEVELS.get(level, logging.INFO)
+    if not component_logger.isEnabledFor(levelno):
+        return False
+    component_logger.handle(
+        _VaultRecord(component_logger.name, levelno, component, level.upper(), message))
+    return True
+
+
+def flush_logs():
+    """Block until every queued line has been written and flushed to disk."""
+    with _state_lock:
+        log_queue, listener = _queue, _listener
+    if listener is None:
+        return
+    request = _FlushRequest()
+    log_queue.put(request)
+    request.done.wait(timeout=10)
+
+
+atexit.register(shutdown_logging)
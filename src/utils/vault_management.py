@@ -1,8 +1,34 @@
 """Vault Management Module - Core file operations for AI Employee Vault"""
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 import re
 
+from src.utils.vault_logging import log_event
+from src.utils.vault_manifest import get_manifest
+from src.utils.vault_writer import get_writer
+
+
+def _vault_manifest():
+    """Shared manifest of the vault, or None if it cannot be opened."""
+    try:
+        return get_manifest("AI_Employee_Vault")
+    except Exception as e:
+        write_log("WARN", "VaultManager", f"Vault manifest unavailable: {e}")
+        return None
+
+
+def _track_write(filename: str):
+    """Manifest tracking for one commit (no-op if the manifest is unavailable)."""
+    manifest = _vault_manifest()
+    return manifest.track(filename) if manifest else nullcontext()
+
+
+def _vault_writer():
+    """Shared atomic writer of the vault."""
+    return get_writer("AI_Employee_Vault", track=_track_write,
+                      log=lambda level, message: write_log(level, "VaultManager", message))
+
 
 def read_vault_file(filename: str) -> str | None:
     """
@@ -17,6 +43,11 @@ def read_vault_file(filename: str) -> str | None:
     vault_base = Path("AI_Employee_Vault")
     file_path = vault_base / filename
 
+    # A deferred write not yet on disk is the current content
+    pending = _vault_writer().read(filename)
+    if pending is not None:
+        return pending
+
     try:
         return file_path.read_text(encoding='utf-8')
     except FileNotFoundError:
@@ -27,34 +58,44 @@ def read_vault_file(filename: str) -> str | None:
         return None
 
 
-def write_vault_file(filename: str, content: str) -> bool:
+def write_vault_file(filename: str, content: str, defer: bool = False) -> bool:
     """
     Write content to vault file.
 
+    The file is replaced atomically (temp file + fsync + rename) and left
+    alone if it already holds this content.
+
     Args:
         filename: Path relative to vault root
         content: Content to write
+        defer: Coalesce with later writes to the same file for a short
+            window (for files rewritten on every event, like Dashboard.md)
 
     Returns:
-        True if successful, False otherwise
+        True if successful (or queued), False otherwise
     """
-    vault_base = Path("AI_Employee_Vault")
-    file_path = vault_base / filename
-
     try:
-        # Create parent directories if needed
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write atomically
-        file_path.write_text(content, encoding='utf-8')
-
-        write_log("INFO", "VaultManager", f"Wrote file: {filename}")
+        result = _vault_writer().write(filename, content, defer=defer)
+        if result == 'written':
+            write_log("INFO", "VaultManager", f"Wrote file: {filename}")
         return True
     except Exception as e:
         write_log("ERROR", "VaultManager", f"Error writing {filename}: {e}")
         return False
 
 
+def flush_vault_writes() -> dict:
+    """
+    Commit deferred vault writes now.
+
+    Returns:
+        Writes saved and bytes avoided so far
+    """
+    writer = _vault_writer()
+    writer.flush()
+    return writer.saved()
+
+
 def list_vault_directory(directory: str, pattern: str = "*.md") -> list[str]:
     """
     List files in vault directory.
@@ -72,6 +113,13 @@ def list_vault_directory(directory: str, pattern: str = "*.md") -> list[str]:
     if not dir_path.exists():
         return []
 
+    manifest = _vault_manifest() if '/' not in pattern else None
+    if manifest:
+        try:
+            return [entry['name'] for entry in manifest.list_files(directory, pattern)]
+        except Exception as e:
+            write_log("WARN", "VaultManager", f"Manifest listing failed for {directory}: {e}")
+
     return [f.name for f in dir_path.glob(pattern) if f.is_file()]
 
 
@@ -92,6 +140,14 @@ def count_vault_items(directory: str, recursive: bool = True) -> int:
     if not dir_path.exists():
         return 0
 
+    # Counters from the manifest; only folders changed since the last query are rescanned
+    manifest = _vault_manifest()
+    if manifest:
+        try:
+            return manifest.count(directory, kind="md", recursive=recursive)
+        except Exception as e:
+            write_log("WARN", "VaultManager", f"Manifest count failed for {directory}: {e}")
+
     if recursive:
         return len(list(dir_path.rglob("*.md")))
     else:
@@ -102,34 +158,42 @@ def write_log(level: str, component: str, message: str):
     """
     Write entry to daily log file.
 
+    Thin wrapper over the queue-backed vault log (see vault_logging); call
+    vault_logging.flush_logs() before reading the file back.
+
     Args:
         level: Log level (INFO, WARN, ERROR)
         component: Component name (e.g., "VaultManager", "EmailProcessor")
         message: Log message
     """
-    timestamp = datetime.now().isoformat()
-    log_dir = Path("AI_Employee_Vault/Logs")
-    log_file = log_dir / f"{datetime.now().strftime('%Y-%m-%d')}.log"
-
-    # Ensure logs directory exists
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Format log entry
-    log_entry = f"[{timestamp}] [{level}] [{component}] {message}\n"
-
-    # Append to log file
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(log_entry)
+    # Queued for the log listener thread; lines below the component's level are dropped
+    if not log_event(level, component, message):
+        return
 
     # Also add to dashboard activity buffer for real-time updates
-    try:
-        from src.utils.dashboard_updater import add_activity
-        # Create a user-friendly activity message
-        activity_msg = f"[{component}] {message}"
-        add_activity(activity_msg)
-    except Exception:
-        # Silently fail if dashboard updater not available
-        pass
+    add_activity = _activity_sink()
+    if add_activity is not None:
+        try:
+            # Create a user-friendly activity message
+            add_activity(f"[{component}] {message}")
+        except Exception:
+            pass
+
+
+_add_activity = None
+
+
+def _activity_sink():
+    """dashboard_updater.add_activity, imported once (None if unavailable)."""
+    global _add_activity
+    if _add_activity is None:
+        try:
+            from src.utils.dashboard_updater import add_activity
+        except Exception:
+            # Silently fail if dashboard updater not available
+            return None
+        _add_activity = add_activity
+    return _add_activity
 
 
 def update_dashboard_timestamp():
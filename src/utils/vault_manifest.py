@@ -0,0 +1,428 @@
+"""Vault Manifest - Persistent index of vault files with O(1) folder counters
+
+Every file in the vault has a row (folder, size, mtime, kind) in a small SQLite
+database, and per-folder counters for each kind are kept in step as rows come
+and go, so counts are a single primary-key lookup instead of a tree walk.
+Writers report their changes through track(). Changes made behind the
+manifest's back (Obsidian, shutil.move, another tool) are caught by comparing
+each known folder's directory mtime: only folders whose mtime moved are
+rescanned, and only one directory level at a time.
+"""
+import fnmatch
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+
+logger = logging.getLogger(__name__)
+
+# Default manifest location inside the vault
+MANIFEST_NAME = "vault_manifest.db"
+
+# One open manifest per vault, shared by the module-level helpers
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,      -- relative to the vault, '/'-separated
+    folder TEXT NOT NULL,       -- '' for the vault root
+    kind TEXT NOT NULL,         -- lower-case extension without the dot ('md', 'pdf', '')
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_files_folder ON files(folder);
+
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    parent TEXT,                -- NULL for the vault root
+    mtime_ns INTEGER NOT NULL   -- directory mtime when it was last scanned
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent);
+
+CREATE TABLE IF NOT EXISTS counts (
+    folder TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    direct INTEGER NOT NULL DEFAULT 0,  -- files directly in the folder
+    total INTEGER NOT NULL DEFAULT 0,   -- files in the folder and below
+    PRIMARY KEY (folder, kind)
+) WITHOUT ROWID;
+"""
+
+
+def _kind(name: str) -> str:
+    """Kind of a file: its lower-case extension without the dot."""
+    return PurePosixPath(name).suffix.lower().lstrip('.')
+
+
+def _parent(folder: str):
+    """Parent folder of a folder ('' for top-level folders, None for the root)."""
+    if not folder:
+        return None
+    return folder.rpartition('/')[0]
+
+
+def _ancestors(folder: str) -> list:
+    """The folder and every folder above it, up to and including the root."""
+    chain = [folder]
+    while folder:
+        folder = folder.rpartition('/')[0]
+        chain.append(folder)
+    return chain
+
+
+def _subtree_clause(folder: str) -> tuple:
+    """WHERE clause (and parameters) matching a folder and all folders below it."""
+    if not folder:
+        return "1 = 1", ()
+    # '0' sorts right after '/', so this range is exactly the folder's children
+    return "(folder = ? OR (folder >= ? AND folder < ?))", (folder, folder + '/', folder + '0')
+
+
+class VaultManifest:
+    """Persistent manifest of vault files with per-folder counters.
+
+    Safe to share between threads; several processes may open the same
+    manifest, since every change runs in its own IMMEDIATE transaction.
+    """
+
+    def __init__(self, vault_path: str = "AI_Employee_Vault", db_path: str = None):
+        """
+        Open (or create) the manifest for a vault.
+
+        Args:
+            vault_path: Vault root
+            db_path: Manifest database (default: Database/vault_manifest.db in the vault)
+        """
+        self.root = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else self.root / "Database" / MANIFEST_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The manifest's own files live in the vault but are never listed
+        own = self._relative(self.db_path)
+        self._ignored = {own + suffix for suffix in ('', '-wal', '-shm', '-journal')} if own else set()
+
+        self._lock = threading.Lock()
+        # Changes applied by the current transaction, reported by sync()
+        self._changes = []
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the manifest database."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Serialized write transaction over the manifest."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._changes = []
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # === Queries ===
+
+    def count(self, folder: str = ".", kind: str = "md", recursive: bool = True) -> int:
+        """
+        Count files of one kind in a folder.
+
+        Args:
+            folder: Folder relative to the vault root ("." for the root)
+            kind: File extension without the dot (default: "md")
+            recursive: Include subfolders (default: True)
+
+        Returns:
+            Number of matching files (0 if the folder does not exist)
+        """
+        folder = self._folder(folder)
+        with self._transaction() as conn:
+            self._refresh(conn, folder, recursive)
+            row = conn.execute(
+                f"SELECT {'total' if recursive else 'direct'} FROM counts "
+                "WHERE folder = ? AND kind = ?", (folder, kind.lower().lstrip('.'))
+            ).fetchone()
+        return row[0] if row else 0
+
+    def list_files(self, folder: str = ".", pattern: str = "*", recursive: bool = False) -> list:
+        """
+        List manifest entries in a folder.
+
+        Args:
+            folder: Folder relative to the vault root
+            pattern: Glob pattern matched against file names
+            recursive: Include subfolders
+
+        Returns:
+            Dicts with path, name, folder, kind, size and mtime, sorted by path
+        """
+        folder = self._folder(folder)
+        with self._transaction() as conn:
+            self._refresh(conn, folder, recursive)
+            if recursive:
+                where, params = _subtree_clause(folder)
+            else:
+                where, params = "folder = ?", (folder,)
+            rows = conn.execute(
+                f"SELECT path, folder, kind, size, mtime FROM files WHERE {where} ORDER BY path",
+                params
+            ).fetchall()
+
+        entries = []
+        for path, entry_folder, kind, size, mtime in rows:
+            name = path.rpartition('/')[2]
+            if fnmatch.fnmatchcase(name, pattern):
+                entries.append({'path': path, 'name': name, 'folder': entry_folder,
+                                'kind': kind, 'size': size, 'mtime': mtime})
+        return entries
+
+    # === Writers ===
+
+    @contextmanager
+    def track(self, *paths):
+        """
+        Record the effect of a write, move or delete on the given paths.
+
+        Wrap the filesystem operation in the block; afterwards each path is
+        recorded if it exists and forgotten if it does not. Folder stamps are
+        advanced past the change only if nothing else had changed the folder
+        since it was last scanned, so concurrent outside edits still trigger a
+        rescan.
+
+        Example:
+            >>> with manifest.track("Inbox/a.md", "Done/a.md"):
+            ...     shutil.move(vault / "Inbox/a.md", vault / "Done/a.md")
+        """
+        rels = [rel for rel in (self._relative(Path(p)) for p in paths) if rel]
+        before = {}
+        for rel in rels:
+            folder = _parent(rel)
+            before[folder] = self._dir_mtime_ns(folder)
+
+        yield
+
+        try:
+            with self._transaction() as conn:
+                for rel in rels:
+                    self._record(conn, rel)
+                for folder, mtime_ns in before.items():
+                    row = conn.execute("SELECT mtime_ns FROM folders WHERE folder = ?",
+                                       (folder,)).fetchone()
+                    if row is None:
+                        # Never scanned (or new): the next query scans it fully
+                        continue
+                    if row[0] == mtime_ns:
+                        after = self._dir_mtime_ns(folder)
+                        if after is not None:
+                            conn.execute("UPDATE folders SET mtime_ns = ? WHERE folder = ?",
+                                         (after, folder))
+        except sqlite3.Error as e:
+            # The folder stamps were not advanced, so the next query rescans them
+            logger.warning(f"Could not record vault change to {', '.join(rels)}: {e}")
+
+    def sync(self, folders, recursive: bool = False) -> list:
+        """
+        Reconcile folders with the disk now, whatever their stamps say.
+
+        Used by the change feed once it knows which folders were touched:
+        each folder is rescanned one level deep (new subfolders in full).
+
+        Args:
+            folders: Vault-relative folders to rescan
+            recursive: Also re-check the stamps of folders below them
+
+        Returns:
+            Change dicts (change: added/modified/removed, path, folder, kind)
+        """
+        with self._transaction() as conn:
+            for folder in sorted({self._folder(f) for f in folders}):
+                self._scan(conn, folder)
+                if recursive:
+                    self._refresh(conn, folder, True)
+            return list(self._changes)
+
+    @property
+    def ignored(self) -> frozenset:
+        """Vault-relative paths of the manifest's own database files."""
+        return frozenset(self._ignored)
+
+    def rebuild(self):
+        """Forget everything and rescan the whole vault."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM folders")
+            conn.execute("DELETE FROM counts")
+            self._refresh(conn, '', True)
+
+    # === Internals ===
+
+    def _relative(self, path: Path):
+        """Vault-relative '/'-separated path, or None if outside the vault."""
+        if not path.is_absolute():
+            # Accept both vault-relative paths and paths under the vault's own relative root
+            try:
+                path = path.relative_to(self.root)
+            except ValueError:
+                pass
+            path = self.root / path
+        try:
+            rel = path.resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return None
+        return rel.as_posix() if rel.parts else ''
+
+    def _folder(self, folder: str) -> str:
+        """Normalise a vault-relative folder name ('.' and '' are the root)."""
+        parts = [p for p in PurePosixPath(str(folder).replace('\\', '/')).parts if p not in ('.', '/')]
+        return '/'.join(parts)
+
+    def _dir_mtime_ns(self, folder: str):
+        try:
+            return os.stat(self.root / folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self, conn, folder: str, recursive: bool):
+        """Rescan the folders (under ``folder``) whose directory mtime changed."""
+        if recursive:
+            where, params = _subtree_clause(folder)
+            known = conn.execute(f"SELECT folder, mtime_ns FROM folders WHERE {where}",
+                                 params).fetchall()
+        else:
+            known = conn.execute("SELECT folder, mtime_ns FROM folders WHERE folder = ?",
+                                 (folder,)).fetchall()
+
+        if folder not in {f for f, _ in known}:
+            self._scan(conn, folder)
+
+        for known_folder, mtime_ns in known:
+            current = self._dir_mtime_ns(known_folder)
+            if current is None:
+                self._drop_subtree(conn, known_folder)
+            elif current != mtime_ns:
+                self._scan(conn, known_folder)
+
+    def _scan(self, conn, folder: str):
+        """Reconcile one directory with the manifest; new subfolders are scanned fully."""
+        path = self.root / folder
+        try:
+            # Stamp before listing, so a change made mid-scan is seen next time
+            mtime_ns = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except (FileNotFoundError, NotADirectoryError):
+            self._drop_subtree(conn, folder)
+            return
+
+        existing = {row[0]: row[1:] for row in conn.execute(
+            "SELECT path, size, mtime FROM files WHERE folder = ?", (folder,))}
+        known_dirs = {row[0] for row in conn.execute(
+            "SELECT folder FROM folders WHERE parent = ?", (folder,))}
+
+        seen_files, seen_dirs = set(), set()
+        for entry in entries:
+            rel = f"{folder}/{entry.name}" if folder else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    seen_dirs.add(rel)
+                    if rel not in known_dirs:
+                        self._scan(conn, rel)
+                elif entry.is_file(follow_symlinks=False) and rel not in self._ignored:
+                    st = entry.stat(follow_symlinks=False)
+                    seen_files.add(rel)
+                    if existing.get(rel) != (st.st_size, st.st_mtime):
+                        self._put(conn, rel, folder, st.st_size, st.st_mtime)
+            except OSError:
+                # Vanished while scanning; the folder mtime moved, so it is rescanned later
+                continue
+
+        for rel in existing.keys() - seen_files:
+            self._remove(conn, rel, folder)
+        for rel in known_dirs - seen_dirs:
+            self._drop_subtree(conn, rel)
+
+        conn.execute(
+            "INSERT INTO folders (folder, parent, mtime_ns) VALUES (?, ?, ?) "
+            "ON CONFLICT(folder) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+            (folder, _parent(folder), mtime_ns)
+        )
+
+    def _record(self, conn, rel: str):
+        """Record the current state of one file (or forget it if it is gone)."""
+        if rel in self._ignored:
+            return
+        folder = _parent(rel)
+        try:
+            st = os.stat(self.root / rel)
+        except OSError:
+            st = None
+        if st is None or not os.path.isfile(self.root / rel):
+            self._remove(conn, rel, folder)
+        else:
+            self._put(conn, rel, folder, st.st_size, st.st_mtime)
+
+    def _put(self, conn, rel: str, folder: str, size: int, mtime: float):
+        kind = _kind(rel)
+        exists = conn.execute("SELECT size, mtime FROM files WHERE path = ?", (rel,)).fetchone()
+        if exists == (size, mtime):
+            return
+        self._changes.append({'change': 'modified' if exists else 'added',
+                              'path': rel, 'folder': folder, 'kind': kind})
+        conn.execute(
+            "INSERT INTO files (path, folder, kind, size, mtime) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime = excluded.mtime",
+            (rel, folder, kind, size, mtime)
+        )
+        if not exists:
+            self._bump(conn, folder, kind, 1)
+
+    def _remove(self, conn, rel: str, folder: str):
+        row = conn.execute("DELETE FROM files WHERE path = ? RETURNING kind", (rel,)).fetchone()
+        if row:
+            self._changes.append({'change': 'removed', 'path': rel, 'folder': folder, 'kind': row[0]})
+            self._bump(conn, folder, row[0], -1)
+
+    def _drop_subtree(self, conn, folder: str):
+        """Forget a folder that no longer exists, with everything below it."""
+        where, params = _subtree_clause(folder)
+        for rel, file_folder in conn.execute(
+                f"SELECT path, folder FROM files WHERE {where}", params).fetchall():
+            self._remove(conn, rel, file_folder)
+        conn.execute(f"DELETE FROM folders WHERE {where}", params)
+
+    def _bump(self, conn, folder: str, kind: str, delta: int):
+        """Adjust the direct counter of a folder and the totals of it and its ancestors."""
+        for i, ancestor in enumerate(_ancestors(folder)):
+            conn.execute(
+                "INSERT INTO counts (folder, kind, direct, total) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(folder, kind) DO UPDATE SET "
+                "direct = direct + excluded.direct, total = total + excluded.total",
+                (ancestor, kind, delta if i == 0 else 0, delta)
+            )
+
+
+def get_manifest(vault_path: str = "AI_Employee_Vault") -> VaultManifest:
+    """
+    Shared manifest for a vault, opened on first use.
+
+    Args:
+        vault_path: Vault root
+
+    Returns:
+        VaultManifest for the vault
+    """
+    key = str(Path(vault_path).resolve())
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = VaultManifest(vault_path)
+        return manifest
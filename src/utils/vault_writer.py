@@ -0,0 +1,270 @@
+"""Vault Writer - Atomic, coalescing write-behind for vault files
+
+Every commit goes to a temporary file in the target folder, is fsynced and
+then renamed over the target, so readers (Obsidian, the watchers) never see a
+half-written card. Writes whose content hashes the same as what is already on
+disk are skipped. Deferred writes (used for Dashboard.md, which is rewritten
+on every event) are held for a short window; repeated writes to the same path
+inside the window replace each other and only the last one reaches the disk.
+"""
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _default_log(level: str, message: str):
+    logger.log(logging.ERROR if level == 'ERROR' else logging.INFO, message)
+
+
+def atomic_write(path: Path, data: bytes):
+    """
+    Replace a file's content atomically.
+
+    Args:
+        path: Target file (parent folders are created)
+        data: New content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if os.name == 'posix':
+        # Make the rename itself durable
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class VaultWriter:
+    """Atomic vault writer with change detection and write-behind coalescing.
+
+    Thread-safe. Deferred writes are committed by a background thread once
+    their window has passed, by flush(), or at interpreter exit.
+    """
+
+    def __init__(self, vault_path: str = "AI_Employee_Vault", window: float = 0.5,
+                 track=None, log=None):
+        """
+        Create a writer for a vault.
+
+        Args:
+            vault_path: Vault root
+            window: Seconds a deferred write waits for newer content
+            track: Optional callable returning a context manager around each
+                commit (e.g. VaultManifest.track)
+            log: Optional callable(level, message) reporting commits and failures
+        """
+        self.root = Path(vault_path)
+        self.window = window
+        self._track = track or (lambda rel: nullcontext())
+        self._log = log or _default_log
+
+        self._cond = threading.Condition()
+        self._pending = {}      # rel -> (data, due time)
+        self._committed = {}    # rel -> (digest, size, mtime_ns) of our last commit
+        self._thread = None
+        self._closed = False
+
+        self.stats = {
+            'requested': 0,     # write() calls
+            'committed': 0,     # writes that reached the disk
+            'coalesced': 0,     # deferred writes replaced by a newer one
+            'unchanged': 0,     # writes skipped because the content was already there
+            'bytes_written': 0,
+            'bytes_avoided': 0,
+        }
+
+    # === Public API ===
+
+    def write(self, rel: str, content: str, defer: bool = False) -> str:
+        """
+        Write a vault file.
+
+        Args:
+            rel: Path relative to the vault root
+            content: New file content
+            defer: Hold the write for the coalescing window instead of committing now
+
+        Returns:
+            'written', 'unchanged' or 'queued'
+
+        Raises:
+            OSError: If an immediate write fails
+        """
+        data = content.encode('utf-8')
+        with self._cond:
+            if self._closed:
+                defer = False
+            self.stats['requested'] += 1
+            previous = self._pending.pop(rel, None)
+            if previous is not None:
+                self.stats['coalesced'] += 1
+                self.stats['bytes_avoided'] += len(previous[0])
+
+            if defer:
+                # The first write in a burst sets the deadline, so a steady
+                # stream of updates still lands at least once per window
+                due = previous[1] if previous else time.monotonic() + self.window
+                self._pending[rel] = (data, due)
+                self._ensure_thread()
+                self._cond.notify()
+                return 'queued'
+
+            return self._commit(rel, data)
+
+    def read(self, rel: str):
+        """Content of a deferred write not yet committed, or None."""
+        with self._cond:
+            pending = self._pending.get(rel)
+        return pending[0].decode('utf-8') if pending else None
+
+    def flush(self) -> int:
+        """
+        Commit every deferred write now.
+
+        Returns:
+            Number of paths flushed
+        """
+        with self._cond:
+            pending, self._pending = self._pending, {}
+            for rel, (data, _) in sorted(pending.items()):
+                self._commit_logged(rel, data)
+            return len(pending)
+
+    def close(self):
+        """Flush deferred writes, stop the background thread and report savings."""
+        with self._cond:
+            if self._closed and self._thread is None and not self._pending:
+                return
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+        saved = self.saved()
+        if saved['writes_saved']:
+            self._log('INFO', f"Vault writer saved {saved['writes_saved']} writes "
+                              f"({saved['bytes_avoided']} bytes avoided, "
+                              f"{saved['writes_committed']} committed)")
+
+    def saved(self) -> dict:
+        """Summary of the work avoided so far."""
+        with self._cond:
+            return {
+                'writes_saved': self.stats['coalesced'] + self.stats['unchanged'],
+                'bytes_avoided': self.stats['bytes_avoided'],
+                'writes_committed': self.stats['committed'],
+                'bytes_written': self.stats['bytes_written'],
+            }
+
+    # === Internals ===
+
+    def _unchanged(self, rel: str, path: Path, data: bytes, digest: bytes) -> bool:
+        """Whether the file already holds exactly this content."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_size != len(data):
+            return False
+        if self._committed.get(rel) == (digest, st.st_size, st.st_mtime_ns):
+            return True
+        # Changed since our last commit (or never ours): compare with the disk
+        try:
+            return _digest(path.read_bytes()) == digest
+        except OSError:
+            return False
+
+    def _commit(self, rel: str, data: bytes) -> str:
+        """Write data to rel unless it is already there (caller holds the lock)."""
+        path = self.root / rel
+        digest = _digest(data)
+        if self._unchanged(rel, path, data, digest):
+            self.stats['unchanged'] += 1
+            self.stats['bytes_avoided'] += len(data)
+            return 'unchanged'
+
+        with self._track(rel):
+            atomic_write(path, data)
+        st = os.stat(path)
+        self._committed[rel] = (digest, st.st_size, st.st_mtime_ns)
+        self.stats['committed'] += 1
+        self.stats['bytes_written'] += len(data)
+        return 'written'
+
+    def _commit_logged(self, rel: str, data: bytes):
+        """Commit a deferred write, reporting the outcome instead of raising."""
+        try:
+            if self._commit(rel, data) == 'written':
+                self._log('INFO', f"Wrote file: {rel}")
+        except OSError as e:
+            self._log('ERROR', f"Error writing {rel}: {e}")
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='vault-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Commit deferred writes as their windows close."""
+        with self._cond:
+            while not self._closed:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                due = [rel for rel, (_, when) in self._pending.items() if when <= now]
+                if not due:
+                    self._cond.wait(min(when for _, when in self._pending.values()) - now)
+                    continue
+                for rel in sorted(due):
+                    data, _ = self._pending.pop(rel)
+                    self._commit_logged(rel, data)
+
+
+# Shared writer per vault, flushed at exit
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(vault_path: str = "AI_Employee_Vault", **options) -> VaultWriter:
+    """
+    Shared writer for a vault, created on first use and flushed at exit.
+
+    Args:
+        vault_path: Vault root
+        **options: VaultWriter options, used only when the writer is created
+
+    Returns:
+        VaultWriter for the vault
+    """
+    key = str(Path(vault_path).resolve())
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = VaultWriter(vault_path, **options)
+            atexit.register(writer.close)
+        return writer
@@ -0,0 +1,323 @@
+"""Watcher Registry - Heartbeats from running watchers
+
+Each watcher registers itself under a fixed name and beats once per loop,
+updating one row (PID, start time, last loop time, items processed, last
+error) in a small SQLite database shared by every process. The dashboard reads
+those few rows instead of scanning the host's process table, so it can tell
+the watchers apart and report how far behind each one is.
+
+Watchers that cannot write SQLite (the Node.js WhatsApp watcher) drop the
+same fields as JSON in Database/heartbeats/<name>.json, replaced atomically.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Default registry location inside the vault
+REGISTRY_NAME = "watcher_registry.db"
+
+# Folder (inside the vault) for JSON heartbeats from non-Python watchers
+HEARTBEAT_DIR = "Database/heartbeats"
+
+# Known watchers and the label the dashboards show for them
+WATCHERS = {
+    'gmail': 'Gmail',
+    'filesystem': 'Filesystem',
+    'whatsapp': 'WhatsApp',
+    'linkedin': 'LinkedIn',
+}
+
+# A watcher is stalled once it misses this many loops (and at least STALE_AFTER_MIN seconds)
+STALE_LOOPS = 3
+STALE_AFTER_MIN = 30.0
+
+# One registry per vault, shared by the module-level helpers
+_registries = {}
+_registries_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchers (
+    name TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    host TEXT NOT NULL,
+    started_at REAL NOT NULL,       -- epoch seconds
+    last_beat REAL NOT NULL,        -- epoch seconds of the last completed loop
+    interval REAL NOT NULL,         -- seconds between loops
+    items_processed INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    last_error_at REAL,
+    stopped_at REAL                 -- set on clean shutdown
+) WITHOUT ROWID;
+"""
+
+_FIELDS = ('name', 'pid', 'host', 'started_at', 'last_beat', 'interval',
+           'items_processed', 'last_error', 'last_error_at', 'stopped_at')
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a local process exists (always True where that cannot be checked cheaply)."""
+    if os.name != 'posix':
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows; rely on the heartbeat age
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def liveness(entry: dict, now: float = None) -> dict:
+    """
+    Classify one registry entry.
+
+    Args:
+        entry: Registry row (as returned by WatcherRegistry.entries)
+        now: Current epoch time (default: time.time())
+
+    Returns:
+        The entry plus 'state' ('Active', 'Stalled', 'Stopped' or 'Dead') and
+        'lag' (seconds since the last loop)
+    """
+    now = time.time() if now is None else now
+    lag = max(0.0, now - entry['last_beat'])
+    if entry.get('stopped_at'):
+        state = 'Stopped'
+    elif entry['host'] == socket.gethostname() and not _pid_alive(entry['pid']):
+        state = 'Dead'
+    elif lag > max(entry['interval'] * STALE_LOOPS, STALE_AFTER_MIN):
+        state = 'Stalled'
+    else:
+        state = 'Active'
+    return {**entry, 'state': state, 'lag': lag}
+
+
+class Heartbeat:
+    """Handle a running watcher uses to report progress.
+
+    Usable as a context manager: the watcher is marked stopped on exit, and an
+    exception escaping the block is recorded as its last error.
+    """
+
+    def __init__(self, registry: 'WatcherRegistry', name: str, interval: float):
+        self.registry = registry
+        self.name = name
+        self.interval = interval
+        self.items_processed = 0
+
+    def beat(self, items: int = 0) -> bool:
+        """
+        Record a completed loop.
+
+        Args:
+            items: Items processed since the previous beat
+
+        Returns:
+            True if the heartbeat was stored
+        """
+        self.items_processed += items
+        return self.registry._execute(
+            "UPDATE watchers SET last_beat = ?, items_processed = ?, stopped_at = NULL "
+            "WHERE name = ?",
+            (time.time(), self.items_processed, self.name))
+
+    def error(self, message: str) -> bool:
+        """Record the latest error without counting it as a loop."""
+        return self.registry._execute(
+            "UPDATE watchers SET last_error = ?, last_error_at = ? WHERE name = ?",
+            (str(message)[:500], time.time(), self.name))
+
+    def stop(self) -> bool:
+        """Mark the watcher as cleanly stopped."""
+        return self.registry._execute(
+            "UPDATE watchers SET stopped_at = ? WHERE name = ?", (time.time(), self.name))
+
+    def __enter__(self) -> 'Heartbeat':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None and not isinstance(exc, KeyboardInterrupt):
+            self.error(f"{exc_type.__name__}: {exc}")
+        self.stop()
+
+
+class WatcherRegistry:
+    """Shared table of watcher heartbeats.
+
+    Safe to share between threads; any number of processes may open the same
+    registry. Reads never create the database.
+    """
+
+    def __init__(self, vault_path: str = "AI_Employee_Vault", db_path: str = None):
+        """
+        Open the registry for a vault.
+
+        Args:
+            vault_path: Vault root
+            db_path: Registry database (default: Database/watcher_registry.db in the vault)
+        """
+        self.root = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else self.root / "Database" / REGISTRY_NAME
+        self.heartbeat_dir = self.root / HEARTBEAT_DIR
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self, create: bool):
+        """Open the database on first use (None if it does not exist and create is False)."""
+        if self._conn is None:
+            if not create and not self.db_path.exists():
+                return None
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple) -> bool:
+        try:
+            with self._lock:
+                self._connect(create=True).execute(sql, params)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Watcher registry update failed: {e}")
+            return False
+
+    def close(self):
+        """Close the registry database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def register(self, name: str, interval: float) -> Heartbeat:
+        """
+        Announce a starting watcher (replacing any previous entry under the name).
+
+        Args:
+            name: Watcher name ('gmail', 'filesystem', 'whatsapp', 'linkedin')
+            interval: Seconds between loops, used to judge when it has stalled
+
+        Returns:
+            Heartbeat handle for the watcher
+        """
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO watchers "
+            "(name, pid, host, started_at, last_beat, interval, items_processed) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0)",
+            (name, os.getpid(), socket.gethostname(), now, now, float(interval)))
+        return Heartbeat(self, name, interval)
+
+    def entries(self) -> dict:
+        """
+        Raw heartbeats of every registered watcher.
+
+        Returns:
+            {name: row dict}; JSON heartbeat files override rows of the same name
+        """
+        entries = {}
+        try:
+            with self._lock:
+                conn = self._connect(create=False)
+                rows = conn.execute(
+                    f"SELECT {', '.join(_FIELDS)} FROM watchers").fetchall() if conn else []
+            entries = {row[0]: dict(zip(_FIELDS, row)) for row in rows}
+        except sqlite3.Error as e:
+            logger.error(f"Watcher registry read failed: {e}")
+
+        if self.heartbeat_dir.is_dir():
+            for path in self.heartbeat_dir.glob('*.json'):
+                try:
+                    data = json.loads(path.read_text(encoding='utf-8'))
+                    entry = {field: data.get(field) for field in _FIELDS}
+                    entry['name'] = path.stem
+                    entry['last_beat'] = float(entry['last_beat'])
+                    entry['interval'] = float(entry['interval'] or 0)
+                    entry['pid'] = int(entry['pid'] or 0)
+                    entry['host'] = entry['host'] or ''
+                    entry['items_processed'] = int(entry['items_processed'] or 0)
+                except (OSError, ValueError, TypeError):
+                    continue
+                entries[path.stem] = entry
+        return entries
+
+    def statuses(self, now: float = None) -> dict:
+        """
+        Liveness of every known or registered watcher.
+
+        Args:
+            now: Current epoch time (default: time.time())
+
+        Returns:
+            {name: entry with 'state' and 'lag'}; known watchers that never
+            registered have state 'Not started'
+        """
+        now = time.time() if now is None else now
+        statuses = {name: liveness(entry, now) for name, entry in self.entries().items()}
+        for name in WATCHERS:
+            statuses.setdefault(name, {'name': name, 'state': 'Not started', 'lag': None,
+                                       'items_processed': 0, 'last_error': None})
+        return statuses
+
+
+def get_registry(vault_path: str = "AI_Employee_Vault") -> WatcherRegistry:
+    """
+    Shared registry for a vault.
+
+    Args:
+        vault_path: Vault root
+
+    Returns:
+        WatcherRegistry for the vault
+    """
+    key = str(Path(vault_path).resolve())
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = WatcherRegistry(vault_path)
+        return registry
+
+
+def register_watcher(name: str, interval: float,
+                     vault_path: str = "AI_Employee_Vault") -> Heartbeat:
+    """
+    Register a watcher in the vault's shared registry.
+
+    Args:
+        name: Watcher name
+        interval: Seconds between loops
+        vault_path: Vault root
+
+    Returns:
+        Heartbeat handle for the watcher
+    """
+    return get_registry(vault_path).register(name, interval)
+
+
+def format_status(status: dict) -> str:
+    """One-line dashboard description of a watcher status."""
+    state = status['state']
+    if status['lag'] is None:
+        return state
+    details = [f"last loop {status['lag']:.0f}s ago", f"{status['items_processed']} items"]
+    if status.get('last_error'):
+        details.append(f"last error: {status['last_error'][:60]}")
+    return f"{state} ({', '.join(details)})"
+
+
+if __name__ == '__main__':
+    import sys
+    vault = sys.argv[1] if len(sys.argv) > 1 else 'AI_Employee_Vault'
+    for name, status in sorted(WatcherRegistry(vault).statuses().items()):
+        print(f"{WATCHERS.get(name, name):<12} {format_status(status)}")
@@ -10,12 +10,14 @@ from pathlib import Path
 try:
     from src.utils.vault_management import write_log, write_vault_file
     from src.utils.dashboard_updater import log_and_update
+    from src.utils.watcher_registry import register_watcher
 except ImportError:
     # Fallback for direct execution
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from src.utils.vault_management import write_log, write_vault_file
     from src.utils.dashboard_updater import log_and_update
+    from src.utils.watcher_registry import register_watcher
 
 
 def detect_file_type(file_path: Path) -> dict:
@@ -385,31 +387,42 @@ def start_watcher(watch_directory: str):
     # Track already seen files
     seen_files = set(f.name for f in watch_path.iterdir() if f.is_file())
 
+    # Publish liveness for the dashboard
+    heartbeat = register_watcher('filesystem', interval=1)
+
     try:
-        while True:
-            # Check for new files
-            current_files = set(f.name for f in watch_path.iterdir() if f.is_file())
-            new_files = current_files - seen_files
-
-            for filename in new_files:
-                file_path = watch_path / filename
-
-                # Skip hidden/temp files
-                if filename.startswith('.') or filename.startswith('~'):
-                    continue
-
-                # Wait for file to finish writing
-                time.sleep(2)
-
-                try:
-                    result = organize_file_complete(file_path)
-                    print(f"✅ Organized: {filename} -> {result['category']['destination']}")
-                except Exception as e:
-                    print(f"❌ Error organizing {filename}: {e}")
-                    write_log('ERROR', 'FileOrganizer', f"Failed: {filename}: {e}")
-
-            seen_files = current_files
-            time.sleep(1)
+        with heartbeat:
+            while True:
+                # Check for new files
+                current_files = set(f.name for f in watch_path.iterdir() if f.is_file())
+                new_files = current_files - seen_files
+
+                for filename in new_files:
+                    file_path = watch_path / filename
+
+                    # Skip hidden/temp files
+                    if filename.startswith('.') or filename.startswith('~'):
+                        continue
+
+                    # Wait for file to finish writing
+                    time.sleep(2)
+
+                    try:
+                        result = organize_file_complete(file_path)
+                        print(f"✅ Organized: {filename} -> {result['category']['destination']}")
+                        organized = 1
+                    except Exception as e:
+                        print(f"❌ Error organizing {filename}: {e}")
+                        write_log('ERROR', 'FileOrganizer', f"Failed: {filename}: {e}")
+                        heartbeat.error(f"{filename}: {e}")
+                        organized = 0
+
+                    # Beat per file: a large drop takes 2s a file and must not look stalled
+                    heartbeat.beat(organized)
+
+                seen_files = current_files
+                heartbeat.beat()
+                time.sleep(1)
 
     except KeyboardInterrupt:
         print("\n⏸️  Watcher stopped")
@@ -19,11 +19,13 @@ except ImportError as e:
 try:
     from src.utils.vault_management import write_log, write_vault_file
     from src.utils.dashboard_updater import log_and_update
+    from src.utils.watcher_registry import register_watcher
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from src.utils.vault_management import write_log, write_vault_file
     from src.utils.dashboard_updater import log_and_update
+    from src.utils.watcher_registry import register_watcher
 
 
 # Gmail API scope - read-only access
@@ -551,20 +553,25 @@ def start_email_watcher(check_interval=60):
     except Exception as e:
         print(f"⚠️ Could not get profile: {e}")
 
+    # Publish liveness for the dashboard
+    heartbeat = register_watcher('gmail', interval=check_interval)
+
     # Main loop
     import time
     try:
-        while True:
-            processed = process_new_emails(service)
-
-            if processed:
-                print(f"\n📊 Processed {len(processed)} email(s)")
-                for email in processed:
-                    print(f"   - {email['subject'][:40]}... [{email['priority']}]")
-
-            print(f"\n⏳ Next check in {check_interval} seconds...")
-            print("(Press Ctrl+C to stop)\n")
-            time.sleep(check_interval)
+        with heartbeat:
+            while True:
+                processed = process_new_emails(service)
+                heartbeat.beat(len(processed))
+
+                if processed:
+                    print(f"\n📊 Processed {len(processed)} email(s)")
+                    for email in processed:
+                        print(f"   - {email['subject'][:40]}... [{email['priority']}]")
+
+                print(f"\n⏳ Next check in {check_interval} seconds...")
+                print("(Press Ctrl+C to stop)\n")
+                time.sleep(check_interval)
 
     except KeyboardInterrupt:
         print("\n⏸️  Email watcher stopped")
@@ -14,6 +14,13 @@ import requests
 from requests_oauthlib import OAuth2Session
 from dotenv import load_dotenv
 
+try:
+    from src.utils.watcher_registry import register_watcher
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.utils.watcher_registry import register_watcher
+
 load_dotenv()
 
 # Disable OAuth HTTPS requirement for localhost
@@ -251,23 +258,31 @@ class LinkedInWatcher:
         print(f"Checking every {interval} seconds")
         print("Monitoring for important LinkedIn activity...\n")
 
-        try:
-            while True:
-                try:
-                    important_items = self.check_important_content()
-
-                    for item in important_items:
-                        if item['type'] == 'message':
-                            self.process_message(item['data'])
+        # Publish liveness for the dashboard
+        heartbeat = register_watcher('linkedin', interval=interval, vault_path=str(VAULT_PATH))
 
-                    if important_items:
-                        print(f"[OK] Processed {len(important_items)} items")
-
-                except Exception as e:
-                    print(f"[ERROR] Error in check loop: {e}")
-                    self.log_error(str(e))
-
-                time.sleep(interval)
+        try:
+            with heartbeat:
+                while True:
+                    processed = 0
+                    try:
+                        important_items = self.check_important_content()
+
+                        for item in important_items:
+                            if item['type'] == 'message':
+                                self.process_message(item['data'])
+
+                        if important_items:
+                            print(f"[OK] Processed {len(important_items)} items")
+                        processed = len(important_items)
+
+                    except Exception as e:
+                        print(f"[ERROR] Error in check loop: {e}")
+                        self.log_error(str(e))
+                        heartbeat.error(str(e))
+
+                    heartbeat.beat(processed)
+                    time.sleep(interval)
 
         except KeyboardInterrupt:
             print("\nLinkedIn watcher stopped")
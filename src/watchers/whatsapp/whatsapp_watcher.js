@@ -8,6 +8,7 @@
 const { Client, LocalAuth } = require('whatsapp-web.js');
 const qrcode = require('qrcode-terminal');
 const fs = require('fs');
+const os = require('os');
 const path = require('path');
 const { spawn } = require('child_process');
 
@@ -16,6 +17,10 @@ const VAULT_PATH = path.join(__dirname, '../../../AI_Employee_Vault');
 const INBOX_PATH = path.join(VAULT_PATH, 'Inbox/whatsapp');
 const PYTHON_PROCESSOR = path.join(__dirname, '../../processors/whatsapp_processor.py');
 
+// Heartbeat read by the dashboard (see src/utils/watcher_registry.py)
+const HEARTBEAT_PATH = path.join(VAULT_PATH, 'Database', 'heartbeats', 'whatsapp.json');
+const HEARTBEAT_INTERVAL = 30; // seconds
+
 // Urgent keywords for filtering
 const URGENT_KEYWORDS = [
     'urgent', 'asap', 'emergency', 'immediately', 'critical',
@@ -33,6 +38,41 @@ if (!fs.existsSync(INBOX_PATH)) {
     fs.mkdirSync(INBOX_PATH, { recursive: true });
 }
 
+/**
+ * Heartbeat state, rewritten atomically on every change
+ */
+const heartbeat = {
+    pid: process.pid,
+    host: os.hostname(),
+    started_at: Date.now() / 1000,
+    last_beat: Date.now() / 1000,
+    interval: HEARTBEAT_INTERVAL,
+    items_processed: 0,
+    last_error: null,
+    last_error_at: null,
+    stopped_at: null
+};
+let connected = false;
+
+function writeHeartbeat(changes = {}) {
+    Object.assign(heartbeat, changes);
+    try {
+        fs.mkdirSync(path.dirname(HEARTBEAT_PATH), { recursive: true });
+        const tmpPath = `${HEARTBEAT_PATH}.${process.pid}.tmp`;
+        fs.writeFileSync(tmpPath, JSON.stringify(heartbeat));
+        fs.renameSync(tmpPath, HEARTBEAT_PATH);
+    } catch (error) {
+        console.error('Could not write heartbeat:', error.message);
+    }
+}
+
+// Beat while connected; a dropped connection shows up as a stalled watcher
+setInterval(() => {
+    if (connected) {
+        writeHeartbeat({ last_beat: Date.now() / 1000 });
+    }
+}, HEARTBEAT_INTERVAL * 1000);
+
 // Initialize WhatsApp client with Windows-compatible settings
 const client = new Client({
     authStrategy: new LocalAuth({
@@ -85,6 +125,8 @@ client.on('qr', (qr) => {
 
 // Ready event
 client.on('ready', () => {
+    connected = true;
+    writeHeartbeat({ last_beat: Date.now() / 1000 });
     console.log('\n' + '='.repeat(60));
     console.log('✅ WhatsApp watcher connected successfully!');
     console.log('👀 Monitoring for new messages...');
@@ -106,6 +148,7 @@ client.on('auth_failure', (msg) => {
 // Disconnected
 client.on('disconnected', (reason) => {
     console.log('⚠️  WhatsApp disconnected:', reason);
+    connected = false;
     console.log('🔄 Attempting to reconnect...');
 });
 
@@ -122,6 +165,7 @@ client.on('message', async (message) => {
         if (shouldProcess) {
             console.log(`\n📱 New WhatsApp message from ${contact.pushname || contact.number}`);
             await processMessage(message, chat, contact);
+            writeHeartbeat({ items_processed: heartbeat.items_processed + 1 });
         }
     } catch (error) {
         console.error('Error processing message:', error.message);
@@ -231,6 +275,7 @@ async function processMessage(message, chat, contact) {
         console.log('  ✅ Message processed successfully');
     } catch (error) {
         console.error('  ❌ Error calling Python processor:', error.message);
+        writeHeartbeat({ last_error: error.message, last_error_at: Date.now() / 1000 });
 
         // Fallback: save raw JSON
         const fallbackPath = path.join(INBOX_PATH, `fallback_${Date.now()}.json`);
@@ -306,16 +351,20 @@ function logError(error, message) {
 
     const logEntry = `[${new Date().toISOString()}] ERROR: ${error.message}\n`;
     fs.appendFileSync(logPath, logEntry);
+
+    writeHeartbeat({ last_error: error.message, last_error_at: Date.now() / 1000 });
 }
 
 // Handle process termination
 process.on('SIGINT', async () => {
     console.log('\n\n⚠️  Shutting down WhatsApp watcher...');
     await client.destroy();
+    writeHeartbeat({ stopped_at: Date.now() / 1000 });
     console.log('✅ WhatsApp watcher stopped');
     process.exit(0);
 });
 
 // Start the client
 console.log('🚀 Starting WhatsApp watcher...');
+writeHeartbeat();
 client.initialize();
@@ -0,0 +1,156 @@
+"""Tests for the write-behind activity log writer."""
+
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.activity_writer import ActivityLogWriter
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        path = tmp.name
+    yield path
+    os.unlink(path)
+
+
+def test_log_activity_is_queued_and_flushed(db_path):
+    """Test queued entries are committed by flush()."""
+    db = DatabaseManager(db_path, async_activity_log=True,
+                         activity_log_options={'flush_interval': 5.0})
+    for i in range(10):
+        assert db.log_activity({'level': 'INFO', 'component': 'test', 'action': f'a{i}'}) is True
+
+    assert db.flush_activity_log(timeout=10)
+    assert db.activity_writer.stats['written'] == 10
+    db.close()
+
+
+def test_recent_activity_reads_own_writes(db_path):
+    """Test get_recent_activity sees entries still in the queue."""
+    db = DatabaseManager(db_path, async_activity_log=True,
+                         activity_log_options={'flush_interval': 5.0})
+    db.log_activity({'level': 'INFO', 'component': 'test', 'action': 'queued'})
+
+    activities = db.get_recent_activity()
+    assert activities[0]['action'] == 'queued'
+    assert activities[0]['timestamp'] is not None
+    db.close()
+
+
+def test_batches_group_commit(db_path):
+    """Test entries are written in batches of at most batch_size."""
+    db = DatabaseManager(db_path, async_activity_log=True,
+                         activity_log_options={'batch_size': 25, 'flush_interval': 1.0})
+    for i in range(100):
+        db.log_activity({'level': 'INFO', 'component': 'test', 'action': f'a{i}'})
+    db.flush_activity_log(timeout=10)
+
+    stats = db.activity_writer.stats
+    assert stats['written'] == 100
+    assert stats['batches'] <= 100 // 25 + 1
+    db.close()
+
+
+def test_close_flushes_queue(db_path):
+    """Test close() commits everything still queued."""
+    db = DatabaseManager(db_path, async_activity_log=True,
+                         activity_log_options={'flush_interval': 5.0})
+    for i in range(5):
+        db.log_activity({'level': 'INFO', 'component': 'test', 'action': f'a{i}'})
+    db.close()
+
+    reopened = DatabaseManager(db_path)
+    assert reopened.get_stats()['activity_log'] == 5
+    reopened.close()
+
+
+def test_drop_policy_when_full():
+    """Test 'drop' overflow discards entries once the queue is full."""
+    release = threading.Event()
+    fake_db = MagicMock()
+    fake_db.log_activity_many.side_effect = lambda batch: release.wait(5) and [True] * len(batch)
+
+    writer = ActivityLogWriter(fake_db, batch_size=1, flush_interval=0.01,
+                               max_queue_size=2, overflow='drop')
+    results = [writer.submit({'component': 'test', 'action': f'a{i}'}) for i in range(10)]
+    release.set()
+    writer.close()
+
+    assert results.count(False) > 0
+    assert writer.stats['dropped'] == results.count(False)
+
+
+def test_block_policy_times_out():
+    """Test 'block' overflow gives up after block_timeout."""
+    release = threading.Event()
+    fake_db = MagicMock()
+    fake_db.log_activity_many.side_effect = lambda batch: release.wait(5) and [True] * len(batch)
+
+    writer = ActivityLogWriter(fake_db, batch_size=1, flush_interval=0.01,
+                               max_queue_size=1, overflow='block', block_timeout=0.05)
+    results = [writer.submit({'component': 'test', 'action': f'a{i}'}) for i in range(5)]
+    release.set()
+    writer.close()
+
+    assert False in results
+
+
+def test_submit_after_close_is_dropped():
+    """Test entries submitted after close() are rejected."""
+    writer = ActivityLogWriter(MagicMock(), flush_interval=0.01)
+    writer.close()
+    assert writer.submit({'component': 'test', 'action': 'late'}) is False
+
+
+def test_failed_batch_is_counted():
+    """Test write errors are counted and do not stop the writer."""
+    fake_db = MagicMock()
+    fake_db.log_activity_many.side_effect = RuntimeError("disk full")
+
+    writer = ActivityLogWriter(fake_db, flush_interval=0.01)
+    writer.submit({'component': 'test', 'action': 'a'})
+    assert writer.flush(timeout=5)
+    assert writer.stats['failed'] == 1
+    writer.close()
+
+
+def test_stats_are_exact_under_contention():
+    """Test counters from many producers and the writer thread add up exactly."""
+    # Switch threads as often as possible to provoke lost updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    fake_db = MagicMock()
+    fake_db.log_activity_many.side_effect = lambda batch: [True] * len(batch)
+    writer = ActivityLogWriter(fake_db, batch_size=10, flush_interval=0.01,
+                               max_queue_size=50, overflow='drop')
+
+    def produce():
+        for i in range(2000):
+            writer.submit({'component': 'test', 'action': f'a{i}'})
+
+    try:
+        threads = [threading.Thread(target=produce) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert writer.stats['queued'] + writer.stats['dropped'] == 16000
+    assert writer.stats['written'] == writer.stats['queued']
+
+
+def test_invalid_overflow_policy():
+    """Test unknown overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        ActivityLogWriter(MagicMock(), overflow='spill')
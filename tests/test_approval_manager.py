@@ -7,6 +7,7 @@ import shutil
 from datetime import datetime, timedelta
 from uuid import uuid4
 from pathlib import Path
+from unittest.mock import patch
 
 from src.approvals.approval_manager import ApprovalManager
 from src.database.db_manager import DatabaseManager
@@ -791,5 +792,75 @@ class TestApprovalErrorHandling:
         assert result['success'] is True
 
 
+class TestApprovalAtomicity:
+    """Test approval decisions commit or roll back as a unit."""
+
+    @pytest.fixture
+    def setup(self):
+        """Create approval manager with an item card awaiting approval."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+
+        vault_dir = tempfile.mkdtemp()
+        db = DatabaseManager(db_path)
+        manager = ApprovalManager(db, vault_dir)
+
+        card = Path(vault_dir) / 'Pending_Approval' / 'invoice.md'
+        card.write_text('# Invoice\n')
+        db.create_item({
+            'id': 'item-1',
+            'source': 'gmail',
+            'type': 'invoice',
+            'status': 'pending_approval',
+            'file_path': 'Pending_Approval/invoice.md'
+        })
+        db.create_approval({
+            'id': 'approval-1',
+            'item_id': 'item-1',
+            'deadline': (datetime.now() - timedelta(hours=25)).isoformat()
+        })
+
+        yield manager, db, vault_dir
+
+        db.close()
+        os.unlink(db_path)
+        shutil.rmtree(vault_dir)
+
+    def test_failed_item_update_rolls_back_decision(self, setup):
+        """Test a failure after the approval update leaves nothing applied."""
+        manager, db, vault_dir = setup
+
+        with patch.object(db, 'update_item', return_value=False):
+            result = manager.process_approval('approval-1', 'approved')
+
+        assert result['success'] is False
+        assert db.get_approval('approval-1')['decision'] is None
+        assert db.get_recent_activity(5) == []
+        assert (Path(vault_dir) / 'Pending_Approval' / 'invoice.md').exists()
+
+    def test_failed_move_rolls_back_records(self, setup):
+        """Test a card that cannot be moved leaves the records untouched."""
+        manager, db, vault_dir = setup
+
+        with patch('src.approvals.approval_manager.shutil.move', side_effect=OSError('disk full')):
+            result = manager.process_approval('approval-1', 'rejected')
+
+        assert result['success'] is False
+        assert db.get_approval('approval-1')['decision'] is None
+        assert db.get_item('item-1')['status'] == 'pending_approval'
+
+    def test_timeout_failure_skips_only_that_approval(self, setup):
+        """Test a failed auto-approval is rolled back and reported as not approved."""
+        manager, db, vault_dir = setup
+
+        with patch.object(db, 'update_item', return_value=False):
+            assert manager.check_approval_timeouts() == []
+        assert db.get_approval('approval-1')['decision'] is None
+
+        assert manager.check_approval_timeouts() == ['approval-1']
+        assert db.get_approval('approval-1')['auto_decided'] == 1
+        assert db.get_item('item-1')['status'] == 'approved'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
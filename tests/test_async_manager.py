@@ -0,0 +1,160 @@
+"""Tests for the asyncio database facade."""
+
+import asyncio
+import inspect
+import os
+import tempfile
+
+import pytest
+
+from src.database.async_manager import AsyncDatabaseManager
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path():
+    """Path for a temporary database, removed afterwards."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        path = tmp.name
+    yield path
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+def _item(i):
+    return {'id': f'item-{i}', 'source': 'gmail', 'type': 'email'}
+
+
+def test_every_public_method_is_mirrored():
+    """Test the facade exposes a coroutine for each sync method."""
+    public = {name for name, _ in inspect.getmembers(DatabaseManager, inspect.isfunction)
+              if not name.startswith('_')}
+    for name in public - AsyncDatabaseManager.EXCLUDED_METHODS:
+        method = getattr(AsyncDatabaseManager, name)
+        if name.startswith('iter_'):
+            assert not inspect.iscoroutinefunction(method), name
+        else:
+            assert inspect.iscoroutinefunction(method), name
+
+    writes = {name for name in public
+              if name.startswith(('create_', 'update_', 'delete_', 'upsert_', 'log_activity'))}
+    assert writes <= AsyncDatabaseManager.WRITE_METHODS
+
+
+def test_concurrent_writes_share_group_commits(db_path):
+    """Test many concurrent awaits are committed in far fewer transactions."""
+    async def run():
+        async with AsyncDatabaseManager(db_path, batch_window=0.01) as db:
+            results = await asyncio.gather(*(db.create_item(_item(i)) for i in range(200)))
+            items = await db.get_items_by_source('gmail')
+            return results, items, dict(db.stats)
+
+    results, items, stats = asyncio.run(run())
+
+    assert all(results)
+    assert len(items) == 200
+    assert stats['writes'] == 200
+    assert stats['batches'] < 20
+
+
+def test_read_after_write_sees_commit(db_path):
+    """Test an awaited write is visible to the next read."""
+    async def run():
+        async with AsyncDatabaseManager(db_path) as db:
+            await db.create_item(_item(1))
+            await db.update_item('item-1', {'status': 'done'})
+            return await db.get_item('item-1')
+
+    assert asyncio.run(run())['status'] == 'done'
+
+
+def test_failing_write_does_not_fail_its_batch(db_path):
+    """Test a write that raises is replayed alone and the others still commit."""
+    async def run():
+        async with AsyncDatabaseManager(db_path, batch_window=0.05) as db:
+            def explode(tx):
+                raise ValueError('bad write')
+
+            # Queue the failing write inside the same batch as the good ones
+            ok = [db._write(db.db.create_item, (_item(i),), {}) for i in range(5)]
+            bad = db._write(explode, (db.db,), {})
+            results = await asyncio.gather(*ok, bad, return_exceptions=True)
+            return results, await db.get_items_by_source('gmail'), dict(db.stats)
+
+    results, items, stats = asyncio.run(run())
+
+    assert results[:5] == [True] * 5
+    assert isinstance(results[5], ValueError)
+    assert len(items) == 5
+    assert stats['replayed'] == 6
+
+
+def test_run_transaction_is_atomic(db_path):
+    """Test run_transaction commits all steps or none."""
+    async def run():
+        async with AsyncDatabaseManager(db_path) as db:
+            await db.create_item(_item(1))
+            await db.create_approval({'id': 'approval-1', 'item_id': 'item-1'})
+
+            def approve(tx, fail):
+                tx.update_approval('approval-1', {'decision': 'approved'})
+                if fail:
+                    raise RuntimeError('halfway')
+                tx.update_item('item-1', {'status': 'approved'})
+
+            with pytest.raises(RuntimeError):
+                await db.run_transaction(approve, True)
+            before = await db.get_approval('approval-1')
+            await db.run_transaction(approve, False)
+            return before, await db.get_approval('approval-1'), await db.get_item('item-1')
+
+    before, after, item = asyncio.run(run())
+
+    assert before['decision'] is None
+    assert after['decision'] == 'approved'
+    assert item['status'] == 'approved'
+
+
+def test_iterators_stream_in_chunks(db_path):
+    """Test iter_* methods are async iterators over every row."""
+    async def run():
+        async with AsyncDatabaseManager(db_path) as db:
+            await db.create_items_many([_item(i) for i in range(25)])
+            return [row['id'] async for row in db.iter_items_by_source('gmail', chunk_size=10)]
+
+    assert len(set(asyncio.run(run()))) == 25
+
+
+def test_event_loop_not_blocked(db_path):
+    """Test the loop keeps running other tasks while queries execute."""
+    async def run():
+        async with AsyncDatabaseManager(db_path) as db:
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await db.create_items_many([_item(i) for i in range(2000)])
+            await db.get_items_by_source('gmail')
+            task.cancel()
+            return ticks
+
+    assert asyncio.run(run()) > 1
+
+
+def test_closed_manager_rejects_calls(db_path):
+    """Test calls after close() raise instead of hanging."""
+    async def run():
+        db = AsyncDatabaseManager(db_path)
+        await db.close()
+        with pytest.raises(RuntimeError):
+            await db.get_item('item-1')
+        with pytest.raises(RuntimeError):
+            await db.create_item(_item(1))
+
+    asyncio.run(run())
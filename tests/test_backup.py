@@ -0,0 +1,134 @@
+"""Tests for online database backups."""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.database.backup import list_snapshots, restore, rotate, snapshot_path
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db():
+    """Fresh database in its own folder, removed afterwards."""
+    folder = tempfile.mkdtemp()
+    db = DatabaseManager(os.path.join(folder, 'ai_employee.db'))
+    yield db
+    db.close()
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+def _items(start, count):
+    return [{'id': f'item-{i}', 'source': 'gmail', 'type': 'email', 'metadata': 'x' * 200}
+            for i in range(start, start + count)]
+
+
+def test_snapshot_is_compressed_and_restorable(db):
+    """Test a snapshot decompresses to a valid copy of the database."""
+    db.create_items_many(_items(0, 500))
+
+    result = db.backup()
+    snapshot = Path(result['path'])
+
+    assert snapshot.exists()
+    assert snapshot.name.endswith('.db.gz')
+    assert result['size_bytes'] == snapshot.stat().st_size
+    with gzip.open(snapshot, 'rb') as f:
+        raw = f.read()
+    assert raw.startswith(b'SQLite format 3\x00')
+    assert result['size_bytes'] < len(raw)
+
+    target = snapshot.parent / 'restored.db'
+    restore(snapshot, target)
+    conn = sqlite3.connect(str(target))
+    try:
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 500
+    finally:
+        conn.close()
+
+    with pytest.raises(FileExistsError):
+        restore(snapshot, target)
+
+
+def test_backup_recorded_for_dashboard(db):
+    """Test the last successful run is recorded with its duration."""
+    assert db.get_last_backup() is None
+
+    first = db.backup()
+    second = db.backup()
+    last = db.get_last_backup()
+
+    assert first['path'] != second['path']
+    assert last['path'] == second['path']
+    assert last['finished_at'] == second['finished_at']
+    assert last['duration_ms'] == second['duration_ms']
+    assert last['status'] == 'ok'
+
+
+def test_rotation_keeps_newest(db):
+    """Test only the newest snapshots survive rotation."""
+    paths = [db.backup(keep=2)['path'] for _ in range(4)]
+
+    remaining = [str(p) for p in list_snapshots(db.backup_dir, db.db_path.stem)]
+    assert remaining == paths[-2:]
+
+
+def test_snapshot_names_sort_by_time(tmp_path):
+    """Test colliding timestamps get ordered suffixes."""
+    when = datetime(2026, 1, 2, 3, 4, 5)
+    for _ in range(3):
+        snapshot_path(tmp_path, 'db', when).touch()
+    names = [p.name for p in list_snapshots(tmp_path, 'db')]
+
+    assert names == ['db_20260102_030405.db.gz', 'db_20260102_030405_1.db.gz',
+                     'db_20260102_030405_2.db.gz']
+    assert len(rotate(tmp_path, 'db', 1)) == 2
+
+
+def test_failed_backup_recorded(db, tmp_path):
+    """Test a failing run returns {} and leaves the last good backup in place."""
+    good = db.backup()
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('file in the way')
+
+    assert db.backup(backup_dir=str(blocker)) == {}
+    assert db.get_last_backup()['path'] == good['path']
+
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        statuses = [row[0] for row in conn.execute("SELECT status FROM backups ORDER BY id")]
+    finally:
+        conn.close()
+    assert statuses == ['ok', 'failed']
+
+
+def test_writers_keep_going_during_backup(db):
+    """Test writes from another thread succeed while a stepped backup runs."""
+    db.create_items_many(_items(0, 3000))
+    errors = []
+    written = []
+
+    def writer():
+        try:
+            for i in range(3000, 3200):
+                written.append(db.create_item(_items(i, 1)[0]))
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    result = db.backup(pages_per_step=16)
+    thread.join()
+
+    assert result
+    assert not errors
+    assert all(written)
+    assert db.get_item('item-3199') is not None
@@ -0,0 +1,107 @@
+"""Tests for the cross-process daily stats service."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils import daily_stats
+from src.utils.daily_stats import DailyStats
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def stats(tmp_path):
+    service = DailyStats(str(tmp_path), flush_interval=0.05)
+    yield service
+    service.close()
+
+
+def test_increments_are_summed(stats):
+    """Test increments from several calls add up and unknown counters are rejected."""
+    for _ in range(3):
+        stats.increment('files_organized')
+    stats.increment('emails_processed', 2)
+
+    today = stats.get()
+    assert today['files_organized'] == 3
+    assert today['emails_processed'] == 2
+    assert today['errors'] == 0
+    with pytest.raises(ValueError):
+        stats.increment('tweets_sent')
+
+
+def test_use_after_close(tmp_path):
+    """Test a closed service still counts and reads, reopening its database."""
+    service = DailyStats(str(tmp_path))
+    service.increment('errors')
+    service.close()
+
+    service.increment('errors')
+    assert service.get()['errors'] == 2
+    assert json.loads((tmp_path / 'Logs' / 'daily_stats.json').read_text())['errors'] == 2
+    service.close()
+    service.close()
+
+
+def test_concurrent_processes_lose_no_increments(stats, tmp_path):
+    """Test watchers counting from separate processes never overwrite each other."""
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from src.utils.daily_stats import DailyStats;"
+        "s = DailyStats(sys.argv[2], flush_interval=0.001);"
+        "[s.increment('actions_completed') for _ in range(500)];"
+        "s.close()"
+    )
+    workers = [subprocess.Popen([sys.executable, '-c', script, str(PROJECT_ROOT), str(tmp_path)])
+               for _ in range(4)]
+    for _ in range(500):
+        stats.increment('actions_completed')
+    assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+    assert stats.get()['actions_completed'] == 2500
+
+
+def test_midnight_rollover_keeps_history(stats, monkeypatch):
+    """Test a new day starts from zero while earlier days stay available."""
+    monkeypatch.setattr(daily_stats, '_today', lambda: '2026-03-01')
+    stats.increment('errors')
+    stats.increment('files_organized', 4)
+    stats.flush()
+
+    monkeypatch.setattr(daily_stats, '_today', lambda: '2026-03-03')
+    assert stats.get() == {'date': '2026-03-03', 'emails_processed': 0,
+                           'files_organized': 0, 'actions_completed': 0, 'errors': 0}
+    stats.increment('files_organized')
+
+    history = stats.history(days=3)
+    assert [day['date'] for day in history] == ['2026-03-01', '2026-03-02', '2026-03-03']
+    assert [day['files_organized'] for day in history] == [4, 0, 1]
+    assert history[0]['errors'] == 1
+
+
+def test_snapshot_written_after_flush(stats, tmp_path):
+    """Test today's totals are mirrored to Logs/daily_stats.json."""
+    stats.increment('emails_processed')
+    stats.flush()
+
+    snapshot = json.loads((tmp_path / 'Logs' / 'daily_stats.json').read_text())
+    assert snapshot == stats.get()
+
+
+def test_existing_snapshot_is_imported(tmp_path):
+    """Test counts from the old JSON file carry over into a new database."""
+    logs = tmp_path / 'Logs'
+    logs.mkdir()
+    (logs / 'daily_stats.json').write_text(json.dumps({
+        'date': '2026-03-01', 'emails_processed': 7, 'files_organized': 2,
+        'actions_completed': 0, 'errors': 1}))
+
+    stats = DailyStats(str(tmp_path))
+    try:
+        assert stats.get('2026-03-01')['emails_processed'] == 7
+    finally:
+        stats.close()
@@ -0,0 +1,189 @@
+"""Tests for the debounced dashboard refresher."""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils import dashboard_updater
+from src.utils.dashboard_refresher import DashboardRefresher, benchmark
+from src.utils.vault_logging import shutdown_logging
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class CountingRender:
+    """Render stand-in that records when it ran."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls.append(time.monotonic())
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('render broke')
+        return {'status': 'success'}
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_burst_renders_once():
+    """Test a burst of events inside the window produces a single render."""
+    render = CountingRender()
+    refresher = DashboardRefresher(render, debounce=0.1, max_latency=2.0)
+    for _ in range(500):
+        refresher.notify()
+
+    assert _wait_for(lambda: render.calls)
+    time.sleep(0.2)
+    refresher.close()
+
+    assert len(render.calls) == 1
+    assert refresher.stats['events'] == 500
+    assert refresher.stats['renders'] == 1
+
+
+def test_max_latency_caps_a_steady_stream():
+    """Test a stream that never goes quiet still renders every max_latency."""
+    render = CountingRender()
+    refresher = DashboardRefresher(render, debounce=0.1, max_latency=0.25)
+    end = time.monotonic() + 1.0
+    while time.monotonic() < end:
+        refresher.notify()
+        time.sleep(0.02)
+    refresher.close()
+
+    assert 3 <= len(render.calls) <= 6
+    assert refresher.stats['max_delay_ms'] < 250 + 150
+
+
+def test_close_renders_pending_events():
+    """Test events still waiting for their window are rendered on close."""
+    render = CountingRender()
+    refresher = DashboardRefresher(render, debounce=60, max_latency=60)
+    refresher.notify()
+    refresher.close()
+    assert len(render.calls) == 1
+
+    # After close there is nothing to coalesce with: render straight away
+    refresher.notify()
+    assert len(render.calls) == 2
+
+
+def test_flush_renders_now():
+    """Test flush() renders pending events and returns the result."""
+    render = CountingRender()
+    refresher = DashboardRefresher(render, debounce=60, max_latency=60)
+    assert refresher.flush() is None
+
+    refresher.notify()
+    assert refresher.flush() == {'status': 'success'}
+    assert refresher.flush() is None
+    refresher.close()
+    assert len(render.calls) == 1
+
+
+def test_failed_render_does_not_stop_refresher():
+    """Test a render that raises is counted and later events still render."""
+    render = CountingRender(fail=True)
+    refresher = DashboardRefresher(render, debounce=0.02, max_latency=0.1)
+    refresher.notify()
+    assert _wait_for(lambda: refresher.stats['failures'] == 1)
+
+    refresher.notify()
+    assert _wait_for(lambda: refresher.stats['failures'] == 2)
+    refresher.close()
+
+
+@pytest.fixture
+def vault_cwd(tmp_path, monkeypatch):
+    """Temporary working directory holding an empty vault."""
+    for folder in ('Inbox', 'Needs_Action/urgent', 'Needs_Action/normal', 'Done', 'Logs'):
+        (tmp_path / 'AI_Employee_Vault' / folder).mkdir(parents=True)
+    # Logging resolves the vault on first use; restart it inside and after the test
+    shutdown_logging()
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    shutdown_logging()
+
+
+def test_log_and_update_does_not_render_per_event(vault_cwd, monkeypatch, capsys):
+    """Test log_and_update queues a refresh instead of regenerating the dashboard."""
+    render = CountingRender()
+    refresher = DashboardRefresher(render, debounce=60, max_latency=60)
+    monkeypatch.setattr(dashboard_updater, 'get_refresher', lambda: refresher)
+
+    for i in range(50):
+        result = dashboard_updater.log_and_update(f"Organized file: {i}.pdf", stat_type='file')
+        assert result['status'] == 'queued'
+
+    assert render.calls == []
+    assert dashboard_updater.flush_dashboard() == {'status': 'success'}
+    assert dashboard_updater.flush_dashboard() == {'status': 'unchanged'}
+    assert "Organized file: 49.pdf" in dashboard_updater.get_recent_activities()
+    refresher.close()
+
+
+def test_benchmark_events_per_second(vault_cwd):
+    """Benchmark: events/sec with debouncing against one full render per event."""
+    legacy_events = 20
+    start = time.perf_counter()
+    for i in range(legacy_events):
+        dashboard_updater.add_activity(f"Legacy event {i}")
+        dashboard_updater.update_dashboard_complete()
+    legacy_rate = legacy_events / (time.perf_counter() - start)
+
+    result = benchmark(5000, debounce=0.05, max_latency=0.5,
+                       activity=lambda n: dashboard_updater.add_activity(f"Event {n}"))
+    print(f"\ndebounced: {result['events_per_sec']:,.0f} events/sec "
+          f"({result['renders']} renders), legacy: {legacy_rate:,.0f} events/sec")
+
+    assert result['renders'] <= 5
+    assert result['events_per_sec'] > 10 * legacy_rate
+    # The last render saw the last event
+    assert 'Event 4999' in dashboard_updater.read_vault_file('Dashboard.md')
+
+
+def test_flush_dashboard_writes_file_to_disk(vault_cwd, monkeypatch):
+    """Test flush_dashboard() leaves the rendered Dashboard.md on disk, not only queued."""
+    refresher = DashboardRefresher(debounce=60, max_latency=60)
+    monkeypatch.setattr(dashboard_updater, 'get_refresher', lambda: refresher)
+
+    dashboard_updater.log_and_update("Organized file: on-disk.pdf", stat_type='file')
+    assert dashboard_updater.flush_dashboard()['status'] == 'success'
+    refresher.close()
+
+    content = (vault_cwd / 'AI_Employee_Vault' / 'Dashboard.md').read_text(encoding='utf-8')
+    assert "Organized file: on-disk.pdf" in content
+
+
+def test_exit_hook_writes_dashboard(vault_cwd):
+    """Test a process that only calls log_and_update still updates Dashboard.md at exit."""
+    # The stats service is opened after the refresher, so it is closed before the last render
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from src.utils.dashboard_updater import log_and_update;"
+        "log_and_update('Checked inbox');"
+        "log_and_update('Organized file: at-exit.pdf', 'file')"
+    )
+    subprocess.run([sys.executable, '-c', script, str(PROJECT_ROOT)],
+                   cwd=vault_cwd, check=True, timeout=60, capture_output=True)
+
+    content = (vault_cwd / 'AI_Employee_Vault' / 'Dashboard.md').read_text(encoding='utf-8')
+    assert "Organized file: at-exit.pdf" in content
+    assert "- Files Organized: 1" in content
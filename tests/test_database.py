@@ -1,8 +1,10 @@
 """Tests for database module - Phase 1 Silver Tier."""
 
 import pytest
+import json
 import sqlite3
 import os
+import shutil
 import tempfile
 from datetime import datetime, timedelta
 from uuid import uuid4
@@ -1102,5 +1104,920 @@ class TestDatabaseExceptionHandling:
         os.unlink(db_path)
 
 
+class TestConnectionPool:
+    """Test pooled connection management."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database with a small pool."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path, pool_size=2)
+        yield db
+        db.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.unlink(db_path + suffix)
+
+    def test_pragmas_applied(self, db):
+        """Test WAL and tuning pragmas are set on pooled connections."""
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+
+    def test_foreign_keys_opt_in(self):
+        """Test foreign key enforcement can be enabled."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path, foreign_keys=True)
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        db.close()
+        os.unlink(db_path)
+
+    def test_connection_reused(self, db):
+        """Test sequential operations reuse the same connection."""
+        with db._get_connection() as first:
+            pass
+        db.get_item('missing')
+        with db._get_connection() as second:
+            assert second is first
+
+    def test_nested_borrow_reuses_connection(self, db):
+        """Test nested borrows on one thread share the held connection."""
+        with db._get_connection() as outer:
+            with db._get_connection() as inner:
+                assert inner is outer
+
+    def test_pool_is_bounded(self, db):
+        """Test concurrent threads never open more than pool_size connections."""
+        import threading
+
+        def worker():
+            for i in range(20):
+                db.create_item({
+                    'id': str(uuid4()),
+                    'source': 'gmail',
+                    'type': 'email',
+                    'file_path': f'test_{i}.md'
+                })
+                db.get_items_by_source('gmail')
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(db._connections) <= 2
+        assert len(db.get_items_by_source('gmail')) == 120
+
+    def test_uncommitted_work_discarded_on_release(self, db):
+        """Test a connection returned without commit is rolled back."""
+        item_id = str(uuid4())
+        with db._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO items (id, source, type) VALUES (?, 'gmail', 'email')",
+                (item_id,)
+            )
+        assert db.get_item(item_id) is None
+
+    def test_close_reopens_lazily(self, db):
+        """Test the manager keeps working after close()."""
+        db.close()
+        assert db._connections == []
+        assert 'items' in db.get_tables()
+
+
+class TestBulkOperations:
+    """Test bulk insert and upsert APIs."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        yield db
+        db.close()
+        os.unlink(db_path)
+
+    def test_create_items_many(self, db):
+        """Test bulk item creation returns one outcome per row."""
+        items = [
+            {'id': str(uuid4()), 'source': 'gmail', 'type': 'email', 'file_path': f'{i}.md'}
+            for i in range(50)
+        ]
+        results = db.create_items_many(items)
+        assert results == [True] * 50
+        assert len(db.get_items_by_source('gmail')) == 50
+
+    def test_create_items_many_reports_failed_rows(self, db):
+        """Test duplicate and invalid rows fail without aborting the batch."""
+        existing = str(uuid4())
+        db.create_item({'id': existing, 'source': 'gmail', 'type': 'email'})
+
+        items = [
+            {'id': str(uuid4()), 'source': 'gmail', 'type': 'email'},
+            {'id': existing, 'source': 'gmail', 'type': 'email'},
+            {'id': str(uuid4()), 'source': 'filesystem'},  # type is NOT NULL
+            {'id': str(uuid4()), 'source': 'filesystem', 'type': 'file'},
+        ]
+        results = db.create_items_many(items)
+        assert results == [True, False, False, True]
+        assert db.get_stats()['items'] == 3
+
+    def test_create_items_many_mixed_columns(self, db):
+        """Test rows with different column sets are all inserted."""
+        items = [
+            {'id': 'a', 'source': 'gmail', 'type': 'email'},
+            {'id': 'b', 'source': 'gmail', 'type': 'email', 'amount': 10.0},
+            {'id': 'c', 'source': 'gmail', 'type': 'email'},
+        ]
+        assert db.create_items_many(items) == [True, True, True]
+        assert db.get_item('b')['amount'] == 10.0
+
+    def test_create_items_many_empty(self, db):
+        """Test an empty batch is a no-op."""
+        assert db.create_items_many([]) == []
+
+    def test_upsert_items(self, db):
+        """Test upsert inserts new rows and updates existing ones."""
+        db.create_item({'id': 'x', 'source': 'gmail', 'type': 'email', 'status': 'pending'})
+
+        results = db.upsert_items([
+            {'id': 'x', 'source': 'gmail', 'type': 'email', 'status': 'done'},
+            {'id': 'y', 'source': 'whatsapp', 'type': 'message', 'status': 'pending'},
+        ])
+        assert results == [True, True]
+        assert db.get_item('x')['status'] == 'done'
+        assert db.get_item('y')['source'] == 'whatsapp'
+
+    def test_log_activity_many(self, db):
+        """Test bulk activity logging."""
+        entries = [
+            {'level': 'INFO', 'component': 'test', 'action': f'action {i}'}
+            for i in range(20)
+        ]
+        assert db.log_activity_many(entries) == [True] * 20
+        assert db.get_stats()['activity_log'] == 20
+
+    def test_create_and_upsert_financial_records(self, db):
+        """Test bulk financial record creation and upsert."""
+        records = [
+            {'id': f'r{i}', 'record_type': 'receipt', 'amount': float(i)}
+            for i in range(5)
+        ]
+        assert db.create_financial_records_many(records) == [True] * 5
+
+        results = db.upsert_financial_records([
+            {'id': 'r0', 'record_type': 'receipt', 'amount': 99.0},
+        ])
+        assert results == [True]
+        assert db.get_financial_record('r0')['amount'] == 99.0
+
+    def test_bulk_insert_with_db_error(self, db):
+        """Test bulk insert reports every row failed on connection errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            results = db.create_items_many([{'id': 'a', 'source': 'gmail', 'type': 'email'}])
+            assert results == [False]
+
+
+class TestPagination:
+    """Test keyset-paginated and streaming list queries."""
+
+    @pytest.fixture
+    def db(self):
+        """Create database with items sharing created_at timestamps."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        db.create_items_many([
+            {
+                'id': f'item-{i:03d}',
+                'source': 'gmail' if i % 2 == 0 else 'whatsapp',
+                'type': 'email',
+                'status': 'pending',
+                # Several items per second to exercise the id tie-break
+                'created_at': f'2026-02-{1 + i // 10:02d} 10:00:00'
+            }
+            for i in range(45)
+        ])
+        yield db
+        db.close()
+        os.unlink(db_path)
+
+    def test_pages_cover_all_rows_once(self, db):
+        """Test consecutive pages return every row exactly once, newest first."""
+        seen = []
+        after = None
+        while True:
+            page = db.get_items_by_status_page('pending', limit=10, after=after)
+            if not page:
+                break
+            seen.extend(row['id'] for row in page)
+            after = (page[-1]['created_at'], page[-1]['id'])
+
+        assert len(seen) == 45
+        assert len(set(seen)) == 45
+        assert seen == sorted(seen, key=lambda i: (db.get_item(i)['created_at'], i), reverse=True)
+
+    def test_iter_items_by_source_streams_in_chunks(self, db):
+        """Test iterator yields the same rows as the list method."""
+        streamed = list(db.iter_items_by_source('gmail', chunk_size=4))
+        assert len(streamed) == 23
+        assert {r['id'] for r in streamed} == {r['id'] for r in db.get_items_by_source('gmail')}
+
+    def test_iter_is_lazy(self, db):
+        """Test the iterator fetches one chunk at a time."""
+        with patch.object(db, 'get_items_by_status_page',
+                          wraps=db.get_items_by_status_page) as page:
+            iterator = db.iter_items_by_status('pending', chunk_size=5)
+            next(iterator)
+            assert page.call_count == 1
+
+    def test_iter_resumes_after_cursor(self, db):
+        """Test iteration can start from a cursor."""
+        first = db.get_items_by_source_page('gmail', limit=5)
+        cursor = (first[-1]['created_at'], first[-1]['id'])
+        rest = list(db.iter_items_by_source('gmail', after=cursor))
+        assert len(rest) == 18
+        assert not {r['id'] for r in first} & {r['id'] for r in rest}
+
+    def test_pending_approvals_page(self, db):
+        """Test pending approvals paginate by deadline."""
+        for i in range(7):
+            db.create_approval({
+                'id': f'appr-{i}',
+                'item_id': f'item-{i:03d}',
+                'deadline': f'2026-03-0{1 + i % 3} 00:00:00'
+            })
+
+        streamed = list(db.iter_pending_approvals(chunk_size=2))
+        keys = [(a['deadline'], a['id']) for a in streamed]
+        assert len(keys) == 7
+        assert keys == sorted(keys)
+        assert streamed[0]['source'] == 'gmail'
+
+    def test_linkedin_posts_pages(self, db):
+        """Test LinkedIn post paging in both directions and failed posts."""
+        for i in range(6):
+            db.create_linkedin_post({
+                'id': f'post-{i}',
+                'content': f'Post {i}',
+                'status': 'failed' if i < 2 else 'posted',
+                'created_at': f'2026-02-0{1 + i} 09:00:00',
+                'updated_at': f'2026-02-0{1 + i} 09:00:00'
+            })
+
+        newest = list(db.iter_linkedin_posts_by_status('posted', chunk_size=3))
+        assert [p['id'] for p in newest] == ['post-5', 'post-4', 'post-3', 'post-2']
+
+        oldest = db.get_linkedin_posts_by_status_page('posted', limit=2, oldest_first=True)
+        assert [p['id'] for p in oldest] == ['post-2', 'post-3']
+
+        failed = list(db.iter_failed_linkedin_posts(chunk_size=1))
+        assert [p['id'] for p in failed] == ['post-1', 'post-0']
+
+    def test_pending_approvals_stream_past_null_deadlines(self, db):
+        """Test streaming keeps going across approvals without a deadline."""
+        for i in range(5):
+            db.create_approval({
+                'id': f'appr-{i}',
+                'item_id': f'item-{i:03d}',
+                'deadline': None if i >= 2 else f'2026-03-0{1 + i} 00:00:00'
+            })
+
+        streamed = [a['id'] for a in db.iter_pending_approvals(chunk_size=2)]
+        assert streamed == [a['id'] for a in db.get_pending_approvals()]
+        assert streamed == ['appr-2', 'appr-3', 'appr-4', 'appr-0', 'appr-1']
+
+    def test_failed_linkedin_posts_stream_past_null_updated_at(self, db):
+        """Test failed posts without updated_at are streamed after dated ones."""
+        for i in range(5):
+            db.create_linkedin_post({
+                'id': f'post-{i}',
+                'content': f'Post {i}',
+                'status': 'failed',
+                'updated_at': None if i >= 2 else f'2026-02-0{1 + i} 09:00:00'
+            })
+
+        failed = [p['id'] for p in db.iter_failed_linkedin_posts(chunk_size=2)]
+        assert failed == ['post-1', 'post-0', 'post-4', 'post-3', 'post-2']
+
+    def test_page_with_db_error(self, db):
+        """Test page methods return [] on database errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            assert db.get_items_by_source_page('gmail') == []
+            assert list(db.iter_items_by_status('pending')) == []
+
+
+
+class TestFinancialRollups:
+    """Test the trigger-maintained financial_rollups table."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        yield db
+        db.close()
+        os.unlink(db_path)
+
+    @staticmethod
+    def _scan_summary(db):
+        """Summary computed the old way, straight from financial_records."""
+        with db._get_connection() as conn:
+            pending = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM financial_records
+                WHERE record_type = 'invoice' AND payment_status = 'pending'
+            """).fetchone()
+            paid = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM financial_records
+                WHERE record_type = 'invoice' AND payment_status = 'paid'
+                AND strftime('%Y-%m', paid_at) = strftime('%Y-%m', 'now')
+            """).fetchone()
+            expenses = conn.execute("""
+                SELECT COALESCE(SUM(amount), 0) FROM financial_records
+                WHERE record_type = 'expense'
+                AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
+            """).fetchone()[0]
+        return {
+            'pending_invoices_count': pending[0],
+            'pending_invoices_amount': pending[1],
+            'paid_this_month_count': paid[0],
+            'paid_this_month_amount': paid[1],
+            'expenses_this_month': expenses
+        }
+
+    def _populate(self, db):
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        db.create_financial_records_many([
+            {'id': 'inv-1', 'record_type': 'invoice', 'amount': 100.0},
+            {'id': 'inv-2', 'record_type': 'invoice', 'amount': 250.0, 'category': 'consulting'},
+            {'id': 'inv-3', 'record_type': 'invoice', 'amount': 75.0,
+             'payment_status': 'paid', 'paid_at': now},
+            {'id': 'inv-old', 'record_type': 'invoice', 'amount': 500.0,
+             'payment_status': 'paid', 'paid_at': '2020-01-15 10:00:00'},
+            {'id': 'exp-1', 'record_type': 'expense', 'amount': 40.0, 'category': 'software'},
+            {'id': 'exp-old', 'record_type': 'expense', 'amount': 60.0,
+             'created_at': '2020-01-15 10:00:00'},
+        ])
+        return now
+
+    def test_summary_matches_full_scan(self, db):
+        """Test rollup-backed summary equals the full-scan aggregates."""
+        self._populate(db)
+        summary = db.get_financial_summary()
+
+        assert summary == self._scan_summary(db)
+        assert summary['pending_invoices_count'] == 2
+        assert summary['pending_invoices_amount'] == 350.0
+        assert summary['paid_this_month_count'] == 1
+        assert summary['expenses_this_month'] == 40.0
+
+    def test_updates_move_rows_between_rollups(self, db):
+        """Test status, amount and paid_at updates are reflected."""
+        now = self._populate(db)
+
+        db.update_financial_record('inv-1', {'payment_status': 'paid', 'paid_at': now})
+        db.update_financial_record('inv-2', {'amount': 300.0})
+        db.upsert_financial_records([{'id': 'exp-1', 'record_type': 'expense', 'amount': 45.0}])
+
+        summary = db.get_financial_summary()
+        assert summary == self._scan_summary(db)
+        assert summary['pending_invoices_count'] == 1
+        assert summary['pending_invoices_amount'] == 300.0
+        assert summary['paid_this_month_amount'] == 175.0
+        assert summary['expenses_this_month'] == 45.0
+
+    def test_deletes_remove_empty_rollups(self, db):
+        """Test deleting records decrements and drops empty rollup rows."""
+        self._populate(db)
+        with db._get_connection() as conn:
+            conn.execute("DELETE FROM financial_records")
+            conn.commit()
+            remaining = conn.execute("SELECT COUNT(*) FROM financial_rollups").fetchone()[0]
+
+        assert remaining == 0
+        assert db.get_financial_summary()['pending_invoices_count'] == 0
+
+    def test_rebuild_financial_rollups(self, db):
+        """Test rebuild repairs rollups that drifted from the records."""
+        self._populate(db)
+        with db._get_connection() as conn:
+            conn.execute("UPDATE financial_rollups SET record_count = 99, total_amount = 0")
+            conn.commit()
+        assert db.get_financial_summary() != self._scan_summary(db)
+
+        assert db.rebuild_financial_rollups() is True
+        assert db.get_financial_summary() == self._scan_summary(db)
+
+    def test_existing_database_is_backfilled(self, db):
+        """Test a database created before rollups existed is backfilled on open."""
+        self._populate(db)
+        expected = self._scan_summary(db)
+        with db._get_connection() as conn:
+            conn.execute("DROP TABLE financial_rollups")
+            for name in ('insert', 'update', 'delete'):
+                conn.execute(f"DROP TRIGGER trg_financial_rollups_{name}")
+            conn.execute("PRAGMA user_version = 0")  # pre-versioning database
+            conn.commit()
+        db.close()
+
+        reopened = DatabaseManager(str(db.db_path))
+        assert reopened.get_financial_summary() == expected
+        reopened.close()
+
+    def test_rebuild_with_db_error(self, db):
+        """Test rebuild returns False on database errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            assert db.rebuild_financial_rollups() is False
+
+
+
+class TestDashboardSnapshot:
+    """Test item rollups and the single-transaction dashboard snapshot."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        yield db
+        db.close()
+        os.unlink(db_path)
+
+    @staticmethod
+    def _scan_counts(db):
+        """Per-source item counts straight from items."""
+        with db._get_connection() as conn:
+            return dict(conn.execute(
+                "SELECT source, COUNT(*) FROM items GROUP BY source").fetchall())
+
+    def test_item_rollups_follow_writes(self, db):
+        """Test inserts, source/status updates and deletes keep the counts exact."""
+        db.create_items_many([
+            {'id': f'item-{i}', 'source': 'gmail' if i % 2 else 'whatsapp', 'type': 'email'}
+            for i in range(10)
+        ])
+        db.update_item('item-1', {'source': 'linkedin'})
+        db.update_item('item-3', {'status': 'done'})
+        db.delete_item('item-0')
+
+        counts = db.get_dashboard_snapshot()['items_by_source']
+        assert counts == self._scan_counts(db)
+        assert counts == {'gmail': 4, 'whatsapp': 4, 'linkedin': 1}
+
+    def test_existing_database_is_backfilled(self, db):
+        """Test a database created before item rollups existed is backfilled on open."""
+        db.create_items_many([{'id': f'item-{i}', 'source': 'gmail', 'type': 'email'}
+                              for i in range(3)])
+        with db._get_connection() as conn:
+            conn.execute("DROP TABLE item_rollups")
+            for name in ('insert', 'update', 'delete'):
+                conn.execute(f"DROP TRIGGER trg_item_rollups_{name}")
+            conn.execute("PRAGMA user_version = 4")
+            conn.commit()
+        db.close()
+
+        reopened = DatabaseManager(str(db.db_path))
+        assert reopened.get_dashboard_snapshot()['items_by_source'] == {'gmail': 3}
+        reopened.close()
+
+    def test_sections_read_in_one_transaction(self, db):
+        """Test every section is read on one connection between BEGIN and its end."""
+        db.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email', 'amount': 90.0})
+        db.create_approval({'id': 'approval-1', 'item_id': 'item-1', 'deadline': '2026-03-01'})
+        db.create_financial_record({'id': 'fin-1', 'record_type': 'invoice', 'amount': 90.0})
+        db.log_activity({'component': 'test', 'action': 'created'})
+        db.close()
+
+        statements = []
+        original_connect = db._connect
+
+        def traced_connect():
+            conn = original_connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        db._connect = traced_connect
+        snapshot = db.get_dashboard_snapshot()
+
+        queries = [s.split()[0].upper() for s in statements if not s.startswith('PRAGMA')]
+        assert queries[0] == 'BEGIN' and queries[-1] == 'ROLLBACK'
+        assert queries[1:-1] == ['SELECT'] * (len(queries) - 2)
+        assert len(db._connections) == 1
+        assert snapshot['pending_approvals'][0]['amount'] == 90.0
+        assert snapshot['financial']['pending_invoices_count'] == 1
+        assert snapshot['recent_activity'][0]['action'] == 'created'
+        assert snapshot['last_backup'] is None
+
+    def test_snapshot_joins_caller_transaction(self, db):
+        """Test a snapshot inside transaction() sees the caller's uncommitted writes."""
+        with db.transaction() as tx:
+            tx.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email'})
+            assert tx.get_dashboard_snapshot()['items_by_source'] == {'gmail': 1}
+        assert db.get_dashboard_snapshot()['items_by_source'] == {'gmail': 1}
+
+    def test_snapshot_with_db_error(self, db):
+        """Test the snapshot is empty on database errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            assert db.get_dashboard_snapshot() == {}
+
+
+class TestFullTextSearch:
+    """Test FTS5 search over items and vault markdown."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        yield db
+        db.close()
+        os.unlink(db_path)
+
+    @pytest.fixture
+    def vault(self, tmp_path):
+        """Small vault with cards, a log and a dashboard."""
+        (tmp_path / 'Inbox' / 'emails').mkdir(parents=True)
+        (tmp_path / 'Done').mkdir()
+        (tmp_path / 'Logs').mkdir()
+        (tmp_path / 'Inbox' / 'emails' / 'acme.md').write_text(
+            "# Email: Acme invoice overdue\n\nPlease pay invoice INV-42 for consulting.\n")
+        (tmp_path / 'Done' / 'lunch.md').write_text(
+            "---\ntags: [misc]\n---\n# Team lunch\n\nPizza on Friday, invoice to follow.\n")
+        (tmp_path / 'Logs' / '2026-02-15.md').write_text("# Log\n\ninvoice processed\n")
+        (tmp_path / 'Dashboard.md').write_text("# Dashboard\n\ninvoice count: 3\n")
+        return tmp_path
+
+    def test_items_are_searchable(self, db):
+        """Test items are indexed on insert, update and delete."""
+        db.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email',
+                        'category': 'invoice', 'metadata': '{"subject": "Quarterly retainer"}'})
+        assert [h['ref'] for h in db.search('retainer')] == ['item-1']
+
+        db.update_item('item-1', {'metadata': '{"subject": "Annual licence"}'})
+        assert db.search('retainer') == []
+        assert db.search('licence')[0]['snippet'].count('[licence]') == 1
+
+        db.delete_item('item-1')
+        assert db.search('licence') == []
+
+    def test_index_vault_and_search(self, db, vault):
+        """Test vault cards are indexed with titles and ranked snippets."""
+        stats = db.index_vault(str(vault))
+        assert stats == {'indexed': 2, 'removed': 0, 'unchanged': 0}
+
+        hits = db.search('invoice')
+        assert [h['ref'] for h in hits] == ['Inbox/emails/acme.md', 'Done/lunch.md']
+        assert hits[0]['title'] == 'Email: Acme invoice overdue'
+        assert hits[1]['title'] == 'Team lunch'
+        assert '[invoice]' in hits[0]['snippet']
+
+    def test_index_vault_is_incremental(self, db, vault):
+        """Test only changed files are re-read and deleted files are dropped."""
+        db.index_vault(str(vault))
+        card = vault / 'Done' / 'lunch.md'
+        card.write_text("# Team lunch\n\nTacos instead of pizza.\n")
+        os.utime(card, (card.stat().st_atime, card.stat().st_mtime + 10))
+        (vault / 'Inbox' / 'emails' / 'acme.md').unlink()
+
+        assert db.index_vault(str(vault)) == {'indexed': 1, 'removed': 1, 'unchanged': 0}
+        assert db.search('pizza')[0]['ref'] == 'Done/lunch.md'
+        assert db.search('consulting') == []
+        assert db.index_vault(str(vault)) == {'indexed': 0, 'removed': 0, 'unchanged': 1}
+
+    def test_index_vault_paths(self, db, vault):
+        """Test indexing only the given files."""
+        new_card = vault / 'Inbox' / 'emails' / 'globex.md'
+        new_card.write_text("# Email: Globex contract\n\nSigned copy attached.\n")
+
+        stats = db.index_vault(str(vault), paths=[str(new_card), str(vault / 'Dashboard.md')])
+        assert stats == {'indexed': 1, 'removed': 0, 'unchanged': 0}
+        assert db.search('globex')[0]['ref'] == 'Inbox/emails/globex.md'
+        assert db.search('acme') == []
+
+        new_card.unlink()
+        assert db.index_vault(str(vault), paths=[str(new_card)])['removed'] == 1
+
+    def test_search_query_syntax_is_escaped(self, db, vault):
+        """Test punctuation in queries never raises FTS syntax errors."""
+        db.index_vault(str(vault))
+        assert db.search('INV-42')[0]['ref'] == 'Inbox/emails/acme.md'
+        assert db.search('"unbalanced (') == []
+        assert db.search('   ') == []
+        assert db.search('consult*')[0]['ref'] == 'Inbox/emails/acme.md'
+
+    def test_search_with_db_error(self, db):
+        """Test search and index_vault degrade on database errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            assert db.search('invoice') == []
+            assert db.index_vault('/nonexistent') == {}
+
+
+
+class TestActivityRetention:
+    """Test activity_log archiving, cross-partition queries and vacuum."""
+
+    @pytest.fixture
+    def db(self):
+        """Database with a year of old activity plus a few recent entries."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        db.log_activity_many([
+            {'timestamp': f'2025-{month:02d}-{day:02d} 12:00:00', 'level': 'INFO',
+             'component': 'gmail' if day % 2 else 'filesystem', 'action': f'{month}/{day}',
+             'details': 'x' * 500}
+            for month in range(1, 13) for day in range(1, 21)
+        ])
+        db.log_activity({'component': 'gmail', 'action': 'today'})
+        yield db
+        db.close()
+        shutil.rmtree(db.archive_dir, ignore_errors=True)
+        os.unlink(db_path)
+
+    def test_archive_moves_old_rows_by_month(self, db):
+        """Test rows past retention move to one archive file per month."""
+        result = db.archive_activity_log(retention_days=30)
+
+        assert result['rows_archived'] == 240
+        assert result['months'] == [f'2025-{m:02d}' for m in range(1, 13)]
+        assert sorted(p.name for p in db.archive_dir.iterdir()) == [
+            f'activity_log_2025-{m:02d}.db' for m in range(1, 13)]
+        assert db.get_stats()['activity_log'] == 1
+
+        with sqlite3.connect(db.archive_dir / 'activity_log_2025-03.db') as archive:
+            assert archive.execute("SELECT COUNT(*) FROM activity_log").fetchone()[0] == 20
+
+        assert db.archive_activity_log(retention_days=30)['rows_archived'] == 0
+
+    def test_archive_is_idempotent_after_partial_run(self, db):
+        """Test rows already copied to an archive are not duplicated."""
+        db.archive_activity_log(retention_days=30)
+        # Simulate a crash after the archive commit but before the live delete
+        with sqlite3.connect(db.archive_dir / 'activity_log_2025-01.db') as archive:
+            rows = archive.execute("SELECT * FROM activity_log LIMIT 5").fetchall()
+        with db._get_connection() as conn:
+            conn.executemany("INSERT INTO activity_log VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+
+        assert db.archive_activity_log(retention_days=30)['rows_archived'] == 5
+        with sqlite3.connect(db.archive_dir / 'activity_log_2025-01.db') as archive:
+            assert archive.execute("SELECT COUNT(*) FROM activity_log").fetchone()[0] == 20
+
+    def test_query_spans_live_and_archives(self, db):
+        """Test query_activity merges partitions newest first."""
+        before = db.query_activity(limit=1000)
+        db.archive_activity_log(retention_days=30)
+        after = db.query_activity(limit=1000)
+
+        assert [e['id'] for e in after] == [e['id'] for e in before]
+        assert after[0]['action'] == 'today'
+        assert after[-1]['timestamp'] == '2025-01-01 12:00:00'
+
+    def test_query_filters_and_limit(self, db):
+        """Test range, component and limit filters across archives."""
+        db.archive_activity_log(retention_days=30)
+
+        march = db.query_activity(start='2025-03-01', end='2025-04-01', component='gmail')
+        assert len(march) == 10
+        assert all(e['timestamp'].startswith('2025-03') for e in march)
+
+        latest = db.query_activity(limit=3)
+        assert [e['action'] for e in latest] == ['today', '12/20', '12/19']
+
+    def test_incremental_vacuum_releases_pages(self, db):
+        """Test archiving then vacuuming shrinks the free list."""
+        db.archive_activity_log(retention_days=30)
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+
+        assert db.incremental_vacuum() > 0
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_run_maintenance_metrics(self, db):
+        """Test the maintenance job reports size and time metrics."""
+        metrics = db.run_maintenance(retention_days=30)
+
+        assert metrics['rows_archived'] == 240
+        assert metrics['pages_freed'] > 0
+        assert metrics['size_after'] < metrics['size_before']
+        assert metrics['duration_ms'] >= 0
+        assert db.get_recent_activity(1)[0]['component'] == 'db-maintenance'
+
+    def test_run_maintenance_converts_legacy_database(self):
+        """Test databases created without auto_vacuum are converted once."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE legacy (id INTEGER)")
+        db = DatabaseManager(db_path)
+
+        assert db.run_maintenance()['vacuum_converted'] is True
+        assert db.run_maintenance()['vacuum_converted'] is False
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        db.close()
+        os.unlink(db_path)
+
+    def test_maintenance_with_db_error(self, db):
+        """Test retention methods degrade on database errors."""
+        with patch.object(db, '_get_connection') as mock_conn:
+            mock_context = MagicMock()
+            mock_context.__enter__ = MagicMock(side_effect=sqlite3.Error("Test error"))
+            mock_conn.return_value = mock_context
+
+            assert db.archive_activity_log() == {}
+            assert db.query_activity() == []
+            assert db.incremental_vacuum() == 0
+            assert db.run_maintenance() == {}
+
+
+class TestTransactions:
+    """Test unit-of-work transactions spanning several operations."""
+
+    @pytest.fixture
+    def db(self):
+        """Database with one item awaiting approval."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path, entity_cache=True)
+        db.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email'})
+        db.create_approval({'id': 'approval-1', 'item_id': 'item-1'})
+        yield db
+        db.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.unlink(db_path + suffix)
+
+    def test_single_commit(self, db):
+        """Test the operations in a block share one connection and one commit."""
+        statements = []
+        with db._get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+
+        with db.transaction() as tx:
+            tx.update_approval('approval-1', {'decision': 'approved'})
+            tx.update_item('item-1', {'status': 'approved'})
+            tx.log_activity({'component': 'test', 'action': 'approved'})
+
+        with db._get_connection() as conn:
+            conn.set_trace_callback(None)
+
+        assert statements[0] == 'BEGIN IMMEDIATE'
+        assert statements.count('COMMIT') == 1
+        assert statements[-1] == 'COMMIT'
+        assert db.get_item('item-1')['status'] == 'approved'
+        assert db.get_approval('approval-1')['decision'] == 'approved'
+
+    def test_exception_rolls_back_everything(self, db):
+        """Test a failure halfway through leaves no partial writes."""
+        with pytest.raises(RuntimeError):
+            with db.transaction() as tx:
+                tx.update_approval('approval-1', {'decision': 'approved'})
+                tx.log_activity({'component': 'test', 'action': 'approved'})
+                raise RuntimeError('item update failed')
+
+        assert db.get_approval('approval-1')['decision'] is None
+        assert db.get_recent_activity(5) == []
+
+    def test_nested_block_joins_outer(self, db):
+        """Test an inner block commits only with the outer one."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                with db.transaction() as inner:
+                    inner.update_item('item-1', {'status': 'done'})
+                raise RuntimeError('outer failed')
+
+        assert db.get_item('item-1')['status'] == 'pending'
+
+    def test_cache_not_left_with_rolled_back_rows(self, db):
+        """Test rows read inside a rolled-back block are not served from cache."""
+        assert db.get_item('item-1')['status'] == 'pending'
+        with pytest.raises(RuntimeError):
+            with db.transaction() as tx:
+                tx.update_item('item-1', {'status': 'done'})
+                assert tx.get_item('item-1')['status'] == 'done'
+                raise RuntimeError('abort')
+
+        assert db.get_item('item-1')['status'] == 'pending'
+
+    def test_async_activity_joins_transaction(self):
+        """Test queued-mode log_activity writes with the transaction instead."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path, async_activity_log=True)
+        try:
+            with pytest.raises(RuntimeError):
+                with db.transaction() as tx:
+                    tx.log_activity({'component': 'test', 'action': 'rolled back'})
+                    raise RuntimeError('abort')
+            with db.transaction() as tx:
+                tx.log_activity({'component': 'test', 'action': 'kept'})
+
+            assert [e['action'] for e in db.get_recent_activity(5)] == ['kept']
+        finally:
+            db.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(db_path + suffix):
+                    os.unlink(db_path + suffix)
+
+
+class TestJsonColumns:
+    """Test generated columns over items.metadata and workflows.state_data."""
+
+    @pytest.fixture
+    def db(self):
+        """Database with items carrying JSON metadata."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+            db_path = tmp.name
+        db = DatabaseManager(db_path)
+        db.create_items_many([
+            {'id': 'email-1', 'source': 'gmail', 'type': 'email', 'created_at': '2026-02-01 09:00:00',
+             'metadata': json.dumps({'sender': 'billing@acme.com', 'vendor': 'Acme'})},
+            {'id': 'email-2', 'source': 'gmail', 'type': 'email', 'created_at': '2026-02-02 09:00:00',
+             'metadata': json.dumps({'sender': 'billing@acme.com', 'vendor': 'Acme'})},
+            {'id': 'chat-1', 'source': 'whatsapp', 'type': 'message', 'created_at': '2026-02-03 09:00:00',
+             'metadata': json.dumps({'sender': 'Ana', 'chat_type': 'group'})},
+            {'id': 'file-1', 'source': 'filesystem', 'type': 'file', 'metadata': 'not json'},
+            {'id': 'file-2', 'source': 'filesystem', 'type': 'file'},
+        ])
+        yield db
+        db.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.unlink(db_path + suffix)
+
+    def test_lookup_by_sender_vendor_and_chat_type(self, db):
+        """Test helpers filter on JSON fields, newest first."""
+        assert [i['id'] for i in db.get_items_by_sender('billing@acme.com')] == ['email-2', 'email-1']
+        assert [i['id'] for i in db.get_items_by_vendor('Acme', limit=1)] == ['email-2']
+        assert [i['id'] for i in db.get_items_by_chat_type('group')] == ['chat-1']
+        assert db.get_items_by_vendor('Nobody') == []
+
+    def test_sender_pages(self, db):
+        """Test sender lookups page with a (created_at, id) cursor."""
+        first = db.get_items_by_sender('billing@acme.com', limit=1)
+        after = (first[0]['created_at'], first[0]['id'])
+        assert [i['id'] for i in db.get_items_by_sender('billing@acme.com', 1, after)] == ['email-1']
+
+    def test_columns_follow_metadata_updates(self, db):
+        """Test the generated columns track later metadata changes."""
+        db.update_item('file-2', {'metadata': json.dumps({'vendor': 'Globex'})})
+        assert [i['id'] for i in db.get_items_by_vendor('Globex')] == ['file-2']
+
+    def test_invalid_json_is_accepted(self, db):
+        """Test non-JSON metadata stores fine and simply has no derived values."""
+        assert db.get_item('file-1')['metadata'] == 'not json'
+
+    def test_lookups_use_indexes(self, db):
+        """Test the JSON lookups are index searches, not table scans."""
+        with db._get_connection() as conn:
+            for column in ('sender', 'vendor', 'chat_type'):
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT id FROM items WHERE {column} = ? "
+                    f"ORDER BY created_at DESC, id DESC", ('x',)).fetchall()
+                assert f'USING INDEX idx_items_{column}' in plan[0][3]
+
+    def test_workflows_by_pause_reason(self, db):
+        """Test workflows are found by state_data.pause_reason."""
+        db.create_workflow({'id': 'wf-1', 'workflow_type': 'invoice',
+                            'state_data': json.dumps({'pause_reason': 'approval_required'})})
+        db.create_workflow({'id': 'wf-2', 'workflow_type': 'invoice', 'state_data': '{}'})
+
+        assert [w['id'] for w in db.get_workflows_by_pause_reason('approval_required')] == ['wf-1']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
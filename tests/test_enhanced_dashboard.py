@@ -4,7 +4,6 @@ import pytest
 import os
 import tempfile
 import shutil
-from datetime import datetime
 from pathlib import Path
 
 from src.skills.enhanced_dashboard import EnhancedDashboard
@@ -19,6 +18,7 @@ class TestDashboardGeneration:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_generate_dashboard(self, dashboard):
@@ -63,6 +63,7 @@ class TestMultiPlatformSummary:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_platform_summary(self, dashboard):
@@ -93,6 +94,7 @@ class TestPendingApprovals:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_pending_approvals(self, dashboard):
@@ -103,21 +105,16 @@ class TestPendingApprovals:
 
     def test_approval_structure(self, dashboard):
         """Test approval item structure."""
-        # Add mock approval
-        dashboard._add_mock_approval({
-            'item_id': 'test-123',
-            'type': 'invoice',
-            'amount': 1500,
-            'priority': 'high',
-            'deadline': '2026-02-20'
-        })
+        db = dashboard._database(create=True)
+        db.create_item({'id': 'test-123', 'source': 'gmail', 'type': 'email',
+                        'category': 'invoice', 'amount': 1500, 'priority': 'high'})
+        db.create_approval({'id': 'approval-123', 'item_id': 'test-123',
+                            'deadline': '2026-02-20'})
 
         approvals = dashboard.get_pending_approvals()
-        if approvals:
-            approval = approvals[0]
-            assert 'item_id' in approval
-            assert 'type' in approval
-            assert 'amount' in approval or 'priority' in approval
+        assert approvals == [{'approval_id': 'approval-123', 'item_id': 'test-123',
+                              'type': 'invoice', 'amount': 1500, 'priority': 'high',
+                              'deadline': '2026-02-20'}]
 
 
 class TestActivePlans:
@@ -129,6 +126,7 @@ class TestActivePlans:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_active_plans(self, dashboard):
@@ -139,18 +137,14 @@ class TestActivePlans:
 
     def test_plan_progress(self, dashboard):
         """Test plan progress calculation."""
-        # Add mock plan
-        dashboard._add_mock_plan({
-            'plan_id': 'plan-123',
-            'title': 'Test Plan',
-            'total_steps': 10,
-            'completed_steps': 5
-        })
+        db = dashboard._database(create=True)
+        db.create_plan({'id': 'plan-123', 'title': 'Test Plan', 'status': 'active',
+                        'steps_total': 10, 'steps_completed': 5})
+        db.create_plan({'id': 'plan-456', 'title': 'Draft Plan'})
 
         plans = dashboard.get_active_plans()
-        if plans:
-            plan = plans[0]
-            assert 'progress' in plan or 'completed_steps' in plan
+        assert [plan['plan_id'] for plan in plans] == ['plan-123']
+        assert plans[0]['progress'] == 50
 
 
 class TestWorkflowStatus:
@@ -162,6 +156,7 @@ class TestWorkflowStatus:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_workflow_status(self, dashboard):
@@ -172,18 +167,15 @@ class TestWorkflowStatus:
 
     def test_workflow_structure(self, dashboard):
         """Test workflow item structure."""
-        # Add mock workflow
-        dashboard._add_mock_workflow({
-            'workflow_id': 'wf-123',
-            'type': 'invoice_processing',
-            'state': 'running',
-            'current_step': 2
-        })
+        db = dashboard._database(create=True)
+        db.create_workflow({'id': 'wf-123', 'workflow_type': 'invoice_processing',
+                            'current_step': 2})
+        db.create_workflow({'id': 'wf-456', 'workflow_type': 'research', 'status': 'completed'})
 
         workflows = dashboard.get_workflow_status()
-        if workflows:
-            workflow = workflows[0]
-            assert 'workflow_id' in workflow or 'type' in workflow
+        assert [workflow['workflow_id'] for workflow in workflows] == ['wf-123']
+        assert workflows[0]['state'] == 'running'
+        assert workflows[0]['current_step'] == 2
 
 
 class TestFinancialTracking:
@@ -195,6 +187,7 @@ class TestFinancialTracking:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_financial_summary(self, dashboard):
@@ -222,6 +215,7 @@ class TestRecentActivity:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_recent_activity(self, dashboard):
@@ -232,15 +226,15 @@ class TestRecentActivity:
 
     def test_activity_limit(self, dashboard):
         """Test activity limited to 10 items."""
-        # Add 15 mock activities
-        for i in range(15):
-            dashboard._add_mock_activity({
-                'timestamp': datetime.now().isoformat(),
-                'action': f'Test action {i}'
-            })
+        dashboard._database(create=True).log_activity_many([
+            {'timestamp': f'2026-02-18 10:{i:02d}:00', 'component': 'Test',
+             'action': f'Test action {i}'}
+            for i in range(15)
+        ])
 
         activity = dashboard.get_recent_activity()
-        assert len(activity) <= 10
+        assert len(activity) == 10
+        assert activity[0]['action'] == '[Test] Test action 14'
 
 
 class TestSystemStatus:
@@ -252,6 +246,7 @@ class TestSystemStatus:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_get_system_status(self, dashboard):
@@ -266,6 +261,32 @@ class TestSystemStatus:
 
         assert 'watchers' in status or 'email_watcher' in status
 
+    def test_last_backup_not_invented(self, dashboard):
+        """Test no backup time is reported without a database."""
+        assert dashboard.get_system_status()['last_backup'] == 'N/A'
+
+    def test_last_backup_from_database(self):
+        """Test the last backup time and duration come from recorded runs."""
+        from src.database.db_manager import DatabaseManager
+
+        vault_dir = tempfile.mkdtemp()
+        db = DatabaseManager(os.path.join(vault_dir, 'ai_employee.db'))
+        try:
+            dashboard = EnhancedDashboard(vault_dir, db_manager=db)
+            assert dashboard.get_system_status()['last_backup'] == 'never'
+
+            result = db.backup()
+            status = dashboard.get_system_status()
+            assert status['last_backup'] == f"{result['finished_at']} UTC"
+            assert status['last_backup_duration_ms'] == result['duration_ms']
+
+            dashboard.generate_dashboard()
+            content = (Path(vault_dir) / 'Dashboard.md').read_text(encoding='utf-8')
+            assert f"**Last Backup:** {result['finished_at']} UTC" in content
+        finally:
+            db.close()
+            shutil.rmtree(vault_dir)
+
 
 class TestRealTimeUpdates:
     """Test real-time update functionality."""
@@ -276,6 +297,7 @@ class TestRealTimeUpdates:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_update_on_event(self, dashboard):
@@ -306,6 +328,7 @@ class TestDashboardFormatting:
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_markdown_table_format(self, dashboard):
@@ -337,41 +360,30 @@ class TestDashboardWithData:
 
     @pytest.fixture
     def dashboard(self):
-        """Create enhanced dashboard with mock data."""
+        """Create enhanced dashboard over a populated vault database."""
         vault_dir = tempfile.mkdtemp()
         dashboard = EnhancedDashboard(vault_dir)
+        db = dashboard._database(create=True)
+
+        db.create_item({'id': 'INV-001', 'source': 'gmail', 'type': 'email',
+                        'category': 'invoice', 'amount': 2500, 'priority': 'high'})
+        db.create_approval({'id': 'APR-001', 'item_id': 'INV-001', 'deadline': '2026-02-20'})
+
+        db.create_plan({'id': 'PLAN-001', 'title': 'Q1 Marketing Campaign', 'status': 'active',
+                        'steps_total': 10, 'steps_completed': 7,
+                        'started_at': '2026-02-01 09:00:00'})
 
-        # Add mock data
-        dashboard._add_mock_approval({
-            'item_id': 'INV-001',
-            'type': 'invoice',
-            'amount': 2500,
-            'priority': 'high',
-            'deadline': '2026-02-20'
-        })
-
-        dashboard._add_mock_plan({
-            'plan_id': 'PLAN-001',
-            'title': 'Q1 Marketing Campaign',
-            'total_steps': 10,
-            'completed_steps': 7,
-            'status': 'active'
-        })
-
-        dashboard._add_mock_workflow({
-            'workflow_id': 'WF-001',
-            'type': 'invoice_processing',
-            'state': 'running',
-            'current_step': 3
-        })
-
-        for i in range(5):
-            dashboard._add_mock_activity({
-                'timestamp': '2026-02-18 10:00:00',
-                'action': f'Processed item {i}'
-            })
+        db.create_workflow({'id': 'WF-001', 'workflow_type': 'invoice_processing',
+                            'item_id': 'INV-001', 'current_step': 3})
+
+        db.log_activity_many([
+            {'timestamp': '2026-02-18 10:00:00', 'component': 'Test',
+             'action': f'Processed item {i}'}
+            for i in range(5)
+        ])
 
         yield dashboard
+        dashboard.close()
         shutil.rmtree(vault_dir)
 
     def test_dashboard_with_approvals(self, dashboard):
@@ -421,12 +433,9 @@ class TestDashboardWithData:
 
     def test_plan_with_progress_percentage(self, dashboard):
         """Test plan with progress field."""
-        dashboard._add_mock_plan({
-            'plan_id': 'PLAN-002',
-            'title': 'Test Plan',
-            'progress': 85,
-            'status': 'active'
-        })
+        dashboard.db.create_plan({'id': 'PLAN-002', 'title': 'Test Plan', 'status': 'active',
+                                  'steps_total': 20, 'steps_completed': 17,
+                                  'started_at': '2026-02-10 09:00:00'})
 
         result = dashboard.generate_dashboard()
         filepath = result['filepath']
@@ -437,6 +446,97 @@ class TestDashboardWithData:
         assert '85%' in content
 
 
+class TestDatabaseSnapshot:
+    """Test the dashboard reads the vault database in one snapshot."""
+
+    @pytest.fixture
+    def vault_dir(self):
+        """Create temporary vault."""
+        vault_dir = tempfile.mkdtemp()
+        yield vault_dir
+        shutil.rmtree(vault_dir)
+
+    def test_reading_does_not_create_database(self, vault_dir):
+        """Test rendering an empty vault reports no database and creates none."""
+        dashboard = EnhancedDashboard(vault_dir)
+        assert dashboard.generate_dashboard()['success'] is True
+
+        assert dashboard.get_system_status()['database'] == 'not created'
+        assert not (Path(vault_dir) / 'Database').exists()
+
+    def test_counts_and_financials_from_database(self, vault_dir):
+        """Test platform counts and financial figures come from the vault database."""
+        dashboard = EnhancedDashboard(vault_dir, monthly_budget=1000)
+        db = dashboard._database(create=True)
+        db.create_items_many([
+            {'id': f'mail-{i}', 'source': 'gmail', 'type': 'email'} for i in range(3)
+        ] + [{'id': 'file-1', 'source': 'filesystem', 'type': 'file'}])
+        db.create_financial_records_many([
+            {'id': 'inv-1', 'record_type': 'invoice', 'amount': 1500.0},
+            {'id': 'exp-1', 'record_type': 'expense', 'amount': 250.0, 'category': 'Meals'},
+        ])
+
+        snapshot = dashboard.get_snapshot()
+        dashboard.close()
+
+        assert snapshot['platforms'] == {'email': 3, 'whatsapp': 0, 'linkedin': 0, 'files': 1}
+        assert snapshot['financial']['pending_invoices'] == 1
+        assert snapshot['financial']['total_expenses'] == 250.0
+        assert snapshot['financial']['budget_status'] == {
+            'total_budget': 1000, 'spent': 250.0, 'remaining': 750.0, 'percentage': 25}
+        assert snapshot['database'] == 'connected'
+
+    def test_update_on_event_records_activity(self, vault_dir):
+        """Test events are logged to the database and shown after regeneration."""
+        dashboard = EnhancedDashboard(vault_dir)
+        result = dashboard.update_on_event('new_item', {'source': 'email'})
+        dashboard.close()
+
+        content = Path(result['filepath']).read_text(encoding='utf-8')
+        assert '[Dashboard] new_item: email' in content
+
+    def test_snapshot_at_scale(self, vault_dir):
+        """Test a snapshot over many rows counts every item and keeps lists short.
+
+        Latency is measured by scripts/benchmark_database.py dashboard.
+        """
+        from src.database.db_manager import DatabaseManager
+
+        db = DatabaseManager(os.path.join(vault_dir, 'Database', 'ai_employee.db'))
+        sources = ['gmail', 'filesystem', 'whatsapp', 'linkedin']
+        db.create_items_many([
+            {'id': f'item-{i}', 'source': sources[i % 4], 'type': 'email',
+             'status': 'pending' if i % 3 else 'done', 'amount': float(i % 500),
+             'created_at': f'2026-02-{1 + i % 28:02d} 10:00:00'}
+            for i in range(10_000)
+        ])
+        with db.transaction() as tx:
+            for i in range(1_000):
+                tx.create_approval({'id': f'approval-{i}', 'item_id': f'item-{i}',
+                                    'deadline': f'2026-03-{1 + i % 28:02d} 00:00:00',
+                                    'decision': 'approved' if i % 2 else None})
+        db.create_financial_records_many([
+            {'id': f'fin-{i}', 'record_type': ('invoice', 'expense')[i % 2],
+             'amount': float(i % 900), 'payment_status': 'paid' if i % 4 == 0 else 'pending'}
+            for i in range(2_000)
+        ])
+        db.log_activity_many([
+            {'timestamp': f'2026-02-{1 + i % 28:02d} {i % 24:02d}:00:00',
+             'component': 'Bench', 'action': f'event {i}'}
+            for i in range(2_000)
+        ])
+        for i in range(100):
+            db.create_plan({'id': f'plan-{i}', 'title': f'Plan {i}',
+                            'status': 'active' if i % 2 else 'completed', 'steps_total': 10})
+        db.create_workflow({'id': 'wf-1', 'workflow_type': 'invoice'})
+
+        snapshot = EnhancedDashboard(vault_dir, db_manager=db).get_snapshot()
+        db.close()
+
+        assert sum(snapshot['platforms'].values()) == 10_000
+        assert len(snapshot['approvals']) == 5
+
+
 class TestErrorHandling:
     """Test error handling."""
 
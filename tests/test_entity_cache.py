@@ -0,0 +1,143 @@
+"""Tests for the read-through entity cache."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.database.entity_cache import EntityCache
+
+
+@pytest.fixture
+def db():
+    """Database with the entity cache enabled."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        db_path = tmp.name
+    db = DatabaseManager(db_path, entity_cache=True)
+    db.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email'})
+    db.create_approval({'id': 'approval-1', 'item_id': 'item-1'})
+    db.create_linkedin_post({'id': 'post-1', 'content': 'Hello'})
+    yield db
+    db.close()
+    os.unlink(db_path)
+
+
+def test_repeated_get_is_a_hit(db):
+    """Test the second lookup of an ID is served from the cache."""
+    db.get_item('item-1')
+    db.get_item('item-1')
+    db.get_linkedin_post('post-1')
+    db.get_linkedin_post('post-1')
+
+    assert db.entity_cache.stats['misses'] == 2
+    assert db.entity_cache.stats['hits'] == 2
+    assert db.entity_cache.hit_rate == 0.5
+
+
+def test_update_invalidates(db):
+    """Test update_* drops the cached row so the next read is fresh."""
+    assert db.get_item('item-1')['status'] == 'pending'
+    db.update_item('item-1', {'status': 'done'})
+    assert db.get_item('item-1')['status'] == 'done'
+
+    assert db.get_approval('approval-1')['decision'] is None
+    db.update_approval('approval-1', {'decision': 'approved'})
+    assert db.get_approval('approval-1')['decision'] == 'approved'
+
+    assert db.get_linkedin_post('post-1')['status'] == 'pending'
+    db.update_linkedin_post('post-1', {'status': 'posted'})
+    assert db.get_linkedin_post('post-1')['status'] == 'posted'
+
+
+def test_delete_and_upsert_invalidate(db):
+    """Test delete_item and upsert_items drop cached rows."""
+    db.get_item('item-1')
+    db.upsert_items([{'id': 'item-1', 'source': 'gmail', 'type': 'email', 'status': 'archived'}])
+    assert db.get_item('item-1')['status'] == 'archived'
+
+    db.delete_item('item-1')
+    assert db.get_item('item-1') is None
+
+
+def test_missing_rows_are_not_cached(db):
+    """Test a miss for an absent ID does not hide a later insert."""
+    assert db.get_item('item-2') is None
+    db.create_item({'id': 'item-2', 'source': 'gmail', 'type': 'email'})
+    assert db.get_item('item-2') is not None
+
+
+def test_cached_rows_are_copies(db):
+    """Test mutating a returned dict does not change the cached row."""
+    item = db.get_item('item-1')
+    item['status'] = 'mutated'
+    assert db.get_item('item-1')['status'] == 'pending'
+
+
+def test_disabled_by_default():
+    """Test managers without entity_cache never cache."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        db_path = tmp.name
+    db = DatabaseManager(db_path)
+    assert db.entity_cache is None
+    db.close()
+    os.unlink(db_path)
+
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted at max_size."""
+    cache = EntityCache(max_size=2, ttl=None)
+    cache.put('items', 'a', {'id': 'a'}, cache.token())
+    cache.put('items', 'b', {'id': 'b'}, cache.token())
+    cache.get('items', 'a')
+    cache.put('items', 'c', {'id': 'c'}, cache.token())
+
+    assert cache.get('items', 'b') is None
+    assert cache.get('items', 'a') == {'id': 'a'}
+    assert cache.stats['evictions'] == 1
+
+
+def test_ttl_expiry():
+    """Test entries expire after the TTL."""
+    cache = EntityCache(ttl=0.01)
+    cache.put('items', 'a', {'id': 'a'}, cache.token())
+    time.sleep(0.02)
+
+    assert cache.get('items', 'a') is None
+    assert cache.stats['expired'] == 1
+
+
+def test_stale_load_is_not_stored():
+    """Test a row loaded before an invalidation is not cached."""
+    cache = EntityCache()
+    token = cache.token()
+    cache.invalidate('items', 'a')  # concurrent write lands mid-load
+    cache.put('items', 'a', {'id': 'a', 'status': 'old'}, token)
+
+    assert cache.get('items', 'a') is None
+
+
+def test_concurrent_access(db):
+    """Test readers and writers on many threads see consistent rows."""
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(50):
+                db.update_item('item-1', {'priority': f'p{n}-{i}'})
+                assert db.get_item('item-1') is not None
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    with db._get_connection() as conn:
+        stored = conn.execute("SELECT priority FROM items WHERE id = 'item-1'").fetchone()[0]
+    assert db.get_item('item-1')['priority'] == stored
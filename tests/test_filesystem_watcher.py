@@ -195,9 +195,11 @@ def test_vault_file_operations(tmp_path):
 def test_write_log():
     """Logging works"""
     from src.utils.vault_management import write_log
+    from src.utils.vault_logging import flush_logs
     from datetime import datetime
 
     write_log("INFO", "TestComponent", "Test message")
+    flush_logs()
 
     # Check log file was created
     today = datetime.now().strftime('%Y-%m-%d')
@@ -208,3 +210,44 @@ def test_write_log():
     assert "[INFO]" in content
     assert "[TestComponent]" in content
     assert "Test message" in content
+
+
+def test_watcher_stays_active_through_large_drop(tmp_path, monkeypatch):
+    """A drop that takes longer than the stale threshold keeps the watcher Active"""
+    from src.watchers import filesystem_watcher
+    from src.utils.watcher_registry import WatcherRegistry
+
+    watch_dir = tmp_path / 'watch'
+    watch_dir.mkdir()
+    registry = WatcherRegistry(str(tmp_path / 'vault'))
+    monkeypatch.setattr(filesystem_watcher, 'register_watcher',
+                        lambda name, interval: registry.register(name, interval=interval))
+    monkeypatch.setattr(filesystem_watcher, 'organize_file_complete',
+                        lambda path: {'category': {'destination': 'Inbox/'}})
+
+    clock = [time.time()]
+    states = []
+
+    def fake_sleep(seconds):
+        if seconds == 1 and states:
+            # End of the first batch
+            raise KeyboardInterrupt
+        if seconds == 1:
+            # Drop 20 files (40s of write waits) after the watcher has started
+            for i in range(20):
+                (watch_dir / f'scan_{i:02d}.pdf').write_text('scan')
+            return
+        clock[0] += seconds
+        states.append(registry.statuses(now=clock[0])['filesystem']['state'])
+
+    monkeypatch.setattr(filesystem_watcher.time, 'sleep', fake_sleep)
+    monkeypatch.setattr(filesystem_watcher.time, 'time', lambda: clock[0])
+
+    # First loop sees nothing new, the second organizes the drop
+    filesystem_watcher.start_watcher(str(watch_dir))
+
+    status = registry.statuses(now=clock[0])['filesystem']
+    registry.close()
+    assert len(states) == 20
+    assert set(states) == {'Active'}
+    assert status['items_processed'] == 20
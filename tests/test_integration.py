@@ -112,12 +112,14 @@ def test_dashboard_updates_correctly():
 def test_log_generation():
     """Test that logs are generated properly"""
     from src.utils.vault_management import write_log
+    from src.utils.vault_logging import flush_logs
     from datetime import datetime
 
     # Write test log entries
     write_log("INFO", "TestIntegration", "Test info message")
     write_log("WARN", "TestIntegration", "Test warning message")
     write_log("ERROR", "TestIntegration", "Test error message")
+    flush_logs()
 
     # Check log file
     today = datetime.now().strftime('%Y-%m-%d')
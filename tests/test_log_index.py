@@ -0,0 +1,160 @@
+"""Tests for the log offset index and queries."""
+
+import json
+import logging
+import sys
+from datetime import datetime
+
+import pytest
+
+from src.cli import logs_cli
+from src.utils import log_index
+from src.utils.log_index import index_log_file, index_path, parse_log_line, query_logs
+from src.utils.vault_logging import DailyFileHandler
+
+
+def _line(ts, level, component, message):
+    return f"[{ts}] [{level}] [{component}] {message}\n"
+
+
+@pytest.fixture
+def logs(tmp_path):
+    """Log folder with a text day, a JSON-lines day and the WhatsApp error log."""
+    (tmp_path / '2026-03-01.log').write_text(
+        _line('2026-03-01T09:00:00', 'INFO', 'GmailWatcher', 'Checked inbox')
+        + _line('2026-03-01T09:00:30', 'ERROR', 'GmailWatcher', 'Token expired')
+        + 'Traceback (most recent call last):\n  File "gmail.py", line 1\n'
+        + _line('2026-03-01T09:05:00', 'WARN', 'VaultManager', 'Slow write'),
+        encoding='utf-8')
+    (tmp_path / '2026-03-02.jsonl').write_text(
+        json.dumps({'ts': '2026-03-02T08:00:00', 'level': 'ERROR',
+                    'component': 'GmailWatcher', 'message': 'Rate limited'}) + '\n',
+        encoding='utf-8')
+    (tmp_path / 'whatsapp_errors.log').write_text(
+        "[2026-03-01T12:00:00.000Z] ERROR: Session closed\n", encoding='utf-8')
+    return tmp_path
+
+
+def test_parse_formats():
+    """Test each log format parses to (timestamp, level, component, message)."""
+    ts, level, component, message = parse_log_line(
+        '[2026-03-01T09:00:00.5] [WARNING] [Orchestrator] Step [2] failed')
+    assert (ts, level, component, message) == (
+        datetime(2026, 3, 1, 9, 0, 0, 500000), 'WARN', 'Orchestrator', 'Step [2] failed')
+    assert parse_log_line('  File "x.py", line 1') is None
+    assert parse_log_line('[2026-03-01T09:00:00Z] ERROR: boom', 'WhatsAppWatcher')[2:] == (
+        'WhatsAppWatcher', 'boom')
+
+
+def test_query_merges_files_in_time_order(logs):
+    """Test entries from every file and format come back oldest first."""
+    entries = list(query_logs(logs, levels=['ERROR']))
+
+    # The WhatsApp log is in UTC; its entry lands wherever the local offset puts it
+    by_component = {(e['component'], e['message'].splitlines()[0]) for e in entries}
+    assert by_component == {('GmailWatcher', 'Token expired'),
+                            ('WhatsAppWatcher', 'Session closed'),
+                            ('GmailWatcher', 'Rate limited')}
+    timestamps = [e['timestamp'] for e in entries]
+    assert timestamps == sorted(timestamps)
+    # Continuation lines stay with their entry
+    token = next(e for e in entries if e['message'].startswith('Token expired'))
+    assert 'Traceback' in token['message']
+
+
+def test_query_filters(logs):
+    """Test component, level, text and time filters."""
+    assert [e['message'] for e in query_logs(logs, components=['vaultmanager'])] == [
+        'Slow write']
+    assert [e['message'] for e in query_logs(logs, levels=['WARNING'])] == ['Slow write']
+    assert [e['message'] for e in query_logs(logs, contains='RATE')] == ['Rate limited']
+    window = list(query_logs(logs, since='2026-03-01T09:00:10', until='2026-03-01T09:05:00'))
+    assert [e['message'].splitlines()[0] for e in window] == ['Token expired']
+    assert len(list(query_logs(logs, limit=2))) == 2
+
+
+def test_dated_files_outside_range_are_not_opened(logs):
+    """Test a time range skips other days' files entirely."""
+    list(query_logs(logs, since='2026-03-02'))
+
+    assert index_path(logs / '2026-03-02.jsonl', logs).exists()
+    assert not index_path(logs / '2026-03-01.log', logs).exists()
+
+
+def test_query_reads_only_matching_ranges(tmp_path, monkeypatch):
+    """Test a narrow query parses only the lines of the ranges it selected."""
+    with open(tmp_path / '2026-03-01.log', 'w', encoding='utf-8') as f:
+        for minute in range(600):
+            for component in ('GmailWatcher', 'FileOrganizer', 'VaultManager'):
+                f.write(_line(f'2026-03-01T{minute // 60:02d}:{minute % 60:02d}:00',
+                              'INFO', component, f'tick {minute}'))
+    index_log_file(tmp_path / '2026-03-01.log', tmp_path)
+
+    parsed = []
+    original = log_index.parse_log_line
+    monkeypatch.setattr(log_index, 'parse_log_line',
+                        lambda line, default='': parsed.append(line) or original(line, default))
+    entries = list(query_logs(tmp_path, components=['FileOrganizer'],
+                              since='2026-03-01T05:00', until='2026-03-01T05:10'))
+
+    assert [e['message'] for e in entries] == [f'tick {m}' for m in range(300, 310)]
+    assert len(parsed) <= 11
+
+
+def test_index_is_incremental(logs):
+    """Test appended lines are indexed without reparsing the rest of the file."""
+    log_file = logs / '2026-03-01.log'
+    first = index_log_file(log_file, logs)
+    size = first['size']
+
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write(_line('2026-03-01T10:00:00', 'INFO', 'Orchestrator', 'Started'))
+        f.write('[2026-03-01T10:00:01] [INFO] [Orche')   # line still being written
+    second = index_log_file(log_file, logs)
+
+    assert second['ranges'][:len(first['ranges'])] == first['ranges']
+    assert second['ranges'][-1][3] == size
+    assert second['size'] == log_file.stat().st_size - len('[2026-03-01T10:00:01] [INFO] [Orche')
+    assert [e['message'] for e in query_logs(logs, components=['Orchestrator'])] == ['Started']
+
+
+def test_replaced_file_is_reindexed(logs):
+    """Test a file rewritten in place is not read through a stale index."""
+    log_file = logs / '2026-03-01.log'
+    index_log_file(log_file, logs)
+    log_file.write_text(_line('2026-03-01T11:00:00', 'ERROR', 'Replaced', 'New content')
+                        + _line('2026-03-01T11:00:01', 'INFO', 'Replaced', 'More content')
+                        + _line('2026-03-01T11:00:02', 'INFO', 'Replaced', 'Even more'),
+                        encoding='utf-8')
+
+    assert [e['message'] for e in query_logs(logs, components=['Replaced'])] == [
+        'New content', 'More content', 'Even more']
+
+
+def test_rotation_writes_index(tmp_path):
+    """Test the daily handler indexes a day's file when it moves to the next day."""
+    handler = DailyFileHandler(tmp_path)
+    for created in (datetime(2026, 3, 1, 23, 59).timestamp(),
+                    datetime(2026, 3, 2, 0, 1).timestamp()):
+        record = logging.LogRecord('ai_employee.Test', logging.INFO, __file__, 0,
+                                   'tick', None, None)
+        record.created = created
+        handler.emit(record)
+
+    sidecar = index_path(tmp_path / '2026-03-01.log', tmp_path)
+    assert sidecar.exists()
+    assert json.loads(sidecar.read_text())['ranges'][0][0] == '2026-03-01T23:59'
+    handler.close()
+
+
+def test_cli_query(logs, monkeypatch, capsys):
+    """Test the logs query command prints matching entries."""
+    monkeypatch.setattr(sys, 'argv', ['logs_cli', '--logs', str(logs), 'query',
+                                      '--component', 'GmailWatcher', '--level', 'ERROR',
+                                      '--json'])
+    assert logs_cli.main() == 0
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line['message'] for line in lines] == [
+        'Token expired\nTraceback (most recent call last):\n  File "gmail.py", line 1',
+        'Rate limited']
@@ -0,0 +1,203 @@
+"""Tests for PRAGMA user_version schema migrations."""
+
+import os
+import sqlite3
+import tempfile
+import threading
+
+import pytest
+
+from src.database import migrations
+from src.database.db_manager import DatabaseManager
+
+
+class TracedDatabaseManager(DatabaseManager):
+    """DatabaseManager that records every statement its connections run."""
+
+    statements = []
+
+    def _connect(self):
+        conn = super()._connect()
+        conn.set_trace_callback(self.statements.append)
+        return conn
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        path = tmp.name
+    os.unlink(path)
+    yield path
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+def _ddl(statements):
+    return [s for s in statements
+            if s.lstrip().upper().startswith(('CREATE', 'DROP', 'ALTER'))]
+
+
+def test_new_database_is_current(db_path):
+    """Test a fresh database is stamped with the latest schema version."""
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    assert 'financial_rollups' in db.get_tables()
+    db.close()
+
+
+def test_current_database_skips_ddl(db_path):
+    """Test reopening a current database runs no DDL."""
+    DatabaseManager(db_path).close()
+
+    TracedDatabaseManager.statements.clear()
+    db = TracedDatabaseManager(db_path)
+    assert _ddl(TracedDatabaseManager.statements) == []
+    assert 'PRAGMA user_version' in TracedDatabaseManager.statements
+    db.close()
+
+
+def test_unversioned_database_is_upgraded(db_path):
+    """Test a database created before versioning is migrated in place."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE items (
+            id TEXT PRIMARY KEY, source TEXT NOT NULL, type TEXT NOT NULL,
+            category TEXT, priority TEXT DEFAULT 'normal', amount REAL,
+            status TEXT DEFAULT 'pending', file_path TEXT, metadata TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, processed_at TIMESTAMP
+        );
+        CREATE INDEX idx_items_status ON items(status);
+        INSERT INTO items (id, source, type) VALUES ('legacy-1', 'gmail', 'email');
+    """)
+    conn.close()
+
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    assert db.get_item('legacy-1')['source'] == 'gmail'
+    with db._get_connection() as conn:
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert 'idx_items_status' not in indexes
+    assert 'idx_items_status_created' in indexes
+    db.close()
+
+
+def test_pending_migrations_applied_once(db_path, monkeypatch):
+    """Test a newly appended migration runs once and bumps the version."""
+    DatabaseManager(db_path).close()
+
+    calls = []
+
+    def add_column(conn):
+        calls.append(1)
+        conn.execute("ALTER TABLE items ADD COLUMN tags TEXT")
+
+    next_version = migrations.SCHEMA_VERSION + 1
+    monkeypatch.setattr(migrations, 'MIGRATIONS',
+                        migrations.MIGRATIONS + [(next_version, 'add tags', add_column)])
+    monkeypatch.setattr(migrations, 'SCHEMA_VERSION', next_version)
+
+    db = DatabaseManager(db_path)
+    db.close()
+    db = DatabaseManager(db_path)
+
+    assert calls == [1]
+    assert db.get_schema_version() == next_version
+    db.close()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+    finally:
+        conn.close()
+    assert 'tags' in columns
+
+
+def test_failed_migration_rolls_back(db_path, monkeypatch):
+    """Test a failing migration leaves schema and version untouched."""
+    DatabaseManager(db_path).close()
+
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (id INTEGER)")
+        conn.execute("ALTER TABLE no_such_table ADD COLUMN x TEXT")
+
+    next_version = migrations.SCHEMA_VERSION + 1
+    monkeypatch.setattr(migrations, 'MIGRATIONS',
+                        migrations.MIGRATIONS + [(next_version, 'broken', broken)])
+    monkeypatch.setattr(migrations, 'SCHEMA_VERSION', next_version)
+
+    with pytest.raises(sqlite3.Error):
+        DatabaseManager(db_path)
+
+    monkeypatch.undo()
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    assert 'half_done' not in db.get_tables()
+    db.close()
+
+
+def test_newer_database_left_untouched(db_path):
+    """Test a database from a newer release is opened without changes."""
+    DatabaseManager(db_path).close()
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA user_version = {migrations.SCHEMA_VERSION + 5}")
+    conn.close()
+
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION + 5
+    db.close()
+
+
+def test_concurrent_first_open(db_path):
+    """Test several processes-worth of managers racing to create the schema."""
+    errors = []
+
+    def open_db():
+        try:
+            DatabaseManager(db_path).close()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=open_db) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    db.close()
+
+
+def test_search_index_backfilled_on_upgrade(db_path, monkeypatch):
+    """Test items written at version 1 are searchable after upgrading."""
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS[:1])
+    monkeypatch.setattr(migrations, 'SCHEMA_VERSION', 1)
+    db = DatabaseManager(db_path)
+    db.create_item({'id': 'old-1', 'source': 'gmail', 'type': 'email', 'category': 'receipt'})
+    db.close()
+
+    monkeypatch.undo()
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    assert [hit['ref'] for hit in db.search('receipt')] == ['old-1']
+    db.close()
+
+
+def test_json_columns_cover_existing_rows(db_path, monkeypatch):
+    """Test rows written before version 3 are found through the new columns."""
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS[:2])
+    monkeypatch.setattr(migrations, 'SCHEMA_VERSION', 2)
+    db = DatabaseManager(db_path)
+    db.create_item({'id': 'old-1', 'source': 'gmail', 'type': 'email',
+                    'metadata': '{"sender": "ana@example.com"}'})
+    db.close()
+
+    monkeypatch.undo()
+    db = DatabaseManager(db_path)
+    assert db.get_schema_version() == migrations.SCHEMA_VERSION
+    assert [item['id'] for item in db.get_items_by_sender('ana@example.com')] == ['old-1']
+    db.close()
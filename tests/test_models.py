@@ -0,0 +1,127 @@
+"""Tests for the typed row models and the statement cache."""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.database import db_manager
+from src.database.db_manager import DatabaseManager
+from src.database.models import (MODELS, Approval, FinancialRecord, Item, LinkedInPost,
+                                 Plan, Workflow)
+
+
+@pytest.fixture
+def db():
+    """Fresh database."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        db_path = tmp.name
+    db = DatabaseManager(db_path)
+    yield db
+    db.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.unlink(db_path + suffix)
+
+
+def test_model_fields_match_schema(db):
+    """Test every model lists its table's columns in schema order."""
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        for table, model in MODELS.items():
+            columns = tuple(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+            assert model.COLUMNS == columns, table
+    finally:
+        conn.close()
+
+
+def test_model_is_slotted_mapping():
+    """Test models have no per-instance dict and behave like read-only row dicts."""
+    item = Item(id='item-1', source='gmail', status='pending')
+
+    assert not hasattr(item, '__dict__')
+    with pytest.raises(AttributeError):
+        item.unknown = 1
+
+    assert item['source'] == 'gmail'
+    assert item.get('missing', 'default') == 'default'
+    assert 'status' in item and 'missing' not in item
+    assert dict(item) == item.to_dict()
+    assert item == dict(item)
+    assert item.to_dict(skip_none=True) == {'id': 'item-1', 'source': 'gmail', 'status': 'pending'}
+
+    with pytest.raises(KeyError):
+        item['missing']
+    item['status'] = 'done'
+    assert item.status == 'done'
+
+
+def test_reads_return_models(db):
+    """Test get and list methods decode rows into the table's model."""
+    db.create_item(Item(id='item-1', source='gmail', type='email', amount=12.5))
+    db.create_approval({'id': 'approval-1', 'item_id': 'item-1'})
+    db.create_plan({'id': 'plan-1', 'title': 'Plan', 'status': 'active'})
+    db.create_workflow({'id': 'wf-1', 'workflow_type': 'invoice'})
+    db.create_financial_record({'id': 'fin-1', 'record_type': 'invoice', 'amount': 5.0})
+    db.create_linkedin_post({'id': 'post-1', 'content': 'Hello'})
+
+    item = db.get_item('item-1')
+    assert isinstance(item, Item)
+    assert item.amount == 12.5
+    assert item.status == 'pending'  # schema default applied for the unset field
+    assert isinstance(db.get_approval('approval-1'), Approval)
+    assert isinstance(db.get_plan('plan-1'), Plan)
+    assert isinstance(db.get_workflow('wf-1'), Workflow)
+    assert isinstance(db.get_financial_record('fin-1'), FinancialRecord)
+    assert isinstance(db.get_linkedin_post('post-1'), LinkedInPost)
+
+    assert all(isinstance(row, Item) for row in db.get_items_by_source('gmail'))
+    assert all(isinstance(row, Item) for row in db.get_items_by_status_page('pending', 10))
+    assert all(isinstance(row, Plan) for row in db.get_active_plans())
+    assert all(isinstance(row, FinancialRecord) for row in db.get_pending_invoices())
+    assert all(isinstance(row, LinkedInPost)
+               for row in db.get_linkedin_posts_by_status_page('pending', 10))
+
+
+def test_unknown_columns_rejected_before_sql(db):
+    """Test writes naming a column outside the table fail without running SQL."""
+    db.create_item({'id': 'item-1', 'source': 'gmail', 'type': 'email'})
+
+    assert not db.create_item({'id': 'item-2', 'source': 'gmail', 'type': 'email',
+                               'status = status; --': 'x'})
+    assert not db.update_item('item-1', {'bogus': 1})
+    assert not db.update_approval('approval-1', {})
+    assert not db.update_linkedin_post('post-1', {'content) VALUES (1': 'x'})
+    assert db.get_item('item-2') is None
+
+    results = db.create_items_many([
+        {'id': 'bulk-1', 'source': 'gmail', 'type': 'email'},
+        {'id': 'bulk-2', 'source': 'gmail', 'type': 'email', 'bogus': 1},
+    ])
+    assert results == [True, False]
+
+
+def test_statement_text_is_cached(db):
+    """Test one statement string is built per table and column set."""
+    db_manager._build_insert_sql.cache_clear()
+    db_manager._build_update_sql.cache_clear()
+
+    for i in range(5):
+        db.create_item({'id': f'item-{i}', 'source': 'gmail', 'type': 'email'})
+        db.update_item(f'item-{i}', {'status': 'done'})
+
+    assert db_manager._build_insert_sql.cache_info().misses == 1
+    assert db_manager._build_insert_sql.cache_info().hits == 4
+    assert db_manager._build_update_sql.cache_info().misses == 1
+    assert db_manager._build_update_sql.cache_info().hits == 4
+
+
+def test_update_linkedin_post_leaves_caller_dict(db):
+    """Test the updated_at stamp is not written into the caller's dict."""
+    db.create_linkedin_post({'id': 'post-1', 'content': 'Hello'})
+    updates = {'status': 'posted'}
+
+    assert db.update_linkedin_post('post-1', updates)
+    assert updates == {'status': 'posted'}
+    assert db.get_linkedin_post('post-1').updated_at is not None
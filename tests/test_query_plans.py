@@ -0,0 +1,215 @@
+"""Query-plan regression tests for DatabaseManager.
+
+Every public DatabaseManager method is exercised with SQL tracing enabled,
+then each traced statement is run through EXPLAIN QUERY PLAN. A statement
+that falls back to a full table scan or a temporary sort fails the test.
+"""
+
+import inspect
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+
+
+# Statement kinds whose plan is checked
+PLANNED = ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+
+# Tables that may legitimately be scanned
+SCAN_EXEMPT_TABLES = {'sqlite_master', 'sqlite_schema'}
+
+# Statements FTS5 issues against its own shadow tables
+FTS_INTERNAL = re.compile(r"'main'\.'\w+_(config|data|idx|docsize|content)'")
+
+# Maintenance methods that read a whole table by design
+FULL_SCAN_ALLOWED = {
+    'index_vault': {'vault_documents'},
+    # One row per (source, status), whatever the number of items
+    'get_dashboard_snapshot': {'item_rollups'},
+}
+
+# Methods that run no query of their own
+NO_SQL_METHODS = {'close', 'flush_activity_log'}
+
+def _approve_in_transaction(db):
+    with db.transaction() as tx:
+        tx.update_approval('approval-1', {'decision': 'approved'})
+        tx.update_item('item-1', {'status': 'approved'})
+
+
+# One representative call per public method
+METHOD_CALLS = {
+    'create_item': lambda db: db.create_item({'id': 'new-item', 'source': 'gmail', 'type': 'email'}),
+    'create_items_many': lambda db: db.create_items_many([{'id': 'bulk-1', 'source': 'gmail', 'type': 'email'}]),
+    'upsert_items': lambda db: db.upsert_items([{'id': 'item-1', 'source': 'gmail', 'type': 'email'}]),
+    'get_item': lambda db: db.get_item('item-1'),
+    'update_item': lambda db: db.update_item('item-1', {'status': 'done'}),
+    'delete_item': lambda db: db.delete_item('item-2'),
+    'get_items_by_source': lambda db: db.get_items_by_source('gmail'),
+    'get_items_by_status': lambda db: db.get_items_by_status('pending'),
+    'get_items_by_source_page': lambda db: db.get_items_by_source_page('gmail', 10, ('2026-02-01', 'item-5')),
+    'get_items_by_status_page': lambda db: db.get_items_by_status_page('pending', 10, ('2026-02-01', 'item-5')),
+    'iter_items_by_source': lambda db: list(db.iter_items_by_source('gmail', chunk_size=2)),
+    'iter_items_by_status': lambda db: list(db.iter_items_by_status('pending', chunk_size=2)),
+    'get_items_by_sender': lambda db: db.get_items_by_sender('ana@example.com', 10, ('2026-02-01', 'item-5')),
+    'get_items_by_vendor': lambda db: db.get_items_by_vendor('Acme', 10),
+    'get_items_by_chat_type': lambda db: db.get_items_by_chat_type('group', 10),
+    'create_approval': lambda db: db.create_approval({'id': 'new-approval', 'item_id': 'item-1'}),
+    'get_approval': lambda db: db.get_approval('approval-1'),
+    'update_approval': lambda db: db.update_approval('approval-1', {'reminder_sent': 1}),
+    'get_pending_approvals': lambda db: db.get_pending_approvals(),
+    'get_pending_approvals_page': lambda db: db.get_pending_approvals_page(10, ('2026-03-01', 'approval-1')),
+    'iter_pending_approvals': lambda db: list(db.iter_pending_approvals(chunk_size=2)),
+    'get_overdue_approvals': lambda db: db.get_overdue_approvals(),
+    'create_plan': lambda db: db.create_plan({'id': 'new-plan', 'title': 'Plan'}),
+    'get_plan': lambda db: db.get_plan('plan-1'),
+    'update_plan': lambda db: db.update_plan('plan-1', {'steps_completed': 1}),
+    'get_active_plans': lambda db: db.get_active_plans(),
+    'create_workflow': lambda db: db.create_workflow({'id': 'new-wf', 'workflow_type': 'invoice'}),
+    'get_workflow': lambda db: db.get_workflow('wf-1'),
+    'update_workflow': lambda db: db.update_workflow('wf-1', {'current_step': 2}),
+    'get_active_workflows': lambda db: db.get_active_workflows(),
+    'get_workflows_by_pause_reason': lambda db: db.get_workflows_by_pause_reason('approval_required'),
+    'create_financial_record': lambda db: db.create_financial_record({'id': 'new-fin', 'record_type': 'invoice', 'amount': 1.0}),
+    'create_financial_records_many': lambda db: db.create_financial_records_many([{'id': 'bulk-fin', 'record_type': 'receipt', 'amount': 1.0}]),
+    'upsert_financial_records': lambda db: db.upsert_financial_records([{'id': 'fin-1', 'record_type': 'invoice', 'amount': 2.0}]),
+    'get_financial_record': lambda db: db.get_financial_record('fin-1'),
+    'update_financial_record': lambda db: db.update_financial_record('fin-1', {'payment_status': 'paid'}),
+    'get_pending_invoices': lambda db: db.get_pending_invoices(),
+    'get_overdue_invoices': lambda db: db.get_overdue_invoices(),
+    'get_financial_summary': lambda db: db.get_financial_summary(),
+    'rebuild_financial_rollups': lambda db: db.rebuild_financial_rollups(),
+    'log_activity': lambda db: db.log_activity({'component': 'test', 'action': 'a'}),
+    'log_activity_many': lambda db: db.log_activity_many([{'component': 'test', 'action': 'b'}]),
+    'get_recent_activity': lambda db: db.get_recent_activity(5),
+    'query_activity': lambda db: db.query_activity(start='2025-01-01', component='test', limit=5),
+    'archive_activity_log': lambda db: db.archive_activity_log(retention_days=30),
+    'incremental_vacuum': lambda db: db.incremental_vacuum(10),
+    'run_maintenance': lambda db: db.run_maintenance(retention_days=30),
+    'backup': lambda db: db.backup(keep=2),
+    'get_last_backup': lambda db: db.get_last_backup(),
+    'get_tables': lambda db: db.get_tables(),
+    'index_vault': lambda db: db.index_vault(db.vault_dir),
+    'search': lambda db: db.search('hello invoice*'),
+    'get_schema_version': lambda db: db.get_schema_version(),
+    'transaction': _approve_in_transaction,
+    'get_stats': lambda db: db.get_stats(),
+    'get_dashboard_snapshot': lambda db: db.get_dashboard_snapshot(),
+    'create_linkedin_post': lambda db: db.create_linkedin_post({'id': 'new-post', 'content': 'Hi'}),
+    'get_linkedin_post': lambda db: db.get_linkedin_post('post-1'),
+    'update_linkedin_post': lambda db: db.update_linkedin_post('post-1', {'retry_count': 1}),
+    'get_pending_linkedin_posts': lambda db: db.get_pending_linkedin_posts(),
+    'get_linkedin_posts_needing_approval': lambda db: db.get_linkedin_posts_needing_approval(),
+    'get_failed_linkedin_posts': lambda db: db.get_failed_linkedin_posts(),
+    'get_linkedin_posts_by_status': lambda db: db.get_linkedin_posts_by_status('posted'),
+    'get_linkedin_posts_by_status_page': lambda db: db.get_linkedin_posts_by_status_page('posted', 10, ('2026-02-01', 'post-1')),
+    'iter_linkedin_posts_by_status': lambda db: list(db.iter_linkedin_posts_by_status('pending', chunk_size=2, oldest_first=True)),
+    'get_failed_linkedin_posts_page': lambda db: db.get_failed_linkedin_posts_page(10, ('2026-02-01', 'post-1')),
+    'iter_failed_linkedin_posts': lambda db: list(db.iter_failed_linkedin_posts(chunk_size=2)),
+}
+
+
+def _public_methods():
+    return {
+        name for name, _ in inspect.getmembers(DatabaseManager, inspect.isfunction)
+        if not name.startswith('_')
+    }
+
+
+def _degraded_steps(plan_rows, allowed_scans=frozenset()):
+    """Return plan steps that indicate a full scan or a temporary sort."""
+    bad = []
+    for row in plan_rows:
+        detail = row[3]
+        match = re.match(r'SCAN (\w+)', detail)
+        exempt = SCAN_EXEMPT_TABLES | allowed_scans
+        if match and 'INDEX' not in detail and match.group(1) not in exempt:
+            bad.append(detail)
+        elif 'USE TEMP B-TREE' in detail:
+            bad.append(detail)
+    return bad
+
+
+@pytest.fixture
+def traced_db():
+    """Populated database whose pooled connections record executed SQL."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
+        db_path = tmp.name
+
+    db = DatabaseManager(db_path)
+    db.create_items_many([
+        {'id': f'item-{i}', 'source': 'gmail' if i % 2 else 'whatsapp', 'type': 'email',
+         'status': 'pending', 'created_at': f'2026-02-0{1 + i % 9} 10:00:00'}
+        for i in range(20)
+    ])
+    db.create_approval({'id': 'approval-1', 'item_id': 'item-1', 'deadline': '2026-03-01 00:00:00'})
+    db.create_plan({'id': 'plan-1', 'title': 'Plan', 'status': 'active'})
+    db.create_workflow({'id': 'wf-1', 'workflow_type': 'invoice', 'item_id': 'item-1'})
+    db.create_financial_record({'id': 'fin-1', 'record_type': 'invoice', 'amount': 10.0})
+    db.create_linkedin_post({'id': 'post-1', 'content': 'Hello', 'status': 'failed'})
+
+    vault_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(vault_dir, 'Inbox'))
+    with open(os.path.join(vault_dir, 'Inbox', 'card.md'), 'w') as f:
+        f.write('# Hello\n\nInvoice attached.\n')
+    db.index_vault(vault_dir)
+    db.log_activity_many([
+        {'timestamp': f'2025-0{1 + i % 3}-10 10:00:00', 'component': 'test', 'action': f'old {i}'}
+        for i in range(6)
+    ])
+    db.vault_dir = vault_dir
+
+    statements = []
+    db.close()
+    original_connect = db._connect
+
+    def traced_connect():
+        conn = original_connect()
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    db._connect = traced_connect
+    db.statements = statements
+    yield db
+
+    db.close()
+    shutil.rmtree(vault_dir, ignore_errors=True)
+    shutil.rmtree(db.archive_dir, ignore_errors=True)
+    shutil.rmtree(db.backup_dir, ignore_errors=True)
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.unlink(db_path + suffix)
+
+
+def test_every_public_method_is_covered():
+    """Test new DatabaseManager methods are added to the plan suite."""
+    missing = _public_methods() - set(METHOD_CALLS) - NO_SQL_METHODS
+    assert not missing, f"Add query-plan coverage for: {sorted(missing)}"
+
+
+@pytest.mark.parametrize('method', sorted(METHOD_CALLS))
+def test_query_plan_uses_indexes(traced_db, method):
+    """Test no statement issued by the method scans a table or sorts in a temp b-tree."""
+    traced_db.statements.clear()
+    METHOD_CALLS[method](traced_db)
+
+    planned = [s for s in traced_db.statements
+               if s.lstrip().upper().startswith(PLANNED) and not FTS_INTERNAL.search(s)]
+
+    explain = sqlite3.connect(str(traced_db.db_path))
+    try:
+        failures = {}
+        for statement in planned:
+            plan = explain.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+            bad = _degraded_steps(plan, FULL_SCAN_ALLOWED.get(method, frozenset()))
+            if bad:
+                failures[statement.strip()] = bad
+    finally:
+        explain.close()
+
+    assert not failures, f"{method} degraded to full scans: {failures}"
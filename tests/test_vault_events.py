@@ -0,0 +1,182 @@
+"""Tests for the vault change feed."""
+
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.vault_events import RESYNC, VaultChangeFeed, inotify_available
+from src.utils.vault_manifest import VaultManifest
+
+needs_inotify = pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Empty vault with the usual folders."""
+    root = tmp_path / 'vault'
+    for folder in ('Inbox', 'Needs_Action/urgent', 'Needs_Action/normal', 'Done',
+                   'Approved', 'Rejected'):
+        (root / folder).mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def manifest(vault):
+    manifest = VaultManifest(str(vault))
+    yield manifest
+    manifest.close()
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@needs_inotify
+def test_storm_coalesced_into_one_sync_per_folder(manifest, vault):
+    """Test a burst of events is applied as one batch per touched folder."""
+    changes = []
+    feed = VaultChangeFeed(manifest, coalesce=0.3)
+    feed.subscribe(changes.extend)
+
+    with feed:
+        for i in range(200):
+            (vault / 'Inbox' / f'{i}.md').write_text('x', encoding='utf-8')
+        assert _wait_for(lambda: len(changes) == 200)
+
+    assert {c['change'] for c in changes} == {'added'}
+    assert feed.stats['events'] >= 200
+    assert feed.stats['folders_synced'] < 10
+    assert manifest.count('Inbox') == 200
+
+
+@needs_inotify
+def test_drag_and_drop_moves_tracked(manifest, vault):
+    """Test moves done outside our writers keep counters current."""
+    card = vault / 'Needs_Action/urgent/invoice.md'
+    card.write_text('# Invoice', encoding='utf-8')
+    assert manifest.count('Needs_Action') == 1
+    changes = []
+    feed = VaultChangeFeed(manifest, coalesce=0.05)
+    feed.subscribe(changes.extend)
+
+    with feed:
+        shutil.move(str(card), str(vault / 'Approved/invoice.md'))
+        assert _wait_for(lambda: len(changes) == 2)
+
+        # New folders dropped in are watched too
+        (vault / 'Inbox/whatsapp').mkdir()
+        (vault / 'Inbox/whatsapp/chat.md').write_text('# Chat', encoding='utf-8')
+        assert _wait_for(lambda: len(changes) == 3)
+        (vault / 'Inbox/whatsapp/chat2.md').write_text('# Chat', encoding='utf-8')
+        assert _wait_for(lambda: len(changes) == 4)
+
+    assert {(c['change'], c['path']) for c in changes[:2]} == {
+        ('removed', 'Needs_Action/urgent/invoice.md'), ('added', 'Approved/invoice.md')}
+    assert manifest.count('Needs_Action') == 0
+    assert manifest.count('Approved') == 1
+    assert manifest.count('Inbox') == 2
+
+
+@needs_inotify
+def test_subscription_filters_by_folder(manifest, vault):
+    """Test subscribers only see changes under their folders."""
+    approvals, everything = [], []
+    feed = VaultChangeFeed(manifest, coalesce=0.05)
+    token = feed.subscribe(approvals.extend, folders=['Approved', 'Rejected'])
+    feed.subscribe(everything.extend)
+
+    with feed:
+        (vault / 'Inbox/a.md').write_text('a', encoding='utf-8')
+        (vault / 'Rejected/b.md').write_text('b', encoding='utf-8')
+        assert _wait_for(lambda: len(everything) == 2)
+        feed.unsubscribe(token)
+        (vault / 'Approved/c.md').write_text('c', encoding='utf-8')
+        assert _wait_for(lambda: len(everything) == 3)
+
+    assert [c['path'] for c in approvals] == ['Rejected/b.md']
+
+
+@needs_inotify
+def test_overflow_triggers_resync(manifest, vault):
+    """Test a kernel queue overflow rebuilds the manifest and notifies subscribers."""
+    max_events = int(Path('/proc/sys/fs/inotify/max_queued_events').read_text())
+    if max_events > 20000:
+        pytest.skip("inotify queue too large to overflow quickly")
+
+    changes = []
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_subscriber(batch):
+        changes.extend(batch)
+        entered.set()
+        release.wait()
+
+    feed = VaultChangeFeed(manifest, coalesce=0.05)
+    feed.subscribe(slow_subscriber)
+    files = max_events // 2 + 500  # two events (create, close-write) per file
+
+    with feed:
+        (vault / 'Inbox/first.md').write_text('x', encoding='utf-8')
+        assert entered.wait(5)
+        # The feed thread is stuck in the subscriber, so the kernel queue fills up
+        for i in range(files):
+            (vault / 'Inbox' / f'{i}.md').write_text('x', encoding='utf-8')
+        release.set()
+        assert _wait_for(lambda: RESYNC in changes, timeout=10)
+
+    assert feed.stats['resyncs'] == 1
+    assert manifest.count('Inbox') == files + 1
+
+
+def test_polling_fallback(manifest, vault):
+    """Test the feed still reports changes without inotify."""
+    changes = []
+    feed = VaultChangeFeed(manifest, poll_interval=0.05, use_inotify=False)
+    feed.subscribe(changes.extend)
+
+    with feed:
+        (vault / 'Done/a.md').write_text('a', encoding='utf-8')
+        assert _wait_for(lambda: changes)
+
+    assert changes[0]['path'] == 'Done/a.md'
+    assert manifest.count('Done') == 1
+
+
+def test_start_catches_up_on_offline_changes(manifest, vault):
+    """Test changes made while no feed was running are reported on start."""
+    assert manifest.count('.') == 0
+    (vault / 'Inbox/offline.md').write_text('x', encoding='utf-8')
+    changes = []
+    feed = VaultChangeFeed(manifest, use_inotify=False, poll_interval=60)
+    feed.subscribe(changes.extend)
+
+    with feed:
+        pass
+
+    assert [c['path'] for c in changes] == ['Inbox/offline.md']
+
+
+def test_failing_subscriber_does_not_stop_others(manifest, vault):
+    """Test one subscriber raising does not starve the rest."""
+    def broken(batch):
+        raise RuntimeError('boom')
+
+    changes = []
+    feed = VaultChangeFeed(manifest, use_inotify=False, poll_interval=60)
+    feed.subscribe(broken)
+    feed.subscribe(changes.extend)
+    (vault / 'Inbox/a.md').write_text('x', encoding='utf-8')
+
+    with feed:
+        pass
+
+    assert len(changes) == 1
@@ -0,0 +1,169 @@
+"""Tests for the queue-backed vault logging."""
+
+import json
+import logging
+import logging.handlers
+import time
+from datetime import datetime
+
+import pytest
+
+from src.utils import vault_logging
+from src.utils.vault_logging import (DailyFileHandler, configure_logging, flush_logs,
+                                     log_event, set_component_level, shutdown_logging)
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Route vault logs to a temporary folder for one test."""
+    configure_logging(log_dir=tmp_path, json_lines=False, levels={}, default_level='DEBUG')
+    yield tmp_path
+    # The next log call outside this test reconfigures the default location
+    shutdown_logging()
+
+
+def _today_file(log_dir, suffix='log'):
+    return log_dir / f"{datetime.now().strftime('%Y-%m-%d')}.{suffix}"
+
+
+def test_lines_keep_write_log_format(log_dir):
+    """Test lines keep the [timestamp] [LEVEL] [Component] message format."""
+    from src.utils.vault_management import write_log
+
+    write_log('INFO', 'VaultManager', 'Wrote file: Dashboard.md')
+    write_log('WARN', 'GmailWatcher', 'Rate limited')
+    flush_logs()
+
+    lines = _today_file(log_dir).read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith('[INFO] [VaultManager] Wrote file: Dashboard.md')
+    assert lines[1].endswith('[WARN] [GmailWatcher] Rate limited')
+    datetime.fromisoformat(lines[0][1:lines[0].index(']')])
+
+
+def test_messages_with_percent_signs_unchanged(log_dir):
+    """Test messages are written verbatim, not %-formatted."""
+    log_event('INFO', 'Reports', 'Margin 100% (%s)')
+    flush_logs()
+
+    assert _today_file(log_dir).read_text(encoding='utf-8').rstrip().endswith('Margin 100% (%s)')
+
+
+def test_json_lines(tmp_path):
+    """Test JSON-lines output goes to <date>.jsonl."""
+    configure_logging(log_dir=tmp_path, json_lines=True, levels={})
+    try:
+        log_event('ERROR', 'FileOrganizer', 'Failed: "a.pdf"')
+        flush_logs()
+    finally:
+        shutdown_logging()
+
+    record = json.loads(_today_file(tmp_path, 'jsonl').read_text(encoding='utf-8'))
+    assert record['level'] == 'ERROR'
+    assert record['component'] == 'FileOrganizer'
+    assert record['message'] == 'Failed: "a.pdf"'
+
+
+def test_per_component_levels(tmp_path):
+    """Test each component can have its own minimum level."""
+    configure_logging(log_dir=tmp_path, json_lines=False, levels={'VaultManager': 'WARN'})
+    try:
+        assert not log_event('INFO', 'VaultManager', 'quiet')
+        assert log_event('ERROR', 'VaultManager', 'loud')
+        assert log_event('INFO', 'GmailWatcher', 'other component')
+        set_component_level('GmailWatcher', 'ERROR')
+        assert not log_event('INFO', 'GmailWatcher', 'now filtered')
+        flush_logs()
+    finally:
+        shutdown_logging()
+
+    content = _today_file(tmp_path).read_text(encoding='utf-8')
+    assert 'loud' in content and 'other component' in content
+    assert 'quiet' not in content and 'now filtered' not in content
+
+
+def test_levels_from_environment(tmp_path, monkeypatch):
+    """Test AI_EMPLOYEE_LOG_LEVELS and AI_EMPLOYEE_LOG_FORMAT are honoured."""
+    monkeypatch.setenv('AI_EMPLOYEE_LOG_LEVELS', 'Noisy=ERROR, Other = WARN')
+    monkeypatch.setenv('AI_EMPLOYEE_LOG_FORMAT', 'jsonl')
+    configure_logging(log_dir=tmp_path)
+    try:
+        assert not log_event('WARN', 'Noisy', 'x')
+        assert log_event('WARN', 'Other', 'y')
+        flush_logs()
+    finally:
+        shutdown_logging()
+
+    assert _today_file(tmp_path, 'jsonl').exists()
+
+
+def test_daily_rotation(tmp_path):
+    """Test records are split into one file per local day."""
+    handler = DailyFileHandler(tmp_path)
+    before = datetime(2026, 3, 1, 23, 59, 59).timestamp()
+    after = datetime(2026, 3, 2, 0, 0, 1).timestamp()
+    for created, message in ((before, 'late'), (after, 'early')):
+        record = logging.LogRecord('ai_employee.Test', logging.INFO, __file__, 0,
+                                   message, None, None)
+        record.created = created
+        handler.emit(record)
+    handler.close()
+
+    assert 'late' in (tmp_path / '2026-03-01.log').read_text()
+    assert 'early' in (tmp_path / '2026-03-02.log').read_text()
+
+
+def test_lines_are_batched(log_dir, monkeypatch):
+    """Test a burst of lines is written with a handful of flushes."""
+    flushes = []
+    original = DailyFileHandler.flush
+
+    def counting_flush(self):
+        flushes.append(self._unflushed)
+        original(self)
+    monkeypatch.setattr(DailyFileHandler, 'flush', counting_flush)
+
+    for i in range(2000):
+        log_event('INFO', 'Burst', f'line {i}')
+    flush_logs()
+
+    assert len(_today_file(log_dir).read_text(encoding='utf-8').splitlines()) == 2000
+    assert len([n for n in flushes if n]) < 100
+
+
+def test_per_call_cost_below_open_append_close(log_dir, tmp_path, monkeypatch):
+    """Test a log call is cheaper than the old open/append/close per line."""
+    # pytest attaches its capture handlers to non-propagating loggers; time our pipeline only
+    vault_logger = logging.getLogger(vault_logging.LOGGER_NAME)
+    monkeypatch.setattr(vault_logger, 'handlers',
+                        [h for h in vault_logger.handlers
+                         if isinstance(h, logging.handlers.QueueHandler)])
+    calls = 5000
+    start = time.perf_counter()
+    for i in range(calls):
+        log_event('INFO', 'Bench', f'message {i}')
+    queued = (time.perf_counter() - start) / calls
+    flush_logs()
+
+    legacy_file = tmp_path / 'legacy.log'
+    start = time.perf_counter()
+    for i in range(calls):
+        with open(legacy_file, 'a', encoding='utf-8') as f:
+            f.write(f"[{datetime.now().isoformat()}] [INFO] [Bench] message {i}\n")
+    legacy = (time.perf_counter() - start) / calls
+
+    # Relative to the same machine's file I/O, so slow CI runners scale both sides
+    assert queued * 2 < legacy
+
+
+def test_logging_restarts_after_shutdown(tmp_path, monkeypatch):
+    """Test a log call after shutdown brings the pipeline back up."""
+    monkeypatch.setattr(vault_logging, 'DEFAULT_LOG_DIR', tmp_path)
+    shutdown_logging()
+    try:
+        assert log_event('INFO', 'Restart', 'after shutdown')
+        flush_logs()
+    finally:
+        shutdown_logging()
+
+    assert 'after shutdown' in _today_file(tmp_path).read_text(encoding='utf-8')
@@ -0,0 +1,171 @@
+"""Tests for the persistent vault manifest."""
+
+import os
+import shutil
+import sqlite3
+import time
+
+import pytest
+
+from src.utils.vault_manifest import VaultManifest
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Small vault with a few cards."""
+    root = tmp_path / 'vault'
+    for rel in ('Inbox/email/a.md', 'Inbox/email/b.md', 'Inbox/files/c.pdf',
+                'Needs_Action/urgent/d.md', 'Needs_Action/normal/e.md', 'Done/f.md'):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'# {rel}\n', encoding='utf-8')
+    return root
+
+
+@pytest.fixture
+def manifest(vault):
+    manifest = VaultManifest(str(vault))
+    yield manifest
+    manifest.close()
+
+
+def _spy_scans(manifest):
+    """Record the folders a manifest rescans from now on."""
+    scanned = []
+    scan = manifest._scan
+
+    def spy(conn, folder):
+        scanned.append(folder)
+        scan(conn, folder)
+    manifest._scan = spy
+    return scanned
+
+
+def _touch_dir(path):
+    """Move a directory's mtime forward so the change is visible on coarse clocks."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_counts_match_tree_walk(manifest, vault):
+    """Test recursive and direct counts agree with rglob/glob."""
+    for folder in ('.', 'Inbox', 'Inbox/email', 'Needs_Action', 'Needs_Action/urgent', 'Done'):
+        path = vault / folder
+        assert manifest.count(folder) == len(list(path.rglob('*.md'))), folder
+        assert manifest.count(folder, recursive=False) == len(list(path.glob('*.md'))), folder
+
+    assert manifest.count('Inbox', kind='pdf') == 1
+    assert manifest.count('Missing') == 0
+
+
+def test_counts_persist_across_instances(manifest, vault):
+    """Test a reopened manifest answers from stored counters without rescanning."""
+    assert manifest.count('.') == 5
+    manifest.close()
+
+    reopened = VaultManifest(str(vault))
+    try:
+        scanned = _spy_scans(reopened)
+        assert reopened.count('.') == 5
+        assert reopened.count('Needs_Action/urgent', recursive=False) == 1
+        # Only the folder holding the manifest's own WAL files changed
+        assert set(scanned) <= {'Database'}
+    finally:
+        reopened.close()
+
+
+def test_tracked_writes_update_counters(manifest, vault):
+    """Test track() records writes, moves and deletes without a rescan."""
+    assert manifest.count('.') == 5
+
+    with manifest.track('Needs_Action/urgent/g.md'):
+        (vault / 'Needs_Action/urgent/g.md').write_text('# g', encoding='utf-8')
+    with manifest.track('Needs_Action/urgent/d.md', 'Done/d.md'):
+        shutil.move(str(vault / 'Needs_Action/urgent/d.md'), str(vault / 'Done/d.md'))
+
+    scanned = _spy_scans(manifest)
+    assert manifest.count('Needs_Action/urgent', recursive=False) == 1
+    assert manifest.count('Done') == 2
+    assert manifest.count('.') == 6
+    # Tracked changes need no rescans
+    assert set(scanned) <= {'Database'}
+
+
+def test_untracked_changes_are_picked_up(manifest, vault):
+    """Test files added, removed or moved behind the manifest's back are noticed."""
+    assert manifest.count('.') == 5
+
+    (vault / 'Inbox/email/new.md').write_text('# new', encoding='utf-8')
+    (vault / 'Done/f.md').unlink()
+    (vault / 'Inbox/whatsapp').mkdir()
+    (vault / 'Inbox/whatsapp/chat.md').write_text('# chat', encoding='utf-8')
+    shutil.rmtree(vault / 'Needs_Action/normal')
+    for folder in ('Inbox/email', 'Done', 'Inbox', 'Needs_Action'):
+        _touch_dir(vault / folder)
+
+    assert manifest.count('Inbox') == 4
+    assert manifest.count('Done') == 0
+    assert manifest.count('Needs_Action') == 1
+    assert manifest.count('.') == 5
+
+
+def test_listing(manifest, vault):
+    """Test listings come from the manifest with size and kind."""
+    names = [entry['name'] for entry in manifest.list_files('Inbox/email', '*.md')]
+    assert names == ['a.md', 'b.md']
+
+    entries = manifest.list_files('Inbox', recursive=True)
+    assert [e['path'] for e in entries] == ['Inbox/email/a.md', 'Inbox/email/b.md',
+                                            'Inbox/files/c.pdf']
+    assert entries[2]['kind'] == 'pdf'
+    assert entries[0]['size'] == (vault / 'Inbox/email/a.md').stat().st_size
+
+
+def test_manifest_files_not_listed(manifest, vault):
+    """Test the manifest's own database is not counted as vault content."""
+    assert manifest.count('Database', kind='db') == 0
+    assert manifest.list_files('Database') == []
+
+
+def test_rebuild_matches_incremental(manifest, vault):
+    """Test a full rebuild produces the same counters."""
+    before = {f: manifest.count(f) for f in ('.', 'Inbox', 'Needs_Action', 'Done')}
+    manifest.rebuild()
+    after = {f: manifest.count(f) for f in ('.', 'Inbox', 'Needs_Action', 'Done')}
+
+    assert before == after
+    conn = sqlite3.connect(str(manifest.db_path))
+    try:
+        direct_sum = conn.execute(
+            "SELECT SUM(direct) FROM counts WHERE kind = 'md'").fetchone()[0]
+    finally:
+        conn.close()
+    assert direct_sum == before['.']
+
+
+def test_count_is_faster_than_walk(tmp_path):
+    """Test a warm count beats walking a large tree."""
+    root = tmp_path / 'big'
+    for d in range(20):
+        folder = root / 'Done' / f'{d:02d}'
+        folder.mkdir(parents=True)
+        for i in range(250):
+            (folder / f'{i}.md').write_text('x', encoding='utf-8')
+
+    manifest = VaultManifest(str(root))
+    try:
+        assert manifest.count('Done') == 5000
+
+        start = time.perf_counter()
+        for _ in range(20):
+            manifest.count('Done')
+        warm = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(20):
+            len(list((root / 'Done').rglob('*.md')))
+        walk = time.perf_counter() - start
+    finally:
+        manifest.close()
+
+    assert warm * 5 < walk
@@ -0,0 +1,122 @@
+"""Tests for the atomic, coalescing vault writer."""
+
+import os
+import time
+
+import pytest
+
+from src.utils import vault_writer
+from src.utils.vault_writer import VaultWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = VaultWriter(str(tmp_path), window=0.1)
+    yield writer
+    writer.close()
+
+
+def test_write_is_atomic_and_leaves_no_temp_files(writer, tmp_path):
+    """Test a write lands in full and no temp file is left behind."""
+    assert writer.write('Inbox/card.md', '# Card\n') == 'written'
+
+    assert (tmp_path / 'Inbox/card.md').read_text(encoding='utf-8') == '# Card\n'
+    assert sorted(p.name for p in (tmp_path / 'Inbox').iterdir()) == ['card.md']
+
+
+def test_failed_rename_keeps_old_content(writer, tmp_path, monkeypatch):
+    """Test a failure before the rename leaves the previous file intact."""
+    writer.write('card.md', 'old')
+
+    def broken_replace(src, dst):
+        raise OSError('disk full')
+    monkeypatch.setattr(vault_writer.os, 'replace', broken_replace)
+
+    with pytest.raises(OSError):
+        writer.write('card.md', 'new')
+    assert (tmp_path / 'card.md').read_text() == 'old'
+    assert [p.name for p in tmp_path.iterdir()] == ['card.md']
+
+
+def test_unchanged_content_skipped(writer, tmp_path):
+    """Test rewriting identical content does not touch the file."""
+    writer.write('Dashboard.md', 'same')
+    mtime = os.stat(tmp_path / 'Dashboard.md').st_mtime_ns
+
+    assert writer.write('Dashboard.md', 'same') == 'unchanged'
+    assert os.stat(tmp_path / 'Dashboard.md').st_mtime_ns == mtime
+    assert writer.stats['unchanged'] == 1
+    assert writer.stats['bytes_avoided'] == 4
+
+
+def test_outside_edit_is_not_mistaken_for_unchanged(writer, tmp_path):
+    """Test content edited by someone else is rewritten even if we wrote it before."""
+    writer.write('card.md', 'ours')
+    (tmp_path / 'card.md').write_text('edit')
+
+    assert writer.write('card.md', 'ours') == 'written'
+    assert (tmp_path / 'card.md').read_text() == 'ours'
+
+
+def test_deferred_writes_coalesce(writer, tmp_path):
+    """Test a burst of deferred writes to one path commits only the last."""
+    for i in range(20):
+        assert writer.write('Dashboard.md', f'version {i}', defer=True) == 'queued'
+
+    assert writer.read('Dashboard.md') == 'version 19'
+    deadline = time.monotonic() + 2
+    while writer.stats['committed'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert (tmp_path / 'Dashboard.md').read_text() == 'version 19'
+    assert writer.read('Dashboard.md') is None
+    assert writer.stats['committed'] == 1
+    assert writer.saved()['writes_saved'] == 19
+    assert writer.saved()['bytes_avoided'] == sum(len(f'version {i}') for i in range(19))
+
+
+def test_immediate_write_supersedes_pending(writer, tmp_path):
+    """Test an immediate write wins over an older deferred one."""
+    writer.write('card.md', 'deferred', defer=True)
+    writer.write('card.md', 'now')
+    writer.flush()
+
+    assert (tmp_path / 'card.md').read_text() == 'now'
+    assert writer.stats['coalesced'] == 1
+
+
+def test_close_flushes_pending_and_reports(tmp_path):
+    """Test deferred writes are not lost on close and the savings are reported."""
+    messages = []
+    writer = VaultWriter(str(tmp_path), window=60,
+                         log=lambda level, message: messages.append(message))
+    writer.write('Dashboard.md', 'draft', defer=True)
+    writer.write('Dashboard.md', 'final', defer=True)
+    writer.close()
+    writer.close()
+
+    assert (tmp_path / 'Dashboard.md').read_text() == 'final'
+    assert messages == ['Wrote file: Dashboard.md',
+                        'Vault writer saved 1 writes (5 bytes avoided, 1 committed)']
+
+
+def test_commits_are_tracked(tmp_path):
+    """Test each commit runs inside the tracking hook."""
+    tracked = []
+
+    class Track:
+        def __init__(self, rel):
+            self.rel = rel
+
+        def __enter__(self):
+            tracked.append(('enter', self.rel))
+
+        def __exit__(self, *exc):
+            tracked.append(('exit', self.rel, (tmp_path / self.rel).exists()))
+
+    writer = VaultWriter(str(tmp_path), track=Track)
+    writer.write('a.md', 'x')
+    writer.write('a.md', 'x')
+    writer.close()
+
+    assert tracked == [('enter', 'a.md'), ('exit', 'a.md', True)]
@@ -0,0 +1,119 @@
+"""Tests for the watcher heartbeat registry."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils import dashboard_updater
+from src.utils.watcher_registry import WatcherRegistry, liveness
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = WatcherRegistry(str(tmp_path))
+    yield registry
+    registry.close()
+
+
+def test_heartbeat_reports_active_watcher(registry):
+    """Test a beating watcher is Active with its item count."""
+    heartbeat = registry.register('gmail', interval=60)
+    heartbeat.beat(3)
+    heartbeat.beat(2)
+
+    status = registry.statuses()['gmail']
+    assert status['state'] == 'Active'
+    assert status['items_processed'] == 5
+    assert status['pid'] == os.getpid()
+    assert status['lag'] < 5
+
+
+def test_missed_loops_mark_watcher_stalled(registry):
+    """Test a watcher that stops beating is reported as stalled with its lag."""
+    registry.register('filesystem', interval=1)
+    entry = registry.entries()['filesystem']
+
+    assert liveness(entry, now=entry['last_beat'] + 10)['state'] == 'Active'
+    stalled = liveness(entry, now=entry['last_beat'] + 120)
+    assert stalled['state'] == 'Stalled'
+    assert stalled['lag'] == pytest.approx(120)
+
+
+def test_context_manager_records_error_and_stop(registry):
+    """Test leaving the heartbeat block stores the error and marks the watcher stopped."""
+    with pytest.raises(RuntimeError):
+        with registry.register('linkedin', interval=300) as heartbeat:
+            heartbeat.beat(1)
+            raise RuntimeError('token expired')
+
+    status = registry.statuses()['linkedin']
+    assert status['state'] == 'Stopped'
+    assert status['last_error'] == 'RuntimeError: token expired'
+
+
+def test_unregistered_watchers_and_no_database(tmp_path):
+    """Test reading an empty vault reports every watcher as not started without creating files."""
+    registry = WatcherRegistry(str(tmp_path))
+    statuses = registry.statuses()
+
+    assert {name: s['state'] for name, s in statuses.items()} == {
+        'gmail': 'Not started', 'filesystem': 'Not started',
+        'whatsapp': 'Not started', 'linkedin': 'Not started'}
+    assert not (tmp_path / 'Database').exists()
+
+
+def test_json_heartbeat_from_node_watcher(registry, tmp_path):
+    """Test heartbeat files written by the WhatsApp watcher are read like rows."""
+    heartbeat_dir = tmp_path / 'Database' / 'heartbeats'
+    heartbeat_dir.mkdir(parents=True)
+    now = time.time()
+    (heartbeat_dir / 'whatsapp.json').write_text(json.dumps({
+        'pid': os.getpid(), 'host': 'other-host', 'started_at': now - 100,
+        'last_beat': now - 10, 'interval': 30, 'items_processed': 7,
+        'last_error': None, 'last_error_at': None, 'stopped_at': None}))
+
+    status = registry.statuses()['whatsapp']
+    assert status['state'] == 'Active'
+    assert status['items_processed'] == 7
+
+
+def test_crashed_process_reported_dead(registry, tmp_path):
+    """Test a watcher process that exits without stopping is detected from another process."""
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from src.utils.watcher_registry import WatcherRegistry;"
+        "WatcherRegistry(sys.argv[2]).register('gmail', 60).beat(4)"
+    )
+    subprocess.run([sys.executable, '-c', script, str(PROJECT_ROOT), str(tmp_path)],
+                   check=True, timeout=30)
+
+    status = registry.statuses()['gmail']
+    assert status['items_processed'] == 4
+    assert status['state'] == ('Dead' if os.name == 'posix' else 'Active')
+
+
+def test_dashboard_lists_each_watcher(tmp_path, monkeypatch):
+    """Test the dashboard shows per-watcher liveness without scanning processes."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(sys.modules, 'psutil', None)
+    registry = WatcherRegistry('AI_Employee_Vault')
+    monkeypatch.setattr(dashboard_updater, 'get_registry', lambda: registry)
+    registry.register('gmail', interval=60).beat(2)
+
+    status = dashboard_updater.get_system_status()
+    content = dashboard_updater.generate_dashboard_content(
+        {'inbox': 0, 'needs_action': {'total': 0, 'urgent': 0, 'normal': 0}, 'done': 0},
+        status)
+    registry.close()
+
+    assert status['watcher'] == 'Active'
+    assert status['overall'] == 'Active'
+    assert '  - Gmail: Active (last loop 0s ago, 2 items)' in content
+    assert '  - WhatsApp: Not started' in content